@@ -10,8 +10,9 @@ __description__ = "DVD 연결 및 안전성 관리 모듈"
 
 try:
     from .connector import DVDConnector, DVDEnvironment, DVDConnectionConfig, DVDConnectionStatus, DVDStatus
-    from .safety_checker import SafetyChecker, SafetyLevel, NetworkType, SafetyCheckResult, quick_safety_check
-    from .network_scanner import DVDNetworkScanner, NetworkDevice, NetworkService, NetworkScanResult, quick_dvd_scan, find_drone_devices
+    from .safety_checker import SafetyChecker, SafetyLevel, NetworkType, SafetyCheckResult, EnvironmentFingerprint, quick_safety_check
+    from .watchdog import SafetyWatchdog, WatchdogEvent, WatchdogEventType
+    from .network_scanner import DVDNetworkScanner, NetworkDevice, NetworkService, NetworkScanResult, ScanDiff, diff_scan_results, quick_dvd_scan, find_drone_devices
     
     # 편의 함수들
     from .connector import create_dvd_connection, test_dvd_connection
@@ -32,11 +33,17 @@ except ImportError as e:
     SafetyLevel = None
     NetworkType = None
     SafetyCheckResult = None
+    EnvironmentFingerprint = None
     quick_safety_check = None
+    SafetyWatchdog = None
+    WatchdogEvent = None
+    WatchdogEventType = None
     DVDNetworkScanner = None
     NetworkDevice = None
     NetworkService = None
     NetworkScanResult = None
+    ScanDiff = None
+    diff_scan_results = None
     quick_dvd_scan = None
     find_drone_devices = None
     create_dvd_connection = None
@@ -57,13 +64,19 @@ __all__ = [
     "SafetyLevel",
     "NetworkType", 
     "SafetyCheckResult",
+    "EnvironmentFingerprint",
     "quick_safety_check",
+    "SafetyWatchdog",
+    "WatchdogEvent",
+    "WatchdogEventType",
     
     # 네트워크 스캐너
     "DVDNetworkScanner",
     "NetworkDevice",
     "NetworkService",
     "NetworkScanResult",
+    "ScanDiff",
+    "diff_scan_results",
     "quick_dvd_scan",
     "find_drone_devices",
     
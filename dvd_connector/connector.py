@@ -17,6 +17,12 @@ import subprocess
 import requests
 from contextlib import asynccontextmanager
 
+# RTSP 클라이언트 (dvd_lite 사용 가능 시)
+try:
+    from dvd_lite.rtsp import RTSPClient, RTSPError
+except ImportError:
+    RTSPClient = None
+
 logger = logging.getLogger(__name__)
 
 class DVDConnectionStatus(Enum):
@@ -51,6 +57,14 @@ class DVDConnectionConfig:
     companion_computer_ip: str = "10.13.0.2"
     gcs_ip: str = "10.13.0.3"
     flight_controller_ip: str = "10.13.0.4"
+    
+    def attack_targets(self) -> Dict[str, str]:
+        """역할별 공격 대상 IP (DVDLite.run_attack_fanout 대상 목록용)"""
+        return {
+            "companion_computer": self.companion_computer_ip,
+            "gcs": self.gcs_ip,
+            "flight_controller": self.flight_controller_ip
+        }
 
 @dataclass
 class DVDStatus:
@@ -286,8 +300,19 @@ class DVDConnector:
             return False
     
     async def _check_rtsp_stream(self) -> bool:
-        """RTSP 스트림 확인"""
+        """RTSP 스트림 확인 (dvd_lite가 있으면 OPTIONS 응답까지 확인)"""
         try:
+            if RTSPClient is not None:
+                async with await RTSPClient.connect(f"rtsp://{self.config.host}:{self.config.rtsp_port}/",
+                                                    timeout=5) as client:
+                    try:
+                        await client.options()
+                    except RTSPError as e:
+                        # 인증 요구 등 오류 응답도 RTSP 서비스가 동작 중인 것
+                        if e.status is None:
+                            raise
+                return True
+            
             # RTSP 포트 연결 테스트
             reader, writer = await asyncio.wait_for(
                 asyncio.open_connection(self.config.host, self.config.rtsp_port),
@@ -15,8 +15,15 @@ from dataclasses import dataclass, asdict
 from enum import Enum
 import ipaddress
 from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 import struct
 
+# 메트릭 수집 (dvd_lite 사용 가능 시)
+try:
+    from dvd_lite.metrics import METRICS
+except ImportError:
+    METRICS = None
+
 logger = logging.getLogger(__name__)
 
 class ServiceType(Enum):
@@ -91,6 +98,34 @@ class NetworkScanResult:
                 return device
         return None
 
+@dataclass
+class ScanDiff:
+    """두 스캔 결과의 차이 (정찰 캐시 무효화 등에 사용)"""
+    added_hosts: List[str]
+    removed_hosts: List[str]
+    changed_hosts: List[str]
+    
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.added_hosts or self.removed_hosts or self.changed_hosts)
+
+def _service_signature(device: NetworkDevice) -> set:
+    return {(service.port, service.service_type, service.version) for service in device.services}
+
+def diff_scan_results(previous: NetworkScanResult, current: NetworkScanResult) -> ScanDiff:
+    """이전 스캔 대비 추가/제거된 호스트와 서비스가 바뀐 호스트"""
+    previous_devices = {device.ip: device for device in previous.devices}
+    current_devices = {device.ip: device for device in current.devices}
+    
+    return ScanDiff(
+        added_hosts=sorted(set(current_devices) - set(previous_devices)),
+        removed_hosts=sorted(set(previous_devices) - set(current_devices)),
+        changed_hosts=sorted(
+            ip for ip in set(previous_devices) & set(current_devices)
+            if _service_signature(previous_devices[ip]) != _service_signature(current_devices[ip])
+        )
+    )
+
 class DVDNetworkScanner:
     """DVD 네트워크 스캐너"""
     
@@ -301,12 +336,16 @@ class DVDNetworkScanner:
     
     async def _scan_single_port(self, host_ip: str, port: int) -> Optional[NetworkService]:
         """단일 포트 스캔"""
+        span = (METRICS.span("dvd_scanner_probe_seconds", "포트 프로브 시간", scanner="network_scanner")
+                if METRICS is not None else nullcontext())
+        
         try:
             # 포트 연결 테스트
-            reader, writer = await asyncio.wait_for(
-                asyncio.open_connection(host_ip, port),
-                timeout=self.timeout
-            )
+            with span:
+                reader, writer = await asyncio.wait_for(
+                    asyncio.open_connection(host_ip, port),
+                    timeout=self.timeout
+                )
             
             # 서비스 타입 식별
             service_type = self.drone_ports.get(port, ServiceType.UNKNOWN)
@@ -8,13 +8,22 @@ import asyncio
 import logging
 import time
 import socket
-import subprocess
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
 import json
 import ipaddress
+import hashlib
+import os
+import re
+from contextlib import nullcontext
+
+# 메트릭 수집 (dvd_lite 사용 가능 시)
+try:
+    from dvd_lite.metrics import METRICS
+except ImportError:
+    METRICS = None
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +42,23 @@ class NetworkType(Enum):
     REAL_ISOLATED = "real_isolated"  # 격리된 실제 네트워크
     REAL_PRODUCTION = "real_production"  # 실제 운영 네트워크
 
+@dataclass(frozen=True)
+class EnvironmentFingerprint:
+    """안전성 검사 입력 환경 지문 (구성 요소별 해시)"""
+    device_nodes: str
+    usb_devices: str
+    processes: str
+    target_config: str
+
+# 검사 단계별 입력 - 해당 지문 구성 요소가 바뀐 단계만 다시 실행
+PHASE_INPUTS = {
+    "network": ("target_config",),
+    "hardware": ("device_nodes", "usb_devices"),
+    "process": ("processes",),
+    "configuration": ("target_config",),
+    "location": ("target_config",)
+}
+
 @dataclass
 class SafetyCheckResult:
     """안전성 검사 결과"""
@@ -44,10 +70,130 @@ class SafetyCheckResult:
     is_safe_to_proceed: bool
     timestamp: float
 
+# 알려진 플라이트 컨트롤러 제조사/모델
+FLIGHT_CONTROLLER_SIGNATURES = [
+    "pixhawk", "cube", "holybro", "ardupilot", "px4",
+    "omnibus", "kakute", "matek", "betaflight"
+]
+
+# 알려진 무선 장비 시그니처
+RADIO_SIGNATURES = [
+    "915mhz", "2.4ghz", "elrs", "crossfire", "frsky",
+    "spektrum", "futaba", "radiomaster", "horus"
+]
+
+# 실제 드론 조종 프로세스
+DANGEROUS_PROCESS_SIGNATURES = [
+    "mission_planner",
+    "apm_planner",
+    "qgroundcontrol",  # 실제 버전 (Docker가 아닌)
+    "mavproxy",        # 실제 연결
+    "dronekit",        # 실제 드론 제어
+    "px4_",            # 실제 PX4 프로세스
+]
+
+# 드론 관련 프로세스
+DRONE_PROCESS_SIGNATURES = [
+    "ardupilot", "gazebo", "sitl", "mavlink", "qgroundcontrol",
+    "docker", "container", "simulation"
+]
+
+# USB 디바이스 식별에 사용하는 sysfs 속성
+USB_SYSFS_ATTRIBUTES = ("idVendor", "idProduct", "manufacturer", "product")
+
+def compile_signature_matcher(signatures: List[str]) -> "re.Pattern":
+    """시그니처 목록을 대소문자 무시 단일 정규식으로 컴파일"""
+    return re.compile("|".join(re.escape(sig) for sig in signatures), re.IGNORECASE)
+
+FLIGHT_CONTROLLER_MATCHER = compile_signature_matcher(FLIGHT_CONTROLLER_SIGNATURES)
+RADIO_MATCHER = compile_signature_matcher(RADIO_SIGNATURES)
+DANGEROUS_PROCESS_MATCHER = compile_signature_matcher(DANGEROUS_PROCESS_SIGNATURES)
+DRONE_PROCESS_MATCHER = compile_signature_matcher(DRONE_PROCESS_SIGNATURES)
+
+def _read_text(path: str) -> str:
+    """작은 sysfs/procfs 파일 읽기 (없거나 읽을 수 없으면 빈 문자열)"""
+    try:
+        with open(path, "rb") as f:
+            return f.read().decode("utf-8", errors="replace").strip()
+    except OSError:
+        return ""
+
+def read_process_cmdlines(proc_root: str = "/proc") -> Dict[int, str]:
+    """/proc/<pid>/cmdline 직접 읽기 - ps 서브프로세스 없이 pid -> 명령줄 반환"""
+    processes = {}
+    
+    try:
+        entries = os.listdir(proc_root)
+    except OSError:
+        return processes
+    
+    for entry in entries:
+        if not entry.isdigit():
+            continue
+        
+        try:
+            with open(f"{proc_root}/{entry}/cmdline", "rb") as f:
+                raw = f.read()
+        except OSError:
+            # 조회 중 종료된 프로세스 또는 권한 없음
+            continue
+        
+        cmdline = raw.rstrip(b"\0").replace(b"\0", b" ").decode("utf-8", errors="replace")
+        if not cmdline:
+            # 커널 스레드는 명령줄이 없으므로 ps와 같이 [comm] 형식 사용
+            comm = _read_text(f"{proc_root}/{entry}/comm")
+            if not comm:
+                continue
+            cmdline = f"[{comm}]"
+        
+        processes[int(entry)] = cmdline
+    
+    return processes
+
+def read_usb_devices(sysfs_root: str = "/sys/bus/usb/devices") -> List[Dict[str, str]]:
+    """/sys/bus/usb/devices 직접 읽기 - lsusb 서브프로세스 없이 USB 디바이스 속성 반환"""
+    devices = []
+    
+    try:
+        entries = sorted(os.listdir(sysfs_root))
+    except OSError:
+        return devices
+    
+    for entry in entries:
+        # 인터페이스 항목(1-1:1.0 등)은 디바이스 속성이 없음
+        if ":" in entry:
+            continue
+        
+        attributes = {
+            name: _read_text(f"{sysfs_root}/{entry}/{name}")
+            for name in USB_SYSFS_ATTRIBUTES
+        }
+        if not attributes["idVendor"]:
+            continue
+        
+        attributes["bus_id"] = entry
+        devices.append(attributes)
+    
+    return devices
+
 class SafetyChecker:
     """DVD 안전성 검사기"""
     
-    def __init__(self):
+    def __init__(self, check_deadline: float = 5.0, probe_timeout: float = 1.0,
+                 max_concurrent_probes: int = 64, network_cache_ttl: float = 60.0):
+        # 전체 검사 마감 시간 및 개별 프로브 타임아웃 (초)
+        self.check_deadline = check_deadline
+        self.probe_timeout = probe_timeout
+        self.max_concurrent_probes = max_concurrent_probes
+        self._probe_semaphore: Optional[asyncio.Semaphore] = None
+        
+        # 지문 기반 결과 캐시 - 네트워크는 로컬 지문으로 변화를 알 수 없으므로 TTL 적용
+        self.network_cache_ttl = network_cache_ttl
+        self._cached_fingerprint: Optional[EnvironmentFingerprint] = None
+        self._cached_phases: Dict[str, Dict[str, Any]] = {}
+        self._cached_result: Optional[SafetyCheckResult] = None
+        self._network_checked_at = 0.0
+        
         self.known_simulation_networks = [
             "10.13.0.0/24",      # DVD 기본 네트워크
             "127.0.0.0/8",       # 로컬호스트
@@ -73,36 +219,51 @@ class SafetyChecker:
             "dvd-"  # DVD 프리픽스
         ]
     
-    async def comprehensive_safety_check(self, target_config: Dict[str, Any]) -> SafetyCheckResult:
-        """종합적인 안전성 검사"""
-        logger.info("종합적인 안전성 검사 시작")
+    async def comprehensive_safety_check(self, target_config: Dict[str, Any],
+                                         deadline: Optional[float] = None,
+                                         use_cache: bool = True) -> SafetyCheckResult:
+        """종합적인 안전성 검사 (단계별 동시 실행, 전체 마감 시간 적용)
+        
+        환경 지문이 이전 검사와 같으면 이전 결과를 그대로 재사용하고,
+        바뀐 경우에도 입력이 변경된 단계만 다시 실행한다.
+        """
+        timeout = self.check_deadline if deadline is None else deadline
+        
+        fingerprint = self.compute_fingerprint(target_config)
+        stale_phases = self._stale_phases(fingerprint) if use_cache else list(PHASE_INPUTS)
+        
+        if not stale_phases and self._cached_result is not None:
+            logger.debug("환경 지문 변화 없음 - 이전 안전성 검사 결과 재사용")
+            return self._cached_result
+        
+        logger.info(f"종합적인 안전성 검사 시작 (대상 단계: {', '.join(stale_phases)})")
+        
+        # 프로브 예산은 검사 한 번 동안 모든 단계가 공유
+        self._probe_semaphore = asyncio.Semaphore(self.max_concurrent_probes)
+        
+        # 1~5단계: 네트워크, 하드웨어, 프로세스, 설정, 지리적 위치
+        phase_factories = {
+            "network": lambda: self._check_network_safety(target_config),
+            "hardware": self._check_hardware_safety,
+            "process": self._check_process_safety,
+            "configuration": lambda: self._check_configuration_safety(target_config),
+            "location": lambda: self._check_location_safety(target_config)
+        }
+        fresh_results = await self._run_phases(
+            {name: phase_factories[name]() for name in stale_phases}, timeout
+        )
+        
+        phase_results = dict(self._cached_phases) if use_cache else {}
+        phase_results.update(fresh_results)
         
         detected_devices = []
         safety_violations = []
-        recommendations = []
-        
-        # 1. 네트워크 안전성 검사
-        network_result = await self._check_network_safety(target_config)
-        detected_devices.extend(network_result.get("devices", []))
-        safety_violations.extend(network_result.get("violations", []))
-        
-        # 2. 하드웨어 검사
-        hardware_result = await self._check_hardware_safety()
-        detected_devices.extend(hardware_result.get("devices", []))
-        safety_violations.extend(hardware_result.get("violations", []))
         
-        # 3. 프로세스 및 서비스 검사
-        process_result = await self._check_process_safety()
-        detected_devices.extend(process_result.get("devices", []))
-        safety_violations.extend(process_result.get("violations", []))
+        for name in PHASE_INPUTS:
+            detected_devices.extend(phase_results[name].get("devices", []))
+            safety_violations.extend(phase_results[name].get("violations", []))
         
-        # 4. 환경 변수 및 설정 검사
-        config_result = await self._check_configuration_safety(target_config)
-        safety_violations.extend(config_result.get("violations", []))
-        
-        # 5. 지리적 위치 검사 (GPS 좌표)
-        location_result = await self._check_location_safety(target_config)
-        safety_violations.extend(location_result.get("violations", []))
+        network_result = phase_results["network"]
         
         # 안전성 수준 결정
         safety_level = self._determine_safety_level(safety_violations, detected_devices)
@@ -126,9 +287,107 @@ class SafetyChecker:
             timestamp=time.time()
         )
         
+        self._update_cache(fingerprint, fresh_results, result)
+        
         logger.info(f"안전성 검사 완료: {safety_level.value}")
         return result
     
+    def compute_fingerprint(self, target_config: Dict[str, Any]) -> EnvironmentFingerprint:
+        """환경 지문 계산 (디바이스 노드, USB sysfs, 프로세스 집합, 대상 설정)"""
+        return EnvironmentFingerprint(
+            device_nodes=self._hash_listing("/dev"),
+            usb_devices=self._hash_listing("/sys/bus/usb/devices"),
+            processes=self._hash_listing("/proc", only_digits=True),
+            target_config=self._digest(json.dumps(target_config, sort_keys=True, default=str))
+        )
+    
+    def invalidate_cache(self) -> None:
+        """캐시된 안전성 검사 결과 무효화"""
+        self._cached_fingerprint = None
+        self._cached_phases = {}
+        self._cached_result = None
+        self._network_checked_at = 0.0
+    
+    def _stale_phases(self, fingerprint: EnvironmentFingerprint) -> List[str]:
+        """지문 변화 또는 캐시 누락으로 다시 실행해야 하는 단계 목록"""
+        previous = self._cached_fingerprint
+        stale = []
+        
+        for name, inputs in PHASE_INPUTS.items():
+            if name not in self._cached_phases or previous is None:
+                stale.append(name)
+            elif any(getattr(fingerprint, key) != getattr(previous, key) for key in inputs):
+                stale.append(name)
+            elif name == "network" and time.time() - self._network_checked_at > self.network_cache_ttl:
+                stale.append(name)
+        
+        return stale
+    
+    def _update_cache(self, fingerprint: EnvironmentFingerprint,
+                      fresh_results: Dict[str, Dict[str, Any]],
+                      result: SafetyCheckResult) -> None:
+        """검사 결과 캐시 갱신 - 시간 초과된 단계는 다음 검사에서 다시 실행"""
+        for name, phase_result in fresh_results.items():
+            if phase_result.get("timed_out"):
+                self._cached_phases.pop(name, None)
+            else:
+                self._cached_phases[name] = phase_result
+                if name == "network":
+                    self._network_checked_at = time.time()
+        
+        self._cached_fingerprint = fingerprint
+        self._cached_result = result
+    
+    def _hash_listing(self, directory: str, only_digits: bool = False) -> str:
+        """디렉토리 항목 목록 해시"""
+        try:
+            entries = os.listdir(directory)
+        except OSError:
+            return ""
+        
+        if only_digits:
+            entries = [entry for entry in entries if entry.isdigit()]
+        
+        return self._digest("\n".join(sorted(entries)))
+    
+    @staticmethod
+    def _digest(data: str) -> str:
+        """짧은 해시 문자열 생성"""
+        return hashlib.blake2b(data.encode("utf-8"), digest_size=8).hexdigest()
+    
+    async def _run_phases(self, phases: Dict[str, Any], timeout: float) -> Dict[str, Dict[str, Any]]:
+        """검사 단계 동시 실행 - 마감 시간 내에 끝나지 않은 단계는 취소 후 위반으로 기록"""
+        tasks = {
+            name: asyncio.ensure_future(coro) for name, coro in phases.items()
+        }
+        
+        _, pending = await asyncio.wait(tasks.values(), timeout=timeout)
+        
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        
+        results = {}
+        for name, task in tasks.items():
+            if task in pending:
+                logger.warning(f"안전성 검사 단계 시간 초과: {name} ({timeout:.1f}초)")
+                results[name] = {
+                    "devices": [],
+                    "violations": [f"안전성 검사 시간 초과: {name}"],
+                    "timed_out": True
+                }
+            elif task.exception() is not None:
+                logger.error(f"안전성 검사 단계 오류 {name}: {task.exception()}")
+                results[name] = {
+                    "devices": [],
+                    "violations": [f"{name} 검사 오류: {task.exception()}"]
+                }
+            else:
+                results[name] = task.result()
+        
+        return results
+    
     async def _check_network_safety(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """네트워크 안전성 검사"""
         devices = []
@@ -136,6 +395,7 @@ class SafetyChecker:
         
         target_host = config.get("host", "localhost")
         target_network = config.get("dvd_network", "10.13.0.0/24")
+        is_simulation_network = False
         
         try:
             # 대상 네트워크가 알려진 시뮬레이션 네트워크인지 확인
@@ -147,17 +407,20 @@ class SafetyChecker:
             if not is_simulation_network:
                 violations.append(f"알 수 없는 네트워크: {target_network}")
             
-            # 네트워크 스캔
-            network_devices = await self._scan_network(target_network)
+            # 네트워크 스캔과 인터넷 접근 확인을 동시에 수행
+            network_devices, internet_accessible = await asyncio.gather(
+                self._scan_network(target_network),
+                self._check_internet_access(target_host)
+            )
             devices.extend(network_devices)
             
             # 실제 드론 하드웨어 시그니처 확인
             for device in network_devices:
                 if self._is_real_drone_hardware(device):
-                    violations.append(f"실제 드론 하드웨어 감지: {device}")
+                    violations.append(f"실제 드론 하드웨어 감지: {self._device_identity(device)}")
             
             # 인터넷 접근 가능성 확인
-            if await self._check_internet_access(target_host):
+            if internet_accessible:
                 violations.append("인터넷 접근 가능 - 실제 네트워크 환경")
             
         except Exception as e:
@@ -191,10 +454,11 @@ class SafetyChecker:
                 str(network_obj.network_address + 4),  # 플라이트 컨트롤러
             ]
             
-            for host_ip in key_hosts:
-                device_info = await self._probe_host(host_ip)
-                if device_info:
-                    devices.append(device_info)
+            # 주요 호스트 동시 조사
+            probe_results = await asyncio.gather(
+                *(self._probe_host(host_ip) for host_ip in key_hosts)
+            )
+            devices.extend(device_info for device_info in probe_results if device_info)
         
         except Exception as e:
             logger.error(f"네트워크 스캔 오류: {e}")
@@ -228,24 +492,34 @@ class SafetyChecker:
             return None
     
     async def _scan_ports(self, host: str, ports: List[int]) -> List[int]:
-        """포트 스캔"""
-        open_ports = []
-        
-        for port in ports:
-            try:
-                # 비동기 포트 연결 테스트
-                _, writer = await asyncio.wait_for(
-                    asyncio.open_connection(host, port),
-                    timeout=2
-                )
-                writer.close()
-                await writer.wait_closed()
-                open_ports.append(port)
-                
-            except Exception:
-                continue
-        
-        return open_ports
+        """포트 스캔 (동시 프로브, 공유 예산 적용)"""
+        results = await asyncio.gather(
+            *(self._probe_port(host, port) for port in ports)
+        )
+        return [port for port, is_open in zip(ports, results) if is_open]
+    
+    async def _probe_port(self, host: str, port: int, timeout: Optional[float] = None) -> bool:
+        """단일 TCP 포트 연결 테스트"""
+        if self._probe_semaphore is None:
+            self._probe_semaphore = asyncio.Semaphore(self.max_concurrent_probes)
+        
+        span = (METRICS.span("dvd_scanner_probe_seconds", "포트 프로브 시간", scanner="safety_checker")
+                if METRICS is not None else nullcontext())
+        
+        async with self._probe_semaphore:
+            with span:
+                try:
+                    # 비동기 포트 연결 테스트
+                    _, writer = await asyncio.wait_for(
+                        asyncio.open_connection(host, port),
+                        timeout=self.probe_timeout if timeout is None else timeout
+                    )
+                    writer.close()
+                    await writer.wait_closed()
+                    return True
+                    
+                except Exception:
+                    return False
     
     async def _identify_services(self, host: str, ports: List[int]) -> List[str]:
         """서비스 식별"""
@@ -287,17 +561,8 @@ class SafetyChecker:
     
     async def _check_internet_access(self, host: str) -> bool:
         """인터넷 접근 가능성 확인"""
-        try:
-            # 외부 DNS 서버 연결 테스트
-            _, writer = await asyncio.wait_for(
-                asyncio.open_connection("8.8.8.8", 53),
-                timeout=3
-            )
-            writer.close()
-            await writer.wait_closed()
-            return True
-        except Exception:
-            return False
+        # 외부 DNS 서버 연결 테스트
+        return await self._probe_port("8.8.8.8", 53)
     
     async def _check_hardware_safety(self) -> Dict[str, Any]:
         """하드웨어 안전성 검사"""
@@ -305,20 +570,20 @@ class SafetyChecker:
         violations = []
         
         try:
-            # USB 디바이스 검사
-            usb_devices = await self._check_usb_devices()
+            # USB 디바이스 및 시리얼 포트 동시 검사
+            usb_devices, serial_devices = await asyncio.gather(
+                self._check_usb_devices(),
+                self._check_serial_devices()
+            )
             devices.extend(usb_devices)
-            
-            # 시리얼 포트 검사
-            serial_devices = await self._check_serial_devices()
             devices.extend(serial_devices)
             
             # 실제 하드웨어 감지
             for device in devices:
                 if self._is_flight_controller_hardware(device):
-                    violations.append(f"실제 플라이트 컨트롤러 감지: {device}")
+                    violations.append(f"실제 플라이트 컨트롤러 감지: {self._device_identity(device)}")
                 elif self._is_radio_hardware(device):
-                    violations.append(f"실제 무선 장비 감지: {device}")
+                    violations.append(f"실제 무선 장비 감지: {self._device_identity(device)}")
         
         except Exception as e:
             logger.error(f"하드웨어 안전성 검사 오류: {e}")
@@ -326,22 +591,24 @@ class SafetyChecker:
         return {"devices": devices, "violations": violations}
     
     async def _check_usb_devices(self) -> List[Dict[str, Any]]:
-        """USB 디바이스 검사"""
+        """USB 디바이스 검사 (sysfs 직접 조회)"""
         devices = []
         
         try:
-            result = subprocess.run(
-                ["lsusb"], capture_output=True, text=True, timeout=5
+            # 파일 읽기는 한 번에 묶어서 이벤트 루프 밖에서 실행
+            usb_devices = await asyncio.get_event_loop().run_in_executor(
+                None, read_usb_devices
             )
             
-            if result.returncode == 0:
-                for line in result.stdout.split('\n'):
-                    if line.strip():
-                        devices.append({
-                            "type": "usb",
-                            "info": line.strip(),
-                            "timestamp": time.time()
-                        })
+            for usb in usb_devices:
+                # lsusb와 같은 형식의 식별 문자열
+                info = f"ID {usb['idVendor']}:{usb['idProduct']} {usb['manufacturer']} {usb['product']}"
+                devices.append({
+                    "type": "usb",
+                    "info": info.strip(),
+                    "bus_id": usb["bus_id"],
+                    "timestamp": time.time()
+                })
         
         except Exception as e:
             logger.debug(f"USB 디바이스 검사 오류: {e}")
@@ -374,29 +641,22 @@ class SafetyChecker:
         
         return devices
     
+    @staticmethod
+    def _device_identity(device: Dict[str, Any]) -> str:
+        """위반 사항에 쓰는 디바이스 식별 문자열 (검사 시각 제외 - 재검사에서 같은 디바이스는 같은 문자열)"""
+        if device.get("type") == "usb":
+            return f"{device['info']} (USB {device['bus_id']})"
+        if "ip" in device:
+            return f"{device['ip']} ({', '.join(device.get('services', []))})"
+        return str(device.get("device") or device.get("name") or device)
+    
     def _is_flight_controller_hardware(self, device: Dict[str, Any]) -> bool:
         """플라이트 컨트롤러 하드웨어 여부 확인"""
-        info = device.get("info", "").lower()
-        
-        # 알려진 플라이트 컨트롤러 제조사/모델
-        flight_controller_signatures = [
-            "pixhawk", "cube", "holybro", "ardupilot", "px4",
-            "omnibus", "kakute", "matek", "betaflight"
-        ]
-        
-        return any(sig in info for sig in flight_controller_signatures)
+        return FLIGHT_CONTROLLER_MATCHER.search(device.get("info", "")) is not None
     
     def _is_radio_hardware(self, device: Dict[str, Any]) -> bool:
         """무선 장비 여부 확인"""
-        info = device.get("info", "").lower()
-        
-        # 알려진 무선 장비 시그니처
-        radio_signatures = [
-            "915mhz", "2.4ghz", "elrs", "crossfire", "frsky",
-            "spektrum", "futaba", "radiomaster", "horus"
-        ]
-        
-        return any(sig in info for sig in radio_signatures)
+        return RADIO_MATCHER.search(device.get("info", "")) is not None
     
     async def _check_process_safety(self) -> Dict[str, Any]:
         """프로세스 안전성 검사"""
@@ -426,21 +686,14 @@ class SafetyChecker:
         return {"devices": devices, "violations": violations}
     
     async def _get_running_processes(self) -> List[str]:
-        """실행 중인 프로세스 목록"""
+        """실행 중인 프로세스 목록 (/proc 직접 조회)"""
         processes = []
         
         try:
-            result = subprocess.run(
-                ["ps", "aux"], capture_output=True, text=True, timeout=5
+            cmdlines = await asyncio.get_event_loop().run_in_executor(
+                None, read_process_cmdlines
             )
-            
-            if result.returncode == 0:
-                for line in result.stdout.split('\n')[1:]:  # 헤더 제외
-                    if line.strip():
-                        parts = line.split()
-                        if len(parts) >= 11:
-                            process_name = ' '.join(parts[10:])
-                            processes.append(process_name)
+            processes = list(cmdlines.values())
         
         except Exception as e:
             logger.debug(f"프로세스 목록 조회 오류: {e}")
@@ -449,30 +702,11 @@ class SafetyChecker:
     
     def _is_dangerous_process(self, process: str) -> bool:
         """위험한 프로세스 여부 확인"""
-        process_lower = process.lower()
-        
-        # 실제 드론 조종 프로세스
-        dangerous_processes = [
-            "mission_planner",
-            "apm_planner",
-            "qgroundcontrol",  # 실제 버전 (Docker가 아닌)
-            "mavproxy",        # 실제 연결
-            "dronekit",        # 실제 드론 제어
-            "px4_",            # 실제 PX4 프로세스
-        ]
-        
-        return any(dangerous in process_lower for dangerous in dangerous_processes)
+        return DANGEROUS_PROCESS_MATCHER.search(process) is not None
     
     def _is_drone_process(self, process: str) -> bool:
         """드론 관련 프로세스 여부 확인"""
-        process_lower = process.lower()
-        
-        drone_processes = [
-            "ardupilot", "gazebo", "sitl", "mavlink", "qgroundcontrol",
-            "docker", "container", "simulation"
-        ]
-        
-        return any(drone in process_lower for drone in drone_processes)
+        return DRONE_PROCESS_MATCHER.search(process) is not None
     
     async def _check_configuration_safety(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """설정 안전성 검사"""
@@ -0,0 +1,348 @@
+# dvd_connector/watchdog.py
+"""
+DVD 안전성 감시기
+실험 실행 중 환경 변화(하드웨어 연결, 위험 프로세스, 네트워크 변화)를 감지
+"""
+
+import asyncio
+import ctypes
+import ctypes.util
+import logging
+import os
+import struct
+import time
+from typing import Dict, List, Any, Optional, Callable, Set
+from dataclasses import dataclass, field
+from enum import Enum
+
+from .safety_checker import (
+    SafetyChecker, DANGEROUS_PROCESS_MATCHER, FLIGHT_CONTROLLER_MATCHER, RADIO_MATCHER,
+    read_usb_devices
+)
+
+# 가상 시간 루프 지원 (dvd_lite 사용 가능 시)
+try:
+    from dvd_lite.clock import ignore_for_virtual_time
+except ImportError:
+    ignore_for_virtual_time = None
+
+logger = logging.getLogger(__name__)
+
+# inotify 상수 (linux/inotify.h)
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = 0o2000000
+INOTIFY_EVENT_HEADER = struct.Struct("iIII")
+
+# 감시 대상 시리얼 디바이스 노드 접두사
+SERIAL_DEVICE_PREFIXES = ("ttyUSB", "ttyACM")
+
+class WatchdogEventType(Enum):
+    """감시 이벤트 타입"""
+    SERIAL_DEVICE_ADDED = "serial_device_added"
+    HARDWARE_DETECTED = "hardware_detected"
+    DANGEROUS_PROCESS = "dangerous_process"
+    NETWORK_CHANGED = "network_changed"
+
+@dataclass
+class WatchdogEvent:
+    """감시 이벤트"""
+    event_type: WatchdogEventType
+    message: str
+    details: Dict[str, Any] = field(default_factory=dict)
+    timestamp: float = field(default_factory=time.time)
+
+class SafetyWatchdog:
+    """실행 중 안전성 감시기
+
+    전체 안전성 검사를 주기적으로 반복하지 않고 변화분만 확인한다.
+    - /dev: inotify (사용 불가 시 디렉토리 목록 폴링)
+    - /proc: pid 집합 폴링, 새 프로세스의 명령줄만 읽음
+    - 네트워크: 주요 호스트 포트 상태의 주기적 차분
+    """
+
+    def __init__(self, checker: Optional[SafetyChecker] = None,
+                 target_config: Optional[Dict[str, Any]] = None,
+                 process_poll_interval: float = 0.5,
+                 device_poll_interval: float = 1.0,
+                 network_interval: float = 30.0,
+                 dev_path: str = "/dev",
+                 proc_root: str = "/proc",
+                 usb_sysfs_root: str = "/sys/bus/usb/devices"):
+        self.checker = checker or SafetyChecker()
+        self.target_config = target_config or {}
+        self.process_poll_interval = process_poll_interval
+        self.device_poll_interval = device_poll_interval
+        self.network_interval = network_interval
+        self.dev_path = dev_path
+        self.proc_root = proc_root
+        self.usb_sysfs_root = usb_sysfs_root
+
+        self.is_running = False
+        self.tripped = asyncio.Event()
+        self.events: List[WatchdogEvent] = []
+        self.statistics = {
+            "process_polls": 0,
+            "device_scans": 0,
+            "network_scans": 0,
+            "events": 0,
+            "inotify_enabled": False
+        }
+
+        self._listeners: List[Callable[[WatchdogEvent], Any]] = []
+        self._tasks: List[asyncio.Task] = []
+        self._inotify_fd: Optional[int] = None
+        self._known_pids: Set[int] = set()
+        self._known_nodes: Set[str] = set()
+        self._known_usb: Set[str] = set()
+        self._known_drone_hosts: Set[str] = set()
+
+    def add_listener(self, callback: Callable[[WatchdogEvent], Any]) -> None:
+        """이벤트 리스너 등록 - 동기 함수는 감지 즉시 호출, 코루틴은 태스크로 실행"""
+        self._listeners.append(callback)
+
+    async def start(self) -> None:
+        """감시 시작 (현재 환경을 기준선으로 사용)"""
+        if self.is_running:
+            return
+
+        self.is_running = True
+        self.tripped.clear()
+
+        loop = asyncio.get_event_loop()
+        self._known_pids = set(await loop.run_in_executor(None, self._list_pids))
+        self._known_nodes = set(self._list_device_nodes())
+        self._known_usb = {usb["bus_id"] for usb in read_usb_devices(self.usb_sysfs_root)}
+
+        self._inotify_fd = self._open_inotify(self.dev_path)
+        if self._inotify_fd is not None:
+            loop.add_reader(self._inotify_fd, self._on_inotify_readable)
+            if ignore_for_virtual_time is not None:
+                # 감시 fd는 실행 내내 등록되어 있으므로 가상 시계를 붙잡지 않도록 제외
+                ignore_for_virtual_time(self._inotify_fd)
+            self.statistics["inotify_enabled"] = True
+        else:
+            self._tasks.append(asyncio.ensure_future(self._poll_devices()))
+
+        self._tasks.append(asyncio.ensure_future(self._poll_processes()))
+        if self.network_interval > 0:
+            self._known_drone_hosts = await self._scan_drone_hosts()
+            self._tasks.append(asyncio.ensure_future(self._poll_network()))
+
+        logger.info(f"안전성 감시 시작 (inotify: {self.statistics['inotify_enabled']})")
+
+    async def stop(self) -> None:
+        """감시 중지"""
+        self.is_running = False
+
+        if self._inotify_fd is not None:
+            asyncio.get_event_loop().remove_reader(self._inotify_fd)
+            os.close(self._inotify_fd)
+            self._inotify_fd = None
+
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+        logger.info("안전성 감시 중지")
+
+    def _emit(self, event: WatchdogEvent) -> None:
+        """이벤트 기록 및 리스너 통지"""
+        self.events.append(event)
+        self.statistics["events"] += 1
+        self.tripped.set()
+        logger.warning(f"안전성 감시 이벤트: {event.message}")
+
+        for listener in self._listeners:
+            try:
+                outcome = listener(event)
+                if asyncio.iscoroutine(outcome):
+                    asyncio.ensure_future(outcome)
+            except Exception as e:
+                logger.error(f"감시 이벤트 리스너 오류: {e}")
+
+    # -------------------------------------------------------------------------
+    # 디바이스 감시
+    # -------------------------------------------------------------------------
+
+    def _open_inotify(self, path: str) -> Optional[int]:
+        """inotify 디스크립터 생성 (리눅스 외 환경에서는 None)"""
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+            if fd < 0:
+                return None
+
+            if libc.inotify_add_watch(fd, path.encode(), IN_CREATE | IN_DELETE) < 0:
+                os.close(fd)
+                return None
+
+            return fd
+        except (OSError, AttributeError) as e:
+            logger.debug(f"inotify 사용 불가: {e}")
+            return None
+
+    def _on_inotify_readable(self) -> None:
+        """inotify 이벤트 처리"""
+        try:
+            data = os.read(self._inotify_fd, 4096)
+        except BlockingIOError:
+            return
+        except OSError as e:
+            logger.debug(f"inotify 읽기 오류: {e}")
+            return
+
+        created = []
+        removed = []
+        offset = 0
+        while offset + INOTIFY_EVENT_HEADER.size <= len(data):
+            _, mask, _, name_len = INOTIFY_EVENT_HEADER.unpack_from(data, offset)
+            offset += INOTIFY_EVENT_HEADER.size
+            name = data[offset:offset + name_len].rstrip(b"\0").decode("utf-8", errors="replace")
+            offset += name_len
+
+            if mask & IN_CREATE:
+                created.append(name)
+            elif mask & IN_DELETE:
+                removed.append(name)
+
+        self._handle_removed_nodes(removed)
+        self._handle_new_nodes(created)
+
+    async def _poll_devices(self) -> None:
+        """inotify를 쓸 수 없는 경우 /dev 목록 폴링"""
+        while self.is_running:
+            await asyncio.sleep(self.device_poll_interval)
+            nodes = set(self._list_device_nodes())
+            self._handle_removed_nodes(sorted(self._known_nodes - nodes))
+            self._handle_new_nodes(sorted(nodes - self._known_nodes))
+            self._known_nodes = nodes
+
+    def _handle_new_nodes(self, names: List[str]) -> None:
+        """새 디바이스 노드 처리 - 시리얼 노드 및 USB 변화 확인"""
+        if not names:
+            return
+
+        self.statistics["device_scans"] += 1
+        self._known_nodes.update(names)
+
+        for name in names:
+            if name.startswith(SERIAL_DEVICE_PREFIXES):
+                self._emit(WatchdogEvent(
+                    event_type=WatchdogEventType.SERIAL_DEVICE_ADDED,
+                    message=f"시리얼 디바이스 연결 감지: {self.dev_path}/{name}",
+                    details={"device": f"{self.dev_path}/{name}"}
+                ))
+
+        # 새 노드가 생기면 USB 디바이스 목록도 차분 확인 (기준 목록은 현재 목록으로 다시 만듦)
+        devices = read_usb_devices(self.usb_sysfs_root)
+        known_usb, self._known_usb = self._known_usb, {usb["bus_id"] for usb in devices}
+        for usb in devices:
+            if usb["bus_id"] in known_usb:
+                continue
+
+            info = f"ID {usb['idVendor']}:{usb['idProduct']} {usb['manufacturer']} {usb['product']}"
+            if FLIGHT_CONTROLLER_MATCHER.search(info) or RADIO_MATCHER.search(info):
+                self._emit(WatchdogEvent(
+                    event_type=WatchdogEventType.HARDWARE_DETECTED,
+                    message=f"실제 드론 하드웨어 연결 감지: {info.strip()}",
+                    details=usb
+                ))
+
+    def _handle_removed_nodes(self, names: List[str]) -> None:
+        """사라진 디바이스 노드 처리 - 뽑힌 USB 디바이스를 잊어 같은 bus_id로 다시 꽂아도 감지"""
+        if not names:
+            return
+
+        self._known_nodes.difference_update(names)
+        self._known_usb &= {usb["bus_id"] for usb in read_usb_devices(self.usb_sysfs_root)}
+
+    def _list_device_nodes(self) -> List[str]:
+        """디바이스 노드 목록"""
+        try:
+            return os.listdir(self.dev_path)
+        except OSError:
+            return []
+
+    # -------------------------------------------------------------------------
+    # 프로세스 감시
+    # -------------------------------------------------------------------------
+
+    async def _poll_processes(self) -> None:
+        """pid 집합 폴링 - 새로 생긴 프로세스의 명령줄만 확인"""
+        while self.is_running:
+            await asyncio.sleep(self.process_poll_interval)
+            self.check_processes()
+
+    def check_processes(self) -> None:
+        """새 프로세스 확인 (한 번)"""
+        self.statistics["process_polls"] += 1
+        pids = set(self._list_pids())
+        new_pids = pids - self._known_pids
+        self._known_pids = pids
+
+        for pid in new_pids:
+            try:
+                with open(f"{self.proc_root}/{pid}/cmdline", "rb") as f:
+                    cmdline = f.read().rstrip(b"\0").replace(b"\0", b" ").decode("utf-8", errors="replace")
+            except OSError:
+                continue
+
+            if DANGEROUS_PROCESS_MATCHER.search(cmdline):
+                self._emit(WatchdogEvent(
+                    event_type=WatchdogEventType.DANGEROUS_PROCESS,
+                    message=f"위험한 프로세스 감지: {cmdline}",
+                    details={"pid": pid, "cmdline": cmdline}
+                ))
+
+    def _list_pids(self) -> List[int]:
+        """현재 pid 목록"""
+        try:
+            return [int(entry) for entry in os.listdir(self.proc_root) if entry.isdigit()]
+        except OSError:
+            return []
+
+    # -------------------------------------------------------------------------
+    # 네트워크 감시
+    # -------------------------------------------------------------------------
+
+    async def _poll_network(self) -> None:
+        """주요 호스트 포트 상태의 주기적 차분"""
+        while self.is_running:
+            await asyncio.sleep(self.network_interval)
+            await self.check_network()
+
+    async def check_network(self) -> None:
+        """네트워크 차분 확인 (한 번)"""
+        drone_hosts = await self._scan_drone_hosts()
+
+        for ip in sorted(drone_hosts - self._known_drone_hosts):
+            self._emit(WatchdogEvent(
+                event_type=WatchdogEventType.NETWORK_CHANGED,
+                message=f"실제 드론 하드웨어 네트워크 서비스 감지: {ip}",
+                details={"ip": ip}
+            ))
+
+        self._known_drone_hosts = drone_hosts
+
+    async def _scan_drone_hosts(self) -> Set[str]:
+        """실제 드론 하드웨어 서비스 조합을 보이는 호스트 집합"""
+        self.statistics["network_scans"] += 1
+        network = self.target_config.get("dvd_network", "10.13.0.0/24")
+
+        try:
+            devices = await self.checker._scan_network(network)
+        except Exception as e:
+            logger.debug(f"네트워크 감시 오류: {e}")
+            return set(self._known_drone_hosts)
+
+        return {
+            device["ip"] for device in devices
+            if self.checker._is_real_drone_hardware(device)
+        }
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """감시 통계 반환"""
+        return dict(self.statistics, tripped=self.tripped.is_set())
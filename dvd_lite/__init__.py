@@ -11,6 +11,13 @@ __description__ = "경량화된 드론 보안 테스트 프레임워크"
 # 메인 클래스들 import (CTI 제외)
 try:
     from .main import DVDLite, BaseAttack, AttackResult, AttackType, AttackStatus
+    from .rng import ExperimentRNG
+    from .profiling import ProfilingConfig, ProfileSession
+    from .bus import ResultBus, OverflowPolicy
+    from .fanout import TargetContext, TargetPool, FanoutReport
+    from .cpu_lane import CPULane, cpu_stage
+    from .recon_cache import ReconCache
+    from .telemetry_store import TelemetryStore, TelemetryReader
     
     # 기본 공격 모듈들 import (선택적)
     try:
@@ -65,6 +72,19 @@ except ImportError as e:
     AttackResult = None
     AttackType = None
     AttackStatus = None
+    ExperimentRNG = None
+    ProfilingConfig = None
+    ProfileSession = None
+    ResultBus = None
+    OverflowPolicy = None
+    TargetContext = None
+    TargetPool = None
+    FanoutReport = None
+    CPULane = None
+    cpu_stage = None
+    ReconCache = None
+    TelemetryStore = None
+    TelemetryReader = None
     BASIC_ATTACKS_AVAILABLE = False
     DVD_ATTACKS_AVAILABLE = False
 
@@ -94,6 +114,19 @@ __all__ = [
     "AttackResult",
     "AttackType",
     "AttackStatus",
+    "ExperimentRNG",
+    "ProfilingConfig",
+    "ProfileSession",
+    "ResultBus",
+    "OverflowPolicy",
+    "TargetContext",
+    "TargetPool",
+    "FanoutReport",
+    "CPULane",
+    "cpu_stage",
+    "ReconCache",
+    "TelemetryStore",
+    "TelemetryReader",
     
     # 기본 공격 모듈들
     "register_all_attacks",
@@ -5,11 +5,16 @@ DVD-Lite 공격 모듈들
 """
 
 import asyncio
-import random
-import time
+import os
 from typing import Tuple, List, Dict, Any
 
 from .main import BaseAttack, AttackType
+from . import mavlink
+from .clock import now
+from .dvd_attacks.protocol_tampering.gps_trajectory import SpoofProfile, TrajectoryGenerator, NUMPY_AVAILABLE
+from .dvd_attacks.injection.mission_engine import generate_waypoints
+from .dvd_attacks.injection.param_engine import ParameterEngine, ParamTransferError
+from .dvd_attacks.exfiltration.dataflash import parse_log_file, artifact_iocs, DataFlashError
 
 # =============================================================================
 # 정찰 공격들
@@ -26,10 +31,10 @@ class WiFiScan(BaseAttack):
         await asyncio.sleep(1.5)
         
         networks = ["Drone_WiFi", "DroneControl", "UAV_Network", "Companion_AP"]
-        found_networks = random.sample(networks, k=random.randint(1, 3))
+        found_networks = self.random.sample(networks, k=self.random.randint(1, 3))
         
         iocs = [f"SSID:{network}" for network in found_networks]
-        success = "Drone_WiFi" in found_networks or random.random() > 0.3
+        success = "Drone_WiFi" in found_networks or self.random.random() > 0.3
         
         details = {
             "found_networks": found_networks,
@@ -53,7 +58,7 @@ class DroneDiscovery(BaseAttack):
         mavlink_hosts = []
         
         for host in hosts:
-            if random.random() > 0.6:
+            if self.random.random() > 0.6:
                 mavlink_hosts.append(host)
         
         iocs = [f"MAVLINK_HOST:{host}" for host in mavlink_hosts]
@@ -83,14 +88,14 @@ class PacketSniff(BaseAttack):
             "MISSION_CURRENT", "RC_CHANNELS", "SERVO_OUTPUT_RAW"
         ]
         
-        captured = random.sample(mavlink_messages, k=random.randint(2, 5))
+        captured = self.random.sample(mavlink_messages, k=self.random.randint(2, 5))
         iocs = [f"MAVLINK_MSG:{msg}" for msg in captured]
         success = len(captured) >= 3
         
         details = {
             "captured_messages": captured,
             "capture_duration": 3.0,
-            "total_packets": random.randint(50, 200),
+            "total_packets": self.random.randint(50, 200),
             "success_rate": 0.7 if success else 0.3
         }
         
@@ -103,14 +108,28 @@ class TelemetrySpoof(BaseAttack):
         return AttackType.PROTOCOL_TAMPERING
     
     async def _run_attack(self) -> Tuple[bool, List[str], Dict[str, Any]]:
-        """가짜 텔레메트리 데이터 주입"""
+        """가짜 텔레메트리 데이터 주입 (numpy가 있으면 GPS는 표류 궤적 전체를 GPS_RAW_INT로 인코딩)"""
         await asyncio.sleep(2.5)
         
+        trajectory_details = {}
+        if NUMPY_AVAILABLE:
+            profile = SpoofProfile(mode="drift", duration=self.config.get("duration", 30.0),
+                                   drift_speed=self.random.uniform(1.0, 5.0),
+                                   drift_bearing=self.random.uniform(0.0, 360.0))
+            track = TrajectoryGenerator(37.7749, -122.4194).generate(profile, start_time=now())
+            frames = track.encode("GPS_RAW_INT")
+            trajectory = track.summary()
+            gps_lat, gps_lon = trajectory["final_position"]
+            trajectory_details = {"trajectory": trajectory, "spoofed_frames": len(frames)}
+        else:
+            gps_lat = 37.7749 + self.random.uniform(-0.01, 0.01)
+            gps_lon = -122.4194 + self.random.uniform(-0.01, 0.01)
+        
         fake_data = {
-            "gps_lat": 37.7749 + random.uniform(-0.01, 0.01),
-            "gps_lon": -122.4194 + random.uniform(-0.01, 0.01),
-            "altitude": random.randint(50, 150),
-            "battery": random.randint(20, 80)
+            "gps_lat": gps_lat,
+            "gps_lon": gps_lon,
+            "altitude": self.random.randint(50, 150),
+            "battery": self.random.randint(20, 80)
         }
         
         iocs = [
@@ -119,10 +138,11 @@ class TelemetrySpoof(BaseAttack):
             f"FAKE_BATTERY:{fake_data['battery']}"
         ]
         
-        success = random.random() > 0.4
+        success = self.random.random() > 0.4
         
         details = {
             "spoofed_data": fake_data,
+            **trajectory_details,
             "injection_method": "MAVLink",
             "success_rate": 0.6 if success else 0.0
         }
@@ -140,10 +160,10 @@ class CommandInject(BaseAttack):
         await asyncio.sleep(1.8)
         
         commands = ["ARM_DISARM", "SET_MODE", "NAV_LAND", "DO_SET_SERVO"]
-        injected_cmd = random.choice(commands)
+        injected_cmd = self.random.choice(commands)
         
         iocs = [f"COMMAND_INJECTED:{injected_cmd}"]
-        success = random.random() > 0.5
+        success = self.random.random() > 0.5
         
         details = {
             "injected_command": injected_cmd,
@@ -161,20 +181,27 @@ class WaypointInject(BaseAttack):
         return AttackType.INJECTION
     
     async def _run_attack(self) -> Tuple[bool, List[str], Dict[str, Any]]:
-        """악성 웨이포인트 주입"""
+        """악성 웨이포인트 주입 (numpy가 있으면 현재 위치에서 악성 지점까지 이어지는 우회 미션 생성)"""
         await asyncio.sleep(2.2)
         
         malicious_waypoint = {
-            "lat": 37.7749 + random.uniform(-0.1, 0.1),
-            "lon": -122.4194 + random.uniform(-0.1, 0.1),
-            "alt": random.randint(10, 200)
+            "lat": 37.7749 + self.random.uniform(-0.1, 0.1),
+            "lon": -122.4194 + self.random.uniform(-0.1, 0.1),
+            "alt": self.random.randint(10, 200)
         }
+        mission_items = self.config.get("waypoint_count", 10)
+        if NUMPY_AVAILABLE:
+            divert_mission = generate_waypoints("line", 37.7749, -122.4194, count=mission_items,
+                                                altitude=malicious_waypoint["alt"],
+                                                target=(malicious_waypoint["lat"], malicious_waypoint["lon"]))
+            mission_items = len(divert_mission["seq"])
         
         iocs = [f"WAYPOINT_INJECTED:{malicious_waypoint['lat']:.6f},{malicious_waypoint['lon']:.6f},{malicious_waypoint['alt']}"]
-        success = random.random() > 0.6
+        success = self.random.random() > 0.6
         
         details = {
             "malicious_waypoint": malicious_waypoint,
+            "mission_items": mission_items,
             "mission_cleared": success,
             "success_rate": 0.4 if success else 0.0
         }
@@ -188,11 +215,14 @@ class LogExtract(BaseAttack):
         return AttackType.EXFILTRATION
     
     async def _run_attack(self) -> Tuple[bool, List[str], Dict[str, Any]]:
-        """비행 로그 추출"""
+        """비행 로그 추출 (log_path가 있으면 DataFlash 로그를 파싱해 추출물을 IOC로 남김)"""
+        if self.config.get("log_path"):
+            return await self._parse_log(self.config["log_path"])
+        
         await asyncio.sleep(3.5)
         
         log_files = ["flight_log_001.bin", "flight_log_002.bin", "parameters.txt", "waypoints.log"]
-        extracted = random.sample(log_files, k=random.randint(1, 3))
+        extracted = self.random.sample(log_files, k=self.random.randint(1, 3))
         
         iocs = [f"LOG_EXTRACTED:{log}" for log in extracted]
         success = len(extracted) >= 2
@@ -200,11 +230,27 @@ class LogExtract(BaseAttack):
         details = {
             "extracted_files": extracted,
             "access_method": "FTP",
-            "file_sizes": {log: random.randint(1024, 10240) for log in extracted},
+            "file_sizes": {log: self.random.randint(1024, 10240) for log in extracted},
             "success_rate": 0.6 if success else 0.2
         }
         
         return success, iocs, details
+    
+    async def _parse_log(self, path: str) -> Tuple[bool, List[str], Dict[str, Any]]:
+        """DataFlash 로그 파싱 (CPU 작업 레인)"""
+        name = os.path.basename(path)
+        try:
+            artifacts = await self.run_cpu(parse_log_file, path)
+        except (OSError, DataFlashError) as e:
+            return False, [], {"error": str(e), "success_rate": 0.0}
+        
+        details = {
+            "extracted_files": [name],
+            "artifacts": artifacts,
+            "access_method": "DataFlash",
+            "success_rate": 1.0 if "gps" in artifacts else 0.5
+        }
+        return True, artifact_iocs(name, artifacts), details
 
 class ParamExtract(BaseAttack):
     """파라미터 추출 공격"""
@@ -213,7 +259,10 @@ class ParamExtract(BaseAttack):
         return AttackType.EXFILTRATION
     
     async def _run_attack(self) -> Tuple[bool, List[str], Dict[str, Any]]:
-        """시스템 파라미터 추출"""
+        """시스템 파라미터 추출 (live=True면 ParameterEngine으로 전체 덤프)"""
+        if self.config.get("live"):
+            return await self._dump_parameters()
+        
         await asyncio.sleep(2.8)
         
         parameters = {
@@ -224,7 +273,7 @@ class ParamExtract(BaseAttack):
             "GPS_TYPE": 1
         }
         
-        extracted_params = dict(random.sample(list(parameters.items()), k=random.randint(2, 4)))
+        extracted_params = dict(self.random.sample(list(parameters.items()), k=self.random.randint(2, 4)))
         iocs = [f"PARAM_EXTRACTED:{param}={value}" for param, value in extracted_params.items()]
         success = len(extracted_params) >= 3
         
@@ -236,6 +285,35 @@ class ParamExtract(BaseAttack):
         }
         
         return success, iocs, details
+    
+    async def _dump_parameters(self) -> Tuple[bool, List[str], Dict[str, Any]]:
+        """PARAM_REQUEST_LIST 덤프 + 누락 인덱스 재요청"""
+        target = (self.target_ip, self.config.get("mavlink_port", 14550))
+        async with await mavlink.MAVLinkClient.connect(target) as client:
+            engine = ParameterEngine(client, window=self.config.get("window", 16),
+                                     timeout=self.config.get("timeout", 0.5))
+            try:
+                snapshot, report = await engine.fetch_all()
+            except ParamTransferError as e:
+                return False, [], {"error": str(e), "success_rate": 0.0}
+        
+        if self.config.get("snapshot_path"):
+            snapshot.save(self.config["snapshot_path"])
+        
+        parameters = snapshot.to_dict()
+        interesting = [name for name in ("BATT_CAPACITY", "FENCE_ENABLE", "RTL_ALT", "ARMING_CHECK", "GPS_TYPE")
+                       if name in parameters]
+        iocs = [f"PARAM_EXTRACTED:{name}={parameters[name]:g}" for name in interesting]
+        iocs.append(f"PARAM_DUMP:{self.target_ip}:{len(parameters)}_params")
+        
+        details = {
+            "extracted_parameters": {name: parameters[name] for name in interesting},
+            "total_available": report.count,
+            "dump": report.to_dict(),
+            "extraction_method": "MAVLink PARAM_REQUEST_LIST + PARAM_REQUEST_READ",
+            "success_rate": report.received / report.count if report.count else 0.0
+        }
+        return report.missing == 0, iocs, details
 
 # =============================================================================
 # 공격 모듈 등록 함수
@@ -0,0 +1,212 @@
+# dvd_lite/bus.py
+"""
+DVD-Lite 결과 이벤트 버스
+공격 결과를 CTI/대시보드/MQTT/저장소 등 여러 소비자에게 프로세스 내부 pub/sub으로 전달
+
+구독자마다 크기가 제한된 큐와 소비 작업이 따로 있어 느린 소비자가 공격 실행이나
+다른 소비자를 지연시키지 않는다. 큐가 가득 찼을 때의 동작은 구독자별 정책으로 정한다.
+- block:       발행자가 자리가 날 때까지 대기 (유실 없음, 느린 소비자가 발행을 지연)
+- drop_newest: 새 이벤트를 버림
+- drop_oldest: 가장 오래된 이벤트를 버리고 새 이벤트를 넣음 (최신 상태가 중요한 대시보드용)
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Dict, List, Any, Optional, Callable, Awaitable
+
+from .metrics import METRICS
+
+logger = logging.getLogger(__name__)
+
+BatchHandler = Callable[[List[Any]], Awaitable[None]]
+
+class OverflowPolicy(Enum):
+    BLOCK = "block"
+    DROP_NEWEST = "drop_newest"
+    DROP_OLDEST = "drop_oldest"
+
+@dataclass
+class SubscriberStats:
+    """구독자별 처리 통계"""
+    published: int = 0
+    delivered: int = 0
+    dropped: int = 0
+    batches: int = 0
+    errors: int = 0
+    max_depth: int = 0
+    blocked_seconds: float = 0.0
+    handler_seconds: float = 0.0
+
+class Subscription:
+    """버스 구독 - handler는 이벤트 목록(배치)을 받는 코루틴 함수"""
+
+    def __init__(self, name: str, handler: BatchHandler, maxsize: int = 100,
+                 policy: OverflowPolicy = OverflowPolicy.BLOCK,
+                 batch_size: int = 1, batch_timeout: float = 0.0):
+        self.name = name
+        self.handler = handler
+        self.maxsize = max(1, maxsize)
+        self.policy = OverflowPolicy(policy)
+        self.batch_size = max(1, batch_size)
+        self.batch_timeout = batch_timeout
+        self.stats = SubscriberStats()
+        self.queue: Optional[asyncio.Queue] = None
+        self.task: Optional[asyncio.Task] = None
+
+    @property
+    def depth(self) -> int:
+        return self.queue.qsize() if self.queue is not None else 0
+
+    def _start(self) -> None:
+        self.queue = asyncio.Queue(maxsize=self.maxsize)
+        self.task = asyncio.ensure_future(self._consume())
+
+    async def _put(self, event: Any) -> None:
+        self.stats.published += 1
+
+        if self.policy is OverflowPolicy.BLOCK:
+            if self.queue.full():
+                started = time.perf_counter()
+                await self.queue.put(event)
+                blocked = time.perf_counter() - started
+                self.stats.blocked_seconds += blocked
+                METRICS.histogram("dvd_bus_publish_blocked_seconds",
+                                  "느린 구독자로 인한 발행 대기 시간").labels(subscriber=self.name).observe(blocked)
+            else:
+                self.queue.put_nowait(event)
+        elif self.queue.full():
+            if self.policy is OverflowPolicy.DROP_OLDEST:
+                self.queue.get_nowait()
+                self.queue.task_done()
+                self.queue.put_nowait(event)
+            self._record_drop()
+        else:
+            self.queue.put_nowait(event)
+
+        self.stats.max_depth = max(self.stats.max_depth, self.queue.qsize())
+        METRICS.gauge("dvd_bus_queue_depth", "구독자 큐 길이").labels(subscriber=self.name).set(self.queue.qsize())
+
+    def _record_drop(self) -> None:
+        self.stats.dropped += 1
+        METRICS.counter("dvd_bus_dropped_total", "큐 초과로 버린 이벤트 수").labels(subscriber=self.name).inc()
+
+    async def _next_batch(self) -> List[Any]:
+        batch = [await self.queue.get()]
+        deadline = asyncio.get_running_loop().time() + self.batch_timeout
+
+        while len(batch) < self.batch_size:
+            if not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+                continue
+
+            remaining = deadline - asyncio.get_running_loop().time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self.queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def _consume(self) -> None:
+        while True:
+            batch = await self._next_batch()
+            started = time.perf_counter()
+            try:
+                await self.handler(batch)
+                self.stats.delivered += len(batch)
+                METRICS.counter("dvd_bus_delivered_total", "구독자에게 전달된 이벤트 수") \
+                    .labels(subscriber=self.name).inc(len(batch))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.stats.errors += 1
+                logger.warning(f"결과 버스 구독자 처리 실패 ({self.name}): {e}")
+            finally:
+                elapsed = time.perf_counter() - started
+                self.stats.batches += 1
+                self.stats.handler_seconds += elapsed
+                METRICS.histogram("dvd_bus_handler_seconds", "구독자 배치 처리 시간") \
+                    .labels(subscriber=self.name).observe(elapsed)
+                METRICS.gauge("dvd_bus_queue_depth", "구독자 큐 길이") \
+                    .labels(subscriber=self.name).set(self.queue.qsize())
+                for _ in batch:
+                    self.queue.task_done()
+
+class ResultBus:
+    """프로세스 내부 결과 이벤트 버스
+
+    소비 작업은 실행 중인 이벤트 루프에서 처음 발행할 때 시작되며,
+    다른 이벤트 루프에서 다시 사용하면 큐와 소비 작업을 새로 만든다.
+    """
+
+    def __init__(self):
+        self.subscriptions: Dict[str, Subscription] = {}
+        self._loop = None
+
+    def subscribe(self, name: str, handler: BatchHandler, maxsize: int = 100,
+                  policy: OverflowPolicy = OverflowPolicy.BLOCK,
+                  batch_size: int = 1, batch_timeout: float = 0.0) -> Subscription:
+        """구독자 등록 (같은 이름이면 교체)"""
+        self.unsubscribe(name)
+        subscription = Subscription(name, handler, maxsize, policy, batch_size, batch_timeout)
+        self.subscriptions[name] = subscription
+
+        if self._loop is not None and self._loop.is_running():
+            subscription._start()
+
+        logger.info(f"📮 결과 버스 구독: {name} (큐 {subscription.maxsize}, {subscription.policy.value}, "
+                    f"배치 {subscription.batch_size})")
+        return subscription
+
+    def unsubscribe(self, name: str) -> None:
+        subscription = self.subscriptions.pop(name, None)
+        if subscription is not None and subscription.task is not None:
+            subscription.task.cancel()
+
+    def _ensure_started(self) -> None:
+        loop = asyncio.get_running_loop()
+        if loop is self._loop:
+            return
+
+        self._loop = loop
+        for subscription in self.subscriptions.values():
+            subscription._start()
+
+    async def publish(self, event: Any) -> None:
+        """모든 구독자에게 이벤트 발행"""
+        self._ensure_started()
+        for subscription in list(self.subscriptions.values()):
+            await subscription._put(event)
+
+    async def drain(self) -> None:
+        """지금까지 발행된 이벤트를 모든 구독자가 처리할 때까지 대기"""
+        if self._loop is not asyncio.get_running_loop():
+            return
+        await asyncio.gather(*(subscription.queue.join()
+                               for subscription in self.subscriptions.values()
+                               if subscription.queue is not None))
+
+    async def close(self, drain: bool = True) -> None:
+        """소비 작업 종료 (drain이면 남은 이벤트 처리 후)"""
+        if drain:
+            await self.drain()
+
+        tasks = [subscription.task for subscription in self.subscriptions.values()
+                 if subscription.task is not None and not subscription.task.done()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._loop = None
+
+    def get_statistics(self) -> Dict[str, Dict[str, Any]]:
+        """구독자별 통계 (현재 큐 길이 포함)"""
+        return {
+            name: dict(vars(subscription.stats), depth=subscription.depth,
+                       policy=subscription.policy.value)
+            for name, subscription in self.subscriptions.items()
+        }
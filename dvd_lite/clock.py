@@ -0,0 +1,165 @@
+# dvd_lite/clock.py
+"""
+DVD-Lite 시간 제공자
+시뮬레이션 실행을 위한 가상 시간 이벤트 루프
+
+가상 시간 루프에서는 asyncio.sleep / wait_for 등 타이머 대기가 실제로 기다리지 않고
+즉시 다음 타이머 시각으로 건너뛴다. 타이머 순서와 경과 시간(response_time)은 실제 실행과 동일하다.
+
+실제 소켓이 등록되어 있거나 executor 작업이 진행 중이면 건너뛰지 않고 실제로 I/O를 기다리며,
+그동안은 실제 경과 시간만큼 가상 시계를 전진시킨다 (네트워크 응답 제한 시간이 실제 시간 기준으로 유지됨).
+inotify처럼 실행 내내 등록되어 있는 감시용 이벤트 소스는 ignore_for_virtual_time()으로 제외한다.
+"""
+
+import asyncio
+import selectors
+import time
+from typing import Any, Awaitable, Optional, Set
+
+class _VirtualTimeSelector(selectors.BaseSelector):
+    """대기 시간만큼 가상 시간을 전진시키는 셀렉터 래퍼
+
+    준비된 I/O가 있으면 그대로 반환하고, 없으면 실제로 대기하지 않고 가상 시계를 timeout만큼 전진시킨다.
+    예정된 타이머가 없는 경우(timeout=None)와 실제 I/O가 걸려 있는 경우(루프 깨우기용 파이프 외의 fd 등록,
+    진행 중인 executor 작업)에는 실제로 기다리고 기다린 만큼만 가상 시계를 전진시킨다.
+    """
+
+    def __init__(self, selector: selectors.BaseSelector):
+        self._selector = selector
+        self.virtual_time = 0.0
+        # 실제 I/O로 보지 않는 fd (루프 깨우기용 자기 파이프, 감시용 이벤트 소스 - 등록 해제 시 제외 목록에서도 뺌)
+        self.wakeup_fd: Optional[int] = None
+        self.ignored_fds: Set[int] = set()
+        # 진행 중인 executor 작업 수
+        self.pending_jobs = 0
+
+    def real_io_pending(self) -> bool:
+        """실제 I/O(소켓, executor 작업)가 걸려 있는지"""
+        if self.pending_jobs:
+            return True
+        return any(key.fd != self.wakeup_fd and key.fd not in self.ignored_fds
+                   for key in self._selector.get_map().values())
+
+    def register(self, fileobj, events, data=None):
+        return self._selector.register(fileobj, events, data)
+
+    def unregister(self, fileobj):
+        key = self._selector.unregister(fileobj)
+        self.ignored_fds.discard(key.fd)
+        return key
+
+    def modify(self, fileobj, events, data=None):
+        return self._selector.modify(fileobj, events, data)
+
+    def select(self, timeout: Optional[float] = None):
+        ready = self._selector.select(0)
+        if ready or timeout == 0:
+            return ready
+
+        if timeout is None:
+            return self._selector.select(None)
+
+        if self.real_io_pending():
+            started = time.monotonic()
+            ready = self._selector.select(timeout)
+            self.virtual_time += min(timeout, time.monotonic() - started) if ready else timeout
+            return ready
+
+        self.virtual_time += timeout
+        return []
+
+    def close(self):
+        self._selector.close()
+
+    def get_key(self, fileobj):
+        return self._selector.get_key(fileobj)
+
+    def get_map(self):
+        return self._selector.get_map()
+
+class VirtualTimeEventLoop(asyncio.SelectorEventLoop):
+    """가상 시간 이벤트 루프
+
+    loop.time()이 가상 시계를 반환하므로 타이머는 예약 순서대로 즉시 실행된다.
+    epoch는 루프 생성 시점의 실제 시각으로, now()가 현실적인 타임스탬프를 돌려주도록 한다.
+    """
+
+    def __init__(self, epoch: Optional[float] = None):
+        self._virtual_selector = _VirtualTimeSelector(selectors.DefaultSelector())
+        super().__init__(self._virtual_selector)
+        self._virtual_selector.wakeup_fd = self._ssock.fileno()
+        self.epoch = time.time() if epoch is None else epoch
+
+    def time(self) -> float:
+        return self._virtual_selector.virtual_time
+
+    def run_in_executor(self, executor, func, *args):
+        """executor 작업이 끝날 때까지 가상 시계가 건너뛰지 않도록 진행 중인 작업 수를 셈"""
+        future = super().run_in_executor(executor, func, *args)
+        self._virtual_selector.pending_jobs += 1
+        future.add_done_callback(self._job_done)
+        return future
+
+    def _job_done(self, future) -> None:
+        self._virtual_selector.pending_jobs -= 1
+
+    @property
+    def virtual_elapsed(self) -> float:
+        """루프 생성 이후 경과한 가상 시간 (초)"""
+        return self._virtual_selector.virtual_time
+
+def ignore_for_virtual_time(fd: int) -> None:
+    """가상 시간 루프가 응답을 기다리는 실제 I/O로 보지 않을 fd 등록
+
+    언제 이벤트가 올지 모르는 채로 계속 등록되어 있는 감시용 fd(inotify 등)에 사용한다.
+    가상 시간 루프가 아니면 아무것도 하지 않는다.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    if isinstance(loop, VirtualTimeEventLoop):
+        loop._virtual_selector.ignored_fds.add(fd)
+
+def is_virtual_time() -> bool:
+    """현재 실행 중인 루프가 가상 시간 루프인지 확인"""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return isinstance(loop, VirtualTimeEventLoop)
+
+def now() -> float:
+    """현재 시각 (epoch 초)
+
+    가상 시간 루프 안에서는 가상 시각을, 그 외에는 time.time()을 반환한다.
+    공격 실행 시간과 캠페인 시간 측정에는 time.time() 대신 이 함수를 사용한다.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return time.time()
+
+    if isinstance(loop, VirtualTimeEventLoop):
+        return loop.epoch + loop.time()
+    return time.time()
+
+def run(main: Awaitable[Any], virtual_time: bool = False) -> Any:
+    """코루틴 실행 - virtual_time이면 가상 시간 루프 사용 (asyncio.run 대체)"""
+    if not virtual_time:
+        return asyncio.run(main)
+
+    loop = VirtualTimeEventLoop()
+    try:
+        asyncio.set_event_loop(loop)
+        return loop.run_until_complete(main)
+    finally:
+        try:
+            pending = [task for task in asyncio.all_tasks(loop) if not task.done()]
+            for task in pending:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
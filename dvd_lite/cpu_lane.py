@@ -0,0 +1,182 @@
+# dvd_lite/cpu_lane.py
+"""
+DVD-Lite CPU 작업 레인
+패킷 생성, 펌웨어 분석, 로그 파싱, 퍼징 케이스 생성 등 CPU 위주 단계를 프로세스 풀에서 실행
+
+작업은 모듈 수준 함수와 인자로 구성된 CPUTask로 전달되므로 pickle 가능해야 한다.
+큰 bytes / numpy 배열 결과는 파이프로 pickle하지 않고 공유 메모리 버퍼로 돌려받는다.
+
+사용 예 (공격 모듈):
+    @cpu_stage
+    def craft_packets(count: int, seed: int) -> bytes: ...
+
+    payload = await self.run_cpu(craft_packets, 10000, seed)
+"""
+
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Any, Optional, Tuple, Callable
+
+from . import clock
+from .metrics import METRICS
+
+try:
+    from multiprocessing import shared_memory, resource_tracker
+    SHARED_MEMORY_AVAILABLE = True
+except ImportError:
+    shared_memory = None
+    resource_tracker = None
+    SHARED_MEMORY_AVAILABLE = False
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# 이 크기 이상인 결과는 공유 메모리로 전달 (바이트)
+DEFAULT_SHM_THRESHOLD = 64 * 1024
+
+def cpu_stage(func: Callable) -> Callable:
+    """CPU 위주 단계 표시 - 모듈 수준 함수에만 사용 (프로세스 풀로 pickle 전달)"""
+    func.__dvd_cpu_stage__ = True
+    return func
+
+def is_cpu_stage(func: Callable) -> bool:
+    return getattr(func, "__dvd_cpu_stage__", False)
+
+@dataclass
+class CPUTask:
+    """프로세스 풀 작업 명세"""
+    func: Callable
+    args: Tuple[Any, ...] = ()
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def name(self) -> str:
+        return getattr(self.func, "__name__", repr(self.func))
+
+@dataclass
+class SharedResult:
+    """공유 메모리에 기록된 작업 결과 핸들"""
+    shm_name: str
+    size: int
+    kind: str                      # "bytes" 또는 "ndarray"
+    dtype: Optional[str] = None
+    shape: Optional[Tuple[int, ...]] = None
+
+def _export_result(result: Any, threshold: int) -> Any:
+    """큰 결과를 공유 메모리에 기록하고 핸들 반환 (작업자 프로세스에서 실행)"""
+    if NUMPY_AVAILABLE and isinstance(result, np.ndarray):
+        if result.nbytes < threshold or result.dtype.hasobject:
+            return result
+        data = np.ascontiguousarray(result)
+        handle = SharedResult("", data.nbytes, "ndarray", data.dtype.str, data.shape)
+        view = memoryview(data).cast("B")
+    elif isinstance(result, (bytes, bytearray, memoryview)):
+        view = memoryview(result).cast("B")
+        if view.nbytes < threshold:
+            return result
+        handle = SharedResult("", view.nbytes, "bytes")
+    else:
+        return result
+
+    shm = shared_memory.SharedMemory(create=True, size=max(1, handle.size))
+    try:
+        shm.buf[:handle.size] = view
+        handle.shm_name = shm.name
+    finally:
+        shm.close()
+    # 버퍼 해제 책임은 부모 프로세스로 넘어감 (작업자 종료 시 추적기가 지우지 않도록)
+    resource_tracker.unregister(shm._name, "shared_memory")
+    return handle
+
+def _import_result(handle: SharedResult) -> Any:
+    """공유 메모리 결과를 읽고 버퍼 해제 (부모 프로세스에서 실행)"""
+    shm = shared_memory.SharedMemory(name=handle.shm_name)
+    try:
+        if handle.kind == "ndarray":
+            return np.ndarray(handle.shape, dtype=np.dtype(handle.dtype), buffer=shm.buf).copy()
+        return bytes(shm.buf[:handle.size])
+    finally:
+        shm.close()
+        shm.unlink()
+
+def _discard_result(future) -> None:
+    """취소된 작업의 공유 메모리 결과 해제"""
+    if future.cancelled() or future.exception() is not None:
+        return
+    result = future.result()
+    if isinstance(result, SharedResult):
+        _import_result(result)
+
+def _execute_task(task: CPUTask, shm_threshold: Optional[int]) -> Any:
+    """작업자 프로세스 진입점"""
+    result = task.func(*task.args, **task.kwargs)
+    if shm_threshold is not None:
+        return _export_result(result, shm_threshold)
+    return result
+
+class CPULane:
+    """CPU 작업용 프로세스 풀 관리자
+
+    max_workers=0이면 프로세스 풀 없이 호출한 자리에서 바로 실행한다.
+    가상 시간 루프에서는 실제 경과 시간이 가상 시계와 맞지 않으므로 항상 바로 실행한다.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, shm_threshold: int = DEFAULT_SHM_THRESHOLD,
+                 start_method: Optional[str] = None):
+        self.max_workers = max_workers
+        self.shm_threshold = shm_threshold if SHARED_MEMORY_AVAILABLE else None
+        self.start_method = start_method
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self.statistics = {"submitted": 0, "inline": 0, "shared_memory_results": 0}
+
+    @property
+    def inline(self) -> bool:
+        return self.max_workers == 0 or clock.is_virtual_time()
+
+    def _executor(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            context = multiprocessing.get_context(self.start_method) if self.start_method else None
+            self._pool = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=context)
+            logger.info(f"⚙️ CPU 작업 레인 시작 (작업자 {self.max_workers or 'CPU 수'}개)")
+        return self._pool
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """CPU 작업 실행 - 이벤트 루프는 결과를 기다리는 동안 다른 작업을 계속 처리"""
+        if not is_cpu_stage(func):
+            raise TypeError(f"@cpu_stage로 선언되지 않은 함수입니다: {getattr(func, '__name__', func)}")
+        task = CPUTask(func, args, kwargs)
+
+        with METRICS.span("dvd_cpu_lane_task_seconds", "CPU 작업 레인 실행 시간", stage=task.name):
+            if self.inline:
+                self.statistics["inline"] += 1
+                return task.func(*task.args, **task.kwargs)
+
+            self.statistics["submitted"] += 1
+            future = self._executor().submit(_execute_task, task, self.shm_threshold)
+            try:
+                result = await asyncio.wrap_future(future)
+            except asyncio.CancelledError:
+                # 이미 실행 중인 작업은 끝까지 돌므로 완료 후 공유 메모리 버퍼를 해제
+                future.add_done_callback(_discard_result)
+                raise
+
+        if isinstance(result, SharedResult):
+            self.statistics["shared_memory_results"] += 1
+            return _import_result(result)
+        return result
+
+    def shutdown(self, wait: bool = True) -> None:
+        """프로세스 풀 종료"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait)
+            self._pool = None
+            logger.info("⚙️ CPU 작업 레인 종료")
@@ -108,6 +108,27 @@ class SimpleCTI:
             "fake_gps": 25,
             "waypoint_injected": 18,
             "log_extracted": 12,
+            "log_home": 15,
+            "log_gps_track": 12,
+            "log_param": 10,
+            "telemetry_captured": 10,
+            "telemetry_position": 12,
+            "rtsp_service": 8,
+            "rtsp_stream": 12,
+            "rtsp_auth_required": 10,
+            "rtsp_hijacked": 18,
+            "video_keyframe": 8,
+            "firmware_tampered": 20,
+            "firmware_patch": 15,
+            "firmware_rollback": 18,
+            "firmware_diff": 8,
+            "firmware_unsigned": 12,
+            "secure_boot_signature_stripped": 20,
+            "secure_boot_downgrade": 20,
+            "firmware_vuln_tag": 15,
+            "bootloader_hash": 8,
+            "bootloader_modified": 18,
+            "bootloader_vulnerable": 22,
             "param_extracted": 10,
             "wifi_ssid": 8,
             "wifi_bssid": 8
@@ -6,7 +6,7 @@ from .enums import (
     AttackType, DVDAttackTactic, DVDFlightState, 
     AttackDifficulty, AttackStatus
 )
-from .scenario import DVDAttackScenario
+from .scenario import DVDAttackScenario, StochasticModel
 from .attack_base import BaseAttack, AttackResult
 
 __all__ = [
@@ -16,6 +16,7 @@ __all__ = [
     'AttackDifficulty',
     'AttackStatus',
     'DVDAttackScenario',
+    'StochasticModel',
     'BaseAttack',
     'AttackResult'
 ]
@@ -3,12 +3,15 @@
 공격 기본 클래스 정의
 """
 import asyncio
-import time
 import logging
 from abc import ABC, abstractmethod
 from typing import Tuple, List, Dict, Any, Optional
 from dataclasses import dataclass
 from .enums import AttackType, AttackStatus
+from ...clock import now
+from ...rng import ExperimentRNG
+from ...metrics import METRICS
+from ...cpu_lane import CPULane
 
 logger = logging.getLogger(__name__)
 
@@ -30,19 +33,99 @@ class AttackResult:
 class BaseAttack(ABC):
     """DVD 공격 기본 클래스"""
     
-    def __init__(self, target_ip: str = "10.13.0.2", **kwargs):
+    def __init__(self, target_ip: str = "10.13.0.2", rng: Optional[ExperimentRNG] = None,
+                 deadline: Optional[float] = None, cpu_lane: Optional[CPULane] = None,
+                 deadline_limit: Optional[float] = None, **kwargs):
         self.target_ip = target_ip
         self.config = kwargs
-        self.attack_id = f"{self.__class__.__name__.lower()}_{int(time.time())}"
+        # 실험 시드에서 파생된 난수 스트림 (미지정 시 임의 시드)
+        self.rng = rng or ExperimentRNG().spawn(self.__class__.__name__)
+        self.random = self.rng.random
+        # 실행 제한 시간 (초, None이면 제한 없음)
+        self.deadline = deadline
+        # extend_deadline()으로 늘릴 수 있는 상한 (호출자가 요청한 제한 시간, None이면 상한 없음)
+        self.deadline_limit = deadline_limit
+        self._expires_at: Optional[float] = None
+        # CPU 위주 단계 실행용 프로세스 풀 (미지정 시 이벤트 루프에서 바로 실행)
+        self.cpu_lane = cpu_lane or CPULane(max_workers=0)
+        self.attack_id = f"{self.__class__.__name__.lower()}_{int(now())}"
         self.logger = logging.getLogger(f"attack.{self.__class__.__name__}")
+        
+        # 중단 시 PARTIAL 결과로 보고할 진행 상황
+        self.partial_iocs: List[str] = []
+        self.partial_details: Dict[str, Any] = {}
+        self.result: Optional[AttackResult] = None
+    
+    @classmethod
+    def expected_duration(cls, config: Dict[str, Any]) -> Optional[float]:
+        """공격 파라미터로 정해지는 실행 시간 (초) - 없으면 None
+        
+        궤적 길이, 스윕 단계 수, 수집 시간처럼 실행 시간이 파라미터에 따라 달라지는 공격이 재정의하며,
+        DVDLite.attack_deadline()이 시나리오 예상 시간 기반 제한 시간에 더한다.
+        """
+        return None
+    
+    def extend_deadline(self, seconds: float) -> None:
+        """실행 중에 알게 된 작업량(전송할 로그 크기 등)만큼 제한 시간 연장 (deadline_limit까지)"""
+        if self.deadline is None or seconds <= 0:
+            return
+        extended = self.deadline + seconds
+        if self.deadline_limit is not None:
+            extended = max(self.deadline, min(extended, self.deadline_limit))
+        if self._expires_at is not None:
+            self._expires_at += extended - self.deadline
+        self.deadline = extended
+    
+    async def _run_with_deadline(self) -> Tuple[bool, List[str], Dict[str, Any]]:
+        """제한 시간 안에 _run_attack() 실행 - 실행 중 extend_deadline()으로 늘어난 시간도 반영"""
+        loop = asyncio.get_running_loop()
+        self._expires_at = loop.time() + self.deadline
+        task = asyncio.ensure_future(self._run_attack())
+        try:
+            while not task.done():
+                remaining = self._expires_at - loop.time()
+                if remaining <= 0:
+                    break
+                await asyncio.wait({task}, timeout=remaining)
+        finally:
+            if not task.done():
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+        if task.cancelled():
+            raise asyncio.TimeoutError()
+        return task.result()
+    
+    def recon_findings(self) -> Dict[str, Any]:
+        """정찰 캐시에 남아 있는 이 대상의 유효한 정찰 결과 (시나리오 → AttackResult, 캐시가 없으면 빈 dict)"""
+        cache = self.config.get("recon_cache")
+        return cache.findings(self.target_ip) if cache is not None else {}
+    
+    async def run_cpu(self, stage, *args, **kwargs):
+        """@cpu_stage로 선언한 CPU 위주 단계를 CPU 작업 레인에서 실행"""
+        return await self.cpu_lane.run(stage, *args, **kwargs)
+    
+    def record_progress(self, iocs: Optional[List[str]] = None, **details) -> None:
+        """진행 상황 기록 - 제한 시간 초과/취소 시 PARTIAL 결과에 포함"""
+        if iocs:
+            self.partial_iocs.extend(iocs)
+        self.partial_details.update(details)
     
     async def execute(self) -> AttackResult:
-        """공격 실행 메인 메서드"""
-        start_time = time.time()
+        """공격 실행 메인 메서드
+        
+        제한 시간을 넘기면 PARTIAL 결과를 반환한다.
+        취소되면 PARTIAL 결과를 self.result에 남긴 뒤 CancelledError를 다시 발생시킨다.
+        """
+        start_time = now()
         self.logger.info(f"공격 시작: {self.__class__.__name__} -> {self.target_ip}")
         
         try:
-            success, iocs, details = await self._run_attack()
+            with METRICS.span("dvd_attack_phase_seconds", "공격 단계별 실행 시간",
+                              attack=self.__class__.__name__, phase="run"):
+                if self.deadline is not None:
+                    success, iocs, details = await self._run_with_deadline()
+                else:
+                    success, iocs, details = await self._run_attack()
             
             result = AttackResult(
                 attack_id=self.attack_id,
@@ -50,30 +133,65 @@ class BaseAttack(ABC):
                 attack_type=self._get_attack_type(),
                 status=AttackStatus.SUCCESS if success else AttackStatus.FAILED,
                 success_rate=details.get("success_rate", 0.7 if success else 0.0),
-                response_time=time.time() - start_time,
-                timestamp=time.time(),
+                response_time=now() - start_time,
+                timestamp=now(),
                 target=self.target_ip,
                 iocs=iocs,
                 details=details
             )
             
             self.logger.info(f"공격 완료: {result.status.value} ({result.response_time:.2f}초)")
-            return result
+            
+        except asyncio.TimeoutError:
+            self.logger.warning(f"공격 제한 시간 초과: {self.deadline:.1f}초")
+            result = self._partial_result(start_time, "deadline_exceeded")
+            
+        except asyncio.CancelledError:
+            self.logger.warning("공격 취소됨")
+            self.result = self._partial_result(start_time, "cancelled")
+            self._record_metrics(self.result)
+            raise
             
         except Exception as e:
             self.logger.error(f"공격 실패: {str(e)}")
-            return AttackResult(
+            result = AttackResult(
                 attack_id=self.attack_id,
                 attack_name=self.__class__.__name__,
                 attack_type=self._get_attack_type(),
                 status=AttackStatus.FAILED,
                 success_rate=0.0,
-                response_time=time.time() - start_time,
-                timestamp=time.time(),
+                response_time=now() - start_time,
+                timestamp=now(),
                 target=self.target_ip,
                 iocs=[],
                 details={"error": str(e)}
             )
+        
+        self.result = result
+        self._record_metrics(result)
+        return result
+    
+    def _record_metrics(self, result: AttackResult) -> None:
+        """공격 결과 메트릭 기록"""
+        if METRICS.enabled:
+            METRICS.counter("dvd_attack_results_total", "상태별 공격 결과 수").labels(
+                attack=result.attack_name, status=result.status.value
+            ).inc()
+    
+    def _partial_result(self, start_time: float, reason: str) -> AttackResult:
+        """중단된 공격의 PARTIAL 결과"""
+        return AttackResult(
+            attack_id=self.attack_id,
+            attack_name=self.__class__.__name__,
+            attack_type=self._get_attack_type(),
+            status=AttackStatus.PARTIAL,
+            success_rate=0.0,
+            response_time=now() - start_time,
+            timestamp=now(),
+            target=self.target_ip,
+            iocs=list(self.partial_iocs),
+            details=dict(self.partial_details, interrupted=reason, deadline=self.deadline)
+        )
     
     @abstractmethod
     async def _run_attack(self) -> Tuple[bool, List[str], Dict[str, Any]]:
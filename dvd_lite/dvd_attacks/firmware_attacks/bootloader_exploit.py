@@ -1,25 +1,64 @@
 # dvd_lite/dvd_attacks/firmware_attacks/bootloader_exploit.py
 """
-BootloaderExploit 공격 (더미 구현)
+BootloaderExploit 공격
+bootloader_path를 주면 FirmwareEngine으로 부트로더 이미지를 분석해 알려진 취약 해시(known_vulnerable)와 대조하고,
+reference_path(정상 부트로더)가 있으면 변경 구간을 찾아 IOC로 남긴다.
+bootloader_path가 없으면 공격을 시뮬레이션한다.
+
+주요 파라미터 (run_attack 키워드):
+    bootloader_path, reference_path, known_vulnerable (sha256 목록), parallelism
 """
 import asyncio
-import random
 from typing import Tuple, List, Dict, Any
 from ..core.attack_base import BaseAttack
 from ..core.enums import AttackType
+from .firmware_engine import FirmwareEngine, FirmwareError, NUMPY_AVAILABLE
 
 class BootloaderExploit(BaseAttack):
     """BootloaderExploit 공격"""
-    
+
     def _get_attack_type(self) -> AttackType:
-        return AttackType.RECONNAISSANCE  # 기본값
-    
+        return AttackType.FIRMWARE_ATTACKS
+
     async def _run_attack(self) -> Tuple[bool, List[str], Dict[str, Any]]:
-        """더미 공격 로직"""
-        await asyncio.sleep(random.uniform(1.0, 3.0))
-        
-        success = random.random() > 0.3
+        path = self.config.get("bootloader_path")
+        if not path or not NUMPY_AVAILABLE:
+            return await self._simulate()
+        reference_path = self.config.get("reference_path")
+        known_vulnerable = {digest.lower() for digest in self.config.get("known_vulnerable", [])}
+        details: Dict[str, Any] = {}
+
+        with FirmwareEngine(run_cpu=self.run_cpu, parallelism=self.config.get("parallelism", 4)) as engine:
+            try:
+                paths = [path] + ([reference_path] if reference_path else [])
+                bootloader, *reference = await engine.analyze_many(paths)
+                diff = await engine.diff(reference[0], bootloader) if reference else None
+            except (OSError, FirmwareError) as e:
+                details.update(error=str(e), success_rate=0.0)
+                return False, [], details
+
+        iocs = [f"BOOTLOADER_HASH:{bootloader.name}:{bootloader.sha256}"]
+        vulnerable = bootloader.sha256 in known_vulnerable
+        if vulnerable:
+            iocs.append(f"BOOTLOADER_VULNERABLE:{bootloader.name}:{bootloader.sha256}")
+        modified = diff is not None and not diff.identical
+        if modified:
+            iocs.extend(f"BOOTLOADER_MODIFIED:{bootloader.name}:0x{offset:x}+{length}"
+                        for offset, length in diff.regions[:16])
+
+        # 대조 기준이 없으면 지문 수집만으로 성공
+        success = vulnerable or modified or not (reference or known_vulnerable)
+        details.update(bootloader=bootloader.to_dict(), descriptor=bootloader.descriptor, vulnerable=vulnerable,
+                       diff=diff.to_dict() if diff else None, success_rate=1.0 if success else 0.0)
+        self.record_progress(iocs=iocs, **details)
+        return success, iocs, details
+
+    async def _simulate(self) -> Tuple[bool, List[str], Dict[str, Any]]:
+        """공격 시뮬레이션"""
+        await asyncio.sleep(self.random.uniform(1.0, 3.0))
+
+        success = self.random.random() > 0.3
         iocs = [f"BOOTLOADEREXPLOIT_IOC:dummy_indicator"]
         details = {"success_rate": 0.7 if success else 0.2}
-        
+
         return success, iocs, details
@@ -0,0 +1,294 @@
+# dvd_lite/dvd_attacks/firmware_attacks/firmware_catalog.py
+"""
+펌웨어 버전 카탈로그
+펌웨어 이미지의 메타데이터 / 해시 / 보드 ID / 알려진 취약점 태그를 SQLite에 색인해 두고
+"이 보드용 서명된 가장 오래된 이미지 중 태그 X가 붙은 것" 같은 질의에 답한다.
+
+- images: 파일 하나당 한 행. (board_id, signed, version_number)로 시작하는 커버링 인덱스가
+  경로 / 버전 / 해시까지 포함하므로 보드별 버전 질의는 테이블을 읽지 않고 인덱스만 탐색
+- tags: 이미지 내용(sha256)에 붙는 태그 - 파일을 옮기거나 다시 가져와도 유지
+- import_directory(): 디렉터리의 .apj / .px4 / .bin을 가져오며 크기와 mtime이 그대로인 파일은 건너뛰고,
+  바뀐 파일만 FirmwareEngine으로 분석 (해시 계산은 CPU 작업 레인)
+
+롤백 / 보안 부팅 우회 시나리오는 catalog(DB 경로)와 firmware_dir 파라미터로 카탈로그를 사용한다.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Iterable, Tuple
+
+from .firmware_engine import FirmwareEngine, FirmwareError, FirmwareManifest
+
+logger = logging.getLogger(__name__)
+
+FIRMWARE_EXTENSIONS = (".apj", ".px4", ".bin")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS images (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    format TEXT NOT NULL,
+    file_size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    image_size INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    board_id INTEGER,
+    version TEXT,
+    version_number INTEGER NOT NULL,
+    git_identity TEXT,
+    signed INTEGER NOT NULL,
+    chunk_count INTEGER NOT NULL,
+    metadata TEXT NOT NULL,
+    imported_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS images_board_version
+    ON images (board_id, signed, version_number, sha256, version, path);
+CREATE INDEX IF NOT EXISTS images_sha256
+    ON images (sha256, board_id, signed, version_number, version, path);
+CREATE TABLE IF NOT EXISTS tags (
+    tag TEXT NOT NULL,
+    sha256 TEXT NOT NULL,
+    note TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (tag, sha256)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS tags_sha256 ON tags (sha256, tag);
+"""
+
+def version_number(version: Optional[str]) -> int:
+    """버전 문자열 → 정렬용 정수 ("4.5.1" → 4005001000, 숫자 네 자리까지, 자리당 0-999)"""
+    parts = [min(999, int(part)) for part in "".join(c if c.isdigit() else " " for c in version or "").split()][:4]
+    parts += [0] * (4 - len(parts))
+    number = 0
+    for part in parts:
+        number = number * 1000 + part
+    return number
+
+@dataclass
+class CatalogEntry:
+    """카탈로그의 펌웨어 이미지 한 개"""
+    path: str
+    sha256: str
+    board_id: Optional[int]
+    version: Optional[str]
+    signed: bool
+    tags: List[str] = field(default_factory=list)
+
+    @property
+    def name(self) -> str:
+        return os.path.basename(self.path)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"name": self.name, "path": self.path, "sha256": self.sha256, "board_id": self.board_id,
+                "version": self.version, "signed": self.signed, "tags": self.tags}
+
+class FirmwareCatalog:
+    """SQLite 기반 펌웨어 버전 카탈로그 (path=":memory:"면 메모리 DB)"""
+
+    def __init__(self, path: str = ":memory:"):
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(SCHEMA)
+        self.connection.commit()
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def __enter__(self) -> "FirmwareCatalog":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.connection.execute("SELECT COUNT(*) FROM images").fetchone()[0]
+
+    # -------------------------------------------------------------------------
+    # 등록
+    # -------------------------------------------------------------------------
+
+    def add(self, manifest: FirmwareManifest, file_size: Optional[int] = None,
+            mtime_ns: Optional[int] = None) -> None:
+        """분석 결과 등록 (같은 경로는 갱신) - 크기 / mtime 미지정 시 파일에서 읽음"""
+        if file_size is None or mtime_ns is None:
+            stat = os.stat(manifest.path)
+            file_size, mtime_ns = stat.st_size, stat.st_mtime_ns
+        self.connection.execute(
+            """INSERT INTO images (path, format, file_size, mtime_ns, image_size, sha256, board_id, version,
+                                   version_number, git_identity, signed, chunk_count, metadata, imported_at)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+               ON CONFLICT(path) DO UPDATE SET
+                   format=excluded.format, file_size=excluded.file_size, mtime_ns=excluded.mtime_ns,
+                   image_size=excluded.image_size, sha256=excluded.sha256, board_id=excluded.board_id,
+                   version=excluded.version, version_number=excluded.version_number,
+                   git_identity=excluded.git_identity, signed=excluded.signed,
+                   chunk_count=excluded.chunk_count, metadata=excluded.metadata,
+                   imported_at=excluded.imported_at""",
+            (os.path.abspath(manifest.path), manifest.format, file_size, mtime_ns, manifest.image_size,
+             manifest.sha256, manifest.board_id, manifest.version, version_number(manifest.version),
+             manifest.git_identity, int(manifest.signed), len(manifest.chunk_digests),
+             json.dumps(manifest.metadata, default=repr), time.time()))
+        self.connection.commit()
+
+    def remove(self, paths: Iterable[str]) -> int:
+        cursor = self.connection.executemany("DELETE FROM images WHERE path = ?",
+                                             [(os.path.abspath(path),) for path in paths])
+        self.connection.commit()
+        return cursor.rowcount
+
+    async def import_directory(self, directory: str, engine: Optional[FirmwareEngine] = None,
+                               recursive: bool = True, prune: bool = True) -> Dict[str, int]:
+        """디렉터리의 펌웨어 가져오기 - 크기와 mtime이 그대로인 파일은 다시 해시하지 않음
+
+        prune이면 디렉터리에서 사라진 파일의 행을 지운다.
+        """
+        directory = os.path.abspath(directory)
+        statistics = {"scanned": 0, "imported": 0, "unchanged": 0, "failed": 0, "removed": 0}
+        known = {path: (file_size, mtime_ns) for path, file_size, mtime_ns in self.connection.execute(
+            "SELECT path, file_size, mtime_ns FROM images WHERE path >= ? AND path < ?",
+            (directory + os.sep, directory + chr(ord(os.sep) + 1)))}
+
+        found = {}
+        for root, dirs, files in os.walk(directory):
+            if not recursive:
+                dirs.clear()
+            for name in files:
+                if name.lower().endswith(FIRMWARE_EXTENSIONS):
+                    path = os.path.join(root, name)
+                    stat = os.stat(path)
+                    found[path] = (stat.st_size, stat.st_mtime_ns)
+        statistics["scanned"] = len(found)
+        changed = [path for path, signature in sorted(found.items()) if known.get(path) != signature]
+        statistics["unchanged"] = len(found) - len(changed)
+
+        if changed:
+            owns_engine = engine is None
+            engine = engine or FirmwareEngine()
+            try:
+                # 엔진 병렬도만큼 묶어서 분석
+                for index in range(0, len(changed), engine.parallelism):
+                    batch = changed[index:index + engine.parallelism]
+                    results = await asyncio.gather(*(engine.analyze(path) for path in batch), return_exceptions=True)
+                    for path, manifest in zip(batch, results):
+                        if isinstance(manifest, (OSError, FirmwareError)):
+                            logger.warning(f"⚠️ 펌웨어 가져오기 실패: {path} ({manifest})")
+                            statistics["failed"] += 1
+                            continue
+                        if isinstance(manifest, BaseException):
+                            raise manifest
+                        self.add(manifest, *found[path])
+                        statistics["imported"] += 1
+                        # 디코딩한 이미지는 카탈로그에 필요 없음
+                        if manifest.image_path != manifest.path:
+                            os.remove(manifest.image_path)
+            finally:
+                if owns_engine:
+                    engine.close()
+
+        if prune:
+            statistics["removed"] = self.remove(path for path in known if path not in found)
+        logger.info(f"📚 펌웨어 카탈로그 가져오기: {directory} {statistics}")
+        return statistics
+
+    # -------------------------------------------------------------------------
+    # 태그
+    # -------------------------------------------------------------------------
+
+    def tag(self, sha256: str, tag: str, note: str = "") -> None:
+        """이미지 내용(sha256)에 태그 부여 (예: "CVE-2023-XXXX", "no_signature_check")"""
+        self.connection.execute("INSERT OR REPLACE INTO tags (tag, sha256, note) VALUES (?, ?, ?)",
+                                (tag, sha256.lower(), note))
+        self.connection.commit()
+
+    def untag(self, sha256: str, tag: str) -> None:
+        self.connection.execute("DELETE FROM tags WHERE tag = ? AND sha256 = ?", (tag, sha256.lower()))
+        self.connection.commit()
+
+    def tags(self, sha256: str) -> List[str]:
+        return [tag for tag, in self.connection.execute(
+            "SELECT tag FROM tags WHERE sha256 = ? ORDER BY tag", (sha256.lower(),))]
+
+    # -------------------------------------------------------------------------
+    # 조회
+    # -------------------------------------------------------------------------
+
+    def _query(self, board_id: Optional[int], signed: Optional[bool], tag: Optional[str],
+               below: Optional[str], exclude: Optional[str], newest: bool, limit: Optional[int]) -> Tuple[str, list]:
+        columns = "i.path, i.sha256, i.board_id, i.version, i.signed"
+        conditions, parameters = [], []
+        if tag is not None:
+            source = "tags t JOIN images i ON i.sha256 = t.sha256"
+            conditions.append("t.tag = ?")
+            parameters.append(tag)
+        else:
+            source = "images i"
+        for condition, value in (("i.board_id = ?", board_id), ("i.signed = ?", signed),
+                                 ("i.version_number < ?", version_number(below) if below is not None else None),
+                                 ("i.sha256 != ?", exclude)):
+            if value is not None:
+                conditions.append(condition)
+                parameters.append(int(value) if isinstance(value, bool) else value)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        order = "DESC" if newest else "ASC"
+        sql = f"SELECT {columns} FROM {source}{where} ORDER BY i.version_number {order}, i.sha256 {order}"
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        return sql, parameters
+
+    def find(self, board_id: Optional[int] = None, signed: Optional[bool] = None, tag: Optional[str] = None,
+             below: Optional[str] = None, exclude: Optional[str] = None, newest: bool = False,
+             limit: Optional[int] = None, with_tags: bool = True) -> List[CatalogEntry]:
+        """조건에 맞는 이미지 (버전 오름차순, newest면 내림차순)
+
+        below: 이 버전보다 낮은 이미지만, exclude: 제외할 sha256 (현재 설치 이미지 등)
+        """
+        sql, parameters = self._query(board_id, signed, tag, below, exclude, newest, limit)
+        entries = [CatalogEntry(path=path, sha256=sha256, board_id=board, version=version, signed=bool(is_signed))
+                   for path, sha256, board, version, is_signed in self.connection.execute(sql, parameters)]
+        if with_tags:
+            for entry in entries:
+                entry.tags = self.tags(entry.sha256)
+        return entries
+
+    def oldest(self, board_id: Optional[int] = None, signed: Optional[bool] = None, tag: Optional[str] = None,
+               below: Optional[str] = None, exclude: Optional[str] = None) -> Optional[CatalogEntry]:
+        """조건에 맞는 가장 오래된 이미지 하나"""
+        entries = self.find(board_id, signed, tag, below, exclude, limit=1)
+        return entries[0] if entries else None
+
+    def lookup(self, sha256: str) -> List[CatalogEntry]:
+        """같은 내용(sha256)의 이미지들"""
+        rows = self.connection.execute(
+            "SELECT path, sha256, board_id, version, signed FROM images WHERE sha256 = ? ORDER BY path",
+            (sha256.lower(),)).fetchall()
+        tags = self.tags(sha256) if rows else []
+        return [CatalogEntry(path=path, sha256=digest, board_id=board, version=version, signed=bool(is_signed),
+                             tags=list(tags)) for path, digest, board, version, is_signed in rows]
+
+    def query_plan(self, **filters) -> List[str]:
+        """find()가 사용할 SQLite 실행 계획 (인덱스 사용 확인용)"""
+        filters.setdefault("limit", 1)
+        sql, parameters = self._query(filters.get("board_id"), filters.get("signed"), filters.get("tag"),
+                                      filters.get("below"), filters.get("exclude"), filters.get("newest", False),
+                                      filters.get("limit"))
+        return [row[-1] for row in self.connection.execute(f"EXPLAIN QUERY PLAN {sql}", parameters)]
+
+async def load_catalog(config: Dict[str, Any], engine: Optional[FirmwareEngine] = None) -> Optional[FirmwareCatalog]:
+    """공격 파라미터(catalog, firmware_dir)로 카탈로그 열기 - 둘 다 없으면 None
+
+    catalog는 DB 경로 또는 FirmwareCatalog, firmware_dir가 있으면 먼저 증분 가져오기를 한다.
+    """
+    source = config.get("catalog")
+    directory = config.get("firmware_dir")
+    if source is None and directory is None:
+        return None
+    catalog = source if isinstance(source, FirmwareCatalog) else FirmwareCatalog(source or ":memory:")
+    if directory:
+        await catalog.import_directory(directory, engine)
+    return catalog
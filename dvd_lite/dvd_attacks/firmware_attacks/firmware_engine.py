@@ -0,0 +1,471 @@
+# dvd_lite/dvd_attacks/firmware_attacks/firmware_engine.py
+"""
+펌웨어 이미지 분석 엔진
+.apj(ArduPilot) / .px4(PX4) / .bin(원시 이미지) 펌웨어를 mmap으로 열어 분석한다.
+
+- .apj / .px4: JSON의 "image" 값(base64(zlib(이미지)))을 문자열 전체를 복사하지 않고
+  mmap 구간에서 조각 단위로 base64 → zlib 스트리밍 디코딩해 작업 디렉터리에 원시 이미지로 기록
+- 내용 정의 청킹(CDC): 32비트 gear 해시를 numpy로 한 번에 계산해 경계 후보를 찾고 (구간별 병렬),
+  min_chunk / max_chunk 제한으로 경계를 고른 뒤 청크마다 blake2b 해시 (구간별 병렬)
+- 비교: 청크 해시가 같은 부분은 재사용, 나머지만 변경 구간으로 보고하고
+  같은 위치 덮어쓰기 변경은 바이트 단위로 좁힘
+- ArduPilot app descriptor(보드 ID, 버전, 서명 블록) 해석
+
+CPU 위주 단계는 모두 @cpu_stage 모듈 함수이며 이미지 경로만 주고받으므로 (작업자가 직접 mmap)
+공격 모듈에서 run_cpu=self.run_cpu로 넘기면 CPU 작업 레인의 프로세스 풀에서 병렬로 실행된다.
+"""
+
+import asyncio
+import base64
+import hashlib
+import json
+import logging
+import mmap
+import os
+import random
+import re
+import shutil
+import struct
+import tempfile
+import zlib
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Tuple, Callable
+
+from ...cpu_lane import CPULane, cpu_stage
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# JSON 펌웨어 형식 (확장자 → magic)
+JSON_FORMATS = {"apj": "APJFWv1", "px4": "PX4FWv1"}
+IMAGE_KEY = re.compile(rb'"image"\s*:\s*"')
+DECODE_CHUNK = 1 << 20
+
+# ArduPilot app descriptor: 서명 8바이트 + crc1, crc2, 이미지 크기, git 해시, 버전, 보드 ID, 예약
+# 서명된 이미지는 바로 뒤에 서명 길이(u32) + 서명(72바이트)이 이어짐
+APP_DESCRIPTOR_MAGIC = b"\x41\xa3\xe5\xf2\x65\x69\x92\x07"
+APP_DESCRIPTOR = struct.Struct("<8sIIIIBBH8s")
+APP_SIGNATURE = struct.Struct("<I72s")
+
+# gear 해시 테이블 (고정 시드 - 같은 내용이면 어디서든 같은 경계)
+GEAR_WINDOW = 32
+_gear_random = random.Random(0x6EA5)
+GEAR_TABLE = [_gear_random.getrandbits(32) for _ in range(256)]
+
+class FirmwareError(Exception):
+    """펌웨어 형식 오류 (magic 불일치, 이미지 크기 불일치 등)"""
+
+# =============================================================================
+# 이미지 디코딩 / 해석 (작업자 프로세스에서 실행)
+# =============================================================================
+
+def _map(path: str):
+    """읽기 전용 mmap (빈 파일이면 None)"""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+@cpu_stage
+def open_firmware(path: str, work_dir: str) -> Tuple[str, Dict[str, Any], str, int]:
+    """펌웨어 파일 → (형식, 메타데이터, 원시 이미지 경로, 이미지 크기)
+
+    JSON 형식은 "image" 문자열 구간을 mmap에서 찾아 조각 단위로 디코딩해 work_dir에 기록한다.
+    """
+    view = _map(path)
+    if view is None:
+        raise FirmwareError(f"빈 펌웨어 파일: {path}")
+    try:
+        if view[:1] != b"{":
+            return "bin", {}, path, len(view)
+
+        match = IMAGE_KEY.search(view)
+        if match is None:
+            raise FirmwareError(f"image 항목이 없는 펌웨어: {path}")
+        start = match.end()
+        end = view.find(b'"', start)
+        # 이미지 문자열을 뺀 나머지만 JSON으로 해석
+        metadata = json.loads(view[:start] + view[end:])
+        fmt = next((name for name, magic in JSON_FORMATS.items() if metadata.get("magic") == magic), None)
+        if fmt is None:
+            raise FirmwareError(f"알 수 없는 펌웨어 magic: {metadata.get('magic')!r}")
+        metadata.pop("image", None)
+
+        image_path = os.path.join(work_dir, f"{hashlib.blake2b(os.path.abspath(path).encode(), digest_size=8).hexdigest()}.img")
+        decompressor = zlib.decompressobj()
+        size = 0
+        carry = b""
+        with open(image_path, "wb") as out:
+            for position in range(start, end, DECODE_CHUNK):
+                piece = carry + view[position:min(end, position + DECODE_CHUNK)]
+                usable = len(piece) - len(piece) % 4 if position + DECODE_CHUNK < end else len(piece)
+                data = decompressor.decompress(base64.b64decode(piece[:usable]))
+                carry = piece[usable:]
+                out.write(data)
+                size += len(data)
+            data = decompressor.flush()
+            out.write(data)
+            size += len(data)
+    except (ValueError, zlib.error) as e:
+        raise FirmwareError(f"펌웨어 디코딩 실패: {path} ({e})")
+    finally:
+        view.close()
+
+    expected = metadata.get("image_size")
+    if expected is not None and expected != size:
+        raise FirmwareError(f"이미지 크기 불일치: {path} (메타데이터 {expected}, 디코딩 {size})")
+    return fmt, metadata, image_path, size
+
+def parse_app_descriptor(image) -> Optional[Dict[str, Any]]:
+    """이미지에서 ArduPilot app descriptor 검색 - 없으면 None"""
+    offset = image.find(APP_DESCRIPTOR_MAGIC)
+    if offset < 0 or offset + APP_DESCRIPTOR.size > len(image):
+        return None
+    _, crc1, crc2, image_size, git_hash, major, minor, board_id, _ = APP_DESCRIPTOR.unpack_from(image, offset)
+    descriptor = {"offset": offset, "image_crc1": crc1, "image_crc2": crc2, "image_size": image_size,
+                  "git_hash": f"{git_hash:08x}", "version": f"{major}.{minor}", "board_id": board_id,
+                  "signed": False, "signature_offset": None}
+    signature_offset = offset + APP_DESCRIPTOR.size
+    if signature_offset + APP_SIGNATURE.size <= len(image):
+        length, signature = APP_SIGNATURE.unpack_from(image, signature_offset)
+        if 0 < length <= len(signature) and any(signature[:length]):
+            descriptor.update(signed=True, signature_offset=signature_offset, signature_length=length)
+    return descriptor
+
+@cpu_stage
+def image_digest(image_path: str) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """이미지 전체 sha256과 app descriptor"""
+    view = _map(image_path)
+    if view is None:
+        return hashlib.sha256().hexdigest(), None
+    try:
+        return hashlib.sha256(view).hexdigest(), parse_app_descriptor(view)
+    finally:
+        view.close()
+
+def gear_hash(data):
+    """위치마다 직전 GEAR_WINDOW 바이트의 gear 해시 (h = (h << 1) + gear[b]를 벡터로 전개)"""
+    table = np.asarray(GEAR_TABLE, dtype=np.uint32)
+    values = table[data]
+    hashes = values.copy()
+    for shift in range(1, GEAR_WINDOW):
+        hashes[shift:] += values[:-shift] << np.uint32(shift)
+    return hashes
+
+@cpu_stage
+def cdc_candidates(image_path: str, start: int, end: int, mask: int):
+    """[start, end) 안의 청크 경계 후보 (경계 = 해시 & mask == 0인 바이트 다음 위치)"""
+    view = _map(image_path)
+    if view is None:
+        return np.zeros(0, dtype=np.int64)
+    try:
+        # 앞 구간과 이어지도록 창 크기만큼 겹쳐 읽음
+        lead = min(start, GEAR_WINDOW - 1)
+        data = np.frombuffer(view, dtype=np.uint8, count=end - start + lead, offset=start - lead)
+        hashes = gear_hash(data)[lead:]
+        positions = np.flatnonzero((hashes & np.uint32(mask)) == 0) + start + 1
+        del data
+        return positions.astype(np.int64)
+    finally:
+        view.close()
+
+@cpu_stage
+def hash_chunks(image_path: str, bounds: List[int]) -> List[str]:
+    """bounds[i]:bounds[i+1] 청크마다 blake2b(16바이트) 해시"""
+    view = _map(image_path)
+    if view is None:
+        return []
+    try:
+        chunk_view = memoryview(view)
+        digests = [hashlib.blake2b(chunk_view[start:end], digest_size=16).hexdigest()
+                   for start, end in zip(bounds, bounds[1:])]
+        chunk_view.release()
+        return digests
+    finally:
+        view.close()
+
+@cpu_stage
+def refine_regions(old_path: str, new_path: str, regions: List[Tuple[int, int]],
+                   merge_gap: int = 16) -> List[Tuple[int, int]]:
+    """같은 위치에 대응 구간이 있는 변경 구간을 실제로 다른 바이트 범위로 좁힘"""
+    old_view, new_view = _map(old_path), _map(new_path)
+    try:
+        old_size = len(old_view) if old_view is not None else 0
+        refined: List[Tuple[int, int]] = []
+        for offset, length in regions:
+            if offset + length > old_size:
+                refined.append((offset, length))
+                continue
+            old = np.frombuffer(old_view, dtype=np.uint8, count=length, offset=offset)
+            new = np.frombuffer(new_view, dtype=np.uint8, count=length, offset=offset)
+            changed = np.flatnonzero(old != new)
+            del old, new
+            if not len(changed):
+                continue
+            # merge_gap 이하로 떨어진 바이트 차이는 한 구간으로
+            breaks = np.flatnonzero(np.diff(changed) > merge_gap)
+            starts = np.concatenate(([changed[0]], changed[breaks + 1]))
+            ends = np.concatenate((changed[breaks], [changed[-1]])) + 1
+            refined.extend((offset + int(s), int(e - s)) for s, e in zip(starts, ends))
+        return refined
+    finally:
+        for view in (old_view, new_view):
+            if view is not None:
+                view.close()
+
+def select_boundaries(candidates, size: int, min_chunk: int, max_chunk: int) -> List[int]:
+    """경계 후보에서 min_chunk / max_chunk를 지키는 청크 경계 선택 (0과 size 포함)"""
+    bounds = [0]
+    last = 0
+    while last < size:
+        index = np.searchsorted(candidates, last + min_chunk)
+        cut = min(last + max_chunk, size)
+        if index < len(candidates) and candidates[index] < cut:
+            cut = int(candidates[index])
+        bounds.append(cut)
+        last = cut
+    return bounds
+
+# =============================================================================
+# 분석 결과
+# =============================================================================
+
+@dataclass
+class FirmwareManifest:
+    """펌웨어 분석 결과 (청크 목록 포함)"""
+    path: str
+    format: str
+    image_path: str
+    image_size: int
+    sha256: str
+    board_id: Optional[int]
+    version: Optional[str]
+    git_identity: Optional[str]
+    signed: bool
+    descriptor: Optional[Dict[str, Any]]
+    metadata: Dict[str, Any]
+    chunk_offsets: List[int] = field(default_factory=list)
+    chunk_digests: List[str] = field(default_factory=list)
+
+    @property
+    def name(self) -> str:
+        return os.path.basename(self.path)
+
+    @property
+    def version_key(self) -> Tuple[int, ...]:
+        """버전 비교용 정수 튜플 ("4.5.1" → (4, 5, 1))"""
+        return tuple(int(part) for part in re.findall(r"\d+", self.version or ""))
+
+    def chunks(self) -> List[Tuple[int, int, str]]:
+        """(오프셋, 길이, 해시) 목록"""
+        ends = self.chunk_offsets[1:] + [self.image_size]
+        return [(start, end - start, digest) for start, end, digest
+                in zip(self.chunk_offsets, ends, self.chunk_digests)]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"name": self.name, "format": self.format, "image_size": self.image_size, "sha256": self.sha256,
+                "board_id": self.board_id, "version": self.version, "git_identity": self.git_identity,
+                "signed": self.signed, "chunks": len(self.chunk_digests)}
+
+@dataclass
+class FirmwareDiff:
+    """두 펌웨어 이미지 비교 결과 (변경 구간은 새 이미지 기준)"""
+    old_sha256: str
+    new_sha256: str
+    old_size: int
+    new_size: int
+    reused_bytes: int
+    changed_bytes: int
+    removed_bytes: int
+    regions: List[Tuple[int, int]]
+
+    @property
+    def identical(self) -> bool:
+        return self.old_sha256 == self.new_sha256
+
+    @property
+    def similarity(self) -> float:
+        return self.reused_bytes / self.new_size if self.new_size else 1.0
+
+    def to_dict(self, max_regions: int = 50) -> Dict[str, Any]:
+        return {"old_sha256": self.old_sha256, "new_sha256": self.new_sha256, "old_size": self.old_size,
+                "new_size": self.new_size, "reused_bytes": self.reused_bytes, "changed_bytes": self.changed_bytes,
+                "removed_bytes": self.removed_bytes, "similarity": round(self.similarity, 4),
+                "region_count": len(self.regions),
+                "regions": [[offset, length] for offset, length in self.regions[:max_regions]]}
+
+# =============================================================================
+# 엔진
+# =============================================================================
+
+class FirmwareEngine:
+    """펌웨어 분석 / 비교 / 패치
+
+    run_cpu에 BaseAttack.run_cpu를 넘기면 CPU 작업 레인에서 병렬 실행하고, 없으면 바로 실행한다.
+    디코딩한 이미지는 work_dir(미지정 시 임시 디렉터리, close()에서 삭제)에 둔다.
+    """
+
+    def __init__(self, run_cpu: Optional[Callable] = None, parallelism: int = 4, avg_chunk: int = 8192,
+                 min_chunk: int = 2048, max_chunk: int = 65536, work_dir: Optional[str] = None):
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("펌웨어 분석 엔진에는 numpy가 필요합니다")
+        self.run_cpu = run_cpu or CPULane(max_workers=0).run
+        self.parallelism = max(1, parallelism)
+        # 평균 청크 크기의 비트 수만큼 해시 상위 비트를 검사 (상위 비트가 창 전체 바이트의 영향을 받음)
+        bits = max(1, avg_chunk.bit_length() - 1)
+        self.mask = ((1 << bits) - 1) << (32 - bits)
+        self.min_chunk = min_chunk
+        self.max_chunk = max_chunk
+        self._owns_work_dir = work_dir is None
+        self.work_dir = work_dir or tempfile.mkdtemp(prefix="dvd_firmware_")
+        os.makedirs(self.work_dir, exist_ok=True)
+
+    def close(self) -> None:
+        if self._owns_work_dir:
+            shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def __enter__(self) -> "FirmwareEngine":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _split(self, start: int, end: int) -> List[Tuple[int, int]]:
+        step = max(self.max_chunk, -(-(end - start) // self.parallelism))
+        return [(position, min(end, position + step)) for position in range(start, end, step)]
+
+    async def analyze(self, path: str) -> FirmwareManifest:
+        """펌웨어 하나 분석 (디코딩 → 경계 후보 / 전체 해시 → 청크 해시)"""
+        fmt, metadata, image_path, size = await self.run_cpu(open_firmware, path, self.work_dir)
+
+        ranges = self._split(0, size)
+        results = await asyncio.gather(
+            self.run_cpu(image_digest, image_path),
+            *(self.run_cpu(cdc_candidates, image_path, start, end, self.mask) for start, end in ranges))
+        (sha256, descriptor), candidates = results[0], results[1:]
+        candidates = np.concatenate(candidates) if candidates else np.zeros(0, dtype=np.int64)
+        bounds = select_boundaries(candidates, size, self.min_chunk, self.max_chunk)
+
+        # 청크 해시는 청크 경계 목록을 나눠 병렬로
+        per_task = max(1, -(-(len(bounds) - 1) // self.parallelism))
+        groups = [bounds[index:index + per_task + 1] for index in range(0, len(bounds) - 1, per_task)]
+        digests = [digest for group in await asyncio.gather(*(self.run_cpu(hash_chunks, image_path, group)
+                                                              for group in groups)) for digest in group]
+
+        descriptor = descriptor or {}
+        board_id = metadata.get("board_id", descriptor.get("board_id"))
+        version = metadata.get("version") or descriptor.get("version")
+        manifest = FirmwareManifest(
+            path=path, format=fmt, image_path=image_path, image_size=size, sha256=sha256,
+            board_id=board_id, version=str(version) if version is not None else None,
+            git_identity=metadata.get("git_identity") or descriptor.get("git_hash"),
+            signed=bool(metadata.get("signed_firmware") or descriptor.get("signed")),
+            descriptor=descriptor or None, metadata=metadata,
+            chunk_offsets=bounds[:-1], chunk_digests=digests)
+        logger.info(f"🔍 펌웨어 분석: {manifest.name} ({fmt}, {size}바이트, 청크 {len(digests)}개)")
+        return manifest
+
+    async def analyze_many(self, paths: List[str]) -> List[FirmwareManifest]:
+        return list(await asyncio.gather(*(self.analyze(path) for path in paths)))
+
+    async def diff(self, old: FirmwareManifest, new: FirmwareManifest, exact: bool = True) -> FirmwareDiff:
+        """청크 해시 비교 - exact면 같은 위치 덮어쓰기 변경을 바이트 단위로 좁힘"""
+        old_digests = set(old.chunk_digests)
+        new_digests = set(new.chunk_digests)
+        regions: List[Tuple[int, int]] = []
+        reused = 0
+        for offset, length, digest in new.chunks():
+            if digest in old_digests:
+                reused += length
+            elif regions and regions[-1][0] + regions[-1][1] == offset:
+                regions[-1] = (regions[-1][0], regions[-1][1] + length)
+            else:
+                regions.append((offset, length))
+        removed = sum(length for _, length, digest in old.chunks() if digest not in new_digests)
+
+        if exact and regions:
+            regions = await self.run_cpu(refine_regions, old.image_path, new.image_path, regions)
+        changed = sum(length for _, length in regions)
+        return FirmwareDiff(old.sha256, new.sha256, old.image_size, new.image_size, reused, changed,
+                            removed, regions)
+
+    def read_image(self, manifest: FirmwareManifest) -> bytes:
+        with open(manifest.image_path, "rb") as f:
+            return f.read()
+
+# =============================================================================
+# 이미지 조작 / 작성
+# =============================================================================
+
+def patch_image(image: bytes, offset: int, data: bytes) -> bytes:
+    """offset 위치를 data로 덮어쓴 이미지 (크기 유지)"""
+    if offset < 0 or offset + len(data) > len(image):
+        raise FirmwareError(f"패치 범위가 이미지를 벗어남: 0x{offset:x}+{len(data)}")
+    patched = bytearray(image)
+    patched[offset:offset + len(data)] = data
+    return bytes(patched)
+
+def find_padding(image: bytes, fill: int = 0xFF, minimum: int = 64) -> Optional[Tuple[int, int]]:
+    """가장 긴 채움 바이트 구간 (오프셋, 길이) - 삽입 코드를 숨길 자리"""
+    data = np.frombuffer(image, dtype=np.uint8)
+    if not len(data):
+        return None
+    is_fill = np.concatenate(([False], data == fill, [False]))
+    edges = np.flatnonzero(np.diff(is_fill.astype(np.int8)))
+    if not len(edges):
+        return None
+    starts, ends = edges[0::2], edges[1::2]
+    index = int(np.argmax(ends - starts))
+    length = int(ends[index] - starts[index])
+    return (int(starts[index]), length) if length >= minimum else None
+
+def strip_signature(image: bytes) -> Tuple[bytes, Optional[Tuple[int, int]]]:
+    """app descriptor의 서명 블록을 0으로 지운 이미지와 지운 구간"""
+    descriptor = parse_app_descriptor(image)
+    if not descriptor or not descriptor["signed"]:
+        return image, None
+    offset = descriptor["signature_offset"]
+    return patch_image(image, offset, bytes(APP_SIGNATURE.size)), (offset, APP_SIGNATURE.size)
+
+def write_firmware(path: str, image: bytes, fmt: Optional[str] = None, **metadata) -> str:
+    """이미지를 .apj / .px4 (JSON + base64(zlib)) 또는 .bin으로 기록 - fmt 미지정 시 확장자로 결정"""
+    fmt = fmt or os.path.splitext(path)[1].lstrip(".").lower()
+    if fmt not in JSON_FORMATS:
+        with open(path, "wb") as f:
+            f.write(image)
+        return path
+    # 보드 ID / 버전 기본값은 app descriptor에서
+    descriptor = parse_app_descriptor(image) or {}
+    document = {"magic": JSON_FORMATS[fmt], "board_id": descriptor.get("board_id", 9), "board_revision": 0,
+                "version": descriptor.get("version", "0.1"), "summary": "", "description": "",
+                "git_identity": descriptor.get("git_hash", ""), "build_time": 0}
+    document.update(metadata)
+    document.update(image_size=len(image), image=base64.b64encode(zlib.compress(image, 9)).decode())
+    with open(path, "w") as f:
+        json.dump(document, f, indent=4)
+    return path
+
+def synthetic_image(size: int, seed: int = 0, board_id: int = 9, version: Tuple[int, int] = (4, 5),
+                    git_hash: int = 0, signed: bool = False, padding: float = 0.125) -> bytes:
+    """시험용 펌웨어 이미지 (의사 코드 + app descriptor + 0xFF 채움 영역)"""
+    generator = random.Random(seed)
+    body_size = size - int(size * padding)
+    # 반복되는 "함수" 조각을 섞어 실제 코드처럼 압축 가능한 이미지 생성
+    blocks = [generator.randbytes(generator.randint(64, 512)) for _ in range(64)]
+    body = bytearray()
+    while len(body) < body_size:
+        body += blocks[generator.randrange(len(blocks))]
+        body += generator.randbytes(16)
+    image = bytearray(body[:body_size]) + b"\xff" * (size - body_size)
+
+    descriptor = APP_DESCRIPTOR.pack(APP_DESCRIPTOR_MAGIC, zlib.crc32(image[:0x200]), 0, size, git_hash,
+                                     version[0], version[1], board_id, bytes(8))
+    signature = APP_SIGNATURE.pack(72 if signed else 0, generator.randbytes(72) if signed else bytes(72))
+    image[0x200:0x200 + len(descriptor) + len(signature)] = descriptor + signature
+    return bytes(image)
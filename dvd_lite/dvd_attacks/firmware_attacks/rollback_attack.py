@@ -1,25 +1,92 @@
 # dvd_lite/dvd_attacks/firmware_attacks/rollback_attack.py
 """
-FirmwareRollbackAttack 공격 (더미 구현)
+FirmwareRollbackAttack 공격
+current_firmware(현재 설치 이미지)와 candidate_firmware(후보 이미지 목록)를 FirmwareEngine으로 함께 분석해
+같은 보드용 이전 버전 중 가장 오래된 이미지(또는 target_version)를 고르고,
+현재 이미지와의 변경 구간을 IOC로 남긴다. 이미지가 주어지지 않으면 롤백을 시뮬레이션한다.
+
+catalog(펌웨어 카탈로그 DB) / firmware_dir를 주면 후보 목록 대신 카탈로그에서
+require_tag(예: 알려진 취약점 태그) / require_signed 조건에 맞는 가장 오래된 이미지를 고른다.
+
+주요 파라미터 (run_attack 키워드):
+    current_firmware, candidate_firmware (경로 또는 경로 목록), catalog, firmware_dir,
+    require_tag, require_signed, target_version, parallelism
 """
 import asyncio
-import random
+import sqlite3
 from typing import Tuple, List, Dict, Any
 from ..core.attack_base import BaseAttack
 from ..core.enums import AttackType
+from .firmware_engine import FirmwareEngine, FirmwareError, NUMPY_AVAILABLE
+from .firmware_catalog import FirmwareCatalog, load_catalog
 
 class FirmwareRollbackAttack(BaseAttack):
     """FirmwareRollbackAttack 공격"""
-    
+
     def _get_attack_type(self) -> AttackType:
-        return AttackType.RECONNAISSANCE  # 기본값
-    
+        return AttackType.FIRMWARE_ATTACKS
+
     async def _run_attack(self) -> Tuple[bool, List[str], Dict[str, Any]]:
-        """더미 공격 로직"""
-        await asyncio.sleep(random.uniform(1.0, 3.0))
-        
-        success = random.random() > 0.3
+        current_path = self.config.get("current_firmware")
+        candidates = self.config.get("candidate_firmware")
+        use_catalog = self.config.get("catalog") is not None or self.config.get("firmware_dir") is not None
+        if not current_path or not (candidates or use_catalog) or not NUMPY_AVAILABLE:
+            return await self._simulate()
+        candidates = [candidates] if isinstance(candidates, str) else list(candidates or [])
+        target_version = self.config.get("target_version")
+        details: Dict[str, Any] = {}
+        catalog = None
+
+        with FirmwareEngine(run_cpu=self.run_cpu, parallelism=self.config.get("parallelism", 4)) as engine:
+            try:
+                if use_catalog:
+                    catalog = await load_catalog(self.config, engine)
+                    current = await engine.analyze(current_path)
+                    entries = catalog.find(board_id=current.board_id, signed=self.config.get("require_signed"),
+                                           tag=self.config.get("require_tag"), below=current.version,
+                                           exclude=current.sha256)
+                    if target_version is not None:
+                        entries = [entry for entry in entries if entry.version == str(target_version)]
+                    details["candidates"] = [entry.to_dict() for entry in entries[:20]]
+                    older = [await engine.analyze(entries[0].path)] if entries else []
+                    tags = entries[0].tags if entries else []
+                else:
+                    current, *images = await engine.analyze_many([current_path] + candidates)
+                    details["candidates"] = [image.to_dict() for image in images]
+                    older = [image for image in images
+                             if image.board_id == current.board_id and image.version_key < current.version_key]
+                    if target_version is not None:
+                        older = [image for image in older if image.version == str(target_version)]
+                    tags = []
+                details["current"] = current.to_dict()
+                if not older:
+                    details.update(error="같은 보드용 이전 버전 이미지 없음", success_rate=0.0)
+                    return False, [], details
+
+                target = min(older, key=lambda image: image.version_key)
+                diff = await engine.diff(current, target)
+            except (OSError, FirmwareError, sqlite3.Error) as e:
+                details.update(error=str(e), success_rate=0.0)
+                return False, [], details
+            finally:
+                if catalog is not None and not isinstance(self.config.get("catalog"), FirmwareCatalog):
+                    catalog.close()
+
+        details.update(selected=target.to_dict(), selected_tags=tags, diff=diff.to_dict(), success_rate=1.0)
+        iocs = [
+            f"FIRMWARE_ROLLBACK:board{current.board_id}:{current.version}->{target.version}",
+            f"FIRMWARE_DIFF:{target.name}:{diff.changed_bytes}_bytes:{len(diff.regions)}_regions"
+        ]
+        iocs.extend(f"FIRMWARE_VULN_TAG:{target.name}:{tag}" for tag in tags)
+        self.record_progress(iocs=iocs, **details)
+        return True, iocs, details
+
+    async def _simulate(self) -> Tuple[bool, List[str], Dict[str, Any]]:
+        """롤백 시뮬레이션"""
+        await asyncio.sleep(self.random.uniform(1.0, 3.0))
+
+        success = self.random.random() > 0.3
         iocs = [f"FIRMWAREROLLBACKATTACK_IOC:dummy_indicator"]
         details = {"success_rate": 0.7 if success else 0.2}
-        
+
         return success, iocs, details
@@ -1,25 +1,92 @@
 # dvd_lite/dvd_attacks/firmware_attacks/secure_boot_bypass.py
 """
-SecureBootBypass 공격 (더미 구현)
+SecureBootBypass 공격
+firmware_path를 주면 app descriptor의 서명 블록을 확인한다.
+서명된 이미지는 서명을 지운 사본을 만들어 원본과 비교하고 (서명을 검사하지 않는 부트로더 시험용),
+서명이 없는 이미지는 그대로 미서명 IOC를 남긴다. firmware_path가 없으면 우회를 시뮬레이션한다.
+
+catalog(펌웨어 카탈로그 DB) / firmware_dir를 주면 같은 보드용으로 서명된 더 오래된 이미지
+(require_tag가 있으면 그 태그가 붙은 것)를 찾아, 서명 검증을 통과하는 다운그레이드 경로도 보고한다.
+
+주요 파라미터 (run_attack 키워드):
+    firmware_path, output_dir, catalog, firmware_dir, require_tag, parallelism
 """
 import asyncio
-import random
+import sqlite3
+import os
+import tempfile
 from typing import Tuple, List, Dict, Any
 from ..core.attack_base import BaseAttack
 from ..core.enums import AttackType
+from .firmware_engine import FirmwareEngine, FirmwareError, strip_signature, write_firmware, NUMPY_AVAILABLE
+from .firmware_catalog import FirmwareCatalog, load_catalog
 
 class SecureBootBypass(BaseAttack):
     """SecureBootBypass 공격"""
-    
+
     def _get_attack_type(self) -> AttackType:
-        return AttackType.RECONNAISSANCE  # 기본값
-    
+        return AttackType.FIRMWARE_ATTACKS
+
     async def _run_attack(self) -> Tuple[bool, List[str], Dict[str, Any]]:
-        """더미 공격 로직"""
-        await asyncio.sleep(random.uniform(1.0, 3.0))
-        
-        success = random.random() > 0.3
+        path = self.config.get("firmware_path")
+        if not path or not NUMPY_AVAILABLE:
+            return await self._simulate()
+        details: Dict[str, Any] = {}
+        catalog = None
+
+        with FirmwareEngine(run_cpu=self.run_cpu, parallelism=self.config.get("parallelism", 4)) as engine:
+            try:
+                original = await engine.analyze(path)
+                details["original"] = original.to_dict()
+                catalog_iocs = []
+                catalog = await load_catalog(self.config, engine)
+                if catalog is not None:
+                    catalog_iocs = self._signed_downgrade(catalog, original, details)
+                if not original.signed:
+                    details.update(descriptor=original.descriptor, success_rate=1.0)
+                    iocs = [f"FIRMWARE_UNSIGNED:{original.name}:board{original.board_id}"] + catalog_iocs
+                    self.record_progress(iocs=iocs, **details)
+                    return True, iocs, details
+
+                stripped, region = strip_signature(engine.read_image(original))
+                output_dir = self.config.get("output_dir") or tempfile.mkdtemp(prefix="dvd_firmware_")
+                os.makedirs(output_dir, exist_ok=True)
+                stem, extension = os.path.splitext(original.name)
+                output_path = write_firmware(os.path.join(output_dir, f"{stem}_unsigned{extension}"), stripped,
+                                             original.format, **original.metadata)
+                unsigned = await engine.analyze(output_path)
+                diff = await engine.diff(original, unsigned)
+            except (OSError, FirmwareError, sqlite3.Error) as e:
+                details.update(error=str(e), success_rate=0.0)
+                return False, [], details
+            finally:
+                if catalog is not None and not isinstance(self.config.get("catalog"), FirmwareCatalog):
+                    catalog.close()
+
+        details.update(unsigned=unsigned.to_dict(), output_path=output_path, diff=diff.to_dict(),
+                       success_rate=1.0 if not unsigned.signed else 0.0)
+        iocs = [f"SECURE_BOOT_SIGNATURE_STRIPPED:{original.name}:0x{region[0]:x}+{region[1]}",
+                f"FIRMWARE_TAMPERED:{unsigned.name}:{unsigned.sha256}"] + catalog_iocs
+        self.record_progress(iocs=iocs, **details)
+        return not unsigned.signed, iocs, details
+
+    def _signed_downgrade(self, catalog: FirmwareCatalog, original, details: Dict[str, Any]) -> List[str]:
+        """카탈로그에서 서명 검증을 통과하는 이전 버전 이미지 검색"""
+        iocs = [f"FIRMWARE_VULN_TAG:{original.name}:{tag}" for tag in catalog.tags(original.sha256)]
+        entry = catalog.oldest(board_id=original.board_id, signed=True, tag=self.config.get("require_tag"),
+                               below=original.version, exclude=original.sha256)
+        details["signed_downgrade"] = entry.to_dict() if entry else None
+        if entry is not None:
+            iocs.append(f"SECURE_BOOT_DOWNGRADE:board{original.board_id}:{original.version}->{entry.version}")
+            iocs.extend(f"FIRMWARE_VULN_TAG:{entry.name}:{tag}" for tag in entry.tags)
+        return iocs
+
+    async def _simulate(self) -> Tuple[bool, List[str], Dict[str, Any]]:
+        """우회 시뮬레이션"""
+        await asyncio.sleep(self.random.uniform(1.0, 3.0))
+
+        success = self.random.random() > 0.3
         iocs = [f"SECUREBOOTBYPASS_IOC:dummy_indicator"]
         details = {"success_rate": 0.7 if success else 0.2}
-        
+
         return success, iocs, details
@@ -1,25 +1,79 @@
 # dvd_lite/dvd_attacks/injection/firmware_manipulation.py
 """
-FirmwareUploadManipulation 공격 (더미 구현)
+FirmwareUploadManipulation 공격
+firmware_path를 주면 FirmwareEngine으로 원본 펌웨어를 분석하고, 가장 긴 0xFF 채움 영역(또는 patch_offset)에
+payload를 심은 이미지를 같은 형식(.apj / .px4 / .bin)으로 다시 만든 뒤 원본과 비교해 변경 구간을 IOC로 남긴다.
+firmware_path가 없으면 조작을 시뮬레이션한다.
+
+주요 파라미터 (run_attack 키워드):
+    firmware_path, payload, patch_offset, output_dir, parallelism
 """
 import asyncio
-import random
+import os
+import tempfile
 from typing import Tuple, List, Dict, Any
 from ..core.attack_base import BaseAttack
 from ..core.enums import AttackType
+from ..firmware_attacks.firmware_engine import (
+    FirmwareEngine, FirmwareError, find_padding, patch_image, write_firmware, NUMPY_AVAILABLE
+)
+
+DEFAULT_PAYLOAD = b"DVD-LITE-IMPLANT" * 16
 
 class FirmwareUploadManipulation(BaseAttack):
     """FirmwareUploadManipulation 공격"""
-    
+
     def _get_attack_type(self) -> AttackType:
-        return AttackType.RECONNAISSANCE  # 기본값
-    
+        return AttackType.INJECTION
+
     async def _run_attack(self) -> Tuple[bool, List[str], Dict[str, Any]]:
-        """더미 공격 로직"""
-        await asyncio.sleep(random.uniform(1.0, 3.0))
-        
-        success = random.random() > 0.3
+        path = self.config.get("firmware_path")
+        if not path or not NUMPY_AVAILABLE:
+            return await self._simulate()
+
+        payload = self.config.get("payload", DEFAULT_PAYLOAD)
+        payload = payload.encode() if isinstance(payload, str) else bytes(payload)
+        details: Dict[str, Any] = {"payload_size": len(payload)}
+
+        with FirmwareEngine(run_cpu=self.run_cpu, parallelism=self.config.get("parallelism", 4)) as engine:
+            try:
+                original = await engine.analyze(path)
+                details["original"] = original.to_dict()
+                image = engine.read_image(original)
+                offset = self.config.get("patch_offset")
+                if offset is None:
+                    padding = find_padding(image, minimum=len(payload))
+                    if padding is None:
+                        details.update(error="페이로드를 넣을 채움 영역 없음", success_rate=0.0)
+                        return False, [], details
+                    offset = padding[0]
+                patched = patch_image(image, offset, payload)
+
+                output_dir = self.config.get("output_dir") or tempfile.mkdtemp(prefix="dvd_firmware_")
+                os.makedirs(output_dir, exist_ok=True)
+                stem, extension = os.path.splitext(original.name)
+                output_path = write_firmware(os.path.join(output_dir, f"{stem}_patched{extension}"), patched,
+                                             original.format, **original.metadata)
+                tampered = await engine.analyze(output_path)
+                diff = await engine.diff(original, tampered)
+            except (OSError, FirmwareError) as e:
+                details.update(error=str(e), success_rate=0.0)
+                return False, [], details
+
+        details.update(tampered=tampered.to_dict(), output_path=output_path, patch_offset=offset,
+                       diff=diff.to_dict(), signature_invalidated=original.signed, success_rate=1.0)
+        iocs = [f"FIRMWARE_TAMPERED:{tampered.name}:{tampered.sha256}"]
+        iocs.extend(f"FIRMWARE_PATCH:{tampered.name}:0x{region_offset:x}+{length}"
+                    for region_offset, length in diff.regions[:16])
+        self.record_progress(iocs=iocs, **details)
+        return True, iocs, details
+
+    async def _simulate(self) -> Tuple[bool, List[str], Dict[str, Any]]:
+        """조작 시뮬레이션"""
+        await asyncio.sleep(self.random.uniform(1.0, 3.0))
+
+        success = self.random.random() > 0.3
         iocs = [f"FIRMWAREUPLOADMANIPULATION_IOC:dummy_indicator"]
         details = {"success_rate": 0.7 if success else 0.2}
-        
+
         return success, iocs, details
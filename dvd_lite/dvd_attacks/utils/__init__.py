@@ -8,6 +8,9 @@ from .common import (
     calculate_success_probability, generate_ioc_id,
     format_duration, classify_risk_level
 )
+from .monte_carlo import (
+    MonteCarloEngine, MonteCarloEstimate, wilson_interval, scenario_models
+)
 
 __all__ = [
     'generate_fake_mac_address',
@@ -17,5 +20,9 @@ __all__ = [
     'calculate_success_probability',
     'generate_ioc_id',
     'format_duration',
-    'classify_risk_level'
+    'classify_risk_level',
+    'MonteCarloEngine',
+    'MonteCarloEstimate',
+    'wilson_interval',
+    'scenario_models'
 ]
\ No newline at end of file
@@ -9,39 +9,58 @@ DVD 공격 시스템 공통 유틸리티
 import random
 import time
 import asyncio
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union
 
-def generate_fake_mac_address() -> str:
-    """가짜 MAC 주소 생성"""
-    return ":".join([f"{random.randint(0, 255):02x}" for _ in range(6)])
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
 
-def generate_fake_ip_address(network: str = "192.168.13") -> str:
+def generate_fake_mac_address(rng: Optional[random.Random] = None) -> str:
+    """가짜 MAC 주소 생성 (rng: 실험 난수 스트림, 기본값은 전역 random)"""
+    rng = rng or random
+    return ":".join([f"{rng.randint(0, 255):02x}" for _ in range(6)])
+
+def generate_fake_ip_address(network: str = "192.168.13", rng: Optional[random.Random] = None) -> str:
     """가짜 IP 주소 생성"""
-    return f"{network}.{random.randint(1, 254)}"
+    rng = rng or random
+    return f"{network}.{rng.randint(1, 254)}"
 
-def simulate_network_delay(min_delay: float = 0.1, max_delay: float = 2.0) -> float:
+def simulate_network_delay(min_delay: float = 0.1, max_delay: float = 2.0,
+                           rng: Optional[random.Random] = None) -> float:
     """네트워크 지연 시뮬레이션"""
-    delay = random.uniform(min_delay, max_delay)
+    delay = (rng or random).uniform(min_delay, max_delay)
     time.sleep(delay)
     return delay
 
-async def async_network_delay(min_delay: float = 0.1, max_delay: float = 2.0) -> float:
+async def async_network_delay(min_delay: float = 0.1, max_delay: float = 2.0,
+                              rng: Optional[random.Random] = None) -> float:
     """비동기 네트워크 지연 시뮬레이션"""
-    delay = random.uniform(min_delay, max_delay)
+    delay = (rng or random).uniform(min_delay, max_delay)
     await asyncio.sleep(delay)
     return delay
 
-def calculate_success_probability(base_rate: float, modifiers: List[float]) -> float:
-    """성공 확률 계산"""
+def calculate_success_probability(base_rate: Union[float, "np.ndarray"],
+                                  modifiers: List[Union[float, "np.ndarray"]]) -> Union[float, "np.ndarray"]:
+    """성공 확률 계산 (numpy 배열 입력 시 원소별로 일괄 계산)"""
+    if NUMPY_AVAILABLE and (isinstance(base_rate, np.ndarray) or
+                            any(isinstance(modifier, np.ndarray) for modifier in modifiers)):
+        modified_rates = np.asarray(base_rate, dtype=np.float64)
+        for modifier in modifiers:
+            modified_rates = modified_rates * modifier
+        return np.clip(modified_rates, 0.0, 1.0)
+    
     modified_rate = base_rate
     for modifier in modifiers:
         modified_rate *= modifier
     return max(0.0, min(1.0, modified_rate))
 
-def generate_ioc_id(prefix: str = "DVD") -> str:
+def generate_ioc_id(prefix: str = "DVD", rng: Optional[random.Random] = None) -> str:
     """IOC ID 생성"""
     timestamp = int(time.time())
-    random_suffix = random.randint(1000, 9999)
+    random_suffix = (rng or random).randint(1000, 9999)
     return f"{prefix}_{timestamp}_{random_suffix}"
 
 def format_duration(seconds: float) -> str:
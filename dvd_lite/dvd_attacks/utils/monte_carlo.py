@@ -0,0 +1,202 @@
+# dvd_attacks/utils/monte_carlo.py
+"""
+몬테카를로 공격 성공률 추정기
+시나리오별 확률 모델(StochasticModel)을 numpy 배치 연산으로 대량 시행하여 신뢰구간과 함께 추정
+"""
+import logging
+import math
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, asdict
+from statistics import NormalDist
+from typing import List, Dict, Any, Optional, Tuple
+
+from .common import calculate_success_probability, NUMPY_AVAILABLE, np
+from ..core.scenario import StochasticModel
+
+logger = logging.getLogger(__name__)
+
+# 배치당 시행 수 (배치 하나가 float64 배열 몇 개 분량의 메모리를 사용)
+DEFAULT_BATCH_SIZE = 1_000_000
+
+def wilson_interval(successes: int, trials: int, confidence: float = 0.95) -> Tuple[float, float]:
+    """성공 비율의 윌슨 점수 신뢰구간"""
+    if trials <= 0:
+        return 0.0, 1.0
+
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    rate = successes / trials
+    denominator = 1 + z * z / trials
+    centre = (rate + z * z / (2 * trials)) / denominator
+    half_width = z * math.sqrt(rate * (1 - rate) / trials + z * z / (4 * trials * trials)) / denominator
+    return max(0.0, centre - half_width), min(1.0, centre + half_width)
+
+def simulate_batch(model: StochasticModel, trials: int, seed_sequence) -> Tuple[int, float, float]:
+    """배치 하나 시행 - (성공 수, 실행 시간 합, 실행 시간 제곱합) 반환"""
+    rng = np.random.default_rng(seed_sequence)
+    probability = calculate_success_probability(model.success_probability, model.modifiers)
+
+    if model.trials == 1 and model.min_successes == 1:
+        successes = int(np.count_nonzero(rng.random(trials) < probability))
+    else:
+        hits = rng.binomial(model.trials, probability, size=trials)
+        successes = int(np.count_nonzero(hits >= model.min_successes))
+
+    if model.duration_max > model.duration_min:
+        durations = rng.uniform(model.duration_min, model.duration_max, size=trials)
+        return successes, float(durations.sum()), float(np.dot(durations, durations))
+
+    return successes, model.duration_min * trials, model.duration_min ** 2 * trials
+
+def _run_batch(task: Tuple[str, StochasticModel, int, Any]) -> Tuple[str, int, int, float, float]:
+    """프로세스 풀 작업 단위"""
+    name, model, trials, seed_sequence = task
+    successes, duration_sum, duration_sq_sum = simulate_batch(model, trials, seed_sequence)
+    return name, trials, successes, duration_sum, duration_sq_sum
+
+def scenario_models() -> Dict[str, StochasticModel]:
+    """등록된 DVD 시나리오의 확률 모델 목록"""
+    from ..registry.management import DVD_ATTACK_SCENARIOS
+
+    return {
+        name: info["scenario"].stochastic_model
+        for name, info in DVD_ATTACK_SCENARIOS.items()
+        if info["scenario"].stochastic_model is not None
+    }
+
+@dataclass
+class MonteCarloEstimate:
+    """시나리오별 몬테카를로 추정 결과"""
+    scenario: str
+    trials: int
+    successes: int
+    success_rate: float
+    ci_low: float
+    ci_high: float
+    confidence: float
+    mean_duration: float
+    duration_std: float
+    seed: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    def compare_with(self, results: List[Any]) -> Dict[str, Any]:
+        """실제 AttackResult 통계와 비교 - 추정치가 실측 신뢰구간 안에 있으면 일치로 판단"""
+        live_trials = len(results)
+        live_successes = sum(1 for result in results if result.status.value == "success")
+        live_rate = live_successes / live_trials if live_trials else 0.0
+        live_ci = wilson_interval(live_successes, live_trials, self.confidence)
+        live_mean_duration = (
+            sum(result.response_time for result in results) / live_trials if live_trials else 0.0
+        )
+
+        return {
+            "scenario": self.scenario,
+            "live_trials": live_trials,
+            "live_successes": live_successes,
+            "live_success_rate": live_rate,
+            "live_ci": list(live_ci),
+            "estimated_success_rate": self.success_rate,
+            "estimated_ci": [self.ci_low, self.ci_high],
+            "difference": live_rate - self.success_rate,
+            "consistent": live_trials > 0 and live_ci[0] <= self.success_rate <= live_ci[1],
+            "live_mean_duration": live_mean_duration,
+            "estimated_mean_duration": self.mean_duration
+        }
+
+class MonteCarloEngine:
+    """몬테카를로 성공률 추정 엔진
+
+    시나리오 이름과 시드로부터 배치별 SeedSequence를 결정적으로 파생하므로,
+    직렬 실행과 프로세스 풀 실행, 단일 시나리오와 전체 시나리오 실행의 결과가 동일하다.
+    """
+
+    def __init__(self, trials: int = 1_000_000, batch_size: int = DEFAULT_BATCH_SIZE,
+                 confidence: float = 0.95, seed: Optional[int] = None,
+                 max_workers: Optional[int] = None):
+        if not NUMPY_AVAILABLE:
+            raise ImportError("몬테카를로 추정에는 numpy가 필요합니다: pip install numpy")
+
+        self.trials = trials
+        self.batch_size = batch_size
+        self.confidence = confidence
+        self.seed = np.random.SeedSequence(seed).entropy if seed is None else seed
+        self.max_workers = max_workers
+
+    def estimate(self, name: str, model: StochasticModel) -> MonteCarloEstimate:
+        """단일 시나리오 추정"""
+        return self.estimate_all({name: model})[name]
+
+    def estimate_all(self, models: Optional[Dict[str, StochasticModel]] = None,
+                     use_processes: bool = False) -> Dict[str, MonteCarloEstimate]:
+        """여러 시나리오 추정 (기본값: 등록된 전체 시나리오)"""
+        models = scenario_models() if models is None else models
+        tasks = self._plan(models)
+
+        if use_processes:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+                outputs = list(pool.map(_run_batch, tasks))
+        else:
+            outputs = [_run_batch(task) for task in tasks]
+
+        totals = {name: [0, 0, 0.0, 0.0] for name in models}
+        for name, trials, successes, duration_sum, duration_sq_sum in outputs:
+            total = totals[name]
+            total[0] += trials
+            total[1] += successes
+            total[2] += duration_sum
+            total[3] += duration_sq_sum
+
+        estimates = {}
+        for name, (trials, successes, duration_sum, duration_sq_sum) in totals.items():
+            mean_duration = duration_sum / trials if trials else 0.0
+            variance = max(0.0, duration_sq_sum / trials - mean_duration ** 2) if trials else 0.0
+            ci_low, ci_high = wilson_interval(successes, trials, self.confidence)
+
+            estimates[name] = MonteCarloEstimate(
+                scenario=name,
+                trials=trials,
+                successes=successes,
+                success_rate=successes / trials if trials else 0.0,
+                ci_low=ci_low,
+                ci_high=ci_high,
+                confidence=self.confidence,
+                mean_duration=mean_duration,
+                duration_std=math.sqrt(variance),
+                seed=self.seed
+            )
+
+        logger.info(f"몬테카를로 추정 완료: {len(estimates)}개 시나리오, 시나리오당 {self.trials}회")
+        return estimates
+
+    def compare_with_live(self, estimates: Dict[str, MonteCarloEstimate],
+                          results: List[Any]) -> Dict[str, Dict[str, Any]]:
+        """실제 실행 결과(AttackResult 목록)와 시나리오별 비교"""
+        from ..registry.management import DVD_ATTACK_SCENARIOS
+
+        class_to_scenario = {info["class"].__name__: name for name, info in DVD_ATTACK_SCENARIOS.items()}
+
+        grouped: Dict[str, List[Any]] = {}
+        for result in results:
+            name = class_to_scenario.get(result.attack_name, result.attack_name)
+            grouped.setdefault(name, []).append(result)
+
+        return {
+            name: estimates[name].compare_with(live_results)
+            for name, live_results in grouped.items()
+            if name in estimates
+        }
+
+    def _plan(self, models: Dict[str, StochasticModel]) -> List[Tuple[str, StochasticModel, int, Any]]:
+        """배치 작업 목록 생성 - 시나리오 이름의 CRC32로 독립 스트림 파생"""
+        tasks = []
+        for name in sorted(models):
+            root = np.random.SeedSequence(self.seed, spawn_key=(zlib.crc32(name.encode()),))
+            batch_count = max(1, math.ceil(self.trials / self.batch_size))
+
+            for index, batch_seed in enumerate(root.spawn(batch_count)):
+                batch_trials = min(self.batch_size, self.trials - index * self.batch_size)
+                tasks.append((name, models[name], batch_trials, batch_seed))
+
+        return tasks
@@ -0,0 +1,127 @@
+# dvd_lite/fanout.py
+"""
+DVD-Lite 다중 대상 팬아웃 실행 지원
+대상별 동시 실행 제한과 공유 자원(TargetContext), 대상/시나리오별 결과 집계
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Tuple, Callable, Awaitable
+
+logger = logging.getLogger(__name__)
+
+class TargetContext:
+    """대상 하나에 대한 공유 실행 자원
+
+    같은 대상을 노리는 공격들이 함께 사용한다. 공격은 self.config["target_context"]로 접근하며,
+    get_resource()로 연결 등을 한 번만 만들어 재사용할 수 있다.
+    """
+
+    def __init__(self, target: str, max_concurrency: int = 1):
+        self.target = target
+        self.max_concurrency = max(1, max_concurrency)
+        self.semaphore = asyncio.Semaphore(self.max_concurrency)
+        self.resources: Dict[str, Any] = {}
+        self._resource_locks: Dict[str, asyncio.Lock] = {}
+
+    async def get_resource(self, key: str, factory: Callable[[str], Awaitable[Any]]) -> Any:
+        """공유 자원 조회 - 없으면 factory(target)로 생성 (동시 요청 시에도 한 번만 생성)"""
+        if key in self.resources:
+            return self.resources[key]
+
+        lock = self._resource_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            if key not in self.resources:
+                self.resources[key] = await factory(self.target)
+        return self.resources[key]
+
+    async def close(self) -> None:
+        """공유 자원 정리 (aclose/close/wait_closed 지원)"""
+        for key, resource in list(self.resources.items()):
+            try:
+                if hasattr(resource, "aclose"):
+                    await resource.aclose()
+                elif hasattr(resource, "close"):
+                    closed = resource.close()
+                    if asyncio.iscoroutine(closed):
+                        await closed
+                    if hasattr(resource, "wait_closed"):
+                        await resource.wait_closed()
+            except Exception as e:
+                logger.warning(f"공유 자원 정리 실패 ({self.target}/{key}): {e}")
+        self.resources.clear()
+
+class TargetPool:
+    """대상별 TargetContext 모음"""
+
+    def __init__(self, per_target_concurrency: int = 1):
+        self.per_target_concurrency = per_target_concurrency
+        self.contexts: Dict[str, TargetContext] = {}
+
+    def get(self, target: str) -> TargetContext:
+        context = self.contexts.get(target)
+        if context is None:
+            context = TargetContext(target, self.per_target_concurrency)
+            self.contexts[target] = context
+        return context
+
+    async def close(self) -> None:
+        await asyncio.gather(*(context.close() for context in self.contexts.values()))
+
+def summarize_results(results: List[Any]) -> Dict[str, Any]:
+    """AttackResult 목록 요약"""
+    total = len(results)
+    statuses = [result.status.value for result in results]
+    successful = statuses.count("success")
+
+    return {
+        "total": total,
+        "successful": successful,
+        "partial": statuses.count("partial"),
+        "failed": total - successful - statuses.count("partial"),
+        "success_rate": successful / total if total else 0.0,
+        "avg_response_time": sum(result.response_time for result in results) / total if total else 0.0,
+        "iocs": sum(len(result.iocs) for result in results)
+    }
+
+@dataclass
+class FanoutReport:
+    """팬아웃 실행 결과 - (시나리오, 대상, 결과) 목록과 대상/시나리오별 집계"""
+    runs: List[Tuple[str, str, Any]] = field(default_factory=list)
+
+    @property
+    def results(self) -> List[Any]:
+        return [result for _, _, result in self.runs]
+
+    def result(self, scenario: str, target: str) -> Optional[Any]:
+        for run_scenario, run_target, result in self.runs:
+            if run_scenario == scenario and run_target == target:
+                return result
+        return None
+
+    def _grouped(self, index: int) -> Dict[str, Dict[str, Any]]:
+        groups: Dict[str, List[Any]] = {}
+        for run in self.runs:
+            groups.setdefault(run[index], []).append(run[2])
+        return {key: summarize_results(results) for key, results in groups.items()}
+
+    @property
+    def by_target(self) -> Dict[str, Dict[str, Any]]:
+        return self._grouped(1)
+
+    @property
+    def by_scenario(self) -> Dict[str, Dict[str, Any]]:
+        return self._grouped(0)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "summary": summarize_results(self.results),
+            "by_target": self.by_target,
+            "by_scenario": self.by_scenario,
+            "runs": [
+                {"scenario": scenario, "target": target, "status": result.status.value,
+                 "response_time": result.response_time, "iocs": result.iocs}
+                for scenario, target, result in self.runs
+            ]
+        }
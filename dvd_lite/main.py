@@ -5,14 +5,22 @@ DVD-Lite 메인 프레임워크 (완전 수정 버전)
 
 import asyncio
 import json
-import time
 import logging
 from datetime import datetime
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Any, Optional, Union, AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass, asdict, replace
 from enum import Enum
 from pathlib import Path
 
+from .clock import now
+from .rng import ExperimentRNG
+from .metrics import METRICS
+from .profiling import ProfilingConfig, ProfileSession, default_config
+from .bus import ResultBus, OverflowPolicy
+from .fanout import TargetPool, FanoutReport
+from .cpu_lane import CPULane
+from .recon_cache import ReconCache, CacheEntry
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
@@ -28,6 +36,7 @@ class AttackStatus(Enum):
     SUCCESS = "success"
     FAILED = "failed"
     DETECTED = "detected"
+    PARTIAL = "partial"
 
 @dataclass
 class AttackResult:
@@ -63,6 +72,28 @@ class DVDLite:
         self.results = []
         self.cti_collector = None
         
+        # CPU 위주 공격 단계용 프로세스 풀 (config의 cpu_lane.max_workers, 0이면 이벤트 루프에서 실행)
+        cpu_config = self.config.get("cpu_lane", {})
+        self.cpu_lane = CPULane(max_workers=cpu_config.get("max_workers"),
+                                start_method=cpu_config.get("start_method"))
+        
+        # 정찰 결과 캐시 (cache_ttl을 지정한 시나리오만 참여)
+        self.recon_cache = ReconCache(enabled=self.config.get("recon_cache", {}).get("enabled", True))
+        
+        # 결과 이벤트 버스 (CTI/대시보드/저장소 등은 구독자로 연결)
+        self.result_bus = ResultBus()
+        
+        # 실험 난수 서비스 (config의 seed 사용, 없으면 임의 시드)
+        self.rng = ExperimentRNG(self.config.get("seed"))
+        self._trial_counts: Dict[str, int] = {}
+        self._fanout_count = 0
+        
+        # 프로파일링 설정 (config의 profiling 섹션, 없으면 데모 스크립트 기본값)
+        if "profiling" in self.config:
+            self.profiling = ProfilingConfig.from_dict(self.config["profiling"])
+        else:
+            self.profiling = default_config()
+        
         # DVD 공격 레지스트리와 연동
         self._setup_dvd_attack_registry()
         
@@ -73,7 +104,7 @@ class DVDLite:
         except FileNotFoundError:
             return {
                 "target": {"ip": "10.13.0.2", "mavlink_port": 14550},
-                "attacks": {"enabled": [], "delay_between": 2.0},
+                "attacks": {"enabled": [], "delay_between": 2.0, "deadline_factor": 3.0, "deadline_slack": 5.0},
                 "output": {"results_dir": "results", "log_level": "INFO"}
             }
     
@@ -87,16 +118,81 @@ class DVDLite:
             self.dvd_registry = None
             logger.warning("DVD 공격 레지스트리 연동 실패")
     
+    def set_seed(self, seed: Optional[int]) -> ExperimentRNG:
+        """실험 시드 재설정 - 공격별 시행 번호도 초기화"""
+        self.rng = ExperimentRNG(seed)
+        self._trial_counts = {}
+        return self.rng
+    
+    def attack_rng(self, attack_name: str) -> ExperimentRNG:
+        """공격별 다음 시행의 난수 스트림 ("attack", 이름, 시행 번호)"""
+        trial = self._trial_counts.get(attack_name, 0)
+        self._trial_counts[attack_name] = trial + 1
+        return self.rng.spawn("attack", attack_name, trial)
+    
+    def enable_profiling(self, mode: Optional[str], output_dir: str = "results/profiles",
+                         attacks: Optional[List[str]] = None, campaigns: bool = False) -> ProfilingConfig:
+        """프로파일링 설정 - mode가 None이면 비활성화, attacks가 None이면 모든 공격"""
+        self.profiling = ProfilingConfig(
+            mode=mode,
+            output_dir=output_dir,
+            attacks=["*"] if attacks is None else list(attacks),
+            campaigns=campaigns
+        )
+        return self.profiling
+    
+    def attack_deadline(self, attack_name: str, requested: Optional[float] = None,
+                        params: Optional[Dict[str, Any]] = None) -> Optional[float]:
+        """공격 제한 시간 - 시나리오 예상 소요 시간 × deadline_factor + deadline_slack
+        
+        공격이 파라미터(params)로 정해지는 실행 시간(expected_duration)을 보고하면 그만큼 더한다.
+        호출자가 요청한 제한 시간(캠페인 잔여 예산 등)이 더 짧으면 그 값을 사용한다.
+        """
+        derived = None
+        attacks_config = self.config.get("attacks", {})
+        scenario = self.dvd_registry.get_scenario(attack_name) if self.dvd_registry else None
+        if scenario and scenario.estimated_duration > 0:
+            derived = (scenario.estimated_duration * attacks_config.get("deadline_factor", 3.0)
+                       + attacks_config.get("deadline_slack", 5.0))
+        
+        attack_class = self._attack_class(attack_name)
+        expected = attack_class.expected_duration(params or {}) if hasattr(attack_class, "expected_duration") else None
+        if expected:
+            derived = (derived if derived is not None else attacks_config.get("deadline_slack", 5.0)) + expected
+        
+        candidates = [deadline for deadline in (requested, derived) if deadline is not None]
+        return min(candidates) if candidates else None
+    
+    def _attack_class(self, attack_name: str):
+        """이름으로 공격 클래스 검색 (DVD 레지스트리 우선) - 없으면 None"""
+        attack_class = self.dvd_registry.get_attack_class(attack_name) if self.dvd_registry else None
+        return attack_class or self.attack_modules.get(attack_name)
+    
     def register_attack(self, name: str, attack_class):
         """기본 공격 모듈 등록"""
         self.attack_modules[name] = attack_class
         logger.info(f"✅ 기본 공격 모듈 등록: {name}")
     
-    def register_cti_collector(self, cti_collector):
-        """CTI 수집기 등록 (호환성을 위해 추가)"""
+    def register_cti_collector(self, cti_collector, maxsize: int = 100,
+                               policy: OverflowPolicy = OverflowPolicy.BLOCK):
+        """CTI 수집기 등록 - 결과 버스 구독자로 연결되어 공격 실행과 동시에 수집"""
         self.cti_collector = cti_collector
+        
+        async def ingest(batch: List[AttackResult]) -> None:
+            for result in batch:
+                try:
+                    with METRICS.span("dvd_cti_ingest_seconds", "CTI 수집 처리 시간"):
+                        await cti_collector.collect_from_result(result)
+                except Exception as e:
+                    logger.warning(f"CTI 수집 실패: {e}")
+        
+        self.result_bus.subscribe("cti", ingest, maxsize=maxsize, policy=policy)
         logger.info("✅ CTI 수집기 등록 완료")
     
+    async def drain_results(self) -> None:
+        """발행된 결과를 모든 구독자(CTI 등)가 처리할 때까지 대기 - 요약 조회 전에 호출"""
+        await self.result_bus.drain()
+    
     def list_attacks(self) -> List[str]:
         """모든 등록된 공격 목록 반환"""
         attacks = list(self.attack_modules.keys())
@@ -129,67 +225,232 @@ class DVDLite:
         return {}
     
     async def run_attack(self, attack_name: str, **kwargs) -> AttackResult:
-        """공격 실행 - DVD 레지스트리와 기본 모듈 모두 지원"""
+        """공격 실행 - DVD 레지스트리와 기본 모듈 모두 지원
+        
+        cache_ttl이 지정된 정찰 시나리오는 같은 (대상, 파라미터)의 유효한 성공 결과가 있으면
+        실행하지 않고 캐시 결과를 돌려준다 (실행 결과와 같이 기록 / 발행). refresh_cache=True면 캐시를 건너뛰고 다시 실행한다.
+        will_retry: 취소되었을 때 호출자가 다시 실행할지 알려 주는 함수 - True면 중단된 결과를 기록하지 않음
+        """
+        refresh = kwargs.pop("refresh_cache", False)
+        will_retry = kwargs.pop("will_retry", None)
+        kwargs.setdefault("target_ip", self.config["target"]["ip"])
+        
+        cache_ttl = self._cache_ttl(attack_name)
+        if cache_ttl and not refresh:
+            entry = self.recon_cache.get(attack_name, kwargs["target_ip"], kwargs)
+            if entry is not None:
+                result = self._cached_result(entry)
+                await self._record_result(result)
+                return result
+        
+        # 호출자가 스트림을 지정하지 않으면 공격별 시행 스트림 사용
+        if kwargs.get("rng") is None:
+            kwargs["rng"] = self.attack_rng(attack_name)
+        kwargs["deadline_limit"] = kwargs.get("deadline")
+        kwargs["deadline"] = self.attack_deadline(attack_name, kwargs.get("deadline"), kwargs)
+        kwargs.setdefault("cpu_lane", self.cpu_lane)
+        kwargs.setdefault("recon_cache", self.recon_cache)
+        
+        if self.profiling.should_profile_attack(attack_name):
+            with ProfileSession(self.profiling, f"attack_{attack_name}"):
+                result = await self._dispatch_attack(attack_name, will_retry, **kwargs)
+        else:
+            result = await self._dispatch_attack(attack_name, will_retry, **kwargs)
         
+        if cache_ttl and result.status.value == "success":
+            self.recon_cache.put(attack_name, kwargs["target_ip"], kwargs, result, cache_ttl)
+        
+        return result
+    
+    def _cache_ttl(self, attack_name: str) -> Optional[float]:
+        """시나리오의 정찰 캐시 유효 시간"""
+        scenario = self.dvd_registry.get_scenario(attack_name) if self.dvd_registry else None
+        return getattr(scenario, "cache_ttl", None)
+    
+    def _cached_result(self, entry: CacheEntry):
+        """캐시 적중 결과 - 실행 시간 0, 원래 실행 시각은 details에 기록"""
+        logger.info(f"♻️ 정찰 캐시 사용: {entry.result.attack_name} -> {entry.result.target}")
+        return replace(
+            entry.result,
+            response_time=0.0,
+            timestamp=now(),
+            details=dict(entry.result.details, cache_hit=True, cached_at=entry.stored_at)
+        )
+    
+    async def _dispatch_attack(self, attack_name: str, will_retry: Optional[Callable[[], bool]] = None,
+                               **kwargs) -> AttackResult:
+        """DVD 레지스트리 또는 기본 모듈에서 공격 클래스를 찾아 실행"""
         # 1. DVD 레지스트리에서 먼저 확인
         if self.dvd_registry:
             attack_class = self.dvd_registry.get_attack_class(attack_name)
             if attack_class:
-                return await self._run_dvd_attack(attack_name, attack_class, **kwargs)
+                return await self._run_dvd_attack(attack_name, attack_class, will_retry, **kwargs)
         
         # 2. 기본 공격 모듈에서 확인
         if attack_name in self.attack_modules:
             attack_class = self.attack_modules[attack_name]
-            return await self._run_basic_attack(attack_name, attack_class, **kwargs)
+            return await self._run_basic_attack(attack_name, attack_class, will_retry, **kwargs)
         
         # 3. 둘 다 없으면 오류
         available_attacks = self.list_attacks()
         raise ValueError(f"공격 모듈 '{attack_name}'을 찾을 수 없습니다. 사용 가능한 공격: {available_attacks}")
     
-    async def _run_dvd_attack(self, attack_name: str, attack_class, **kwargs) -> AttackResult:
+    async def _run_dvd_attack(self, attack_name: str, attack_class, will_retry=None, **kwargs) -> AttackResult:
         """DVD 공격 실행"""
-        attack_instance = attack_class(
-            target_ip=self.config["target"]["ip"],
-            **kwargs
-        )
-        
-        result = await attack_instance.execute()
-        self.results.append(result)
+        attack_instance = attack_class(**kwargs)
         
-        # CTI 수집
-        if self.cti_collector:
-            try:
-                await self.cti_collector.collect_from_result(result)
-            except Exception as e:
-                logger.warning(f"CTI 수집 실패: {e}")
+        result = await self._execute_instance(attack_instance, will_retry)
         
         return result
     
-    async def _run_basic_attack(self, attack_name: str, attack_class, **kwargs) -> AttackResult:
+    async def _run_basic_attack(self, attack_name: str, attack_class, will_retry=None, **kwargs) -> AttackResult:
         """기본 공격 실행"""
-        attack_instance = attack_class(
-            target_ip=self.config["target"]["ip"],
-            **kwargs
-        )
+        attack_instance = attack_class(**kwargs)
         
-        result = await attack_instance.execute()
-        self.results.append(result)
+        result = await self._execute_instance(attack_instance, will_retry)
         
         return result
     
+    async def _execute_instance(self, attack_instance, will_retry: Optional[Callable[[], bool]] = None) -> AttackResult:
+        """공격 인스턴스 실행 - 취소되면 PARTIAL 결과를 기록한 뒤 취소 전파
+        
+        호출자가 다시 실행할 취소(will_retry()가 True)는 재실행 결과만 남도록 기록하지 않는다.
+        """
+        try:
+            result = await attack_instance.execute()
+        except asyncio.CancelledError:
+            if attack_instance.result is not None and not (will_retry and will_retry()):
+                await self._record_result(attack_instance.result)
+            raise
+        
+        await self._record_result(result)
+        return result
+    
+    async def _record_result(self, result: AttackResult) -> None:
+        """결과 기록 - 결과 목록에 추가하고 결과 버스에 발행"""
+        self.results.append(result)
+        await self.result_bus.publish(result)
+    
     async def run_multiple_attacks(self, attack_names: List[str]) -> List[AttackResult]:
         """여러 공격 실행"""
-        results = []
+        return [result async for result in self.stream_attacks(attack_names)]
+    
+    async def run_attack_fanout(self, attack_names: Union[str, List[str]], targets: List[str],
+                                max_concurrency: int = 8, per_target_concurrency: int = 1,
+                                deadline: Optional[float] = None,
+                                target_pool: Optional[TargetPool] = None) -> FanoutReport:
+        """시나리오를 여러 대상에 동시에 실행 (팬아웃)
+        
+        max_concurrency: 전체 동시 실행 수
+        per_target_concurrency: 대상 하나에 동시에 실행되는 공격 수 상한
+        target_pool: 대상별 공유 자원 (지정하지 않으면 이 호출 동안만 사용하고 정리)
+        
+        공격 인스턴스는 target_context 인자로 대상의 TargetContext를 받는다.
+        난수 스트림은 ("fanout", 호출 번호, 공격 이름, 대상)으로 파생된다.
+        """
+        if isinstance(attack_names, str):
+            attack_names = [attack_names]
+        
+        fanout_rng = self.rng.spawn("fanout", self._fanout_count)
+        self._fanout_count += 1
+        
+        owns_pool = target_pool is None
+        pool = target_pool or TargetPool(per_target_concurrency)
+        
+        # 같은 시나리오의 대상들이 이어지도록 배치해 대상별 제한에 걸려 전체 슬롯이 묶이는 것을 줄임
+        jobs = [(attack_name, target) for attack_name in attack_names for target in targets]
+        
+        async def run_job(index: int, label: str):
+            attack_name, target = jobs[index]
+            context = pool.get(target)
+            async with context.semaphore:
+                result = await self.run_attack(
+                    attack_name, target_ip=target, target_context=context,
+                    rng=fanout_rng.spawn(attack_name, target), deadline=deadline
+                )
+            return attack_name, target, result
+        
+        logger.info(f"🎯 팬아웃 실행: {len(attack_names)}개 시나리오 × {len(targets)}개 대상 "
+                    f"(전체 {max_concurrency}, 대상별 {per_target_concurrency})")
+        
+        report = FanoutReport()
+        try:
+            labels = [f"{attack_name}@{target}" for attack_name, target in jobs]
+            async for run in self.stream_attacks(labels, max_concurrency=max_concurrency,
+                                                 buffer_size=len(jobs) or 1, delay=0, runner=run_job):
+                report.runs.append(run)
+        finally:
+            if owns_pool:
+                await pool.close()
         
-        for attack_name in attack_names:
+        return report
+    
+    async def stream_attacks(self, attack_names: List[str], max_concurrency: int = 1,
+                             buffer_size: int = 1, delay: Optional[float] = None,
+                             runner: Optional[Callable[[int, str], Awaitable[Any]]] = None
+                             ) -> AsyncIterator[Any]:
+        """공격을 실행하면서 완료되는 순서대로 결과를 내보내는 비동기 이터레이터
+        
+        buffer_size: 소비자가 아직 가져가지 않은 결과 수 상한 - 가득 차면 공격이 결과 전달에서
+                     대기하고 동시 실행 슬롯을 쥔 채로 멈추므로 새 공격도 시작되지 않음 (backpressure)
+        delay: 공격 간 간격 (기본값: config의 attacks.delay_between, 마지막 공격 뒤에는 생략)
+        runner: 공격 하나를 실행하는 코루틴 함수 runner(순번, 이름) (기본값: run_attack)
+                반환값이 None이면 결과를 내보내지 않음
+        
+        실패한 공격은 로그만 남기고 건너뛴다. 소비자가 반복을 중단하면 진행 중인 공격은 취소된다.
+        """
+        if delay is None:
+            delay = self.config["attacks"]["delay_between"]
+        if runner is None:
+            async def runner(index: int, attack_name: str) -> AttackResult:
+                return await self.run_attack(attack_name)
+        
+        queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, buffer_size))
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        workers = set()
+        closing = False
+        done = object()
+        
+        async def worker(index: int, attack_name: str) -> None:
             try:
-                result = await self.run_attack(attack_name)
-                results.append(result)
-                await asyncio.sleep(self.config["attacks"]["delay_between"])
-            except Exception as e:
-                logger.error(f"공격 {attack_name} 실패: {str(e)}")
+                try:
+                    result = await runner(index, attack_name)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.error(f"공격 {attack_name} 실패: {str(e)}")
+                    result = None
+                
+                if closing:
+                    return
+                if result is not None:
+                    await queue.put(result)
+                if index < len(attack_names) - 1:
+                    await asyncio.sleep(delay)
+            finally:
+                semaphore.release()
         
-        return results
+        async def feeder() -> None:
+            # 슬롯을 먼저 확보한 뒤 시작하므로 공격은 목록 순서대로 시작됨
+            for index, attack_name in enumerate(attack_names):
+                await semaphore.acquire()
+                workers.add(asyncio.ensure_future(worker(index, attack_name)))
+            await asyncio.gather(*workers)
+            await queue.put(done)
+        
+        feeder_task = asyncio.ensure_future(feeder())
+        try:
+            while True:
+                item = await queue.get()
+                if item is done:
+                    break
+                yield item
+        finally:
+            closing = True
+            pending = [task for task in workers | {feeder_task} if not task.done()]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
     
     def get_summary(self) -> Dict[str, Any]:
         """결과 요약"""
@@ -209,16 +470,45 @@ class DVDLite:
 class BaseAttack:
     """공격 기본 클래스"""
     
-    def __init__(self, target_ip: str = "10.13.0.2", **kwargs):
+    def __init__(self, target_ip: str = "10.13.0.2", rng: Optional[ExperimentRNG] = None,
+                 deadline: Optional[float] = None, cpu_lane: Optional[CPULane] = None,
+                 **kwargs):
         self.target_ip = target_ip
         self.config = kwargs
-        self.attack_id = f"{self.__class__.__name__.lower()}_{int(time.time())}"
+        # 실험 시드에서 파생된 난수 스트림 (미지정 시 임의 시드)
+        self.rng = rng or ExperimentRNG().spawn(self.__class__.__name__)
+        self.random = self.rng.random
+        # 실행 제한 시간 (초, None이면 제한 없음)
+        self.deadline = deadline
+        # CPU 위주 단계 실행용 프로세스 풀 (미지정 시 이벤트 루프에서 바로 실행)
+        self.cpu_lane = cpu_lane or CPULane(max_workers=0)
+        self.attack_id = f"{self.__class__.__name__.lower()}_{int(now())}"
+        
+        # 중단 시 PARTIAL 결과로 보고할 진행 상황
+        self.partial_iocs: List[str] = []
+        self.partial_details: Dict[str, Any] = {}
+        self.result: Optional[AttackResult] = None
+    
+    async def run_cpu(self, stage, *args, **kwargs):
+        """@cpu_stage로 선언한 CPU 위주 단계를 CPU 작업 레인에서 실행"""
+        return await self.cpu_lane.run(stage, *args, **kwargs)
+    
+    def record_progress(self, iocs: Optional[List[str]] = None, **details) -> None:
+        """진행 상황 기록 - 제한 시간 초과/취소 시 PARTIAL 결과에 포함"""
+        if iocs:
+            self.partial_iocs.extend(iocs)
+        self.partial_details.update(details)
     
     async def execute(self) -> AttackResult:
-        start_time = time.time()
+        start_time = now()
         
         try:
-            success, iocs, details = await self._run_attack()
+            with METRICS.span("dvd_attack_phase_seconds", "공격 단계별 실행 시간",
+                              attack=self.__class__.__name__, phase="run"):
+                if self.deadline is not None:
+                    success, iocs, details = await asyncio.wait_for(self._run_attack(), self.deadline)
+                else:
+                    success, iocs, details = await self._run_attack()
             
             result = AttackResult(
                 attack_id=self.attack_id,
@@ -226,28 +516,61 @@ class BaseAttack:
                 attack_type=self._get_attack_type(),
                 status=AttackStatus.SUCCESS if success else AttackStatus.FAILED,
                 success_rate=details.get("success_rate", 0.7 if success else 0.0),
-                response_time=time.time() - start_time,
-                timestamp=time.time(),
+                response_time=now() - start_time,
+                timestamp=now(),
                 target=self.target_ip,
                 iocs=iocs,
                 details=details
             )
             
-            return result
+        except asyncio.TimeoutError:
+            result = self._partial_result(start_time, "deadline_exceeded")
+            
+        except asyncio.CancelledError:
+            # 취소는 전파하되 진행 상황은 self.result로 남김
+            self.result = self._partial_result(start_time, "cancelled")
+            self._record_metrics(self.result)
+            raise
             
         except Exception as e:
-            return AttackResult(
+            result = AttackResult(
                 attack_id=self.attack_id,
                 attack_name=self.__class__.__name__,
                 attack_type=self._get_attack_type(),
                 status=AttackStatus.FAILED,
                 success_rate=0.0,
-                response_time=time.time() - start_time,
-                timestamp=time.time(),
+                response_time=now() - start_time,
+                timestamp=now(),
                 target=self.target_ip,
                 iocs=[],
                 details={"error": str(e)}
             )
+        
+        self.result = result
+        self._record_metrics(result)
+        return result
+    
+    def _record_metrics(self, result: AttackResult) -> None:
+        """공격 결과 메트릭 기록"""
+        if METRICS.enabled:
+            METRICS.counter("dvd_attack_results_total", "상태별 공격 결과 수").labels(
+                attack=result.attack_name, status=result.status.value
+            ).inc()
+    
+    def _partial_result(self, start_time: float, reason: str) -> AttackResult:
+        """중단된 공격의 PARTIAL 결과"""
+        return AttackResult(
+            attack_id=self.attack_id,
+            attack_name=self.__class__.__name__,
+            attack_type=self._get_attack_type(),
+            status=AttackStatus.PARTIAL,
+            success_rate=0.0,
+            response_time=now() - start_time,
+            timestamp=now(),
+            target=self.target_ip,
+            iocs=list(self.partial_iocs),
+            details=dict(self.partial_details, interrupted=reason, deadline=self.deadline)
+        )
     
     async def _run_attack(self) -> tuple:
         raise NotImplementedError
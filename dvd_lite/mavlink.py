@@ -0,0 +1,381 @@
+# dvd_lite/mavlink.py
+"""
+DVD-Lite MAVLink v2 코덱
+pymavlink 없이 공격 엔진에서 사용하는 최소 프레임 인코더/디코더
+
+메시지 필드는 와이어 순서(크기 내림차순)로 정의한다.
+FrameTemplate은 페이로드가 고정된 프레임을 미리 만들어 두고 시퀀스 번호와 CRC만 바꿔 보낸다.
+"""
+
+import asyncio
+import re
+import struct
+from dataclasses import dataclass, field
+from typing import Dict, Any, Optional, Tuple, List, Iterator
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+MAVLINK_V2_STX = 0xFD
+HEADER_LEN = 10          # STX 포함
+CHECKSUM_LEN = 2
+
+@dataclass(frozen=True)
+class MessageSpec:
+    """MAVLink 메시지 정의"""
+    name: str
+    msgid: int
+    crc_extra: int
+    fields: Tuple[str, ...]
+    fmt: str
+
+    @property
+    def struct(self) -> struct.Struct:
+        return _STRUCTS[self.msgid]
+
+    @property
+    def length(self) -> int:
+        return self.struct.size
+
+MESSAGES: Dict[str, MessageSpec] = {}
+MESSAGES_BY_ID: Dict[int, MessageSpec] = {}
+_STRUCTS: Dict[int, struct.Struct] = {}
+
+def register_message(name: str, msgid: int, crc_extra: int, fields: Tuple[str, ...], fmt: str) -> MessageSpec:
+    """메시지 정의 등록"""
+    spec = MessageSpec(name, msgid, crc_extra, tuple(fields), fmt)
+    _STRUCTS[msgid] = struct.Struct(fmt)
+    if len(spec.fields) != len(_STRUCTS[msgid].unpack(bytes(_STRUCTS[msgid].size))):
+        raise ValueError(f"필드 수와 형식이 맞지 않습니다: {name}")
+    MESSAGES[name] = spec
+    MESSAGES_BY_ID[msgid] = spec
+    return spec
+
+register_message("HEARTBEAT", 0, 50,
+                 ("custom_mode", "type", "autopilot", "base_mode", "system_status", "mavlink_version"),
+                 "<IBBBBB")
+register_message("COMMAND_LONG", 76, 152,
+                 ("param1", "param2", "param3", "param4", "param5", "param6", "param7",
+                  "command", "target_system", "target_component", "confirmation"),
+                 "<7fHBBB")
+register_message("PARAM_REQUEST_READ", 20, 214,
+                 ("param_index", "target_system", "target_component", "param_id"), "<hBB16s")
+register_message("PARAM_REQUEST_LIST", 21, 159, ("target_system", "target_component"), "<BB")
+register_message("PARAM_VALUE", 22, 220,
+                 ("param_value", "param_count", "param_index", "param_id", "param_type"), "<fHH16sB")
+register_message("PARAM_SET", 23, 168,
+                 ("param_value", "target_system", "target_component", "param_id", "param_type"), "<fBB16sB")
+register_message("GPS_RAW_INT", 24, 24,
+                 ("time_usec", "lat", "lon", "alt", "eph", "epv", "vel", "cog", "fix_type",
+                  "satellites_visible", "alt_ellipsoid", "h_acc", "v_acc", "vel_acc", "hdg_acc", "yaw"),
+                 "<QiiiHHHHBBiIIIIH")
+register_message("GPS_INPUT", 232, 151,
+                 ("time_usec", "time_week_ms", "lat", "lon", "alt", "hdop", "vdop", "vn", "ve", "vd",
+                  "speed_accuracy", "horiz_accuracy", "vert_accuracy", "ignore_flags", "time_week",
+                  "gps_id", "fix_type", "satellites_visible", "yaw"),
+                 "<QIiifffffffffHHBBBH")
+register_message("MISSION_REQUEST_LIST", 43, 132, ("target_system", "target_component", "mission_type"), "<BBB")
+register_message("MISSION_COUNT", 44, 221, ("count", "target_system", "target_component", "mission_type"), "<HBBB")
+register_message("MISSION_ACK", 47, 153, ("target_system", "target_component", "type", "mission_type"), "<BBBB")
+register_message("MISSION_REQUEST_INT", 51, 196, ("seq", "target_system", "target_component", "mission_type"), "<HBBB")
+register_message("MISSION_ITEM_INT", 73, 38,
+                 ("param1", "param2", "param3", "param4", "x", "y", "z", "seq", "command",
+                  "target_system", "target_component", "frame", "current", "autocontinue", "mission_type"),
+                 "<ffffiifHHBBBBBB")
+register_message("ATTITUDE", 30, 39,
+                 ("time_boot_ms", "roll", "pitch", "yaw", "rollspeed", "pitchspeed", "yawspeed"), "<Iffffff")
+register_message("GLOBAL_POSITION_INT", 33, 104,
+                 ("time_boot_ms", "lat", "lon", "alt", "relative_alt", "vx", "vy", "vz", "hdg"), "<IiiiihhhH")
+register_message("REQUEST_DATA_STREAM", 66, 148,
+                 ("req_message_rate", "target_system", "target_component", "req_stream_id", "start_stop"), "<HBBBB")
+register_message("LOG_REQUEST_LIST", 117, 128, ("start", "end", "target_system", "target_component"), "<HHBB")
+register_message("LOG_ENTRY", 118, 56, ("time_utc", "size", "id", "num_logs", "last_log_num"), "<IIHHH")
+register_message("LOG_REQUEST_DATA", 119, 116, ("ofs", "count", "id", "target_system", "target_component"), "<IIHBB")
+register_message("LOG_DATA", 120, 134, ("ofs", "id", "count", "data"), "<IHB90s")
+register_message("LOG_REQUEST_END", 122, 203, ("target_system", "target_component"), "<BB")
+
+# =============================================================================
+# CRC (X.25 / CRC-16/MCRF4XX)
+# =============================================================================
+
+def _build_crc_table() -> List[int]:
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0x8408 if crc & 1 else crc >> 1
+        table.append(crc)
+    return table
+
+_CRC_TABLE = _build_crc_table()
+
+def crc_accumulate(data, crc: int = 0xFFFF) -> int:
+    """X.25 CRC 누적"""
+    table = _CRC_TABLE
+    for byte in data:
+        crc = (crc >> 8) ^ table[(crc ^ byte) & 0xFF]
+    return crc
+
+def frame_crc(frame, payload_len: int, crc_extra: int) -> int:
+    """프레임 체크섬 (STX 다음부터 페이로드 끝까지 + CRC_EXTRA)"""
+    crc = crc_accumulate(memoryview(frame)[1:HEADER_LEN + payload_len])
+    return crc_accumulate((crc_extra,), crc)
+
+# =============================================================================
+# 인코딩 / 디코딩
+# =============================================================================
+
+def _payload(spec: MessageSpec, values: Dict[str, Any]) -> bytes:
+    try:
+        packed = spec.struct.pack(*(values.get(name, 0) for name in spec.fields))
+    except struct.error as e:
+        raise ValueError(f"{spec.name} 필드 값 오류: {e}") from None
+    # MAVLink v2는 페이로드 끝의 0 바이트를 잘라서 전송 (최소 1바이트)
+    return packed.rstrip(b"\x00") or b"\x00"
+
+def encode(name: str, seq: int = 0, sysid: int = 255, compid: int = 190, /, **values) -> bytes:
+    """메시지 하나를 MAVLink v2 프레임으로 인코딩
+
+    헤더 인자는 위치 인자로만 받는다 (MISSION_ITEM_INT 등의 seq 필드와 구분).
+    """
+    spec = MESSAGES[name]
+    payload = _payload(spec, values)
+    msgid = spec.msgid
+    frame = bytearray(struct.pack("<BBBBBBBHB", MAVLINK_V2_STX, len(payload), 0, 0, seq & 0xFF,
+                                  sysid, compid, msgid & 0xFFFF, msgid >> 16))
+    frame += payload
+    frame += struct.pack("<H", frame_crc(frame, len(payload), spec.crc_extra))
+    return bytes(frame)
+
+@dataclass
+class MAVLinkMessage:
+    """디코딩된 메시지 (필드는 속성으로도 접근, 헤더 시퀀스 번호는 packet_seq)"""
+    name: str
+    msgid: int
+    packet_seq: int
+    sysid: int
+    compid: int
+    fields: Dict[str, Any] = field(default_factory=dict)
+
+    def __getattr__(self, item):
+        try:
+            return self.__dict__["fields"][item]
+        except KeyError:
+            raise AttributeError(item) from None
+
+def parse_frames(data, statistics: Optional[Dict[str, int]] = None) -> Iterator[MAVLinkMessage]:
+    """데이터그램 안의 MAVLink v2 프레임 디코딩
+
+    알 수 없는 메시지와 CRC 오류 프레임은 건너뛰고 statistics에 집계한다.
+    """
+    view = memoryview(data)
+    offset = 0
+    end = len(view)
+    while offset + HEADER_LEN + CHECKSUM_LEN <= end:
+        if view[offset] != MAVLINK_V2_STX:
+            offset += 1
+            continue
+
+        payload_len = view[offset + 1]
+        frame_len = HEADER_LEN + payload_len + CHECKSUM_LEN
+        if view[offset + 2] & 0x01:      # 서명된 프레임
+            frame_len += 13
+        if offset + frame_len > end:
+            break
+
+        msgid = view[offset + 7] | (view[offset + 8] << 8) | (view[offset + 9] << 16)
+        spec = MESSAGES_BY_ID.get(msgid)
+        frame = view[offset:offset + frame_len]
+        offset += frame_len
+
+        if spec is None:
+            _count(statistics, "unknown")
+            continue
+        checksum = frame[HEADER_LEN + payload_len] | (frame[HEADER_LEN + payload_len + 1] << 8)
+        if checksum != frame_crc(frame, payload_len, spec.crc_extra):
+            _count(statistics, "crc_errors")
+            continue
+
+        # 잘린 페이로드는 0으로 채워서 해석
+        payload = bytes(frame[HEADER_LEN:HEADER_LEN + payload_len]).ljust(spec.length, b"\x00")[:spec.length]
+        values = dict(zip(spec.fields, spec.struct.unpack(payload)))
+        yield MAVLinkMessage(spec.name, msgid, frame[4], frame[5], frame[6], values)
+
+def _count(statistics: Optional[Dict[str, int]], key: str) -> None:
+    if statistics is not None:
+        statistics[key] = statistics.get(key, 0) + 1
+
+def _numpy_dtype(spec: MessageSpec):
+    """struct 형식을 같은 배치의 numpy 구조체 dtype으로 변환"""
+    codes = {"B": "u1", "b": "i1", "H": "u2", "h": "i2", "I": "u4", "i": "i4",
+             "Q": "u8", "q": "i8", "f": "f4", "d": "f8"}
+    formats = []
+    for count, code in re.findall(r"(\d*)([a-zA-Z])", spec.fmt[1:]):
+        if code == "s":
+            formats.append(f"S{count}")
+        else:
+            formats.extend(["<" + codes[code]] * int(count or 1))
+    return np.dtype({"names": list(spec.fields), "formats": formats})
+
+def encode_many(name: str, columns: Dict[str, Any], seq_start: int = 0,
+                sysid: int = 255, compid: int = 190) -> List[bytes]:
+    """같은 종류의 메시지 여러 개를 한 번에 인코딩 (numpy 필요)
+
+    columns는 필드 이름 → 배열(또는 스칼라). 페이로드 패킹, 끝의 0 바이트 절단, CRC를
+    메시지 단위 반복 대신 배열 연산으로 처리한다.
+    """
+    if not NUMPY_AVAILABLE:
+        raise RuntimeError("encode_many에는 numpy가 필요합니다")
+
+    spec = MESSAGES[name]
+    count = max((np.size(value) for value in columns.values()), default=1)
+    records = np.zeros(count, dtype=_numpy_dtype(spec))
+    for field_name, value in columns.items():
+        records[field_name] = value
+    payloads = records.view(np.uint8).reshape(count, spec.length)
+
+    # 행별 페이로드 길이 (끝의 0 바이트 제외, 최소 1)
+    nonzero = payloads != 0
+    lengths = np.where(nonzero.any(axis=1), spec.length - np.argmax(nonzero[:, ::-1], axis=1), 1)
+
+    headers = np.zeros((count, HEADER_LEN), dtype=np.uint8)
+    headers[:, 0] = MAVLINK_V2_STX
+    headers[:, 1] = lengths
+    headers[:, 4] = (seq_start + np.arange(count)) & 0xFF
+    headers[:, 5] = sysid
+    headers[:, 6] = compid
+    headers[:, 7:10] = np.frombuffer(struct.pack("<I", spec.msgid)[:3], dtype=np.uint8)
+
+    # CRC를 바이트 열 단위로 모든 행에 대해 동시에 누적 (페이로드 길이를 넘는 열은 건너뜀)
+    table = np.asarray(_CRC_TABLE, dtype=np.uint16)
+    crc = np.full(count, 0xFFFF, dtype=np.uint16)
+    for column in range(1, HEADER_LEN):
+        crc = (crc >> 8) ^ table[(crc ^ headers[:, column]) & 0xFF]
+    for column in range(spec.length):
+        updated = (crc >> 8) ^ table[(crc ^ payloads[:, column]) & 0xFF]
+        crc = np.where(column < lengths, updated, crc)
+    crc = (crc >> 8) ^ table[(crc ^ spec.crc_extra) & 0xFF]
+
+    frames = np.concatenate([headers, payloads, np.zeros((count, CHECKSUM_LEN), dtype=np.uint8)], axis=1)
+    rows = np.arange(count)
+    frames[rows, HEADER_LEN + lengths] = crc & 0xFF
+    frames[rows, HEADER_LEN + lengths + 1] = crc >> 8
+
+    data = frames.tobytes()
+    width = frames.shape[1]
+    return [data[row * width:row * width + HEADER_LEN + int(length) + CHECKSUM_LEN]
+            for row, length in enumerate(lengths)]
+
+# =============================================================================
+# 프레임 템플릿
+# =============================================================================
+
+class FrameTemplate:
+    """페이로드가 고정된 프레임 템플릿
+
+    CRC 계산은 시퀀스 번호(헤더 4번째 바이트) 앞까지를 미리 누적해 두고,
+    시퀀스 번호 256가지에 대한 CRC를 한 번만 계산한다. 전송 시에는 버퍼의 시퀀스/CRC 바이트만 바꾼다.
+    """
+
+    def __init__(self, name: str, sysid: int = 255, compid: int = 190, /, **values):
+        self.spec = MESSAGES[name]
+        self.buffer = bytearray(encode(name, 0, sysid, compid, **values))
+        self.payload_len = self.buffer[1]
+        self.crc_offset = HEADER_LEN + self.payload_len
+
+        prefix = crc_accumulate(self.buffer[1:4])
+        suffix = bytes(self.buffer[5:self.crc_offset]) + bytes((self.spec.crc_extra,))
+        self._crc_bytes = [struct.pack("<H", crc_accumulate(suffix, crc_accumulate((seq,), prefix)))
+                           for seq in range(256)]
+
+    def __len__(self) -> int:
+        return len(self.buffer)
+
+    def frame(self, seq: int) -> bytearray:
+        """시퀀스 번호를 반영한 프레임 (내부 버퍼를 제자리에서 수정해 반환)"""
+        seq &= 0xFF
+        buffer = self.buffer
+        buffer[4] = seq
+        buffer[self.crc_offset:self.crc_offset + 2] = self._crc_bytes[seq]
+        return buffer
+
+# =============================================================================
+# UDP 연결
+# =============================================================================
+
+class MAVLinkClient(asyncio.DatagramProtocol):
+    """대상과 주고받는 비동기 MAVLink UDP 엔드포인트
+
+    수신 메시지는 큐에 쌓이고 recv()로 원하는 메시지만 꺼낸다 (나머지는 버림).
+    """
+
+    def __init__(self, sysid: int = 255, compid: int = 190):
+        self.sysid = sysid
+        self.compid = compid
+        self.transport: Optional[asyncio.DatagramTransport] = None
+        self.queue: "asyncio.Queue[MAVLinkMessage]" = asyncio.Queue()
+        self.statistics: Dict[str, int] = {"frames_sent": 0, "frames_received": 0}
+        self._seq = 0
+
+    @classmethod
+    async def connect(cls, target: Tuple[str, int], **kwargs) -> "MAVLinkClient":
+        loop = asyncio.get_running_loop()
+        _, client = await loop.create_datagram_endpoint(lambda: cls(**kwargs), remote_addr=target)
+        return client
+
+    async def __aenter__(self) -> "MAVLinkClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
+
+    def connection_made(self, transport) -> None:
+        self.transport = transport
+
+    def datagram_received(self, data: bytes, addr) -> None:
+        for message in parse_frames(data, self.statistics):
+            self.statistics["frames_received"] += 1
+            self.queue.put_nowait(message)
+
+    def error_received(self, exc) -> None:
+        # 대상 포트가 닫힌 경우 등 - 재전송 타이머가 처리
+        pass
+
+    def send(self, name: str, **values) -> None:
+        """메시지 인코딩 후 전송"""
+        self._seq = (self._seq + 1) & 0xFF
+        self.send_frame(encode(name, self._seq, self.sysid, self.compid, **values))
+
+    def send_frame(self, frame: bytes) -> None:
+        """미리 인코딩한 프레임 전송"""
+        if self.transport is not None:
+            self.transport.sendto(frame)
+            self.statistics["frames_sent"] += 1
+
+    async def recv(self, names, timeout: Optional[float] = None) -> Optional[MAVLinkMessage]:
+        """names에 속한 메시지 수신 (timeout 안에 없으면 None)"""
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while True:
+            remaining = None if deadline is None else deadline - loop.time()
+            if remaining is not None and remaining <= 0:
+                return None
+            if not self.queue.empty():
+                # 이미 도착한 메시지는 타이머 없이 바로 꺼냄
+                message = self.queue.get_nowait()
+            else:
+                try:
+                    message = await asyncio.wait_for(self.queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    return None
+            if message.name in names:
+                return message
+
+    def close(self) -> None:
+        if self.transport is not None:
+            self.transport.close()
+            self.transport = None
@@ -0,0 +1,302 @@
+# dvd_lite/metrics.py
+"""
+DVD-Lite 메트릭 수집
+카운터/게이지/고정 버킷 히스토그램과 perf_counter_ns 기반 구간(span) 측정, Prometheus 텍스트 출력
+
+기본 레지스트리(METRICS)는 비활성 상태로 시작한다. 비활성 상태에서 span()은 공유 no-op 객체를,
+inc/set/observe는 즉시 반환하므로 계측 지점의 비용은 속성 확인 한 번 수준이다.
+"""
+
+import asyncio
+import bisect
+import logging
+import time
+from collections import deque
+from typing import Dict, List, Any, Optional, Tuple, Callable
+
+from .clock import ignore_for_virtual_time
+
+logger = logging.getLogger(__name__)
+
+# 기본 히스토그램 버킷 (초) - 프로브/큐 연산(ms 미만)부터 공격 실행(수십 초)까지
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+def _label_key(labels: Dict[str, Any]) -> LabelKey:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def _format_labels(key: LabelKey, extra: Tuple[Tuple[str, str], ...] = ()) -> str:
+    pairs = key + extra
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape_label_value(value)}"' for name, value in pairs) + "}"
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value))
+
+class _Counter:
+    """단조 증가 카운터"""
+
+    __slots__ = ("_registry", "value")
+
+    def __init__(self, registry: "MetricsRegistry"):
+        self._registry = registry
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        if self._registry.enabled:
+            self.value += amount
+
+class _Gauge:
+    """임의 값 게이지"""
+
+    __slots__ = ("_registry", "value")
+
+    def __init__(self, registry: "MetricsRegistry"):
+        self._registry = registry
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        if self._registry.enabled:
+            self.value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        if self._registry.enabled:
+            self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        if self._registry.enabled:
+            self.value -= amount
+
+class _Histogram:
+    """고정 버킷 히스토그램"""
+
+    __slots__ = ("_registry", "buckets", "counts", "sum", "count")
+
+    def __init__(self, registry: "MetricsRegistry", buckets: Tuple[float, ...]):
+        self._registry = registry
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        if self._registry.enabled:
+            self.counts[bisect.bisect_left(self.buckets, value)] += 1
+            self.sum += value
+            self.count += 1
+
+class MetricFamily:
+    """이름이 같은 메트릭 묶음 (레이블 조합별 자식 메트릭)"""
+
+    def __init__(self, registry: "MetricsRegistry", name: str, metric_type: str, help_text: str,
+                 buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.registry = registry
+        self.name = name
+        self.type = metric_type
+        self.help = help_text
+        self.buckets = tuple(buckets)
+        self.children: Dict[LabelKey, Any] = {}
+
+    def labels(self, **labels):
+        """레이블 조합의 자식 메트릭"""
+        key = _label_key(labels)
+        child = self.children.get(key)
+        if child is None:
+            if self.type == "counter":
+                child = _Counter(self.registry)
+            elif self.type == "gauge":
+                child = _Gauge(self.registry)
+            else:
+                child = _Histogram(self.registry, self.buckets)
+            self.children[key] = child
+        return child
+
+    # 레이블 없는 메트릭용 단축 메서드
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.labels().dec(amount)
+
+    def set(self, value: float) -> None:
+        self.labels().set(value)
+
+    def observe(self, value: float) -> None:
+        self.labels().observe(value)
+
+    def render(self) -> List[str]:
+        """Prometheus 텍스트 형식 출력"""
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.type}"]
+
+        for key, child in sorted(self.children.items()):
+            if self.type == "histogram":
+                cumulative = 0
+                for bound, count in zip(self.buckets + (float("inf"),), child.counts):
+                    cumulative += count
+                    labels = _format_labels(key, (("le", _format_value(float(bound))),))
+                    lines.append(f"{self.name}_bucket{labels} {cumulative}")
+                lines.append(f"{self.name}_sum{_format_labels(key)} {_format_value(child.sum)}")
+                lines.append(f"{self.name}_count{_format_labels(key)} {child.count}")
+            else:
+                lines.append(f"{self.name}{_format_labels(key)} {_format_value(child.value)}")
+
+        return lines
+
+class _Span:
+    """perf_counter_ns 구간 측정 (히스토그램에 초 단위로 기록)"""
+
+    __slots__ = ("_histogram", "_start")
+
+    def __init__(self, histogram: _Histogram):
+        self._histogram = histogram
+        self._start = 0
+
+    def __enter__(self):
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._histogram.observe((time.perf_counter_ns() - self._start) / 1e9)
+        return False
+
+class _NoopSpan:
+    """비활성 상태용 구간 측정"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+_NOOP_SPAN = _NoopSpan()
+
+class MetricsRegistry:
+    """메트릭 레지스트리"""
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._families: Dict[str, MetricFamily] = {}
+
+    def _family(self, name: str, metric_type: str, help_text: str,
+                buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> MetricFamily:
+        family = self._families.get(name)
+        if family is None:
+            family = MetricFamily(self, name, metric_type, help_text, buckets)
+            self._families[name] = family
+        elif family.type != metric_type:
+            raise ValueError(f"메트릭 타입 불일치: {name} ({family.type} != {metric_type})")
+        return family
+
+    def counter(self, name: str, help_text: str = "") -> MetricFamily:
+        return self._family(name, "counter", help_text)
+
+    def gauge(self, name: str, help_text: str = "") -> MetricFamily:
+        return self._family(name, "gauge", help_text)
+
+    def histogram(self, name: str, help_text: str = "",
+                  buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> MetricFamily:
+        return self._family(name, "histogram", help_text, buckets)
+
+    def span(self, name: str, help_text: str = "", **labels):
+        """구간 시간 측정 컨텍스트 - with METRICS.span("dvd_attack_phase_seconds", phase="run"): ..."""
+        if not self.enabled:
+            return _NOOP_SPAN
+        return _Span(self.histogram(name, help_text).labels(**labels))
+
+    def render_prometheus(self) -> str:
+        """전체 메트릭의 Prometheus 텍스트 형식"""
+        lines = []
+        for name in sorted(self._families):
+            lines.extend(self._families[name].render())
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """수집된 메트릭 초기화"""
+        self._families.clear()
+
+class RateMeter:
+    """최근 window초 동안의 이벤트 처리율"""
+
+    def __init__(self, window: float = 10.0, clock: Callable[[], float] = time.monotonic):
+        self.window = window
+        self.clock = clock
+        self._events = deque()
+        self._started = clock()
+
+    def mark(self, count: int = 1) -> None:
+        now = self.clock()
+        self._events.append((now, count))
+        self._evict(now)
+
+    def rate(self) -> float:
+        now = self.clock()
+        self._evict(now)
+        elapsed = min(self.window, now - self._started)
+        if elapsed <= 0:
+            return 0.0
+        return sum(count for _, count in self._events) / elapsed
+
+    def _evict(self, now: float) -> None:
+        cutoff = now - self.window
+        while self._events and self._events[0][0] < cutoff:
+            self._events.popleft()
+
+class MetricsServer:
+    """localhost Prometheus 텍스트 엔드포인트 (GET /metrics)"""
+
+    def __init__(self, registry: Optional[MetricsRegistry] = None,
+                 host: str = "127.0.0.1", port: int = 9108):
+        self.registry = registry or METRICS
+        self.host = host
+        self.port = port
+        self._server = None
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        # 수신 대기 소켓은 스크레이프가 올 때까지 계속 등록되어 있으므로 가상 시간을 붙잡지 않게 함
+        for sock in self._server.sockets:
+            ignore_for_virtual_time(sock.fileno())
+        logger.info(f"📈 메트릭 엔드포인트 시작: http://{self.host}:{self.port}/metrics")
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), timeout=5.0)
+            request_line = request.split(b"\r\n", 1)[0].decode("latin-1").split()
+
+            if len(request_line) >= 2 and request_line[0] == "GET" and request_line[1].split("?")[0] == "/metrics":
+                body = self.registry.render_prometheus().encode("utf-8")
+                status = "200 OK"
+                content_type = "text/plain; version=0.0.4; charset=utf-8"
+            else:
+                body = b"not found\n"
+                status = "404 Not Found"
+                content_type = "text/plain; charset=utf-8"
+
+            writer.write(
+                f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n"
+                f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode("latin-1") + body
+            )
+            await writer.drain()
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+# 기본 레지스트리 (테스트베드에서 활성화)
+METRICS = MetricsRegistry(enabled=False)
@@ -0,0 +1,308 @@
+# dvd_lite/profiling.py
+"""
+DVD-Lite 프로파일링 훅
+선택한 공격 또는 캠페인 전체를 cProfile / tracemalloc / 샘플링 프로파일러로 감싸고
+실행별 결과 파일과 프로파일러 오버헤드를 출력 디렉토리에 기록
+
+출력 파일 (output_dir/<run>_<timestamp>.*)
+- cprofile:    .pstats (python -m pstats, snakeviz 등으로 열람)
+- tracemalloc: .tracemalloc.txt (할당 상위 항목), .snapshot (tracemalloc.Snapshot.load)
+- sampling:    .folded (flamegraph.pl / speedscope 호환 접힌 스택)
+- 공통:        .overhead.json (벽시계/CPU 시간, 프로파일러 자체 시간, 보정 측정 배율)
+"""
+
+import cProfile
+import json
+import logging
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+PROFILER_MODES = ("cprofile", "tracemalloc", "sampling")
+
+# 프로파일러는 스레드당 하나만 활성화 (캠페인 안의 공격 프로파일 등 중첩은 바깥 세션만 기록)
+_active_session = threading.local()
+
+# 모드별 보정 측정 결과 캐시 (프로파일러 적용 시 실행 시간 배율)
+_calibration_cache: Dict[str, float] = {}
+
+@dataclass
+class ProfilingConfig:
+    """프로파일링 설정
+
+    attacks: 프로파일할 공격 이름 목록 ("*"는 전체)
+    campaigns: 오케스트레이터 캠페인 전체를 하나의 실행으로 프로파일
+    """
+    mode: Optional[str] = None
+    output_dir: str = "results/profiles"
+    attacks: List[str] = field(default_factory=list)
+    campaigns: bool = False
+    sample_interval: float = 0.005
+    tracemalloc_frames: int = 25
+    top_n: int = 30
+
+    def __post_init__(self):
+        if self.mode is not None and self.mode not in PROFILER_MODES:
+            raise ValueError(f"알 수 없는 프로파일러: {self.mode} (사용 가능: {', '.join(PROFILER_MODES)})")
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode is not None
+
+    def should_profile_attack(self, attack_name: str) -> bool:
+        return self.enabled and ("*" in self.attacks or attack_name in self.attacks)
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> "ProfilingConfig":
+        """config.json의 "profiling" 섹션에서 생성"""
+        if not data:
+            return cls()
+        known = {name: value for name, value in data.items() if name in cls.__dataclass_fields__}
+        return cls(**known)
+
+    @classmethod
+    def from_argv(cls, argv: List[str], output_dir: str = "results/profiles") -> "ProfilingConfig":
+        """데모 스크립트용 인자 파싱 (--profile MODE, --profile-attacks a,b, --profile-dir DIR)
+
+        인식한 인자는 argv에서 제거된다. --profile-attacks가 없으면 모든 공격을 프로파일한다.
+        """
+        options = {}
+        for flag in ("--profile", "--profile-attacks", "--profile-dir"):
+            if flag in argv:
+                index = argv.index(flag)
+                if index + 1 >= len(argv):
+                    raise ValueError(f"{flag} 값이 필요합니다")
+                options[flag] = argv[index + 1]
+                del argv[index:index + 2]
+
+        if "--profile" not in options:
+            return cls()
+
+        attacks = options.get("--profile-attacks", "*").split(",")
+        return cls(
+            mode=options["--profile"],
+            output_dir=options.get("--profile-dir", output_dir),
+            attacks=[name.strip() for name in attacks if name.strip()]
+        )
+
+# 명시적 설정이 없는 DVDLite 인스턴스가 사용하는 기본 설정 (데모 스크립트에서 지정)
+_default_config = ProfilingConfig()
+
+def configure_default(config: ProfilingConfig) -> None:
+    """기본 프로파일링 설정 지정"""
+    global _default_config
+    _default_config = config
+
+def default_config() -> ProfilingConfig:
+    return _default_config
+
+class _StackSampler(threading.Thread):
+    """대상 스레드의 호출 스택을 주기적으로 수집하는 샘플링 프로파일러"""
+
+    def __init__(self, target_thread_id: int, interval: float):
+        super().__init__(name="dvd-stack-sampler", daemon=True)
+        self.target_thread_id = target_thread_id
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self.self_seconds = 0.0
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            started = time.perf_counter()
+            frame = sys._current_frames().get(self.target_thread_id)
+            if frame is not None:
+                self.stacks[self._fold(frame)] += 1
+                self.samples += 1
+            self.self_seconds += time.perf_counter() - started
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+    @staticmethod
+    def _fold(frame) -> str:
+        names = []
+        while frame is not None:
+            code = frame.f_code
+            names.append(f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})")
+            frame = frame.f_back
+        return ";".join(reversed(names))
+
+    def write_folded(self, path: Path) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+def _calibration_workload(depth: int = 16) -> int:
+    """보정용 작업 (함수 호출과 소규모 할당 위주)"""
+    if depth < 2:
+        return len([depth])
+    return _calibration_workload(depth - 1) + _calibration_workload(depth - 2)
+
+def _measure(fn) -> float:
+    best = float("inf")
+    for _ in range(3):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+def calibrate(mode: str) -> float:
+    """프로파일러 적용 시 보정 작업의 실행 시간 배율 (1.0 = 오버헤드 없음)"""
+    if mode in _calibration_cache:
+        return _calibration_cache[mode]
+
+    baseline = _measure(_calibration_workload)
+
+    if mode == "cprofile":
+        profiler = cProfile.Profile()
+
+        def profiled():
+            profiler.enable()
+            try:
+                _calibration_workload()
+            finally:
+                profiler.disable()
+        measured = _measure(profiled)
+    elif mode == "tracemalloc":
+        tracemalloc.start()
+        try:
+            measured = _measure(_calibration_workload)
+        finally:
+            tracemalloc.stop()
+    else:
+        sampler = _StackSampler(threading.get_ident(), 0.005)
+        sampler.start()
+        try:
+            measured = _measure(_calibration_workload)
+        finally:
+            sampler.stop()
+
+    _calibration_cache[mode] = measured / baseline if baseline > 0 else 1.0
+    return _calibration_cache[mode]
+
+class ProfileSession:
+    """프로파일 실행 단위 - with ProfileSession(config, "attack_gps_spoofing"): ...
+
+    같은 스레드에서 이미 세션이 활성화되어 있으면 아무것도 하지 않는다.
+    """
+
+    def __init__(self, config: ProfilingConfig, run_name: str):
+        self.config = config
+        self.run_name = run_name
+        self.files: List[str] = []
+        self.report: Dict[str, Any] = {}
+        self._active = False
+        self._profiler: Optional[cProfile.Profile] = None
+        self._sampler: Optional[_StackSampler] = None
+        self._tracemalloc_started = False
+
+    def __enter__(self) -> "ProfileSession":
+        if not self.config.enabled or getattr(_active_session, "session", None) is not None:
+            return self
+
+        _active_session.session = self
+        self._active = True
+        mode = self.config.mode
+
+        # 보정은 측정 구간 밖에서 미리 수행
+        self.report["calibrated_slowdown"] = calibrate(mode)
+
+        if mode == "cprofile":
+            self._profiler = cProfile.Profile()
+        elif mode == "tracemalloc":
+            self._tracemalloc_started = not tracemalloc.is_tracing()
+            if self._tracemalloc_started:
+                tracemalloc.start(self.config.tracemalloc_frames)
+        else:
+            self._sampler = _StackSampler(threading.get_ident(), self.config.sample_interval)
+
+        self._wall_start = time.perf_counter_ns()
+        self._cpu_start = time.process_time_ns()
+
+        if self._profiler is not None:
+            self._profiler.enable()
+        if self._sampler is not None:
+            self._sampler.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if not self._active:
+            return False
+
+        try:
+            if self._profiler is not None:
+                self._profiler.disable()
+            if self._sampler is not None:
+                self._sampler.stop()
+
+            wall_seconds = (time.perf_counter_ns() - self._wall_start) / 1e9
+            cpu_seconds = (time.process_time_ns() - self._cpu_start) / 1e9
+            self._write_outputs(wall_seconds, cpu_seconds)
+        finally:
+            if self._tracemalloc_started:
+                tracemalloc.stop()
+            _active_session.session = None
+            self._active = False
+
+        return False
+
+    def _write_outputs(self, wall_seconds: float, cpu_seconds: float) -> None:
+        output_dir = Path(self.config.output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        stem = output_dir / f"{self.run_name}_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
+        mode = self.config.mode
+        profiler_self_seconds = None
+
+        if mode == "cprofile":
+            path = stem.with_suffix(".pstats")
+            self._profiler.dump_stats(str(path))
+            self.files.append(str(path))
+        elif mode == "tracemalloc":
+            snapshot = tracemalloc.take_snapshot()
+            snapshot_path = stem.with_suffix(".snapshot")
+            snapshot.dump(str(snapshot_path))
+
+            text_path = Path(f"{stem}.tracemalloc.txt")
+            current, peak = tracemalloc.get_traced_memory()
+            with open(text_path, "w", encoding="utf-8") as f:
+                f.write(f"# current={current} peak={peak} bytes\n")
+                for stat in snapshot.statistics("lineno")[:self.config.top_n]:
+                    f.write(f"{stat}\n")
+            self.files.extend([str(snapshot_path), str(text_path)])
+            self.report["traced_memory"] = {"current": current, "peak": peak}
+        else:
+            path = stem.with_suffix(".folded")
+            self._sampler.write_folded(path)
+            self.files.append(str(path))
+            profiler_self_seconds = self._sampler.self_seconds
+            self.report["samples"] = self._sampler.samples
+
+        slowdown = self.report["calibrated_slowdown"]
+        self.report.update({
+            "run": self.run_name,
+            "mode": mode,
+            "wall_seconds": wall_seconds,
+            "cpu_seconds": cpu_seconds,
+            "profiler_self_seconds": profiler_self_seconds,
+            "estimated_overhead_seconds": cpu_seconds * (1 - 1 / slowdown) if slowdown > 1 else 0.0,
+            "files": list(self.files)
+        })
+
+        overhead_path = Path(f"{stem}.overhead.json")
+        with open(overhead_path, "w", encoding="utf-8") as f:
+            json.dump(self.report, f, indent=2, ensure_ascii=False)
+        self.files.append(str(overhead_path))
+
+        logger.info(f"🔬 프로파일 저장 ({mode}): {self.files[0]} "
+                    f"(실행 {wall_seconds:.3f}초, 보정 배율 {slowdown:.2f}x)")
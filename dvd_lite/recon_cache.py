@@ -0,0 +1,110 @@
+# dvd_lite/recon_cache.py
+"""
+DVD-Lite 정찰 결과 캐시
+(시나리오, 대상, 파라미터) 단위로 성공한 정찰 결과를 TTL 동안 재사용
+
+시나리오는 DVDAttackScenario.cache_ttl을 지정해 캐시에 참여한다.
+네트워크 스캔 결과가 바뀌면 invalidate_from_diff()로 영향받은 대상의 항목을 무효화한다.
+"""
+
+import json
+import logging
+from dataclasses import dataclass
+from typing import Dict, Any, Optional, Tuple, Callable, Iterable
+
+from .clock import now
+from .metrics import METRICS
+
+logger = logging.getLogger(__name__)
+
+# 캐시 키에서 제외하는 실행 환경 인자
+RUNTIME_KWARGS = frozenset({"rng", "deadline", "deadline_limit", "cpu_lane", "target_context", "recon_cache",
+                            "target_ip"})
+
+CacheKey = Tuple[str, str, str]
+
+def params_key(params: Dict[str, Any]) -> str:
+    """공격 파라미터를 캐시 키 문자열로 정규화"""
+    relevant = {name: value for name, value in params.items() if name not in RUNTIME_KWARGS}
+    return json.dumps(relevant, sort_keys=True, default=repr)
+
+@dataclass
+class CacheEntry:
+    result: Any
+    stored_at: float
+    expires_at: float
+
+class ReconCache:
+    """TTL 기반 정찰 결과 캐시"""
+
+    def __init__(self, enabled: bool = True, clock: Callable[[], float] = now):
+        self.enabled = enabled
+        self.clock = clock
+        self._entries: Dict[CacheKey, CacheEntry] = {}
+        self.statistics = {"hits": 0, "misses": 0, "stores": 0, "invalidations": 0}
+
+    def get(self, scenario: str, target: str, params: Optional[Dict[str, Any]] = None) -> Optional[CacheEntry]:
+        """유효한 캐시 항목 조회"""
+        if not self.enabled:
+            return None
+
+        key = (scenario, target, params_key(params or {}))
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at <= self.clock():
+            del self._entries[key]
+            entry = None
+
+        outcome = "hit" if entry is not None else "miss"
+        self.statistics["hits" if entry is not None else "misses"] += 1
+        METRICS.counter("dvd_recon_cache_total", "정찰 캐시 조회 수").labels(scenario=scenario, result=outcome).inc()
+        return entry
+
+    def put(self, scenario: str, target: str, params: Optional[Dict[str, Any]], result: Any, ttl: float) -> None:
+        """결과 저장"""
+        if not self.enabled or ttl <= 0:
+            return
+
+        stored_at = self.clock()
+        self._entries[(scenario, target, params_key(params or {}))] = CacheEntry(result, stored_at, stored_at + ttl)
+        self.statistics["stores"] += 1
+
+    def findings(self, target: str) -> Dict[str, Any]:
+        """대상에 대한 유효한 정찰 결과 (시나리오 → AttackResult) - 후속 공격에서 사용"""
+        current = self.clock()
+        findings = {}
+        for (scenario, entry_target, _), entry in self._entries.items():
+            if entry_target == target and entry.expires_at > current:
+                previous = findings.get(scenario)
+                if previous is None or entry.stored_at >= previous[0]:
+                    findings[scenario] = (entry.stored_at, entry.result)
+        return {scenario: result for scenario, (_, result) in findings.items()}
+
+    def invalidate(self, scenario: Optional[str] = None, targets: Optional[Iterable[str]] = None) -> int:
+        """조건에 맞는 항목 무효화 (인자가 없으면 전체) - 제거한 항목 수 반환"""
+        target_set = set(targets) if targets is not None else None
+        removed = [
+            key for key in self._entries
+            if (scenario is None or key[0] == scenario) and (target_set is None or key[1] in target_set)
+        ]
+        for key in removed:
+            del self._entries[key]
+
+        self.statistics["invalidations"] += len(removed)
+        if removed:
+            logger.info(f"🧹 정찰 캐시 무효화: {len(removed)}개 항목")
+        return len(removed)
+
+    def invalidate_from_diff(self, diff) -> int:
+        """스캔 결과 변경(ScanDiff) 반영
+
+        호스트가 추가/제거되면 네트워크 구성 자체가 바뀐 것이므로 전체를 무효화하고,
+        서비스만 바뀐 경우에는 해당 호스트의 항목만 무효화한다.
+        """
+        if diff.added_hosts or diff.removed_hosts:
+            return self.invalidate()
+        if diff.changed_hosts:
+            return self.invalidate(targets=diff.changed_hosts)
+        return 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
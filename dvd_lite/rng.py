@@ -0,0 +1,93 @@
+# dvd_lite/rng.py
+"""
+DVD-Lite 난수 서비스
+하나의 실험 시드에서 캠페인/공격/시행별 독립 난수 스트림을 파생
+
+스트림은 생성 순서가 아니라 이름 경로(예: "campaign", 3, "gps_spoofing", 0)로 결정되므로,
+병렬 실행과 직렬 실행이 같은 경로에 대해 동일한 난수를 얻는다.
+"""
+
+import hashlib
+import random
+import zlib
+from typing import Dict, Any, Optional, Tuple, Union
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+StreamKey = Union[str, int]
+
+def _key_to_int(key: StreamKey) -> int:
+    """스트림 이름을 SeedSequence spawn_key 원소로 변환 (문자열은 CRC32)"""
+    if isinstance(key, int) and key >= 0:
+        return key
+    return zlib.crc32(str(key).encode("utf-8"))
+
+def generate_seed() -> int:
+    """새 실험 시드 생성 (128비트)"""
+    return random.SystemRandom().getrandbits(128)
+
+class ExperimentRNG:
+    """실험 난수 스트림
+
+    - random: 표준 라이브러리 random.Random 인스턴스 (공격 모듈용)
+    - numpy: numpy.random.Generator (벡터 연산용, numpy 설치 시)
+    - spawn(*keys): 하위 스트림 생성
+    """
+
+    def __init__(self, seed: Optional[int] = None, path: Tuple[StreamKey, ...] = ()):
+        self.seed = generate_seed() if seed is None else int(seed)
+        self.path = tuple(path)
+        self._spawn_key = tuple(_key_to_int(key) for key in self.path)
+        self._random: Optional[random.Random] = None
+        self._numpy = None
+
+    def spawn(self, *keys: StreamKey) -> "ExperimentRNG":
+        """하위 스트림 생성"""
+        return ExperimentRNG(self.seed, self.path + keys)
+
+    @property
+    def random(self) -> random.Random:
+        """표준 random.Random 스트림"""
+        if self._random is None:
+            self._random = random.Random(self._state_int())
+        return self._random
+
+    @property
+    def numpy(self):
+        """numpy Generator 스트림"""
+        if not NUMPY_AVAILABLE:
+            raise ImportError("numpy 난수 스트림에는 numpy가 필요합니다: pip install numpy")
+        if self._numpy is None:
+            self._numpy = np.random.default_rng(self.seed_sequence())
+        return self._numpy
+
+    def seed_sequence(self):
+        """이 스트림의 numpy SeedSequence (프로세스 풀 작업에 전달용)"""
+        if not NUMPY_AVAILABLE:
+            raise ImportError("SeedSequence에는 numpy가 필요합니다: pip install numpy")
+        return np.random.SeedSequence(self.seed, spawn_key=self._spawn_key)
+
+    def _state_int(self) -> int:
+        """random.Random 초기화용 정수 상태"""
+        if NUMPY_AVAILABLE:
+            state = self.seed_sequence().generate_state(4, dtype=np.uint64)
+            return int.from_bytes(state.tobytes(), "little")
+
+        digest = hashlib.blake2b(repr((self.seed, self._spawn_key)).encode(), digest_size=32).digest()
+        return int.from_bytes(digest, "little")
+
+    def metadata(self) -> Dict[str, Any]:
+        """실험 메타데이터 기록용 정보"""
+        return {
+            "seed": self.seed,
+            "path": [str(key) for key in self.path],
+            "generator": "numpy.SeedSequence" if NUMPY_AVAILABLE else "blake2b"
+        }
+
+    def __repr__(self) -> str:
+        return f"ExperimentRNG(seed={self.seed}, path={self.path})"
@@ -0,0 +1,677 @@
+# dvd_lite/rtsp.py
+"""
+DVD-Lite RTSP 클라이언트 / RTP 역패킷화
+영상 스트림 공격에서 사용하는 최소 RTSP(RFC 2326) 클라이언트
+
+- OPTIONS / DESCRIBE / SETUP / PLAY / TEARDOWN, 세션 유지(GET_PARAMETER)
+- RTP over RTSP(TCP interleaved, '$' 채널 프레이밍)만 사용 - 방화벽/NAT 뒤 컴패니언 스트림에도 동작
+- H.264(RFC 6184: 단일 NAL / STAP-A / FU-A)는 access unit으로 재조립하고 IDR 포함 여부로 키 프레임 판별,
+  그 외 코덱(MJPEG 등)은 마커 비트까지를 한 프레임(모두 키 프레임)으로 취급
+- FrameRing: 최근 프레임만 프레임 수 / 바이트 한도 안에서 보관 (오래된 것부터 버림)
+- KeyFrameSampler: 스트림 시각 기준 sample_interval마다 키 프레임 하나만 해시하고,
+  최근 해시 LRU로 같은 장면을 중복 제거 - 세션 길이와 무관하게 메모리 / CPU 사용량이 일정
+
+사용 예:
+    report = await sample_stream("rtsp://10.13.0.3:554/stream", duration=30.0,
+                                 sampler=KeyFrameSampler(interval=1.0, output_dir="results/frames"))
+"""
+
+import asyncio
+import base64
+import hashlib
+import logging
+import os
+import struct
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field, asdict
+from typing import Dict, List, Any, Optional, Tuple, Deque
+from urllib.parse import urlsplit, urljoin
+
+logger = logging.getLogger(__name__)
+
+RTSP_VERSION = "RTSP/1.0"
+USER_AGENT = "DVD-Lite"
+DEFAULT_RTSP_PORT = 554
+INTERLEAVED_MAGIC = 0x24  # '$'
+MAX_BACKLOG = 64
+
+# H.264 NAL 단위 종류
+NAL_SLICE = 1
+NAL_IDR = 5
+NAL_SPS = 7
+NAL_PPS = 8
+NAL_STAP_A = 24
+NAL_FU_A = 28
+ANNEXB_START = b"\x00\x00\x00\x01"
+
+class RTSPError(Exception):
+    """RTSP 요청 실패 (연결 실패, 오류 응답, 시간 초과 등)"""
+
+    def __init__(self, message: str, status: Optional[int] = None):
+        super().__init__(message)
+        self.status = status
+
+# =============================================================================
+# RTSP 메시지 / SDP
+# =============================================================================
+
+@dataclass
+class RTSPResponse:
+    """RTSP 응답 (헤더 이름은 소문자)"""
+    status: int
+    reason: str
+    headers: Dict[str, str]
+    body: bytes = b""
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 300
+
+@dataclass
+class MediaTrack:
+    """SDP 미디어 트랙"""
+    media: str
+    payload_type: int
+    encoding: str = ""
+    clock_rate: int = 90000
+    control: str = ""
+
+    @property
+    def codec(self) -> str:
+        return self.encoding.upper() or f"PT{self.payload_type}"
+
+# 정적 페이로드 타입 (RFC 3551)
+STATIC_PAYLOAD_TYPES = {26: ("JPEG", 90000), 32: ("MPV", 90000), 34: ("H263", 90000)}
+
+def parse_sdp(sdp: str, base_url: str) -> List[MediaTrack]:
+    """SDP에서 미디어 트랙 목록 추출 (control URL은 base_url 기준 절대 경로로)"""
+    tracks: List[MediaTrack] = []
+    session_control = ""
+    for line in sdp.splitlines():
+        line = line.strip()
+        if line.startswith("m="):
+            parts = line[2:].split()
+            payload_type = int(parts[3]) if len(parts) > 3 and parts[3].isdigit() else 0
+            encoding, clock_rate = STATIC_PAYLOAD_TYPES.get(payload_type, ("", 90000))
+            tracks.append(MediaTrack(parts[0], payload_type, encoding, clock_rate))
+        elif line.startswith("a=rtpmap:") and tracks:
+            payload, _, mapping = line[9:].partition(" ")
+            if payload.isdigit() and int(payload) == tracks[-1].payload_type:
+                encoding, _, rest = mapping.partition("/")
+                tracks[-1].encoding = encoding
+                clock = rest.split("/")[0]
+                if clock.isdigit():
+                    tracks[-1].clock_rate = int(clock)
+        elif line.startswith("a=control:"):
+            control = line[10:]
+            if tracks:
+                tracks[-1].control = control
+            else:
+                session_control = control
+
+    base = base_url if base_url.endswith("/") else base_url + "/"
+    if session_control and session_control != "*":
+        base = urljoin(base, session_control)
+    for track in tracks:
+        if not track.control or track.control == "*":
+            track.control = base_url
+        elif not track.control.startswith("rtsp://"):
+            track.control = urljoin(base, track.control)
+    return tracks
+
+# =============================================================================
+# RTP
+# =============================================================================
+
+@dataclass
+class RTPPacket:
+    """RTP 패킷 (RFC 3550)"""
+    payload_type: int
+    marker: bool
+    sequence: int
+    timestamp: int
+    ssrc: int
+    payload: bytes
+
+_RTP_HEADER = struct.Struct("!BBHII")
+
+def parse_rtp(data: bytes) -> Optional[RTPPacket]:
+    """RTP 헤더 해석 (CSRC / 확장 헤더 / 패딩 처리), 형식이 맞지 않으면 None"""
+    if len(data) < 12:
+        return None
+    first, second, sequence, timestamp, ssrc = _RTP_HEADER.unpack_from(data)
+    if first >> 6 != 2:
+        return None
+    offset = 12 + 4 * (first & 0x0F)
+    if first & 0x10:
+        if len(data) < offset + 4:
+            return None
+        offset += 4 + 4 * struct.unpack_from("!H", data, offset + 2)[0]
+    end = len(data)
+    if first & 0x20:
+        end -= data[-1]
+    if offset > end:
+        return None
+    return RTPPacket(second & 0x7F, bool(second & 0x80), sequence, timestamp, ssrc, data[offset:end])
+
+def build_rtp(payload_type: int, marker: bool, sequence: int, timestamp: int, ssrc: int, payload: bytes) -> bytes:
+    """RTP 패킷 생성 (확장 헤더 없음)"""
+    return _RTP_HEADER.pack(0x80, (0x80 if marker else 0) | payload_type, sequence & 0xFFFF,
+                            timestamp & 0xFFFFFFFF, ssrc) + payload
+
+def packetize_h264(nal_units: List[bytes], mtu: int = 1400) -> List[bytes]:
+    """NAL 단위 → RTP 페이로드 목록 (작은 연속 NAL은 STAP-A, 큰 NAL은 FU-A로 분할)"""
+    payloads: List[bytes] = []
+    aggregate: List[bytes] = []
+
+    def flush() -> None:
+        if len(aggregate) == 1:
+            payloads.append(aggregate[0])
+        elif aggregate:
+            header = max(nal[0] & 0x60 for nal in aggregate) | NAL_STAP_A
+            payloads.append(bytes([header]) + b"".join(struct.pack("!H", len(nal)) + nal for nal in aggregate))
+        aggregate.clear()
+
+    for nal in nal_units:
+        if len(nal) + 3 <= mtu // 4:
+            aggregate.append(nal)
+            continue
+        flush()
+        if len(nal) <= mtu:
+            payloads.append(nal)
+            continue
+        indicator = (nal[0] & 0xE0) | NAL_FU_A
+        nal_type = nal[0] & 0x1F
+        body = nal[1:]
+        step = mtu - 2
+        for start in range(0, len(body), step):
+            fu_header = nal_type | (0x80 if start == 0 else 0) | (0x40 if start + step >= len(body) else 0)
+            payloads.append(bytes([indicator, fu_header]) + body[start:start + step])
+    flush()
+    return payloads
+
+@dataclass
+class AccessUnit:
+    """재조립된 프레임 (H.264는 NAL 단위 목록, 그 외 코덱은 페이로드 하나)"""
+    timestamp: int
+    nal_units: List[bytes]
+    keyframe: bool
+
+    @property
+    def size(self) -> int:
+        return sum(len(nal) for nal in self.nal_units)
+
+    def annexb(self) -> bytes:
+        """H.264 Annex B 바이트 스트림 (시작 코드 + NAL)"""
+        return b"".join(ANNEXB_START + nal for nal in self.nal_units)
+
+class Depacketizer:
+    """RTP 패킷 → AccessUnit 재조립
+
+    타임스탬프가 바뀌거나 마커 비트가 오면 프레임을 끝낸다.
+    시퀀스 번호가 빠진 프레임은 디코딩할 수 없으므로 버리고 lost에 기록한다.
+    """
+
+    def __init__(self, codec: str = "H264"):
+        self.h264 = codec.upper() == "H264"
+        self.sps: Optional[bytes] = None
+        self.pps: Optional[bytes] = None
+        self.statistics: Dict[str, int] = {"packets": 0, "frames": 0, "lost_packets": 0, "dropped_frames": 0}
+        self._sequence: Optional[int] = None
+        self._timestamp: Optional[int] = None
+        self._nal_units: List[bytes] = []
+        self._fragment: Optional[bytearray] = None
+        self._damaged = False
+
+    def push(self, packet: RTPPacket) -> Optional[AccessUnit]:
+        """패킷 하나 추가 - 프레임이 끝나면 AccessUnit 반환"""
+        self.statistics["packets"] += 1
+        completed = None
+        lost = False
+        if self._sequence is not None:
+            gap = (packet.sequence - self._sequence - 1) & 0xFFFF
+            if gap and gap < 0x8000:
+                self.statistics["lost_packets"] += gap
+                lost = True
+        self._sequence = packet.sequence
+
+        if self._timestamp is not None and packet.timestamp != self._timestamp:
+            # 프레임 경계의 유실은 앞 프레임의 끝인지 새 프레임의 시작인지 알 수 없으므로 둘 다 손상으로 처리
+            self._damaged = self._damaged or lost
+            completed = self._finish()
+        self._timestamp = packet.timestamp
+        self._damaged = self._damaged or lost
+        if self.h264:
+            self._push_h264(packet.payload)
+        elif packet.payload:
+            self._nal_units.append(packet.payload)
+        if packet.marker:
+            completed = self._finish() or completed
+        return completed
+
+    def _push_h264(self, payload: bytes) -> None:
+        if not payload:
+            return
+        nal_type = payload[0] & 0x1F
+        if 1 <= nal_type <= 23:
+            self._nal_units.append(payload)
+        elif nal_type == NAL_STAP_A:
+            offset = 1
+            while offset + 2 <= len(payload):
+                size, = struct.unpack_from("!H", payload, offset)
+                self._nal_units.append(payload[offset + 2:offset + 2 + size])
+                offset += 2 + size
+        elif nal_type == NAL_FU_A and len(payload) >= 2:
+            fu_header = payload[1]
+            if fu_header & 0x80:
+                self._fragment = bytearray([(payload[0] & 0xE0) | (fu_header & 0x1F)])
+            elif self._fragment is None:
+                # 시작 조각을 잃은 NAL
+                self._damaged = True
+                return
+            self._fragment += payload[2:]
+            if fu_header & 0x40:
+                self._nal_units.append(bytes(self._fragment))
+                self._fragment = None
+
+    def _finish(self) -> Optional[AccessUnit]:
+        nal_units, damaged = self._nal_units, self._damaged or self._fragment is not None
+        self._nal_units, self._fragment, self._damaged = [], None, False
+        if not nal_units:
+            return None
+        if damaged:
+            self.statistics["dropped_frames"] += 1
+            return None
+
+        keyframe = True
+        if self.h264:
+            types = [nal[0] & 0x1F for nal in nal_units if nal]
+            for nal in nal_units:
+                if nal and nal[0] & 0x1F == NAL_SPS:
+                    self.sps = nal
+                elif nal and nal[0] & 0x1F == NAL_PPS:
+                    self.pps = nal
+            keyframe = NAL_IDR in types
+            if keyframe and NAL_SPS not in types and self.sps and self.pps:
+                # 대역 밖(SDP)으로만 전달된 파라미터 세트를 붙여 단독 재생 가능하게
+                nal_units = [self.sps, self.pps] + nal_units
+        self.statistics["frames"] += 1
+        return AccessUnit(self._timestamp, nal_units, keyframe)
+
+# =============================================================================
+# 링 버퍼 / 키 프레임 샘플러
+# =============================================================================
+
+class FrameRing:
+    """최근 프레임 링 버퍼 (max_frames개, max_bytes 바이트를 넘으면 오래된 프레임부터 버림)"""
+
+    def __init__(self, max_frames: int = 120, max_bytes: int = 8 * 1024 * 1024):
+        self.max_frames = max_frames
+        self.max_bytes = max_bytes
+        self.frames: Deque[AccessUnit] = deque()
+        self.bytes = 0
+        self.evicted = 0
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+    def append(self, unit: AccessUnit) -> None:
+        self.frames.append(unit)
+        self.bytes += unit.size
+        while self.frames and (len(self.frames) > self.max_frames or self.bytes > self.max_bytes):
+            self.bytes -= self.frames.popleft().size
+            self.evicted += 1
+
+    def latest_keyframe(self) -> Optional[AccessUnit]:
+        for unit in reversed(self.frames):
+            if unit.keyframe:
+                return unit
+        return None
+
+@dataclass
+class KeyFrameSample:
+    """샘플링된 키 프레임"""
+    timestamp: float
+    digest: str
+    size: int
+    path: Optional[str] = None
+
+class KeyFrameSampler:
+    """스트림 시각 기준 interval초마다 키 프레임 하나를 해시해 새 장면만 보관
+
+    최근 max_hashes개 해시를 LRU로 기억해 같은 장면이 반복되면 중복으로 센다.
+    samples는 최근 max_samples개만 유지하고, output_dir을 주면 새 장면을 Annex B(.h264) 파일로 저장한다.
+    """
+
+    def __init__(self, interval: float = 1.0, max_samples: int = 32, max_hashes: int = 1024,
+                 output_dir: Optional[str] = None):
+        self.interval = interval
+        self.max_hashes = max_hashes
+        self.output_dir = output_dir
+        self.samples: Deque[KeyFrameSample] = deque(maxlen=max_samples)
+        self.statistics: Dict[str, int] = {"keyframes": 0, "hashed": 0, "unique": 0, "duplicates": 0}
+        self._seen: "OrderedDict[str, None]" = OrderedDict()
+        self._last: Optional[float] = None
+        self._origin: Optional[int] = None
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+
+    def offer(self, unit: AccessUnit, clock_rate: int = 90000) -> Optional[KeyFrameSample]:
+        """프레임 제공 - 새 장면으로 채택되면 샘플 반환"""
+        if not unit.keyframe:
+            return None
+        self.statistics["keyframes"] += 1
+        if self._origin is None:
+            self._origin = unit.timestamp
+        # 32비트 RTP 타임스탬프 랩어라운드를 고려한 스트림 경과 시간
+        elapsed = ((unit.timestamp - self._origin) & 0xFFFFFFFF) / clock_rate
+        if self._last is not None and 0 <= elapsed - self._last < self.interval:
+            return None
+        self._last = elapsed
+
+        self.statistics["hashed"] += 1
+        digest = hashlib.blake2b(digest_size=16)
+        for nal in unit.nal_units:
+            digest.update(nal)
+        key = digest.hexdigest()
+        if key in self._seen:
+            self._seen.move_to_end(key)
+            self.statistics["duplicates"] += 1
+            return None
+        self._seen[key] = None
+        if len(self._seen) > self.max_hashes:
+            self._seen.popitem(last=False)
+
+        self.statistics["unique"] += 1
+        sample = KeyFrameSample(round(elapsed, 3), key, unit.size)
+        if self.output_dir:
+            sample.path = os.path.join(self.output_dir, f"{self.statistics['unique']:06d}_{key[:12]}.h264")
+            with open(sample.path, "wb") as f:
+                f.write(unit.annexb())
+        self.samples.append(sample)
+        return sample
+
+# =============================================================================
+# RTSP 클라이언트
+# =============================================================================
+
+class RTSPClient:
+    """RTSP over TCP 클라이언트 (RTP는 같은 연결의 interleaved 채널로 수신)"""
+
+    def __init__(self, url: str, reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                 timeout: float = 5.0):
+        parts = urlsplit(url)
+        self.url = parts._replace(netloc=parts.hostname + (f":{parts.port}" if parts.port else "")).geturl()
+        self.reader = reader
+        self.writer = writer
+        self.timeout = timeout
+        self.session: Optional[str] = None
+        self.session_timeout = 60.0
+        self.statistics: Dict[str, int] = {"requests": 0, "packets": 0, "bytes": 0}
+        self._cseq = 0
+        self._authorization = None
+        if parts.username is not None:
+            credentials = f"{parts.username}:{parts.password or ''}".encode()
+            self._authorization = "Basic " + base64.b64encode(credentials).decode()
+        # 응답을 기다리는 동안 도착한 interleaved 패킷
+        self._backlog: Deque[Tuple[int, bytes]] = deque(maxlen=MAX_BACKLOG)
+        self._reading: Optional[asyncio.Future] = None
+
+    @classmethod
+    async def connect(cls, url: str, timeout: float = 5.0) -> "RTSPClient":
+        parts = urlsplit(url)
+        if parts.scheme != "rtsp" or not parts.hostname:
+            raise RTSPError(f"RTSP URL이 아닙니다: {url}")
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(parts.hostname, parts.port or DEFAULT_RTSP_PORT), timeout)
+        except (OSError, asyncio.TimeoutError) as e:
+            raise RTSPError(f"연결 실패: {parts.hostname}:{parts.port or DEFAULT_RTSP_PORT} ({e})")
+        return cls(url, reader, writer, timeout)
+
+    async def __aenter__(self) -> "RTSPClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        if self._reading is not None:
+            self._reading.cancel()
+            await asyncio.gather(self._reading, return_exceptions=True)
+            self._reading = None
+        if self.writer is not None:
+            self.writer.close()
+            try:
+                await self.writer.wait_closed()
+            except OSError:
+                pass
+            self.writer = None
+
+    def send_request(self, method: str, url: Optional[str] = None, headers: Optional[Dict[str, str]] = None) -> int:
+        """요청 전송 (응답은 기다리지 않음) - CSeq 반환"""
+        self._cseq += 1
+        lines = [f"{method} {url or self.url} {RTSP_VERSION}", f"CSeq: {self._cseq}", f"User-Agent: {USER_AGENT}"]
+        if self.session:
+            lines.append(f"Session: {self.session}")
+        if self._authorization:
+            lines.append(f"Authorization: {self._authorization}")
+        lines.extend(f"{name}: {value}" for name, value in (headers or {}).items())
+        self.writer.write(("\r\n".join(lines) + "\r\n\r\n").encode())
+        self.statistics["requests"] += 1
+        return self._cseq
+
+    async def request(self, method: str, url: Optional[str] = None,
+                      headers: Optional[Dict[str, str]] = None) -> RTSPResponse:
+        """요청 후 같은 CSeq의 응답 대기 (그동안 도착한 interleaved 패킷은 backlog에 보관)"""
+        cseq = self.send_request(method, url, headers)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.timeout
+        while True:
+            try:
+                item = await self._receive(deadline - loop.time())
+            except RTSPError as e:
+                raise RTSPError(f"{method} 중 {e}")
+            if item is None:
+                raise RTSPError(f"{method} 응답 없음")
+            if isinstance(item, RTSPResponse):
+                if item.headers.get("cseq") == str(cseq):
+                    return item
+            else:
+                self._backlog.append(item)
+
+    async def _receive(self, timeout: Optional[float]):
+        """다음 항목 수신 - timeout이 지나면 None
+
+        읽기는 하나의 태스크가 계속 맡아 시간 초과로 항목 중간에서 끊기지 않게 한다 (다음 호출이 이어 받음).
+        """
+        if self._reading is None:
+            self._reading = asyncio.ensure_future(self._read_item())
+        if timeout is not None and timeout <= 0 and not self._reading.done():
+            return None
+        done, _ = await asyncio.wait({self._reading}, timeout=timeout)
+        if not done:
+            return None
+        task, self._reading = self._reading, None
+        try:
+            return task.result()
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError) as e:
+            raise RTSPError(f"연결 종료 ({e})")
+
+    async def _read_item(self):
+        """연결에서 다음 항목 읽기 - interleaved 패킷 (채널, 데이터) 또는 RTSPResponse"""
+        first = await self.reader.readexactly(1)
+        if first[0] == INTERLEAVED_MAGIC:
+            channel, length = struct.unpack("!BH", await self.reader.readexactly(3))
+            data = await self.reader.readexactly(length)
+            self.statistics["packets"] += 1
+            self.statistics["bytes"] += length + 4
+            return channel, data
+
+        head = first + await self.reader.readuntil(b"\r\n\r\n")
+        status_line, *header_lines = head.decode("latin-1").split("\r\n")
+        version, _, rest = status_line.partition(" ")
+        if not version.startswith("RTSP/"):
+            raise RTSPError(f"RTSP 응답이 아닙니다: {status_line[:40]!r}")
+        status, _, reason = rest.partition(" ")
+        headers = {}
+        for line in header_lines:
+            name, sep, value = line.partition(":")
+            if sep:
+                headers[name.strip().lower()] = value.strip()
+        length = int(headers.get("content-length", 0))
+        body = await self.reader.readexactly(length) if length else b""
+        return RTSPResponse(int(status), reason, headers, body)
+
+    async def _checked(self, method: str, url: Optional[str] = None,
+                       headers: Optional[Dict[str, str]] = None) -> RTSPResponse:
+        response = await self.request(method, url, headers)
+        if not response.ok:
+            raise RTSPError(f"{method} 실패: {response.status} {response.reason}", response.status)
+        return response
+
+    async def options(self) -> List[str]:
+        """지원 메서드 목록"""
+        response = await self._checked("OPTIONS")
+        return [method.strip() for method in response.headers.get("public", "").split(",") if method.strip()]
+
+    async def describe(self, url: Optional[str] = None) -> List[MediaTrack]:
+        """DESCRIBE - SDP의 미디어 트랙 목록"""
+        response = await self._checked("DESCRIBE", url, {"Accept": "application/sdp"})
+        base = response.headers.get("content-base") or response.headers.get("content-location") or url or self.url
+        return parse_sdp(response.body.decode("utf-8", "replace"), base)
+
+    async def setup(self, track: MediaTrack, channel: int = 0) -> Tuple[int, int]:
+        """트랙을 interleaved 채널로 SETUP - (RTP 채널, RTCP 채널) 반환"""
+        response = await self._checked("SETUP", track.control,
+                                       {"Transport": f"RTP/AVP/TCP;unicast;interleaved={channel}-{channel + 1}"})
+        session = response.headers.get("session", "")
+        if session:
+            self.session, _, parameters = session.partition(";")
+            if parameters.strip().startswith("timeout="):
+                self.session_timeout = float(parameters.strip()[8:] or 60)
+        for parameter in response.headers.get("transport", "").split(";"):
+            if parameter.startswith("interleaved="):
+                rtp, _, rtcp = parameter[12:].partition("-")
+                return int(rtp), int(rtcp or int(rtp) + 1)
+        return channel, channel + 1
+
+    async def play(self) -> RTSPResponse:
+        return await self._checked("PLAY", headers={"Range": "npt=0.000-"})
+
+    def keepalive(self) -> None:
+        """세션 유지 요청 (응답은 read_packet이 건너뜀)"""
+        self.send_request("GET_PARAMETER")
+
+    async def teardown(self) -> None:
+        if self.session and self.writer is not None:
+            self.send_request("TEARDOWN")
+            try:
+                await self.writer.drain()
+            except ConnectionError:
+                pass
+            self.session = None
+
+    async def read_packet(self, timeout: Optional[float] = None) -> Optional[Tuple[int, bytes]]:
+        """다음 interleaved 패킷 (채널, 데이터) - timeout 안에 없으면 None, 연결이 끊기면 RTSPError"""
+        if self._backlog:
+            return self._backlog.popleft()
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while True:
+            item = await self._receive(None if deadline is None else deadline - loop.time())
+            if item is None or not isinstance(item, RTSPResponse):
+                return item
+
+# =============================================================================
+# 스트림 샘플링
+# =============================================================================
+
+@dataclass
+class StreamReport:
+    """스트림 수신 결과"""
+    url: str
+    codec: str
+    elapsed: float
+    packets: int
+    bytes: int
+    frames: int
+    keyframes: int
+    lost_packets: int
+    dropped_frames: int
+    ring_frames: int
+    ring_bytes: int
+    evicted_frames: int
+    samples: List[KeyFrameSample] = field(default_factory=list)
+    sampler: Dict[str, int] = field(default_factory=dict)
+    ended: str = "duration"
+
+    @property
+    def kbps(self) -> float:
+        return self.bytes / 1024 / self.elapsed if self.elapsed > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(asdict(self), kbps=round(self.kbps, 1))
+
+async def sample_stream(url: str, duration: float, sampler: Optional[KeyFrameSampler] = None,
+                        ring: Optional[FrameRing] = None, timeout: float = 5.0,
+                        media: str = "video") -> StreamReport:
+    """url 스트림을 duration초 동안 수신해 링 버퍼에 보관하고 키 프레임을 샘플링"""
+    sampler = KeyFrameSampler() if sampler is None else sampler
+    ring = FrameRing() if ring is None else ring
+    loop = asyncio.get_running_loop()
+
+    async with await RTSPClient.connect(url, timeout) as client:
+        await client.options()
+        tracks = [track for track in await client.describe() if track.media == media]
+        if not tracks:
+            raise RTSPError(f"{media} 트랙 없음: {url}")
+        track = tracks[0]
+        rtp_channel, _ = await client.setup(track)
+        await client.play()
+        logger.info(f"📹 RTSP 스트림 수신 시작: {url} ({track.codec})")
+
+        depacketizer = Depacketizer(track.codec)
+        started = loop.time()
+        deadline = started + duration
+        next_keepalive = started + client.session_timeout / 2
+        ended = "duration"
+        try:
+            while True:
+                now = loop.time()
+                if now >= deadline:
+                    break
+                if now >= next_keepalive:
+                    client.keepalive()
+                    next_keepalive = now + client.session_timeout / 2
+                try:
+                    item = await client.read_packet(min(deadline - now, timeout))
+                except RTSPError:
+                    ended = "closed"
+                    break
+                if item is None:
+                    if loop.time() < deadline:
+                        ended = "timeout"
+                        break
+                    continue
+                channel, data = item
+                if channel != rtp_channel:
+                    continue
+                packet = parse_rtp(data)
+                if packet is None or packet.payload_type != track.payload_type:
+                    continue
+                unit = depacketizer.push(packet)
+                if unit is not None:
+                    ring.append(unit)
+                    sampler.offer(unit, track.clock_rate)
+        finally:
+            await client.teardown()
+
+        statistics = depacketizer.statistics
+        report = StreamReport(url, track.codec, loop.time() - started, statistics["packets"],
+                              client.statistics["bytes"], statistics["frames"], sampler.statistics["keyframes"],
+                              statistics["lost_packets"], statistics["dropped_frames"], len(ring), ring.bytes,
+                              ring.evicted, list(sampler.samples), dict(sampler.statistics), ended)
+    logger.info(f"📹 RTSP 스트림 수신 종료: 프레임 {report.frames}, 키 프레임 {report.keyframes}, "
+                f"새 장면 {sampler.statistics['unique']}, {report.kbps:.1f} KB/s")
+    return report
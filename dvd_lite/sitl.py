@@ -0,0 +1,587 @@
+# dvd_lite/sitl.py
+"""
+DVD-Lite 로컬 SITL 대체 기체 (stand-in)
+실제 SITL 없이 공격 엔진을 시험하기 위한 최소 MAVLink UDP 응답기
+
+- 연결해 온 피어에게 주기적으로 HEARTBEAT 전송
+- 수신 프레임을 메시지 종류별로 집계
+- 미션 업로드/다운로드 프로토콜 (MISSION_COUNT / MISSION_REQUEST_INT / MISSION_ITEM_INT / MISSION_ACK)
+- 파라미터 프로토콜 (PARAM_REQUEST_LIST / PARAM_REQUEST_READ / PARAM_SET / PARAM_VALUE)
+- 로그 다운로드 프로토콜 (LOG_REQUEST_LIST / LOG_ENTRY / LOG_REQUEST_DATA / LOG_DATA / LOG_REQUEST_END)
+- 텔레메트리 스트림 (REQUEST_DATA_STREAM → 원 궤적을 도는 GLOBAL_POSITION_INT / ATTITUDE)
+- handlers에 메시지 이름별 처리 함수를 등록해 프로토콜 동작을 추가
+- drop_rate(수신 손실률), tx_drop_rate(송신 손실률), response_delay(응답 지연)로 링크 품질 모사
+
+StandInCamera는 컴패니언 컴퓨터의 RTSP 영상 스트림 대체 서버 (합성 H.264, RTP over TCP interleaved)
+
+단독 실행:
+    python -m dvd_lite.sitl --port 14550 --rtsp-port 8554
+"""
+
+import asyncio
+import logging
+import math
+import random
+import struct
+from collections import deque
+from typing import Dict, List, Any, Optional, Tuple, Callable, Set, Deque
+from urllib.parse import urlsplit
+
+from . import mavlink, rtsp
+
+logger = logging.getLogger(__name__)
+
+Address = Tuple[str, int]
+Handler = Callable[[mavlink.MAVLinkMessage, Address], None]
+
+MAV_PARAM_TYPE_INT8 = 2
+MAV_PARAM_TYPE_INT32 = 6
+MAV_PARAM_TYPE_REAL32 = 9
+
+# 파라미터 목록 스트림 분할 (묶음 크기, 묶음 간격 s)
+PARAM_STREAM_BURST = 32
+PARAM_STREAM_INTERVAL = 0.001
+
+# 로그 데이터 스트림 (LOG_DATA 한 개의 최대 바이트, 묶음 크기, 묶음 간격 s)
+LOG_DATA_CHUNK = 90
+LOG_STREAM_BURST = 32
+LOG_STREAM_INTERVAL = 0.001
+
+# 텔레메트리 스트림 궤적 (홈 위치 중심 원 비행)
+TELEMETRY_HOME = (37.7749, -122.4194, 50.0)
+TELEMETRY_RADIUS = 100.0
+TELEMETRY_PERIOD = 60.0
+
+# 대표 ArduPilot 파라미터 (이름, 값, 형식)
+CORE_PARAMETERS = [
+    ("SYSID_THISMAV", 1, MAV_PARAM_TYPE_INT8), ("ARMING_CHECK", 1, MAV_PARAM_TYPE_INT32),
+    ("FENCE_ENABLE", 1, MAV_PARAM_TYPE_INT8), ("FENCE_ALT_MAX", 100.0, MAV_PARAM_TYPE_REAL32),
+    ("FENCE_RADIUS", 300.0, MAV_PARAM_TYPE_REAL32), ("RTL_ALT", 1500, MAV_PARAM_TYPE_INT32),
+    ("BATT_CAPACITY", 5000, MAV_PARAM_TYPE_INT32), ("BATT_LOW_VOLT", 10.5, MAV_PARAM_TYPE_REAL32),
+    ("FS_GCS_ENABLE", 1, MAV_PARAM_TYPE_INT8), ("FS_THR_ENABLE", 1, MAV_PARAM_TYPE_INT8),
+    ("GPS_TYPE", 1, MAV_PARAM_TYPE_INT8), ("COMPASS_USE", 1, MAV_PARAM_TYPE_INT8),
+    ("WPNAV_SPEED", 500.0, MAV_PARAM_TYPE_REAL32), ("LOG_BITMASK", 176126, MAV_PARAM_TYPE_INT32),
+]
+
+def default_parameters(count: int = 1000) -> Dict[str, Tuple[float, int]]:
+    """대체 기체 기본 파라미터 (CORE_PARAMETERS + 채널/센서 계열 파라미터로 count개)"""
+    parameters = {name: (float(value), param_type) for name, value, param_type in CORE_PARAMETERS}
+    families = [("SERVO", ("MIN", "MAX", "TRIM", "REVERSED", "FUNCTION")),
+                ("RC", ("MIN", "MAX", "TRIM", "REVERSED", "DZ", "OPTION")),
+                ("INS_ACC", ("OFFS_X", "OFFS_Y", "OFFS_Z", "SCAL_X", "SCAL_Y", "SCAL_Z")),
+                ("COMPASS_OFS", ("X", "Y", "Z"))]
+    channel = 1
+    while len(parameters) < count:
+        for prefix, suffixes in families:
+            for suffix in suffixes:
+                if len(parameters) < count:
+                    parameters[f"{prefix}{channel}_{suffix}"] = (float(channel * 10 + len(suffix)), MAV_PARAM_TYPE_REAL32)
+        channel += 1
+    return parameters
+
+class StandInVehicle(asyncio.DatagramProtocol):
+    """MAVLink UDP 대체 기체"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, heartbeat_interval: float = 1.0,
+                 sysid: int = 1, compid: int = 1, drop_rate: float = 0.0, response_delay: float = 0.0,
+                 seed: Optional[int] = None, tx_drop_rate: float = 0.0, parameter_count: int = 1000):
+        self.host = host
+        self.port = port
+        self.heartbeat_interval = heartbeat_interval
+        self.sysid = sysid
+        self.compid = compid
+        self.drop_rate = drop_rate
+        self.tx_drop_rate = tx_drop_rate
+        self.response_delay = response_delay
+        self.random = random.Random(seed)
+        self.handlers: Dict[str, Handler] = {
+            "MISSION_COUNT": self._on_mission_count,
+            "MISSION_ITEM_INT": self._on_mission_item,
+            "MISSION_REQUEST_LIST": self._on_mission_request_list,
+            "MISSION_REQUEST_INT": self._on_mission_request,
+            "PARAM_REQUEST_LIST": self._on_param_request_list,
+            "PARAM_REQUEST_READ": self._on_param_request_read,
+            "PARAM_SET": self._on_param_set,
+            "LOG_REQUEST_LIST": self._on_log_request_list,
+            "LOG_REQUEST_DATA": self._on_log_request_data,
+            "LOG_REQUEST_END": self._on_log_request_end,
+            "REQUEST_DATA_STREAM": self._on_request_data_stream,
+        }
+        self.peers: Set[Address] = set()
+        self.transport: Optional[asyncio.DatagramTransport] = None
+        self.statistics: Dict[str, Any] = {"frames_received": 0, "datagrams_received": 0, "dropped": 0,
+                                           "tx_dropped": 0, "heartbeats_sent": 0, "by_message": {}}
+        # 파라미터 (이름 → (값, MAV_PARAM_TYPE)), 인덱스는 삽입 순서
+        self.parameters: Dict[str, Tuple[float, int]] = default_parameters(parameter_count)
+        # 저장된 미션 (MISSION_ITEM_INT 필드 dict 목록)과 진행 중인 업로드
+        self.mission: List[Dict[str, Any]] = []
+        self._upload: Optional[List[Optional[Dict[str, Any]]]] = None
+        self._upload_expected = 0
+        self._seq = 0
+        self._heartbeat_task: Optional[asyncio.Task] = None
+        self._param_stream: Optional[asyncio.Task] = None
+        # 저장된 로그 (로그 번호 → DataFlash 바이트)와 LOG_REQUEST_DATA 대기열
+        self.logs: Dict[int, bytes] = {}
+        self._log_requests: Deque[Tuple[int, int, int, Address]] = deque()
+        self._log_stream: Optional[asyncio.Task] = None
+        self._telemetry_stream: Optional[asyncio.Task] = None
+        self._heartbeat = mavlink.FrameTemplate("HEARTBEAT", sysid, compid, type=2, autopilot=3,
+                                                system_status=4, mavlink_version=3)
+
+    @property
+    def address(self) -> Address:
+        return self.transport.get_extra_info("sockname")[:2]
+
+    async def start(self) -> "StandInVehicle":
+        loop = asyncio.get_running_loop()
+        await loop.create_datagram_endpoint(lambda: self, local_addr=(self.host, self.port))
+        self._heartbeat_task = asyncio.ensure_future(self._heartbeat_loop())
+        logger.info(f"🛩️ 대체 기체 시작: {self.address[0]}:{self.address[1]}")
+        return self
+
+    async def stop(self) -> None:
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+            await asyncio.gather(self._heartbeat_task, return_exceptions=True)
+            self._heartbeat_task = None
+        if self._param_stream is not None:
+            self._param_stream.cancel()
+            await asyncio.gather(self._param_stream, return_exceptions=True)
+            self._param_stream = None
+        if self._log_stream is not None:
+            self._log_stream.cancel()
+            await asyncio.gather(self._log_stream, return_exceptions=True)
+            self._log_stream = None
+        if self._telemetry_stream is not None:
+            self._telemetry_stream.cancel()
+            await asyncio.gather(self._telemetry_stream, return_exceptions=True)
+            self._telemetry_stream = None
+        if self.transport is not None:
+            self.transport.close()
+            self.transport = None
+
+    async def __aenter__(self) -> "StandInVehicle":
+        return await self.start()
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    def connection_made(self, transport) -> None:
+        self.transport = transport
+
+    def datagram_received(self, data: bytes, addr: Address) -> None:
+        if self.drop_rate and self.random.random() < self.drop_rate:
+            self.statistics["dropped"] += 1
+            return
+        self.peers.add(addr)
+        self.statistics["datagrams_received"] += 1
+        for message in mavlink.parse_frames(data, self.statistics):
+            self.statistics["frames_received"] += 1
+            counts = self.statistics["by_message"]
+            counts[message.name] = counts.get(message.name, 0) + 1
+            handler = self.handlers.get(message.name)
+            if handler is not None:
+                handler(message, addr)
+
+    def send(self, name: str, addr: Address, **values) -> None:
+        """피어에게 메시지 전송"""
+        if self.transport is None:
+            return
+        frame = mavlink.encode(name, self._next_seq(), self.sysid, self.compid, **values)
+        if self.tx_drop_rate and self.random.random() < self.tx_drop_rate:
+            self.statistics["tx_dropped"] += 1
+            return
+        if self.response_delay > 0:
+            asyncio.get_running_loop().call_later(self.response_delay, self._sendto, frame, addr)
+        else:
+            self.transport.sendto(frame, addr)
+
+    def _sendto(self, frame: bytes, addr: Address) -> None:
+        if self.transport is not None:
+            self.transport.sendto(frame, addr)
+
+    def _next_seq(self) -> int:
+        self._seq = (self._seq + 1) & 0xFF
+        return self._seq
+
+    # -------------------------------------------------------------------------
+    # 미션 프로토콜
+    # 업로드 중에는 받은 항목을 순서와 관계없이 저장하고, 매 항목마다 아직 받지 못한
+    # 가장 작은 번호를 요청한다 (누적 확인 응답). 모두 받으면 MISSION_ACK(ACCEPTED).
+    # -------------------------------------------------------------------------
+
+    def _on_mission_count(self, message: mavlink.MAVLinkMessage, addr: Address) -> None:
+        count = message.fields["count"]
+        if self._upload is None or len(self._upload) != count:
+            self._upload = [None] * count
+            self._upload_expected = 0
+        self._request_next_item(addr)
+
+    def _on_mission_item(self, message: mavlink.MAVLinkMessage, addr: Address) -> None:
+        if self._upload is None:
+            # 완료 ACK가 유실돼 재전송된 항목 - ACK 다시 전송
+            self.send("MISSION_ACK", addr, target_system=message.sysid, target_component=message.compid, type=0)
+            return
+
+        seq = message.fields["seq"]
+        if seq < len(self._upload):
+            self._upload[seq] = message.fields
+        while self._upload_expected < len(self._upload) and self._upload[self._upload_expected] is not None:
+            self._upload_expected += 1
+        self._request_next_item(addr)
+
+    def _request_next_item(self, addr: Address) -> None:
+        if self._upload_expected >= len(self._upload):
+            self.mission = list(self._upload)
+            self._upload = None
+            self.send("MISSION_ACK", addr, target_system=255, target_component=190, type=0)
+            return
+        self.send("MISSION_REQUEST_INT", addr, target_system=255, target_component=190, seq=self._upload_expected)
+
+    def _on_mission_request_list(self, message: mavlink.MAVLinkMessage, addr: Address) -> None:
+        self.send("MISSION_COUNT", addr, target_system=message.sysid, target_component=message.compid,
+                  count=len(self.mission))
+
+    def _on_mission_request(self, message: mavlink.MAVLinkMessage, addr: Address) -> None:
+        seq = message.fields["seq"]
+        if seq < len(self.mission):
+            self.send("MISSION_ITEM_INT", addr, **dict(self.mission[seq], target_system=message.sysid,
+                                                       target_component=message.compid))
+
+    # -------------------------------------------------------------------------
+    # 파라미터 프로토콜
+    # -------------------------------------------------------------------------
+
+    def _send_param(self, index: int, name: str, addr: Address) -> None:
+        value, param_type = self.parameters[name]
+        self.send("PARAM_VALUE", addr, param_id=name.encode("ascii"), param_value=value,
+                  param_type=param_type, param_count=len(self.parameters), param_index=index)
+
+    def _on_param_request_list(self, message: mavlink.MAVLinkMessage, addr: Address) -> None:
+        # 진행 중인 스트림은 처음부터 다시 시작
+        if self._param_stream is not None:
+            self._param_stream.cancel()
+        self._param_stream = asyncio.ensure_future(self._stream_parameters(addr))
+
+    async def _stream_parameters(self, addr: Address) -> None:
+        """전체 파라미터를 PARAM_STREAM_BURST개씩 나눠 전송 (실제 기체처럼 링크 대역폭에 맞춰 분할)"""
+        for index, name in enumerate(list(self.parameters)):
+            if index and index % PARAM_STREAM_BURST == 0:
+                await asyncio.sleep(PARAM_STREAM_INTERVAL)
+            if name in self.parameters:
+                self._send_param(index, name, addr)
+
+    def _on_param_request_read(self, message: mavlink.MAVLinkMessage, addr: Address) -> None:
+        index = message.fields["param_index"]
+        names = list(self.parameters)
+        if index < 0:
+            name = message.fields["param_id"].split(b"\0", 1)[0].decode("ascii", "replace")
+            if name in self.parameters:
+                self._send_param(names.index(name), name, addr)
+        elif index < len(names):
+            self._send_param(index, names[index], addr)
+
+    def _on_param_set(self, message: mavlink.MAVLinkMessage, addr: Address) -> None:
+        name = message.fields["param_id"].split(b"\0", 1)[0].decode("ascii", "replace")
+        if name not in self.parameters:
+            return
+        _, param_type = self.parameters[name]
+        value = message.fields["param_value"]
+        # 정수형 파라미터는 정수로 저장 (실제 기체와 같이 값이 바뀔 수 있음)
+        if param_type != MAV_PARAM_TYPE_REAL32:
+            value = float(int(round(value)))
+        self.parameters[name] = (value, param_type)
+        self._send_param(list(self.parameters).index(name), name, addr)
+
+    # -------------------------------------------------------------------------
+    # 로그 다운로드 프로토콜
+    # -------------------------------------------------------------------------
+
+    def _on_log_request_list(self, message: mavlink.MAVLinkMessage, addr: Address) -> None:
+        ids = sorted(self.logs)
+        if not ids:
+            self.send("LOG_ENTRY", addr, id=0, num_logs=0, last_log_num=0, size=0, time_utc=0)
+            return
+        start, end = message.fields["start"], message.fields["end"]
+        for log_id in ids:
+            if start <= log_id <= end:
+                self.send("LOG_ENTRY", addr, id=log_id, num_logs=len(ids), last_log_num=ids[-1],
+                          size=len(self.logs[log_id]), time_utc=0)
+
+    def _on_log_request_data(self, message: mavlink.MAVLinkMessage, addr: Address) -> None:
+        # 요청은 도착 순서대로 하나의 스트림에서 처리 (링크 하나로 순차 전송)
+        self._log_requests.append((message.fields["id"], message.fields["ofs"], message.fields["count"], addr))
+        if self._log_stream is None or self._log_stream.done():
+            self._log_stream = asyncio.ensure_future(self._stream_logs())
+
+    def _on_log_request_end(self, message: mavlink.MAVLinkMessage, addr: Address) -> None:
+        self._log_requests.clear()
+        if self._log_stream is not None:
+            self._log_stream.cancel()
+
+    async def _stream_logs(self) -> None:
+        """대기 중인 요청마다 [ofs, ofs+count) 구간을 LOG_DATA_CHUNK 바이트씩 전송 (로그 끝을 넘으면 count=0 응답)"""
+        sent = 0
+        while self._log_requests:
+            log_id, offset, count, addr = self._log_requests.popleft()
+            data = self.logs.get(log_id)
+            if data is None:
+                continue
+            end = min(len(data), offset + count)
+            if offset >= end:
+                self.send("LOG_DATA", addr, id=log_id, ofs=offset, count=0, data=b"")
+                continue
+            for chunk_start in range(offset, end, LOG_DATA_CHUNK):
+                chunk = data[chunk_start:min(end, chunk_start + LOG_DATA_CHUNK)]
+                self.send("LOG_DATA", addr, id=log_id, ofs=chunk_start, count=len(chunk), data=chunk)
+                sent += 1
+                if sent % LOG_STREAM_BURST == 0:
+                    await asyncio.sleep(LOG_STREAM_INTERVAL)
+
+    # -------------------------------------------------------------------------
+    # 텔레메트리 스트림
+    # -------------------------------------------------------------------------
+
+    def _on_request_data_stream(self, message: mavlink.MAVLinkMessage, addr: Address) -> None:
+        # 새 요청은 진행 중인 스트림을 대체, start_stop=0이면 중지
+        if self._telemetry_stream is not None:
+            self._telemetry_stream.cancel()
+            self._telemetry_stream = None
+        rate = message.fields["req_message_rate"]
+        if message.fields["start_stop"] and rate > 0:
+            self._telemetry_stream = asyncio.ensure_future(self._stream_telemetry(addr, rate))
+
+    async def _stream_telemetry(self, addr: Address, rate: int) -> None:
+        """rate Hz로 GLOBAL_POSITION_INT / ATTITUDE 전송 (TELEMETRY_HOME 중심 원 궤적)"""
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        lat0, lon0, alt0 = TELEMETRY_HOME
+        tick = 0
+        while True:
+            elapsed = tick / rate
+            angle = 2 * math.pi * elapsed / TELEMETRY_PERIOD
+            north, east = TELEMETRY_RADIUS * math.cos(angle), TELEMETRY_RADIUS * math.sin(angle)
+            speed = 2 * math.pi * TELEMETRY_RADIUS / TELEMETRY_PERIOD
+            heading = math.degrees(angle + math.pi / 2) % 360
+            time_boot_ms = int(elapsed * 1000)
+            self.send("GLOBAL_POSITION_INT", addr, time_boot_ms=time_boot_ms,
+                      lat=round((lat0 + north / 111320.0) * 1e7),
+                      lon=round((lon0 + east / (111320.0 * math.cos(math.radians(lat0)))) * 1e7),
+                      alt=round(alt0 * 1000), relative_alt=round(alt0 * 1000),
+                      vx=round(-speed * math.sin(angle) * 100), vy=round(speed * math.cos(angle) * 100),
+                      vz=0, hdg=round(heading * 100))
+            self.send("ATTITUDE", addr, time_boot_ms=time_boot_ms, roll=0.1, pitch=0.0,
+                      yaw=math.radians(heading if heading <= 180 else heading - 360),
+                      rollspeed=0.0, pitchspeed=0.0, yawspeed=2 * math.pi / TELEMETRY_PERIOD)
+            tick += 1
+            await asyncio.sleep(max(0.0, started + tick / rate - loop.time()))
+
+    async def _heartbeat_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            frame = bytes(self._heartbeat.frame(self._next_seq()))
+            for peer in list(self.peers):
+                self.transport.sendto(frame, peer)
+            self.statistics["heartbeats_sent"] += 1
+
+class StandInCamera:
+    """RTSP 대체 카메라 서버
+
+    path의 영상 트랙 하나를 합성 H.264로 fps 속도로 송출한다 (TCP interleaved만 지원, UDP 요청은 461).
+    gop 프레임마다 SPS/PPS/IDR 키 프레임을 보내며, 장면 하나가 scene_keyframes개 키 프레임 동안
+    같은 IDR을 반복하므로 해시 중복 제거를 시험할 수 있다.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, path: str = "/stream", fps: float = 30.0,
+                 gop: int = 30, frame_size: int = 2000, keyframe_size: int = 12000, scene_keyframes: int = 3,
+                 seed: Optional[int] = None, mtu: int = 1400):
+        self.host = host
+        self.port = port
+        self.path = path
+        self.fps = fps
+        self.gop = gop
+        self.frame_size = frame_size
+        self.keyframe_size = keyframe_size
+        self.scene_keyframes = scene_keyframes
+        self.seed = seed
+        self.mtu = mtu
+        self.server: Optional[asyncio.AbstractServer] = None
+        self.statistics: Dict[str, int] = {"sessions": 0, "requests": 0, "frames_sent": 0,
+                                           "keyframes_sent": 0, "packets_sent": 0}
+        self._streams: Set[asyncio.Task] = set()
+        self._sps = bytes([0x67, 0x42, 0xC0, 0x1F]) + bytes(range(8))
+        self._pps = bytes([0x68, 0xCE, 0x3C, 0x80])
+
+    @property
+    def address(self) -> Address:
+        return self.server.sockets[0].getsockname()[:2]
+
+    @property
+    def url(self) -> str:
+        host, port = self.address
+        return f"rtsp://{host}:{port}{self.path}"
+
+    async def start(self) -> "StandInCamera":
+        self.server = await asyncio.start_server(self._handle, self.host, self.port)
+        logger.info(f"📷 대체 카메라 시작: {self.url}")
+        return self
+
+    async def stop(self) -> None:
+        for task in list(self._streams):
+            task.cancel()
+        await asyncio.gather(*self._streams, return_exceptions=True)
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+            self.server = None
+
+    async def __aenter__(self) -> "StandInCamera":
+        return await self.start()
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    def _frame(self, index: int) -> List[bytes]:
+        """index번째 프레임의 NAL 단위 목록"""
+        if index % self.gop:
+            # P 슬라이스 - 프레임 번호로 내용만 달리함
+            return [bytes([0x41]) + index.to_bytes(4, "big") + bytes(self.frame_size - 5)]
+        scene = index // self.gop // max(1, self.scene_keyframes)
+        scene_random = random.Random(f"{self.seed}:{scene}")
+        return [self._sps, self._pps, bytes([0x65]) + scene_random.randbytes(self.keyframe_size - 1)]
+
+    def _sdp(self) -> str:
+        return "\r\n".join([
+            "v=0", f"o=- 0 0 IN IP4 {self.host}", "s=DVD-Lite stand-in camera", "t=0 0",
+            "a=control:*",
+            "m=video 0 RTP/AVP 96", "a=rtpmap:96 H264/90000",
+            "a=fmtp:96 packetization-mode=1", "a=control:trackID=0", ""
+        ])
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        session = None
+        stream: Optional[asyncio.Task] = None
+        self.statistics["sessions"] += 1
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                request_line, *header_lines = head.decode("latin-1").split("\r\n")
+                method, url, _ = (request_line.split(" ") + ["", ""])[:3]
+                headers = {}
+                for line in header_lines:
+                    name, sep, value = line.partition(":")
+                    if sep:
+                        headers[name.strip().lower()] = value.strip()
+                if int(headers.get("content-length", 0)):
+                    await reader.readexactly(int(headers["content-length"]))
+                self.statistics["requests"] += 1
+
+                status, extra, body = 200, {}, b""
+                path = urlsplit(url).path
+                if method == "OPTIONS":
+                    extra["Public"] = "OPTIONS, DESCRIBE, SETUP, PLAY, TEARDOWN, GET_PARAMETER"
+                elif method == "DESCRIBE":
+                    if path.rstrip("/") != self.path.rstrip("/"):
+                        status = 404
+                    else:
+                        body = self._sdp().encode()
+                        extra.update({"Content-Type": "application/sdp",
+                                      "Content-Base": url.rstrip("/") + "/"})
+                elif method == "SETUP":
+                    transport = headers.get("transport", "")
+                    if "RTP/AVP/TCP" not in transport or "interleaved=" not in transport:
+                        status = 461
+                    else:
+                        session = session or f"{random.getrandbits(32):08X}"
+                        channel = int(transport.split("interleaved=")[1].split("-")[0].split(";")[0])
+                        extra.update({"Session": f"{session};timeout=60",
+                                      "Transport": f"RTP/AVP/TCP;unicast;interleaved={channel}-{channel + 1}"})
+                elif method == "PLAY":
+                    if session is None or headers.get("session", "").split(";")[0] != session:
+                        status = 454
+                    else:
+                        extra["Session"] = session
+                        if stream is None:
+                            stream = asyncio.ensure_future(self._stream(writer, channel))
+                            self._streams.add(stream)
+                            stream.add_done_callback(self._streams.discard)
+                elif method == "GET_PARAMETER":
+                    pass
+                elif method == "TEARDOWN":
+                    if stream is not None:
+                        stream.cancel()
+                    self._respond(writer, headers, 200, {})
+                    break
+                else:
+                    status = 405
+
+                self._respond(writer, headers, status, extra, body)
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            if stream is not None:
+                stream.cancel()
+                await asyncio.gather(stream, return_exceptions=True)
+            writer.close()
+
+    def _respond(self, writer: asyncio.StreamWriter, headers: Dict[str, str], status: int,
+                 extra: Dict[str, str], body: bytes = b"") -> None:
+        reasons = {200: "OK", 404: "Not Found", 405: "Method Not Allowed", 454: "Session Not Found",
+                   461: "Unsupported Transport"}
+        lines = [f"RTSP/1.0 {status} {reasons.get(status, 'Error')}", f"CSeq: {headers.get('cseq', '0')}"]
+        lines.extend(f"{name}: {value}" for name, value in extra.items())
+        if body:
+            lines.append(f"Content-Length: {len(body)}")
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode() + body)
+
+    async def _stream(self, writer: asyncio.StreamWriter, channel: int) -> None:
+        """fps 속도로 RTP 패킷을 interleaved 채널에 송출"""
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        sequence = 0
+        ssrc = random.getrandbits(32)
+        index = 0
+        try:
+            while True:
+                nal_units = self._frame(index)
+                payloads = rtsp.packetize_h264(nal_units, self.mtu)
+                timestamp = round(index * 90000 / self.fps)
+                for position, payload in enumerate(payloads):
+                    packet = rtsp.build_rtp(96, position == len(payloads) - 1, sequence, timestamp, ssrc, payload)
+                    writer.write(struct.pack("!BBH", rtsp.INTERLEAVED_MAGIC, channel, len(packet)) + packet)
+                    sequence += 1
+                self.statistics["packets_sent"] += len(payloads)
+                self.statistics["frames_sent"] += 1
+                if index % self.gop == 0:
+                    self.statistics["keyframes_sent"] += 1
+                await writer.drain()
+                index += 1
+                await asyncio.sleep(max(0.0, started + index / self.fps - loop.time()))
+        except ConnectionError:
+            pass
+
+async def _serve(host: str, port: int, rtsp_port: Optional[int] = None) -> None:
+    async with StandInVehicle(host, port):
+        if rtsp_port is None:
+            await asyncio.Event().wait()
+        async with StandInCamera(host, rtsp_port):
+            await asyncio.Event().wait()
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="DVD-Lite MAVLink 대체 기체")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=14550)
+    parser.add_argument("--rtsp-port", type=int, default=None, help="지정하면 RTSP 대체 카메라도 실행")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    try:
+        asyncio.run(_serve(args.host, args.port, args.rtsp_port))
+    except KeyboardInterrupt:
+        pass
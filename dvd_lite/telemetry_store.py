@@ -0,0 +1,363 @@
+# dvd_lite/telemetry_store.py
+"""
+DVD-Lite 텔레메트리 열 저장소
+수집한 텔레메트리를 메시지 종류별 NumPy 열(미리 할당한 chunk_rows 크기 청크)에 쌓고,
+청크가 차면 압축 세그먼트로 디스크에 기록한다.
+
+열 인코딩:
+- 정수 / 범주 / 시각(µs): 차분 → zigzag → varint → zlib (천천히 변하는 값은 거의 사라짐)
+- 실수: 바이트 셔플 → zlib
+- 배율(scale)을 지정한 실수 열은 정수로 양자화 (예: 위도 1e7 → int32, MAVLink와 같은 정밀도)
+
+파일 구조: <directory>/<message_type>.tcol 에 세그먼트를 이어 붙인다.
+    세그먼트 = b"TCOL" + u32 헤더 길이 + JSON 헤더(행 수, 시각 범위, 열 목록) + 열 블롭들
+TelemetryReader는 파일을 mmap으로 열어 헤더만 읽고, 열은 요청할 때 디코딩한다.
+
+사용 예:
+    with TelemetryStore("results/capture") as store:
+        store.declare("position", {"lat": ("i4", 1e7), "lon": ("i4", 1e7), "mode": "category"})
+        store.append("position", now(), {"lat": 37.7749, "lon": -122.4194, "mode": "AUTO"})
+
+    with TelemetryReader("results/capture") as reader:
+        columns = reader.read("position", start=t0, end=t1)
+"""
+
+import json
+import logging
+import mmap
+import os
+import struct
+import zlib
+from typing import Dict, List, Any, Optional, Tuple, Union
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+SEGMENT_MAGIC = b"TCOL"
+SEGMENT_SUFFIX = ".tcol"
+TIMESTAMP = "timestamp"
+CATEGORY = "category"
+
+FieldSpec = Union[str, Tuple[str, Optional[float]]]
+
+# =============================================================================
+# 열 인코딩
+# =============================================================================
+
+def varint_encode(values) -> bytes:
+    """int64 배열 → 차분 + zigzag + varint 바이트"""
+    values = np.asarray(values, dtype=np.int64)
+    if len(values) == 0:
+        return b""
+    delta = np.diff(values, prepend=np.int64(0))
+    zigzag = ((delta << 1) ^ (delta >> 63)).view(np.uint64)
+
+    # 값마다 필요한 7비트 그룹 수 (1~10)
+    groups = np.ones(len(zigzag), dtype=np.int64)
+    for group in range(1, 10):
+        groups += zigzag >= (np.uint64(1) << np.uint64(7 * group))
+    shifts = np.arange(10, dtype=np.uint64) * np.uint64(7)
+    digits = ((zigzag[:, None] >> shifts) & np.uint64(0x7F)).astype(np.uint8)
+    position = np.arange(10)
+    digits[position < groups[:, None] - 1] |= 0x80
+    return digits[position < groups[:, None]].tobytes()
+
+def varint_decode(data: bytes, count: int):
+    """varint_encode의 역변환"""
+    if count == 0:
+        return np.zeros(0, dtype=np.int64)
+    raw = np.frombuffer(data, dtype=np.uint8)
+    ends = np.flatnonzero(raw < 0x80)
+    starts = np.concatenate(([0], ends[:-1] + 1))
+    group = np.repeat(np.arange(len(starts)), ends - starts + 1)
+    shift = ((np.arange(len(raw)) - starts[group]) * 7).astype(np.uint64)
+    zigzag = np.add.reduceat((raw & 0x7F).astype(np.uint64) << shift, starts)
+    delta = (zigzag >> np.uint64(1)).view(np.int64) ^ -(zigzag & np.uint64(1)).view(np.int64)
+    return np.cumsum(delta)[:count]
+
+def shuffle_encode(values) -> bytes:
+    """고정 크기 값의 바이트 평면 분리 (같은 자리 바이트끼리 모아 압축률 향상)"""
+    values = np.ascontiguousarray(values)
+    return values.view(np.uint8).reshape(-1, values.dtype.itemsize).T.tobytes()
+
+def shuffle_decode(data: bytes, dtype, count: int):
+    dtype = np.dtype(dtype)
+    planes = np.frombuffer(data, dtype=np.uint8).reshape(dtype.itemsize, count)
+    return np.ascontiguousarray(planes.T).view(dtype).reshape(count)
+
+# =============================================================================
+# 저장소
+# =============================================================================
+
+class _Chunk:
+    """메시지 종류 하나의 미리 할당된 열 청크"""
+
+    def __init__(self, fields: Dict[str, Tuple[str, Optional[float]]], rows: int):
+        self.fields = fields
+        self.capacity = rows
+        self.size = 0
+        self.timestamps = np.zeros(rows, dtype=np.int64)
+        self.columns = {name: np.zeros(rows, dtype=np.int32 if dtype == CATEGORY else dtype)
+                        for name, (dtype, _) in fields.items()}
+        # 범주 열: 값 → 코드 (저장소 수명 동안 유지, 세그먼트마다 전체 목록 기록)
+        self.categories: Dict[str, Dict[Any, int]] = {name: {} for name, (dtype, _) in fields.items()
+                                                      if dtype == CATEGORY}
+
+    def _store(self, name: str, value: Any) -> Any:
+        dtype, scale = self.fields[name]
+        if dtype == CATEGORY:
+            codes = self.categories[name]
+            return codes.setdefault(value, len(codes))
+        if scale is not None:
+            return round(value * scale)
+        return value
+
+    def append(self, timestamp: float, values: Dict[str, Any]) -> None:
+        index = self.size
+        self.timestamps[index] = round(timestamp * 1e6)
+        for name, column in self.columns.items():
+            value = values.get(name)
+            if value is not None:
+                column[index] = self._store(name, value)
+        self.size += 1
+
+    def extend(self, timestamps, columns: Dict[str, Any], start: int, count: int) -> None:
+        index = self.size
+        self.timestamps[index:index + count] = np.round(np.asarray(timestamps[start:start + count]) * 1e6)
+        for name, column in self.columns.items():
+            if name not in columns:
+                continue
+            values = columns[name][start:start + count]
+            dtype, scale = self.fields[name]
+            if dtype == CATEGORY:
+                values = [self._store(name, value) for value in values]
+            elif scale is not None:
+                values = np.round(np.asarray(values, dtype=np.float64) * scale)
+            column[index:index + count] = values
+        self.size += count
+
+    def encode(self, level: int) -> bytes:
+        """채워진 행을 세그먼트 바이트로"""
+        rows = self.size
+        blobs: List[bytes] = []
+        columns: List[Dict[str, Any]] = []
+
+        def add(name: str, dtype: str, encoding: str, data: bytes, **extra) -> None:
+            compressed = zlib.compress(data, level)
+            columns.append(dict(name=name, dtype=dtype, encoding=encoding, length=len(compressed), **extra))
+            blobs.append(compressed)
+
+        add(TIMESTAMP, "i8", "delta-varint", varint_encode(self.timestamps[:rows]))
+        for name, column in self.columns.items():
+            dtype, scale = self.fields[name]
+            values = column[:rows]
+            if dtype == CATEGORY:
+                add(name, CATEGORY, "delta-varint", varint_encode(values),
+                    categories=list(self.categories[name]))
+            elif values.dtype.kind in "iub":
+                add(name, values.dtype.str, "delta-varint", varint_encode(values.astype(np.int64)), scale=scale)
+            else:
+                add(name, values.dtype.str, "shuffle", shuffle_encode(values), scale=scale)
+
+        timestamps = self.timestamps[:rows]
+        header = json.dumps({"rows": rows, "t0": int(timestamps.min()), "t1": int(timestamps.max()),
+                             "columns": columns}).encode()
+        # 빠진 필드가 이전 세그먼트 값을 물려받지 않도록 0으로 되돌림
+        self.timestamps[:rows] = 0
+        for column in self.columns.values():
+            column[:rows] = 0
+        self.size = 0
+        return SEGMENT_MAGIC + struct.pack("<I", len(header)) + header + b"".join(blobs)
+
+class TelemetryStore:
+    """텔레메트리 열 저장소 (쓰기)"""
+
+    def __init__(self, directory: str, chunk_rows: int = 8192, level: int = 6):
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("텔레메트리 저장소에는 numpy가 필요합니다")
+        self.directory = directory
+        self.chunk_rows = chunk_rows
+        self.level = level
+        self._chunks: Dict[str, _Chunk] = {}
+        self.statistics: Dict[str, int] = {"rows": 0, "segments": 0, "bytes_written": 0}
+        os.makedirs(directory, exist_ok=True)
+
+    def declare(self, message_type: str, fields: Dict[str, FieldSpec]) -> None:
+        """열 형식 지정 - dtype 문자열, (dtype, 배율) 또는 "category" """
+        if message_type in self._chunks:
+            raise ValueError(f"이미 형식이 정해진 메시지 종류: {message_type}")
+        normalized = {name: spec if isinstance(spec, tuple) else (spec, None) for name, spec in fields.items()}
+        for name, (dtype, _) in normalized.items():
+            if dtype != CATEGORY:
+                np.dtype(dtype)
+        self._chunks[message_type] = _Chunk(normalized, self.chunk_rows)
+
+    def _chunk(self, message_type: str, sample: Dict[str, Any]) -> _Chunk:
+        chunk = self._chunks.get(message_type)
+        if chunk is None:
+            # 선언하지 않은 종류는 첫 샘플로 형식 추론
+            fields = {}
+            for name, value in sample.items():
+                if isinstance(value, (bool, np.bool_)):
+                    fields[name] = "?"
+                elif isinstance(value, (int, np.integer)):
+                    fields[name] = "i8"
+                elif isinstance(value, (float, np.floating)):
+                    fields[name] = "f8"
+                else:
+                    fields[name] = CATEGORY
+            self.declare(message_type, fields)
+            chunk = self._chunks[message_type]
+        return chunk
+
+    def append(self, message_type: str, timestamp: float, values: Dict[str, Any]) -> None:
+        """샘플 한 개 추가"""
+        chunk = self._chunk(message_type, values)
+        chunk.append(timestamp, values)
+        self.statistics["rows"] += 1
+        if chunk.size == chunk.capacity:
+            self._write(message_type, chunk)
+
+    def extend(self, message_type: str, timestamps, columns: Dict[str, Any]) -> None:
+        """열 단위 일괄 추가"""
+        chunk = self._chunk(message_type, {name: values[0] for name, values in columns.items() if len(values)})
+        total = len(timestamps)
+        start = 0
+        while start < total:
+            count = min(total - start, chunk.capacity - chunk.size)
+            chunk.extend(timestamps, columns, start, count)
+            start += count
+            if chunk.size == chunk.capacity:
+                self._write(message_type, chunk)
+        self.statistics["rows"] += total
+
+    def _write(self, message_type: str, chunk: _Chunk) -> None:
+        segment = chunk.encode(self.level)
+        with open(os.path.join(self.directory, message_type + SEGMENT_SUFFIX), "ab") as f:
+            f.write(segment)
+        self.statistics["segments"] += 1
+        self.statistics["bytes_written"] += len(segment)
+
+    def flush(self) -> None:
+        """채우지 못한 청크도 세그먼트로 기록"""
+        for message_type, chunk in self._chunks.items():
+            if chunk.size:
+                self._write(message_type, chunk)
+
+    def close(self) -> None:
+        self.flush()
+        logger.info(f"💾 텔레메트리 저장: {self.statistics['rows']}행, "
+                    f"{self.statistics['segments']}개 세그먼트, {self.statistics['bytes_written']}바이트")
+
+    def __enter__(self) -> "TelemetryStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+# =============================================================================
+# 읽기
+# =============================================================================
+
+class TelemetryReader:
+    """텔레메트리 열 저장소 (읽기) - 세그먼트 파일을 mmap으로 열고 헤더만 색인"""
+
+    def __init__(self, directory: str):
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("텔레메트리 저장소에는 numpy가 필요합니다")
+        self.directory = directory
+        self._maps: Dict[str, mmap.mmap] = {}
+        self._segments: Dict[str, List[Tuple[Dict[str, Any], int]]] = {}
+        for filename in sorted(os.listdir(directory)):
+            if filename.endswith(SEGMENT_SUFFIX):
+                self._open(filename[:-len(SEGMENT_SUFFIX)], os.path.join(directory, filename))
+
+    def _open(self, message_type: str, path: str) -> None:
+        if os.path.getsize(path) == 0:
+            return
+        with open(path, "rb") as f:
+            view = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        segments = []
+        position = 0
+        while position + 8 <= len(view):
+            if view[position:position + 4] != SEGMENT_MAGIC:
+                logger.warning(f"손상된 세그먼트: {path} @ {position}")
+                break
+            header_length, = struct.unpack_from("<I", view, position + 4)
+            header = json.loads(view[position + 8:position + 8 + header_length])
+            data_offset = position + 8 + header_length
+            segments.append((header, data_offset))
+            position = data_offset + sum(column["length"] for column in header["columns"])
+        self._maps[message_type] = view
+        self._segments[message_type] = segments
+
+    def close(self) -> None:
+        for view in self._maps.values():
+            view.close()
+        self._maps = {}
+
+    def __enter__(self) -> "TelemetryReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def message_types(self) -> List[str]:
+        return list(self._segments)
+
+    def rows(self, message_type: str) -> int:
+        return sum(header["rows"] for header, _ in self._segments.get(message_type, []))
+
+    def _decode(self, view: mmap.mmap, offset: int, column: Dict[str, Any], rows: int):
+        data = zlib.decompress(memoryview(view)[offset:offset + column["length"]])
+        if column["encoding"] == "shuffle":
+            values = shuffle_decode(data, column["dtype"], rows)
+        else:
+            values = varint_decode(data, rows)
+            if column["dtype"] == CATEGORY:
+                return np.asarray(column["categories"], dtype=object)[values]
+            values = values.astype(column["dtype"])
+        if column.get("scale"):
+            return values / column["scale"]
+        return values
+
+    def read(self, message_type: str, columns: Optional[List[str]] = None,
+             start: Optional[float] = None, end: Optional[float] = None) -> Dict[str, Any]:
+        """열 dict 반환 (timestamp는 초 단위), start/end로 시간 구간 선택 - 구간 밖 세그먼트는 디코딩하지 않음"""
+        view = self._maps.get(message_type)
+        if view is None:
+            return {}
+        start_us = None if start is None else round(start * 1e6)
+        end_us = None if end is None else round(end * 1e6)
+        parts: Dict[str, List[Any]] = {}
+
+        for header, data_offset in self._segments[message_type]:
+            if (start_us is not None and header["t1"] < start_us) or (end_us is not None and header["t0"] > end_us):
+                continue
+            rows = header["rows"]
+            decoded = {}
+            offset = data_offset
+            for column in header["columns"]:
+                if column["name"] == TIMESTAMP or columns is None or column["name"] in columns:
+                    decoded[column["name"]] = self._decode(view, offset, column, rows)
+                offset += column["length"]
+
+            timestamps = decoded[TIMESTAMP]
+            selected = np.ones(rows, dtype=bool)
+            if start_us is not None:
+                selected &= timestamps >= start_us
+            if end_us is not None:
+                selected &= timestamps <= end_us
+            for name, values in decoded.items():
+                parts.setdefault(name, []).append(values[selected])
+
+        result = {name: np.concatenate(values) for name, values in parts.items()}
+        if TIMESTAMP in result:
+            result[TIMESTAMP] = result[TIMESTAMP] / 1e6
+        return result
@@ -13,14 +13,14 @@ python integrated_dvd_testbed.py --mode full --duration 600 --output results/exp
 
 import asyncio
 import argparse
+import contextlib
 import json
 import logging
 import sys
-import time
 import signal
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, AsyncIterator
 
 # 프로젝트 루트 경로 설정
 sys.path.insert(0, str(Path(__file__).parent))
@@ -30,6 +30,13 @@ try:
     from dvd_lite.main import DVDLite
     from dvd_lite.cti import SimpleCTI
     from dvd_lite.dvd_attacks import register_all_dvd_attacks
+    from dvd_lite import clock
+    from dvd_lite.clock import now
+    from dvd_lite.rng import ExperimentRNG
+    from dvd_lite.metrics import METRICS, MetricsServer, RateMeter
+    from dvd_lite.profiling import ProfileSession
+    from dvd_lite.bus import OverflowPolicy
+    from dvd_lite.telemetry_store import TelemetryStore, NUMPY_AVAILABLE as TELEMETRY_STORE_AVAILABLE
 except ImportError as e:
     print(f"❌ DVD-Lite 모듈 import 실패: {e}")
     print("먼저 다음을 실행하세요: python find_init.py && python fix_actual_cti.py")
@@ -54,18 +61,44 @@ class DVDConnectorConfig:
         self.dvd_gcs_host = kwargs.get('dvd_gcs_host', '10.13.0.4')
         self.max_concurrent_attacks = kwargs.get('max_concurrent_attacks', 19)
         self.telemetry_frequency = kwargs.get('telemetry_frequency', 50)
+        self.virtual_time = kwargs.get('virtual_time', False)
+        self.seed = kwargs.get('seed')
+        self.campaign_concurrency = kwargs.get('campaign_concurrency', 1)
+        self.campaign_time_budget = kwargs.get('campaign_time_budget')
+        self.profile_mode = kwargs.get('profile_mode')
+        self.profile_attacks = kwargs.get('profile_attacks')
+        self.profile_dir = kwargs.get('profile_dir', 'results/profiles')
+        self.cpu_workers = kwargs.get('cpu_workers')
+        self.recon_cache = kwargs.get('recon_cache', True)
+        self.dvd_network = kwargs.get('dvd_network', '10.13.0.0/24')
+        self.network_scan = kwargs.get('network_scan', False)
+        self.telemetry_capture_dir = kwargs.get('telemetry_capture_dir')
+
+# 수집 텔레메트리 열 형식 (위경도 1e-7도, 고도 cm, 전압 mV 정밀도)
+TELEMETRY_CAPTURE_FIELDS = {
+    'gps_lat': ('i4', 1e7),
+    'gps_lon': ('i4', 1e7),
+    'altitude': ('i4', 1e2),
+    'battery_voltage': ('i2', 1e3),
+    'armed': '?',
+    'mode': 'category'
+}
 
 class RealTimeDataCollector:
-    """실시간 데이터 수집기"""
+    """실시간 데이터 수집기 (capture_dir을 지정하면 텔레메트리를 열 저장소에 기록)"""
     
-    def __init__(self):
+    def __init__(self, rng: ExperimentRNG = None, capture_dir: str = None):
         self.is_collecting = False
+        self.rng = rng or ExperimentRNG().spawn("telemetry")
+        self.capture_dir = capture_dir
+        self.store = None
         self.data_queue = asyncio.Queue()
+        self.rate_meter = RateMeter(window=10.0, clock=now)
         self.metrics = {
             'messages_processed': 0,
             'messages_per_second': 0,
             'success_rate': 100.0,
-            'last_update': time.time()
+            'last_update': now()
         }
     
     async def start_collection(self):
@@ -73,6 +106,10 @@ class RealTimeDataCollector:
         self.is_collecting = True
         logger.info("📡 실시간 데이터 수집 시작")
         
+        if self.capture_dir and TELEMETRY_STORE_AVAILABLE and self.store is None:
+            self.store = TelemetryStore(self.capture_dir)
+            self.store.declare('mavlink_telemetry', TELEMETRY_CAPTURE_FIELDS)
+        
         # 데이터 수집 태스크들
         await asyncio.gather(
             self._simulate_telemetry_collection(),
@@ -82,14 +119,14 @@ class RealTimeDataCollector:
     
     async def _simulate_telemetry_collection(self):
         """텔레메트리 데이터 수집 시뮬레이션"""
-        import random
+        random = self.rng.random
         
         while self.is_collecting:
             try:
                 # 시뮬레이션된 드론 텔레메트리 데이터
                 telemetry_data = {
                     'type': 'mavlink_telemetry',
-                    'timestamp': time.time(),
+                    'timestamp': now(),
                     'data': {
                         'gps_lat': 37.7749 + random.uniform(-0.01, 0.01),
                         'gps_lon': -122.4194 + random.uniform(-0.01, 0.01),
@@ -109,8 +146,14 @@ class RealTimeDataCollector:
     
     async def queue_data(self, data):
         """데이터 큐에 추가"""
-        await self.data_queue.put(data)
+        with METRICS.span("dvd_queue_operation_seconds", "데이터 큐 연산 시간", operation="put"):
+            await self.data_queue.put(data)
         self.metrics['messages_processed'] += 1
+        self.rate_meter.mark()
+        
+        if METRICS.enabled:
+            METRICS.counter("dvd_messages_total", "수집된 메시지 수").labels(type=data.get('type', 'unknown')).inc()
+            METRICS.gauge("dvd_queue_depth", "데이터 큐 길이").set(self.data_queue.qsize())
     
     async def _process_data_queue(self):
         """데이터 큐 처리"""
@@ -119,10 +162,13 @@ class RealTimeDataCollector:
                 data = await asyncio.wait_for(self.data_queue.get(), timeout=1.0)
                 
                 # 데이터 처리 로직
-                if data['type'] == 'mavlink_telemetry':
-                    logger.debug(f"📡 텔레메트리: {data['data']}")
-                elif data['type'] == 'attack_result':
-                    logger.info(f"🎯 공격 결과: {data}")
+                with METRICS.span("dvd_queue_operation_seconds", "데이터 큐 연산 시간", operation="process"):
+                    if data['type'] == 'mavlink_telemetry':
+                        logger.debug(f"📡 텔레메트리: {data['data']}")
+                        if self.store is not None:
+                            self.store.append(data['type'], data['timestamp'], data['data'])
+                    elif data['type'] == 'attack_result':
+                        logger.info(f"🎯 공격 결과: {data}")
                 
                 self.data_queue.task_done()
                 
@@ -132,108 +178,281 @@ class RealTimeDataCollector:
                 logger.error(f"❌ 데이터 처리 오류: {e}")
     
     def get_current_metrics(self):
-        """현재 메트릭 반환"""
-        current_time = time.time()
-        time_diff = current_time - self.metrics['last_update']
-        
-        if time_diff > 0:
-            self.metrics['messages_per_second'] = self.metrics['messages_processed'] / time_diff
-        
-        self.metrics['last_update'] = current_time
+        """현재 메트릭 반환 (messages_per_second는 최근 10초 구간 처리율)"""
+        self.metrics['messages_per_second'] = self.rate_meter.rate()
+        self.metrics['last_update'] = now()
+        if self.store is not None:
+            self.metrics['telemetry_capture'] = dict(self.store.statistics, directory=self.capture_dir)
         return self.metrics.copy()
     
     def stop_collection(self):
         """데이터 수집 중지"""
         self.is_collecting = False
+        if self.store is not None:
+            self.store.close()
         logger.info("⏹️ 데이터 수집 중지")
 
 class DVDAttackOrchestrator:
     """DVD 공격 오케스트레이터"""
     
-    def __init__(self, dvd_lite: DVDLite, cti: SimpleCTI):
+    def __init__(self, dvd_lite: DVDLite, cti: SimpleCTI,
+                 max_concurrency: int = 1, time_budget: float = None):
         self.dvd_lite = dvd_lite
         self.cti = cti
         self.active_attacks = {}
+        self.campaign_count = 0
+        
+        # 캠페인 예산 기본값
+        self.max_concurrency = max_concurrency
+        self.time_budget = time_budget
+        self._campaign_tasks = set()
+        
+        # 안전성 일시정지 게이트 (set 상태일 때만 공격 진행)
+        self._resume_event = asyncio.Event()
+        self._resume_event.set()
+        self.pause_reason = None
+        # 일시정지로 취소한 작업 (재개 후 재실행 대상)
+        self._interrupted_tasks = set()
+        # 중단되면 새 공격을 시작하지 않음
+        self.aborted = False
+    
+    @property
+    def is_paused(self) -> bool:
+        """일시정지 여부"""
+        return not self._resume_event.is_set()
+    
+    def pause(self, reason: str = "") -> None:
+        """공격 일시정지 - 새 공격 시작을 막고 진행 중인 공격은 즉시 취소 (재개 후 재실행)"""
+        if self.is_paused:
+            return
+        
+        self.pause_reason = reason
+        self._resume_event.clear()
+        
+        for task in self.active_attacks.values():
+            if task.cancel():
+                self._interrupted_tasks.add(task)
+        
+        logger.warning(f"⏸️ 공격 오케스트레이터 일시정지: {reason}")
     
-    async def execute_attack_campaign(self, attack_list: List[str]) -> Dict[str, Any]:
-        """공격 캠페인 실행"""
-        logger.info(f"🚀 공격 캠페인 시작: {len(attack_list)}개 공격")
+    def resume(self) -> None:
+        """공격 재개"""
+        if not self.is_paused:
+            return
         
-        campaign_results = {
-            'campaign_id': f"campaign_{int(time.time())}",
-            'start_time': time.time(),
-            'attacks': attack_list,
-            'raw_results': [],
-            'basic_statistics': {},
-            'cti_analysis': {},
-            'timestamp': time.time()
-        }
+        self.pause_reason = None
+        self._resume_event.set()
+        logger.info("▶️ 공격 오케스트레이터 재개")
+    
+    async def _run_attack_gated(self, attack_name: str, rng: ExperimentRNG = None,
+                                deadline: float = None, key: str = None):
+        """일시정지 게이트를 통과한 뒤 공격 실행 - 일시정지로 취소되면 재개 후 다시 실행
         
-        successful_attacks = 0
-        total_iocs = 0
-        total_execution_time = 0
+        일시정지로 중단된 실행의 PARTIAL 결과는 기록하지 않고 재실행 결과만 남긴다.
+        """
+        key = key or attack_name
         
-        for i, attack_name in enumerate(attack_list, 1):
-            logger.info(f"[{i}/{len(attack_list)}] 🎯 공격 실행: {attack_name}")
+        while True:
+            await self._resume_event.wait()
+            
+            # 재실행 시에도 같은 난수열로 시작하도록 매번 새 스트림 객체 사용
+            task = asyncio.ensure_future(self.dvd_lite.run_attack(
+                attack_name, rng=rng.spawn() if rng else None, deadline=deadline,
+                will_retry=lambda: task in self._interrupted_tasks
+            ))
+            self.active_attacks[key] = task
+            try:
+                # 바깥 취소는 여기서 CancelledError로 전파되고, 일시정지 취소는 task에만 반영됨
+                await asyncio.wait({task})
+            except asyncio.CancelledError:
+                task.cancel()
+                raise
+            finally:
+                self.active_attacks.pop(key, None)
+                interrupted = task in self._interrupted_tasks
+                self._interrupted_tasks.discard(task)
+            
+            if task.cancelled() and interrupted:
+                logger.info(f"⏸️ 일시정지로 중단된 공격 재실행 대기: {attack_name}")
+                continue
             
+            return task.result()
+    
+    def abort(self, reason: str = "") -> int:
+        """캠페인 중단 - 진행 중 / 재개 대기 중인 공격을 모두 취소하고 이후 공격은 건너뜀 (취소한 작업 수 반환)"""
+        self.aborted = True
+        self.pause_reason = reason
+        logger.error(f"🛑 공격 오케스트레이터 중단: {reason}")
+        return self.cancel_all()
+    
+    def cancel_all(self) -> int:
+        """진행 중인 모든 캠페인 공격 취소 (테스트베드 정지 시) - 취소한 작업 수 반환"""
+        tasks = [task for task in self._campaign_tasks if not task.done()]
+        for task in tasks:
+            task.cancel()
+        
+        if tasks:
+            logger.warning(f"🛑 진행 중인 공격 {len(tasks)}개 취소")
+        return len(tasks)
+    
+    def stream_attack_campaign(self, attack_list: List[str], time_budget: float = None,
+                               max_concurrency: int = None, buffer_size: int = 1) -> AsyncIterator[Dict[str, Any]]:
+        """캠페인 공격 결과를 완료 순서대로 내보내는 비동기 이터레이터 (형식은 raw_results 항목과 동일)
+        
+        시간 예산은 호출 시점부터 계산되며, 소비자가 느리면 buffer_size개가 쌓인 뒤 공격 진행이 멈춘다.
+        """
+        return self._campaign_stream(attack_list, self._next_campaign_index(),
+                                     time_budget, max_concurrency, buffer_size)
+    
+    def _next_campaign_index(self) -> int:
+        campaign_index = self.campaign_count
+        self.campaign_count += 1
+        return campaign_index
+    
+    def _campaign_stream(self, attack_list: List[str], campaign_index: int, time_budget: float = None,
+                         max_concurrency: int = None, buffer_size: int = 1) -> AsyncIterator[Dict[str, Any]]:
+        time_budget = self.time_budget if time_budget is None else time_budget
+        max_concurrency = max_concurrency or self.max_concurrency
+        
+        # 캠페인/공격별 난수 스트림 ("campaign", 캠페인 번호, 공격 이름, 순번)
+        campaign_rng = self.dvd_lite.rng.spawn("campaign", campaign_index)
+        budget_end = now() + time_budget if time_budget else None
+        
+        async def run_one(index: int, attack_name: str) -> Dict[str, Any]:
+            i = index + 1
+            task = asyncio.current_task()
+            self._campaign_tasks.add(task)
             try:
-                start_time = time.time()
-                result = await self.dvd_lite.run_attack(attack_name)
-                execution_time = time.time() - start_time
+                if self.aborted:
+                    logger.warning(f"⏭️ 오케스트레이터 중단됨, 건너뜀: {attack_name}")
+                    return {
+                        'attack_name': attack_name,
+                        'status': 'skipped',
+                        'execution_time': 0,
+                        'iocs': [],
+                        'error': f'orchestrator_aborted: {self.pause_reason}',
+                        'timestamp': now()
+                    }
+                
+                remaining = budget_end - now() if budget_end is not None else None
+                if remaining is not None and remaining <= 0:
+                    logger.warning(f"⏭️ 캠페인 시간 예산 소진, 건너뜀: {attack_name}")
+                    return {
+                        'attack_name': attack_name,
+                        'status': 'skipped',
+                        'execution_time': 0,
+                        'iocs': [],
+                        'error': 'campaign_time_budget_exhausted',
+                        'timestamp': now()
+                    }
                 
-                # 결과 기록
-                attack_result = {
+                logger.info(f"[{i}/{len(attack_list)}] 🎯 공격 실행: {attack_name}")
+                start_time = now()
+                result = await self._run_attack_gated(
+                    attack_name, campaign_rng.spawn(attack_name, i),
+                    deadline=remaining, key=f"{attack_name}#{i}"
+                )
+                execution_time = now() - start_time
+                
+                logger.info(f"✅ 공격 완료: {attack_name} - {result.status.value}")
+                
+                return {
                     'attack_name': attack_name,
-                    'status': 'success' if result.success else 'failed',
+                    'status': result.status.value,
                     'execution_time': execution_time,
                     'iocs': result.iocs,
                     'details': result.details,
-                    'timestamp': time.time()
+                    'timestamp': now()
+                }
+            except asyncio.CancelledError:
+                return {
+                    'attack_name': attack_name,
+                    'status': 'cancelled',
+                    'execution_time': 0,
+                    'iocs': [],
+                    'timestamp': now()
                 }
-                
-                campaign_results['raw_results'].append(attack_result)
-                
-                if result.success:
-                    successful_attacks += 1
-                
-                total_iocs += len(result.iocs)
-                total_execution_time += execution_time
-                
-                logger.info(f"✅ 공격 완료: {attack_name} - {'성공' if result.success else '실패'}")
-                
-                # 공격 간 간격
-                if i < len(attack_list):
-                    await asyncio.sleep(2.0)
-                    
             except Exception as e:
                 logger.error(f"❌ 공격 실행 실패 {attack_name}: {e}")
-                
-                # 실패 결과 기록
-                campaign_results['raw_results'].append({
+                return {
                     'attack_name': attack_name,
                     'status': 'error',
                     'execution_time': 0,
                     'iocs': [],
                     'error': str(e),
-                    'timestamp': time.time()
-                })
+                    'timestamp': now()
+                }
+            finally:
+                self._campaign_tasks.discard(task)
+        
+        # 공격 간 간격 2초
+        return self.dvd_lite.stream_attacks(
+            attack_list, max_concurrency=max_concurrency, buffer_size=buffer_size,
+            delay=2.0, runner=run_one
+        )
+    
+    async def execute_attack_campaign(self, attack_list: List[str], time_budget: float = None,
+                                      max_concurrency: int = None) -> Dict[str, Any]:
+        """공격 캠페인 실행 (stream_attack_campaign 결과를 모아 통계 계산)
+        
+        time_budget: 캠페인 전체 시간 예산 (초) - 남은 예산이 각 공격의 제한 시간 상한이 되고,
+                     예산을 다 쓰면 남은 공격은 건너뜀
+        max_concurrency: 동시 실행 공격 수 (기본값 1: 순차 실행)
+        """
+        time_budget = self.time_budget if time_budget is None else time_budget
+        max_concurrency = max_concurrency or self.max_concurrency
+        
+        logger.info(f"🚀 공격 캠페인 시작: {len(attack_list)}개 공격 (동시 실행 {max_concurrency})")
+        
+        campaign_index = self._next_campaign_index()
+        campaign_results = {
+            'campaign_id': f"campaign_{int(now())}",
+            'start_time': now(),
+            'attacks': attack_list,
+            'raw_results': [],
+            'basic_statistics': {},
+            'cti_analysis': {},
+            'budget': {'time_budget': time_budget, 'max_concurrency': max_concurrency},
+            'timestamp': now()
+        }
+        
+        profiling = self.dvd_lite.profiling
+        profile = (ProfileSession(profiling, f"campaign_{campaign_index}")
+                   if profiling.campaigns else contextlib.nullcontext())
+        with METRICS.span("dvd_campaign_seconds", "캠페인 실행 시간"), profile:
+            stream = self._campaign_stream(attack_list, campaign_index, time_budget, max_concurrency)
+            try:
+                async for outcome in stream:
+                    campaign_results['raw_results'].append(outcome)
+            finally:
+                await stream.aclose()
+        
+        raw_results = campaign_results['raw_results']
+        successful_attacks = sum(1 for r in raw_results if r['status'] == 'success')
+        partial_attacks = sum(1 for r in raw_results if r['status'] == 'partial')
+        skipped_attacks = sum(1 for r in raw_results if r['status'] in ('skipped', 'cancelled'))
+        total_iocs = sum(len(r['iocs']) for r in raw_results)
+        total_execution_time = sum(r['execution_time'] for r in raw_results)
         
         # 캠페인 통계 계산
         campaign_results['basic_statistics'] = {
             'total_attacks': len(attack_list),
             'successful_attacks': successful_attacks,
-            'failed_attacks': len(attack_list) - successful_attacks,
+            'partial_attacks': partial_attacks,
+            'skipped_attacks': skipped_attacks,
+            'failed_attacks': len(attack_list) - successful_attacks - partial_attacks - skipped_attacks,
             'success_rate': (successful_attacks / len(attack_list)) * 100 if attack_list else 0,
             'total_execution_time': total_execution_time,
             'avg_execution_time': total_execution_time / len(attack_list) if attack_list else 0,
             'total_iocs': total_iocs
         }
         
-        # CTI 분석
+        # CTI 분석 (결과 버스의 CTI 구독자가 처리를 마친 뒤)
+        await self.dvd_lite.drain_results()
         cti_summary = self.cti.get_summary()
         campaign_results['cti_analysis'] = cti_summary
         
-        campaign_results['end_time'] = time.time()
+        campaign_results['end_time'] = now()
         campaign_results['total_duration'] = campaign_results['end_time'] - campaign_results['start_time']
         
         logger.info(f"🎉 캠페인 완료: {successful_attacks}/{len(attack_list)} 성공 ({campaign_results['basic_statistics']['success_rate']:.1f}%)")
@@ -245,18 +464,62 @@ class DVDRealtimeConnector:
     
     def __init__(self, config: DVDConnectorConfig):
         self.config = config
-        self.data_collector = RealTimeDataCollector()
         
         # DVD-Lite 초기화
         self.dvd_lite = DVDLite()
+        if config.seed is not None:
+            self.dvd_lite.set_seed(config.seed)
+        self.dvd_lite.recon_cache.enabled = config.recon_cache
+        if config.cpu_workers is not None:
+            self.dvd_lite.cpu_lane.max_workers = config.cpu_workers
+        if config.profile_mode:
+            # 공격 목록이 없으면 캠페인 전체를 프로파일
+            self.dvd_lite.enable_profiling(
+                config.profile_mode, config.profile_dir,
+                attacks=config.profile_attacks or [],
+                campaigns=not config.profile_attacks
+            )
+        
+        self.data_collector = RealTimeDataCollector(rng=self.dvd_lite.rng.spawn("telemetry"),
+                                                    capture_dir=config.telemetry_capture_dir)
         self.cti = SimpleCTI()
         self.dvd_lite.register_cti_collector(self.cti)
         
         # 공격 오케스트레이터 초기화
-        self.attack_orchestrator = DVDAttackOrchestrator(self.dvd_lite, self.cti)
+        self.attack_orchestrator = DVDAttackOrchestrator(
+            self.dvd_lite, self.cti,
+            max_concurrency=config.campaign_concurrency,
+            time_budget=config.campaign_time_budget
+        )
+        
+        # 라운드별 네트워크 스캔 (이전 스캔과 비교해 정찰 캐시 무효화)
+        self.network_scanner = None
+        self.last_scan = None
         
         logger.info(f"🔗 DVD 실시간 커넥터 초기화 완료")
     
+    async def refresh_network_scan(self):
+        """DVD 네트워크를 다시 스캔하고 이전 스캔 대비 바뀐 호스트의 정찰 캐시 항목 무효화 (ScanDiff 반환)"""
+        if not self.config.network_scan:
+            return None
+        
+        from dvd_connector.network_scanner import DVDNetworkScanner, diff_scan_results
+        if self.network_scanner is None:
+            self.network_scanner = DVDNetworkScanner()
+        
+        scan = await self.network_scanner.scan_network(self.config.dvd_network, quick_scan=True)
+        previous, self.last_scan = self.last_scan, scan
+        if previous is None:
+            logger.info(f"🔍 네트워크 기준 스캔: 활성 호스트 {scan.active_hosts}개")
+            return None
+        
+        diff = diff_scan_results(previous, scan)
+        if diff.has_changes:
+            invalidated = self.dvd_lite.recon_cache.invalidate_from_diff(diff)
+            logger.info(f"🔍 네트워크 변경 감지 (추가 {diff.added_hosts}, 제거 {diff.removed_hosts}, "
+                        f"변경 {diff.changed_hosts}) - 정찰 캐시 {invalidated}개 무효화")
+        return diff
+    
     async def start_system(self):
         """시스템 시작"""
         logger.info("🚀 DVD 실시간 연동 시스템 시작")
@@ -265,7 +528,11 @@ class DVDRealtimeConnector:
         registered_attacks = register_all_dvd_attacks()
         logger.info(f"✅ {len(registered_attacks)}개 공격 시나리오 등록")
         
-        # 데이터 수집 시작
+        # 데이터 수집 시작 (가상 시간 모드에서는 50Hz 시뮬레이션 텔레메트리가 실행 시간을 지배하므로 생략)
+        if self.config.virtual_time:
+            logger.info("⏩ 가상 시간 모드: 시뮬레이션 텔레메트리 수집 생략")
+            return None
+        
         data_task = asyncio.create_task(self.data_collector.start_collection())
         
         return data_task
@@ -273,7 +540,9 @@ class DVDRealtimeConnector:
     async def stop_system(self):
         """시스템 중지"""
         logger.info("⏹️ DVD 실시간 연동 시스템 중지")
+        self.attack_orchestrator.cancel_all()
         self.data_collector.stop_collection()
+        self.dvd_lite.cpu_lane.shutdown(wait=False)
 
 class WebSocketDashboardServer:
     """WebSocket 대시보드 서버 (간소화 버전)"""
@@ -560,6 +829,10 @@ class IntegratedDVDTestbed:
         self.dvd_connector = None
         self.dashboard_server = None
         self.mqtt_bridge = None
+        self.safety_watchdog = None
+        self._safety_recheck_task = None
+        self._safety_baseline = None
+        self.metrics_server = None
         
         # 실험 결과
         self.experiment_results = {
@@ -599,7 +872,19 @@ class IntegratedDVDTestbed:
                 dvd_fc_host=self.config.get('dvd_fc_host', '10.13.0.2'),
                 dvd_gcs_host=self.config.get('dvd_gcs_host', '10.13.0.4'),
                 max_concurrent_attacks=self.config.get('max_concurrent_attacks', 19),
-                telemetry_frequency=self.config.get('telemetry_frequency', 50)
+                telemetry_frequency=self.config.get('telemetry_frequency', 50),
+                virtual_time=self.config.get('virtual_time', False),
+                seed=self.config.get('seed'),
+                campaign_concurrency=self.config.get('campaign_concurrency', 1),
+                campaign_time_budget=self.config.get('campaign_time_budget'),
+                profile_mode=self.config.get('profile_mode'),
+                profile_attacks=self.config.get('profile_attacks'),
+                profile_dir=str(output_dir / 'profiles'),
+                cpu_workers=self.config.get('cpu_workers'),
+                recon_cache=self.config.get('recon_cache', True),
+                dvd_network=self.config.get('dvd_network', '10.13.0.0/24'),
+                network_scan=self.config.get('network_scan', False),
+                telemetry_capture_dir=str(output_dir / 'data' / 'telemetry')
             )
             
             # 1. DVD 실시간 커넥터 초기화
@@ -629,10 +914,11 @@ class IntegratedDVDTestbed:
             
             # 5. 실험 메타데이터 설정
             self.experiment_results['metadata'] = {
-                'experiment_id': f"dvd_exp_{int(time.time())}",
+                'experiment_id': f"dvd_exp_{int(now())}",
                 'start_time': datetime.now().isoformat(),
                 'config': self.config,
                 'dvd_config': dvd_config.__dict__,
+                'rng': self.dvd_connector.dvd_lite.rng.metadata(),
                 'system_info': await self._collect_system_info()
             }
             
@@ -646,7 +932,7 @@ class IntegratedDVDTestbed:
         """시스템 시작"""
         logger.info("🚀 통합 DVD 테스트베드 시작")
         self.is_running = True
-        self.start_time = time.time()
+        self.start_time = now()
         
         try:
             # 1. DVD 연동 시스템 시작
@@ -665,7 +951,20 @@ class IntegratedDVDTestbed:
                 except Exception as e:
                     logger.warning(f"⚠️ MQTT 연결 실패 (계속 진행): {e}")
             
-            # 4. 시스템 상태 로깅
+            # 4. 안전성 감시 시작 (선택적)
+            if self.config.get('safety_watchdog', False):
+                await self._start_safety_watchdog()
+            
+            # 5. 메트릭 엔드포인트 시작 (선택적)
+            if self.config.get('metrics_port') is not None:
+                METRICS.enabled = True
+                self.metrics_server = MetricsServer(port=self.config['metrics_port'])
+                await self.metrics_server.start()
+            
+            # 6. 결과 버스 구독 (대시보드/MQTT/결과 저장)
+            self._subscribe_result_consumers()
+            
+            # 7. 시스템 상태 로깅
             self._log_system_event("시스템 시작 완료", "info")
             
             logger.info("🎉 모든 시스템 컴포넌트 시작 완료")
@@ -677,6 +976,125 @@ class IntegratedDVDTestbed:
             await self.stop_system()
             raise
     
+    @staticmethod
+    def _result_payload(result) -> Dict[str, Any]:
+        """공격 결과를 대시보드/MQTT/저장용 dict로 변환"""
+        return {
+            'attack_id': result.attack_id,
+            'attack_name': result.attack_name,
+            'attack_type': result.attack_type.value,
+            'status': result.status.value,
+            'success_rate': result.success_rate,
+            'execution_time': result.response_time,
+            'target': result.target,
+            'iocs': result.iocs,
+            'details': result.details,
+            'timestamp': result.timestamp
+        }
+    
+    def _subscribe_result_consumers(self):
+        """결과 버스에 대시보드, MQTT, 결과 저장 구독자 연결 (CTI는 DVDLite가 연결)"""
+        bus = self.dvd_connector.dvd_lite.result_bus
+        
+        async def to_dashboard(batch):
+            for result in batch:
+                await self.dashboard_server.broadcast_attack_result(self._result_payload(result))
+        
+        # 대시보드는 최신 결과만 의미가 있으므로 밀리면 오래된 결과부터 버림
+        bus.subscribe("dashboard", to_dashboard, maxsize=10, policy=OverflowPolicy.DROP_OLDEST)
+        
+        if self.mqtt_bridge and self.mqtt_bridge.is_connected:
+            async def to_mqtt(batch):
+                for result in batch:
+                    await self.mqtt_bridge.publish_attack_result(self._result_payload(result))
+            
+            bus.subscribe("mqtt", to_mqtt, maxsize=200, policy=OverflowPolicy.DROP_OLDEST,
+                          batch_size=20, batch_timeout=0.5)
+        
+        results_file = Path(self.config['output_dir']) / 'data' / 'attack_results.jsonl'
+        
+        async def to_storage(batch):
+            with open(results_file, 'a', encoding='utf-8') as f:
+                for result in batch:
+                    f.write(json.dumps(self._result_payload(result), ensure_ascii=False, default=str) + '\n')
+        
+        # 저장은 유실 없이 배치로 기록
+        bus.subscribe("storage", to_storage, maxsize=500, policy=OverflowPolicy.BLOCK,
+                      batch_size=50, batch_timeout=1.0)
+    
+    async def _start_safety_watchdog(self):
+        """안전성 감시기 시작 - 위반 감지 시 공격 일시정지 후 전체 재검사
+        
+        시작 시점의 전체 검사 결과를 기준선으로 저장해, 재검사 결과가 기준선보다 나빠졌을 때만 일시정지를 유지한다.
+        """
+        from dvd_connector.watchdog import SafetyWatchdog
+        
+        target_config = {
+            'host': self.config.get('dvd_host', '10.13.0.3'),
+            'dvd_network': self.config.get('dvd_network', '10.13.0.0/24'),
+            'environment': 'SIMULATION',
+            'simulation_mode': True,
+            'safety_enabled': True
+        }
+        self.safety_watchdog = SafetyWatchdog(target_config=target_config)
+        self._safety_baseline = await self.safety_watchdog.checker.comprehensive_safety_check(
+            target_config, use_cache=False
+        )
+        self.safety_watchdog.add_listener(self._on_safety_event)
+        await self.safety_watchdog.start()
+        logger.info(f"✅ 안전성 감시 시작됨 (기준선: {self._safety_baseline.safety_level.value})")
+    
+    def _on_safety_event(self, event):
+        """감시 이벤트 처리 - 감지 즉시 공격 중단"""
+        orchestrator = self.dvd_connector.attack_orchestrator
+        orchestrator.pause(event.message)
+        self._log_system_event(f"안전성 위반 감지, 공격 일시정지: {event.message}", "warning")
+        
+        if self._safety_recheck_task is None or self._safety_recheck_task.done():
+            self._safety_recheck_task = asyncio.ensure_future(self._recheck_safety())
+    
+    async def _recheck_safety(self, interval: float = 5.0, max_attempts: int = None):
+        """전체 안전성 재검사 - 기준선보다 나빠지지 않았으면 공격 재개
+        
+        max_attempts번(기본값: 설정 safety_recheck_attempts) 재검사해도 나빠진 상태가 계속되면 실험을 중단한다.
+        """
+        checker = self.safety_watchdog.checker
+        target_config = self.safety_watchdog.target_config
+        if max_attempts is None:
+            max_attempts = self.config.get('safety_recheck_attempts', 12)
+        
+        for attempt in range(1, max_attempts + 1):
+            if not self.is_running:
+                return
+            
+            result = await checker.comprehensive_safety_check(target_config, use_cache=False)
+            if not self._safety_regressed(self._safety_baseline, result):
+                self.safety_watchdog.tripped.clear()
+                self.dvd_connector.attack_orchestrator.resume()
+                self._log_system_event(f"안전성 재검사 통과 ({result.safety_level.value}), 공격 재개", "info")
+                return
+            
+            logger.warning(f"⚠️ 안전성 재검사 실패 ({attempt}/{max_attempts}): {result.safety_violations}")
+            if attempt < max_attempts:
+                await asyncio.sleep(interval)
+        
+        self._log_system_event(f"안전성 재검사 {max_attempts}회 실패, 실험 중단", "error")
+        self.is_running = False
+        self.dvd_connector.attack_orchestrator.abort("안전성 재검사 실패")
+    
+    @staticmethod
+    def _safety_regressed(baseline, result) -> bool:
+        """재검사 결과가 기준선보다 나빠졌는지 (안전 수준 상승 또는 기준선에 없던 위반 사항)"""
+        if result.is_safe_to_proceed:
+            return False
+        if baseline is None:
+            return True
+        
+        levels = list(type(baseline.safety_level))
+        if levels.index(result.safety_level) > levels.index(baseline.safety_level):
+            return True
+        return bool(set(result.safety_violations) - set(baseline.safety_violations))
+    
     async def run_experiment(self):
         """실험 실행"""
         duration = self.config.get('duration', 300)  # 기본 5분
@@ -755,14 +1173,20 @@ class IntegratedDVDTestbed:
         
         logger.info(f"🔄 연속 실험: {duration}초 동안 반복 실행")
         
-        end_time = time.time() + duration
+        rounds_rng = self.dvd_connector.dvd_lite.rng.spawn("continuous")
+        end_time = now() + duration
+        max_rounds = self.config.get('rounds')
         round_count = 1
         
-        while time.time() < end_time and self.is_running:
+        while now() < end_time and self.is_running:
+            if max_rounds and round_count > max_rounds:
+                break
+            
             logger.info(f"🔄 라운드 {round_count} 시작")
+            await self.dvd_connector.refresh_network_scan()
             
-            # 공격 무작위 선택
-            import random
+            # 공격 무작위 선택 (라운드별 난수 스트림)
+            random = rounds_rng.spawn(round_count).random
             selected_attacks = random.sample(attack_pool, k=random.randint(2, 4))
             
             # 라운드 실행
@@ -772,7 +1196,7 @@ class IntegratedDVDTestbed:
             round_count += 1
             
             # 라운드 간 휴식
-            if time.time() < end_time:
+            if now() < end_time:
                 await asyncio.sleep(10)
     
     async def _run_targeted_experiment(self, duration: int):
@@ -808,7 +1232,11 @@ class IntegratedDVDTestbed:
         rounds = self.config.get('target_rounds', 3)
         
         for round_num in range(rounds):
+            if not self.is_running:
+                break
+            
             logger.info(f"🎯 타겟 라운드 {round_num + 1}/{rounds}")
+            await self.dvd_connector.refresh_network_scan()
             
             campaign_report = await self.dvd_connector.attack_orchestrator.execute_attack_campaign(target_attacks)
             self.experiment_results['attack_results'].append(campaign_report)
@@ -819,7 +1247,7 @@ class IntegratedDVDTestbed:
     async def _analyze_experiment_results(self, campaign_report: Dict[str, Any]):
         """실험 결과 실시간 분석"""
         analysis = {
-            'timestamp': time.time(),
+            'timestamp': now(),
             'basic_stats': campaign_report['basic_statistics'],
             'performance_analysis': {
                 'avg_attack_time': campaign_report['basic_statistics']['avg_execution_time'],
@@ -832,14 +1260,14 @@ class IntegratedDVDTestbed:
         # 대시보드로 분석 결과 전송
         analysis_message = {
             'type': 'experiment_analysis',
-            'timestamp': time.time(),
+            'timestamp': now(),
             'data': analysis
         }
         
         await self.dashboard_server.broadcast_to_all_clients(analysis_message)
         
         # 연구 데이터에 추가
-        self.experiment_results['research_data'][f'analysis_{int(time.time())}'] = analysis
+        self.experiment_results['research_data'][f'analysis_{int(now())}'] = analysis
         
         logger.info(f"📊 실시간 분석 완료: 성공률 {analysis['performance_analysis']['success_rate']:.1f}%")
     
@@ -862,7 +1290,7 @@ class IntegratedDVDTestbed:
     def _log_system_event(self, message: str, level: str = "info"):
         """시스템 이벤트 로깅"""
         event = {
-            'timestamp': time.time(),
+            'timestamp': now(),
             'level': level,
             'message': message,
             'source': 'integrated_testbed'
@@ -883,7 +1311,7 @@ class IntegratedDVDTestbed:
         
         # 성능 메트릭 최종 계산
         self.experiment_results['performance_metrics'] = {
-            'total_runtime': time.time() - self.start_time if self.start_time else 0,
+            'total_runtime': now() - self.start_time if self.start_time else 0,
             'final_data_collector_metrics': (
                 self.dvd_connector.data_collector.get_current_metrics() 
                 if self.dvd_connector else {}
@@ -891,6 +1319,14 @@ class IntegratedDVDTestbed:
             'dashboard_final_stats': (
                 self.dashboard_server.dashboard_data 
                 if self.dashboard_server else {}
+            ),
+            'result_bus': (
+                self.dvd_connector.dvd_lite.result_bus.get_statistics()
+                if self.dvd_connector else {}
+            ),
+            'recon_cache': (
+                dict(self.dvd_connector.dvd_lite.recon_cache.statistics)
+                if self.dvd_connector else {}
             )
         }
         
@@ -940,6 +1376,7 @@ class IntegratedDVDTestbed:
 - **실험 ID**: {self.experiment_results['metadata']['experiment_id']}
 - **실험 일시**: {self.experiment_results['metadata']['start_time']}
 - **실험 모드**: {self.config.get('mode', 'unknown')}
+- **실험 시드**: {self.experiment_results['metadata'].get('rng', {}).get('seed', 'unknown')}
 - **총 실행 시간**: {self.experiment_results['performance_metrics']['total_runtime']:.2f}초
 
 ## 공격 시나리오 실행 결과
@@ -986,12 +1423,25 @@ class IntegratedDVDTestbed:
         self.is_running = False
         
         try:
+            # 진행 중인 공격 취소 (PARTIAL 결과로 기록됨)
+            if self.dvd_connector:
+                self.dvd_connector.attack_orchestrator.cancel_all()
+                
+                # 결과 버스 구독자가 남은 결과를 처리한 뒤 종료
+                await self.dvd_connector.dvd_lite.result_bus.close()
+            
             # 실험 결과 저장
             if self.experiment_results['attack_results']:
                 saved_files = await self.save_experiment_results()
                 logger.info(f"💾 실험 결과 저장 완료: {saved_files}")
             
             # 시스템 컴포넌트 정지
+            if self.safety_watchdog:
+                await self.safety_watchdog.stop()
+                if self._safety_recheck_task:
+                    self._safety_recheck_task.cancel()
+                logger.info("✅ 안전성 감시 정지")
+            
             if self.dvd_connector:
                 await self.dvd_connector.stop_system()
                 logger.info("✅ DVD 커넥터 정지")
@@ -1004,6 +1454,10 @@ class IntegratedDVDTestbed:
                 await self.mqtt_bridge.disconnect()
                 logger.info("✅ MQTT 브리지 연결 해제")
             
+            if self.metrics_server:
+                await self.metrics_server.stop()
+                logger.info("✅ 메트릭 엔드포인트 정지")
+            
             self._log_system_event("시스템 정지 완료", "info")
             
         except Exception as e:
@@ -1070,6 +1524,67 @@ def parse_arguments():
                        action='store_true',
                        help='MQTT 브리지 활성화')
     
+    parser.add_argument('--safety-watchdog', 
+                       action='store_true',
+                       help='실행 중 안전성 감시 활성화 (위반 감지 시 공격 일시정지)')
+    
+    parser.add_argument('--safety-recheck-attempts', 
+                       type=int, 
+                       default=12,
+                       help='안전성 위반 후 재검사 최대 횟수 (5초 간격, 계속 실패하면 실험 중단, 기본값: 12)')
+    
+    parser.add_argument('--rounds', 
+                       type=int, 
+                       default=None,
+                       help='연속 실험 최대 라운드 수 (기본값: 시간 제한만 적용)')
+    
+    parser.add_argument('--virtual-time', 
+                       action='store_true',
+                       help='가상 시간 시뮬레이션 (대기 시간을 실제로 기다리지 않음)')
+    
+    parser.add_argument('--campaign-concurrency', 
+                       type=int, 
+                       default=1,
+                       help='캠페인 내 동시 실행 공격 수 (기본값: 1)')
+    
+    parser.add_argument('--campaign-budget', 
+                       type=float, 
+                       default=None,
+                       help='캠페인당 시간 예산 (초, 기본값: 제한 없음)')
+    
+    parser.add_argument('--metrics-port', 
+                       type=int, 
+                       default=None,
+                       help='Prometheus 메트릭 엔드포인트 포트 (localhost, 지정 시 메트릭 수집 활성화)')
+    
+    parser.add_argument('--profile', 
+                       choices=['cprofile', 'tracemalloc', 'sampling'],
+                       default=None,
+                       help='프로파일러 (결과는 출력 디렉토리의 profiles/에 저장)')
+    
+    parser.add_argument('--profile-attacks', 
+                       type=str, 
+                       default=None,
+                       help='프로파일할 공격 목록 (쉼표 구분, 기본값: 캠페인 전체 프로파일)')
+    
+    parser.add_argument('--cpu-workers', 
+                       type=int, 
+                       default=None,
+                       help='CPU 위주 공격 단계용 프로세스 수 (0: 이벤트 루프에서 실행, 기본값: CPU 수)')
+    
+    parser.add_argument('--no-recon-cache', 
+                       action='store_true',
+                       help='정찰 결과 캐시 비활성화 (매 라운드 정찰 재실행)')
+    
+    parser.add_argument('--network-scan', 
+                       action='store_true',
+                       help='라운드마다 DVD 네트워크를 다시 스캔해 바뀐 호스트의 정찰 캐시 무효화')
+    
+    parser.add_argument('--seed', 
+                       type=int, 
+                       default=None,
+                       help='실험 시드 (지정 시 재현 가능한 실행, 기본값: 임의 시드)')
+    
     parser.add_argument('--verbose', '-v', 
                        action='store_true',
                        help='상세 로깅 활성화')
@@ -1077,10 +1592,11 @@ def parse_arguments():
     return parser.parse_args()
 
 
-async def main():
-    """메인 실행 함수"""
+async def main(args: argparse.Namespace = None):
+    """메인 실행 함수 (args: 파싱한 명령행 인수, 없으면 여기서 파싱)"""
     # 명령행 인수 파싱
-    args = parse_arguments()
+    if args is None:
+        args = parse_arguments()
     
     # 로깅 레벨 설정
     if args.verbose:
@@ -1097,13 +1613,26 @@ async def main():
         'dashboard_port': args.dashboard_port,
         'target_category': args.target_category,
         'target_rounds': args.target_rounds,
-        'enable_mqtt': args.enable_mqtt
+        'enable_mqtt': args.enable_mqtt,
+        'safety_watchdog': args.safety_watchdog,
+        'safety_recheck_attempts': args.safety_recheck_attempts,
+        'rounds': args.rounds,
+        'virtual_time': args.virtual_time,
+        'seed': args.seed,
+        'campaign_concurrency': args.campaign_concurrency,
+        'campaign_time_budget': args.campaign_budget,
+        'metrics_port': args.metrics_port,
+        'profile_mode': args.profile,
+        'profile_attacks': args.profile_attacks.split(',') if args.profile_attacks else None,
+        'cpu_workers': args.cpu_workers,
+        'recon_cache': not args.no_recon_cache,
+        'network_scan': args.network_scan
     }
     
     print("🚁 DVD-Lite ↔ Damn Vulnerable Drone 통합 테스트베드")
     print("=" * 60)
     print(f"📋 실험 모드: {config['mode']}")
-    print(f"⏱️  실행 시간: {config['duration']}초")
+    print(f"⏱️  실행 시간: {config['duration']}초{' (가상 시간)' if config['virtual_time'] else ''}")
     print(f"📁 출력 디렉토리: {config['output_dir']}")
     print(f"🌐 DVD 호스트: {config['dvd_host']} (FC: {config['dvd_fc_host']}, GCS: {config['dvd_gcs_host']})")
     print(f"🔗 대시보드: http://localhost:{config['dashboard_port']}")
@@ -1146,7 +1675,9 @@ if __name__ == "__main__":
     print("📝 논문 작성을 위한 실시간 연동 실험 플랫폼")
     
     try:
-        asyncio.run(main())
+        # 가상 시간 여부는 이벤트 루프 생성 전에 알아야 하므로 먼저 파싱
+        args = parse_arguments()
+        clock.run(main(args), virtual_time=args.virtual_time)
     except KeyboardInterrupt:
         print("\n👋 프로그램이 종료되었습니다.")
     except Exception as e:
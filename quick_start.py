@@ -22,6 +22,7 @@ sys.path.insert(0, str(project_root))
 try:
     from dvd_lite.main import DVDLite
     from dvd_lite.cti import SimpleCTI
+    from dvd_lite import profiling
     from dvd_lite.dvd_attacks import (
         register_all_dvd_attacks, 
         get_attacks_by_tactic, 
@@ -135,6 +136,7 @@ async def run_single_attack_demo():
         print_attack_detail(result)
         
         # CTI 정보 표시
+        await dvd.drain_results()
         cti_summary = cti.get_summary()
         print(f"\n🔍 CTI 수집 결과:")
         print(f"   📊 수집된 지표: {cti_summary['total_indicators']}개")
@@ -233,6 +235,7 @@ async def run_multiple_attacks_demo():
         print(f"   • {tactic}: {stats['success']}/{stats['total']} ({rate:.1f}%)")
     
     # CTI 종합 분석
+    await dvd.drain_results()
     cti_summary = cti.get_summary()
     print(f"\n🔍 CTI 종합 분석:")
     print(f"   📊 총 수집 지표: {cti_summary['total_indicators']}개")
@@ -310,6 +313,7 @@ async def run_tactic_based_demo():
                 print(f"      • {element}")
     
     # CTI 정찰 분석
+    await dvd.drain_results()
     cti_summary = cti.get_summary()
     print(f"\n🔍 CTI 정찰 분석:")
     print(f"   📊 수집된 지표: {cti_summary['total_indicators']}개")
@@ -524,6 +528,7 @@ async def execute_single_attack(dvd, cti, attack_name):
         print_attack_detail(result)
         
         # CTI 분석
+        await dvd.drain_results()
         cti_summary = cti.get_summary()
         if cti_summary['total_indicators'] > 0:
             print(f"\n🔍 CTI 수집:")
@@ -605,6 +610,7 @@ async def execute_attack_sequence(dvd, cti, attacks, scenario_name):
     print(f"   🔍 총 IOCs: {total_iocs}개")
     
     # CTI 분석
+    await dvd.drain_results()
     cti_summary = cti.get_summary()
     print(f"   📊 CTI 지표: {cti_summary['total_indicators']}개")
 
@@ -667,6 +673,9 @@ async def main():
     """메인 함수"""
     print_banner()
     
+    # --profile 옵션은 모드 인자보다 먼저 제거 (이후 생성되는 DVDLite 인스턴스에 적용)
+    profiling.configure_default(profiling.ProfilingConfig.from_argv(sys.argv))
+    
     if len(sys.argv) > 1:
         mode = sys.argv[1]
         
@@ -704,9 +713,14 @@ def print_usage():
     print("   catalog     - 전체 공격 카탈로그")
     print("   interactive - 대화형 모드")
     print("   (없음)      - 핵심 데모 실행")
+    print("\n🔬 프로파일링 (선택):")
+    print("   --profile cprofile|tracemalloc|sampling")
+    print("   --profile-attacks a,b   (기본값: 모든 공격)")
+    print("   --profile-dir DIR       (기본값: results/profiles)")
     print("\n🚀 예시:")
     print("   python quick_start.py single")
     print("   python quick_start.py interactive")
+    print("   python quick_start.py single --profile cprofile")
 
 if __name__ == "__main__":
     try:
@@ -0,0 +1,291 @@
+"""
+공격 실행 제한 시간/취소 테스트
+"""
+import asyncio
+import unittest
+import sys
+import os
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dvd_lite import clock
+from dvd_lite.main import DVDLite
+from dvd_lite.dvd_attacks.core import BaseAttack, AttackType, AttackStatus
+
+class HangingProbe(BaseAttack):
+    """진행 상황을 남긴 뒤 멈추는 테스트용 공격"""
+
+    def _get_attack_type(self):
+        return AttackType.RECONNAISSANCE
+
+    async def _run_attack(self):
+        self.record_progress(iocs=["PROBE:10.13.0.2:14550"], probed_hosts=1)
+        await asyncio.sleep(3600)
+        return True, [], {}
+
+class GrowingTransfer(BaseAttack):
+    """실행 중에 작업량을 알게 되어 제한 시간을 늘리는 테스트용 공격"""
+
+    def _get_attack_type(self):
+        return AttackType.EXFILTRATION
+
+    async def _run_attack(self):
+        await asyncio.sleep(1.0)
+        self.extend_deadline(10.0)
+        await asyncio.sleep(8.0)
+        return True, [], {}
+
+class TestAttackDeadline(unittest.TestCase):
+
+    def test_deadline_reports_partial(self):
+        """제한 시간 초과 시 기록된 진행 상황과 함께 PARTIAL 반환"""
+        result = clock.run(HangingProbe(deadline=5.0).execute(), virtual_time=True)
+
+        self.assertEqual(result.status, AttackStatus.PARTIAL)
+        self.assertEqual(result.iocs, ["PROBE:10.13.0.2:14550"])
+        self.assertEqual(result.details["interrupted"], "deadline_exceeded")
+        self.assertEqual(result.details["probed_hosts"], 1)
+        self.assertAlmostEqual(result.response_time, 5.0, places=6)
+
+    def test_extend_deadline_during_run(self):
+        """실행 중 연장한 제한 시간까지 기다리고, 호출자 상한(deadline_limit)은 넘지 않음"""
+        result = clock.run(GrowingTransfer(deadline=5.0).execute(), virtual_time=True)
+        self.assertEqual(result.status, AttackStatus.SUCCESS)
+
+        result = clock.run(GrowingTransfer(deadline=5.0, deadline_limit=7.0).execute(), virtual_time=True)
+        self.assertEqual(result.status, AttackStatus.PARTIAL)
+        self.assertEqual(result.details["deadline"], 7.0)
+        self.assertAlmostEqual(result.response_time, 7.0, places=6)
+
+    def test_cancellation_propagates(self):
+        """취소는 전파되고 PARTIAL 결과는 DVDLite 결과에 기록"""
+        dvd = DVDLite()
+        dvd.register_attack("hanging_probe", HangingProbe)
+
+        async def run():
+            task = asyncio.ensure_future(dvd.run_attack("hanging_probe"))
+            await asyncio.sleep(1.0)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        clock.run(run(), virtual_time=True)
+
+        self.assertEqual(len(dvd.results), 1)
+        self.assertEqual(dvd.results[0].status, AttackStatus.PARTIAL)
+        self.assertEqual(dvd.results[0].details["interrupted"], "cancelled")
+
+    def test_cancelled_result_published(self):
+        """중단된 결과도 완료 결과와 같이 결과 버스에 발행"""
+        dvd = DVDLite()
+        dvd.register_attack("hanging_probe", HangingProbe)
+        published = []
+
+        async def collect(batch):
+            published.extend(batch)
+
+        async def run():
+            dvd.result_bus.subscribe("test", collect)
+            task = asyncio.ensure_future(dvd.run_attack("hanging_probe"))
+            await asyncio.sleep(1.0)
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            await dvd.result_bus.close()
+
+        clock.run(run(), virtual_time=True)
+        self.assertEqual([result.details["interrupted"] for result in published], ["cancelled"])
+
+    def test_pause_retry_records_single_result(self):
+        """일시정지로 중단 후 재실행한 공격은 재실행 결과 하나만 기록 / 발행"""
+        from integrated_dvd_testbed import DVDAttackOrchestrator
+
+        dvd = DVDLite()
+        dvd.register_attack("sleep_2", _sleep_attack(2))
+        orchestrator = DVDAttackOrchestrator(dvd, cti=None)
+        published = []
+
+        async def collect(batch):
+            published.extend(batch)
+
+        async def run():
+            dvd.result_bus.subscribe("test", collect)
+            task = asyncio.ensure_future(orchestrator._run_attack_gated("sleep_2"))
+            await asyncio.sleep(1.0)
+            orchestrator.pause("test")
+            await asyncio.sleep(1.0)
+            orchestrator.resume()
+            result = await task
+            await dvd.result_bus.close()
+            return result
+
+        result = clock.run(run(), virtual_time=True)
+        self.assertEqual(result.status, AttackStatus.SUCCESS)
+        self.assertEqual([r.status for r in dvd.results], [AttackStatus.SUCCESS])
+        self.assertEqual([r.status for r in published], [AttackStatus.SUCCESS])
+        self.assertEqual(dvd.get_summary()["total_attacks"], 1)
+
+    def test_deadline_derived_from_scenario(self):
+        """제한 시간 = 예상 소요 시간 × 배수 + 여유 시간, 요청 값이 더 짧으면 요청 값"""
+        from dvd_lite.dvd_attacks import register_all_dvd_attacks
+        register_all_dvd_attacks()
+
+        dvd = DVDLite()
+        estimated = dvd.dvd_registry.get_scenario("gps_spoofing").estimated_duration
+
+        self.assertAlmostEqual(dvd.attack_deadline("gps_spoofing"), estimated * 3.0 + 5.0)
+        self.assertEqual(dvd.attack_deadline("gps_spoofing", requested=1.0), 1.0)
+        self.assertIsNone(dvd.attack_deadline("unknown_attack"))
+
+    def test_deadline_follows_configured_duration(self):
+        """live 수집 / 탈취는 설정한 duration만큼 제한 시간이 늘어남"""
+        from dvd_lite.dvd_attacks import register_all_dvd_attacks
+        register_all_dvd_attacks()
+
+        dvd = DVDLite()
+        for name, params, extra in (("video_stream_hijacking", {"duration": 600.0, "timeout": 5.0}, 605.0),
+                                    ("telemetry_exfiltration", {"duration": 600.0}, 600.0)):
+            base = dvd.attack_deadline(name, params=params)
+            self.assertAlmostEqual(dvd.attack_deadline(name, params=dict(params, live=True)), base + extra)
+
+class SleepAttack(BaseAttack):
+    """duration초 동안 대기하는 테스트용 공격"""
+
+    started = []
+
+    def _get_attack_type(self):
+        return AttackType.RECONNAISSANCE
+
+    async def _run_attack(self):
+        SleepAttack.started.append(clock.now())
+        await asyncio.sleep(self.duration)
+        return True, [], {"duration": self.duration}
+
+def _sleep_attack(duration):
+    return type(f"Sleep{duration}", (SleepAttack,), {"duration": duration})
+
+class TestAttackStreaming(unittest.TestCase):
+
+    def setUp(self):
+        SleepAttack.started = []
+        self.dvd = DVDLite(config_path="nonexistent.json")
+        for duration in (1, 2, 3):
+            self.dvd.register_attack(f"sleep_{duration}", _sleep_attack(duration))
+
+    def test_yields_in_completion_order(self):
+        """동시 실행 시 완료되는 순서대로 결과 전달"""
+        async def run():
+            received = []
+            async for result in self.dvd.stream_attacks(["sleep_3", "sleep_1", "sleep_2"],
+                                                        max_concurrency=3, delay=0):
+                received.append((result.details["duration"], clock.now()))
+            return received
+
+        received = clock.run(run(), virtual_time=True)
+        self.assertEqual([duration for duration, _ in received], [1, 2, 3])
+        self.assertAlmostEqual(received[-1][1] - received[0][1], 2.0, places=6)
+
+    def test_backpressure_pauses_execution(self):
+        """소비자가 느리면 버퍼가 찬 뒤 새 공격이 시작되지 않음"""
+        async def run():
+            start = clock.now()
+            async for _ in self.dvd.stream_attacks(["sleep_1"] * 4, buffer_size=1, delay=0):
+                await asyncio.sleep(10)
+            return [t - start for t in SleepAttack.started]
+
+        started = clock.run(run(), virtual_time=True)
+        # 결과 1은 즉시 소비, 결과 2는 버퍼에 대기, 결과 3은 전달 대기 중 → 4번째는 소비 후 시작
+        self.assertEqual(len(started), 4)
+        self.assertGreaterEqual(started[3], 10.0)
+
+    def test_early_exit_cancels_running_attacks(self):
+        """반복 중단 시 진행 중인 공격 취소"""
+        async def run():
+            stream = self.dvd.stream_attacks(["sleep_1", "sleep_3", "sleep_3"], max_concurrency=3, delay=0)
+            async for _ in stream:
+                break
+            await stream.aclose()
+            return asyncio.all_tasks()
+
+        pending = clock.run(run(), virtual_time=True)
+        self.assertEqual(len(pending), 1)  # main 코루틴만 남음
+        statuses = [result.status for result in self.dvd.results]
+        self.assertEqual(statuses.count(AttackStatus.SUCCESS), 1)
+        self.assertEqual(statuses.count(AttackStatus.PARTIAL), 2)
+
+    def test_run_multiple_attacks_wraps_stream(self):
+        """목록 반환 API는 스트림 결과를 모은 것"""
+        self.dvd.config["attacks"]["delay_between"] = 0
+        results = clock.run(self.dvd.run_multiple_attacks(["sleep_2", "missing", "sleep_1"]),
+                            virtual_time=True)
+        self.assertEqual([r.details["duration"] for r in results], [2, 1])
+
+class SharedConnectionAttack(BaseAttack):
+    """대상별 공유 연결을 사용하는 테스트용 공격"""
+
+    opened = []
+    active = {}
+    peak = {}
+
+    def _get_attack_type(self):
+        return AttackType.RECONNAISSANCE
+
+    async def _run_attack(self):
+        async def connect(target):
+            SharedConnectionAttack.opened.append(target)
+            return object()
+
+        context = self.config["target_context"]
+        await context.get_resource("mavlink", connect)
+
+        active = SharedConnectionAttack.active
+        active[self.target_ip] = active.get(self.target_ip, 0) + 1
+        peak = SharedConnectionAttack.peak
+        peak[self.target_ip] = max(peak.get(self.target_ip, 0), active[self.target_ip])
+        await asyncio.sleep(1.0)
+        active[self.target_ip] -= 1
+
+        success = self.target_ip != "10.13.0.4"
+        return success, [f"HOST:{self.target_ip}"] if success else [], {}
+
+class TestAttackFanout(unittest.TestCase):
+
+    def setUp(self):
+        SharedConnectionAttack.opened = []
+        SharedConnectionAttack.active = {}
+        SharedConnectionAttack.peak = {}
+        self.dvd = DVDLite(config_path="nonexistent.json")
+        self.dvd.register_attack("probe", SharedConnectionAttack)
+        self.dvd.register_attack("probe_again", SharedConnectionAttack)
+        self.targets = ["10.13.0.2", "10.13.0.3", "10.13.0.4"]
+
+    def test_fanout_runs_targets_concurrently(self):
+        """대상들은 동시에, 같은 대상은 대상별 제한에 맞춰 실행"""
+        async def run():
+            start = clock.now()
+            report = await self.dvd.run_attack_fanout(["probe", "probe_again"], self.targets,
+                                                      max_concurrency=6, per_target_concurrency=1)
+            return report, clock.now() - start
+
+        report, elapsed = clock.run(run(), virtual_time=True)
+
+        self.assertEqual(len(report.runs), 6)
+        self.assertAlmostEqual(elapsed, 2.0, places=6)
+        self.assertEqual(set(SharedConnectionAttack.peak.values()), {1})
+        # 공유 연결은 대상마다 한 번만 생성
+        self.assertEqual(sorted(SharedConnectionAttack.opened), self.targets)
+
+    def test_fanout_aggregates_per_target_and_scenario(self):
+        """대상별/시나리오별 집계"""
+        report = clock.run(self.dvd.run_attack_fanout(["probe", "probe_again"], self.targets),
+                           virtual_time=True)
+
+        self.assertEqual(report.by_target["10.13.0.4"]["failed"], 2)
+        self.assertEqual(report.by_target["10.13.0.2"]["successful"], 2)
+        self.assertEqual(report.by_scenario["probe"]["total"], 3)
+        self.assertAlmostEqual(report.by_scenario["probe"]["success_rate"], 2 / 3)
+        self.assertEqual(report.result("probe", "10.13.0.3").target, "10.13.0.3")
+        self.assertEqual(report.to_dict()["summary"]["iocs"], 4)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,171 @@
+"""
+가상 시간 시뮬레이션 테스트
+"""
+import asyncio
+import unittest
+import sys
+import os
+import time
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dvd_lite import clock
+from dvd_lite.main import BaseAttack, AttackType, AttackStatus
+
+class SleepyAttack(BaseAttack):
+    """지정 시간 동안 대기하는 테스트용 공격"""
+
+    async def _run_attack(self):
+        await asyncio.sleep(self.config.get("delay", 2.5))
+        return True, [], {}
+
+    def _get_attack_type(self):
+        return AttackType.RECONNAISSANCE
+
+class TestVirtualClock(unittest.TestCase):
+
+    def test_sleep_skipped_with_elapsed_time(self):
+        """가상 시간에서는 대기 없이 경과 시간만 반영"""
+        async def run():
+            start = clock.now()
+            await asyncio.sleep(3600)
+            return clock.now() - start
+
+        wall_start = time.monotonic()
+        elapsed = clock.run(run(), virtual_time=True)
+
+        self.assertLess(time.monotonic() - wall_start, 1.0)
+        self.assertAlmostEqual(elapsed, 3600, places=6)
+
+    def test_timer_order_preserved(self):
+        """타이머 순서는 실제 실행과 동일"""
+        order = []
+
+        async def sleeper(name, delay):
+            await asyncio.sleep(delay)
+            order.append((name, clock.now()))
+
+        async def run():
+            await asyncio.gather(sleeper("c", 3.0), sleeper("a", 1.0), sleeper("b", 2.0))
+
+        clock.run(run(), virtual_time=True)
+
+        self.assertEqual([name for name, _ in order], ["a", "b", "c"])
+        self.assertAlmostEqual(order[2][1] - order[0][1], 2.0, places=6)
+
+    def test_attack_response_time(self):
+        """공격 응답 시간은 가상 대기 시간과 일치"""
+        result = clock.run(SleepyAttack(delay=2.5).execute(), virtual_time=True)
+
+        self.assertEqual(result.status, AttackStatus.SUCCESS)
+        self.assertAlmostEqual(result.response_time, 2.5, places=6)
+
+    def test_wait_for_timeout(self):
+        """wait_for 타임아웃도 가상 시간으로 처리"""
+        async def run():
+            with self.assertRaises(asyncio.TimeoutError):
+                await asyncio.wait_for(asyncio.sleep(100), timeout=10)
+            return asyncio.get_running_loop().time()
+
+        self.assertAlmostEqual(clock.run(run(), virtual_time=True), 10, places=6)
+
+    def test_executor_work_waits_in_real_time(self):
+        """executor 작업이 진행 중이면 가상 시계가 제한 시간으로 건너뛰지 않음"""
+        async def run():
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            await asyncio.wait_for(loop.run_in_executor(None, time.sleep, 0.05), timeout=30)
+            elapsed = loop.time() - started
+            # 작업이 끝나면 다시 건너뜀
+            await asyncio.sleep(3600)
+            return elapsed
+
+        elapsed = clock.run(run(), virtual_time=True)
+        self.assertGreaterEqual(elapsed, 0.04)
+        self.assertLess(elapsed, 5)
+
+    def test_socket_io_waits_in_real_time(self):
+        """소켓이 열려 있으면 실제 응답을 기다리고 기다린 만큼만 가상 시간 전진"""
+        import socket
+        import threading
+
+        async def run():
+            loop = asyncio.get_running_loop()
+            received = loop.create_future()
+
+            class Receiver(asyncio.DatagramProtocol):
+                def datagram_received(self, data, addr):
+                    if not received.done():
+                        received.set_result(data)
+
+            transport, _ = await loop.create_datagram_endpoint(Receiver, local_addr=("127.0.0.1", 0))
+            address = transport.get_extra_info("sockname")
+
+            def send_later():
+                time.sleep(0.05)
+                with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sender:
+                    sender.sendto(b"pong", address)
+
+            threading.Thread(target=send_later).start()
+            started = loop.time()
+            try:
+                data = await asyncio.wait_for(received, timeout=30)
+            finally:
+                transport.close()
+            return data, loop.time() - started
+
+        data, elapsed = clock.run(run(), virtual_time=True)
+        self.assertEqual(data, b"pong")
+        self.assertLess(elapsed, 5)
+
+    def test_ignored_fd_does_not_hold_clock(self):
+        """감시용으로 제외한 fd가 등록되어 있어도 타이머 대기는 건너뜀"""
+        async def run():
+            loop = asyncio.get_running_loop()
+            read_fd, write_fd = os.pipe()
+            loop.add_reader(read_fd, lambda: None)
+            clock.ignore_for_virtual_time(read_fd)
+            try:
+                await asyncio.sleep(3600)
+            finally:
+                loop.remove_reader(read_fd)
+                os.close(read_fd)
+                os.close(write_fd)
+            return loop.time()
+
+        wall_start = time.monotonic()
+        self.assertAlmostEqual(clock.run(run(), virtual_time=True), 3600, places=6)
+        self.assertLess(time.monotonic() - wall_start, 1.0)
+
+    def test_metrics_server_does_not_hold_clock(self):
+        """메트릭 서버가 열려 있어도 타이머 대기는 건너뛰고 스크레이프에는 응답"""
+        from dvd_lite.metrics import MetricsServer
+
+        async def run():
+            loop = asyncio.get_running_loop()
+            server = MetricsServer(port=0)
+            await server.start()
+            try:
+                await asyncio.sleep(3600)
+                reader, writer = await asyncio.open_connection(server.host, server.port)
+                writer.write(b"GET /metrics HTTP/1.1\r\nHost: localhost\r\n\r\n")
+                status = await asyncio.wait_for(reader.readline(), timeout=30)
+                writer.close()
+            finally:
+                await server.stop()
+            return status, loop.time()
+
+        wall_start = time.monotonic()
+        status, virtual_now = clock.run(run(), virtual_time=True)
+        self.assertTrue(status.startswith(b"HTTP/1.1 200"))
+        self.assertGreaterEqual(virtual_now, 3600)
+        self.assertLess(time.monotonic() - wall_start, 1.0)
+
+    def test_real_time_outside_virtual_loop(self):
+        """가상 루프 밖에서는 실제 시각 반환"""
+        self.assertFalse(clock.is_virtual_time())
+        self.assertLess(abs(clock.now() - time.time()), 1.0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+"""
+CPU 작업 레인 테스트
+"""
+import asyncio
+import hashlib
+import time
+import unittest
+import sys
+import os
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dvd_lite import clock
+from dvd_lite.cpu_lane import CPULane, cpu_stage, SHARED_MEMORY_AVAILABLE, NUMPY_AVAILABLE
+from dvd_lite.main import DVDLite, BaseAttack, AttackType
+
+@cpu_stage
+def craft_payload(size: int) -> bytes:
+    block = hashlib.sha256(b"dvd").digest()
+    return (block * (size // len(block) + 1))[:size]
+
+@cpu_stage
+def burn_cpu(seconds: float) -> int:
+    end = time.perf_counter() + seconds
+    count = 0
+    while time.perf_counter() < end:
+        count += 1
+    return count
+
+@cpu_stage
+def fuzz_matrix(rows: int):
+    import numpy as np
+    return np.arange(rows * 64, dtype=np.uint32).reshape(rows, 64)
+
+def undeclared() -> int:
+    return 1
+
+class TestCPULane(unittest.TestCase):
+
+    def setUp(self):
+        self.lane = CPULane(max_workers=2)
+        self.addCleanup(self.lane.shutdown)
+
+    @unittest.skipUnless(SHARED_MEMORY_AVAILABLE, "shared_memory 필요 (Python 3.8+)")
+    def test_large_result_uses_shared_memory(self):
+        """큰 결과는 공유 메모리로, 작은 결과는 그대로 전달"""
+        async def run():
+            return await self.lane.run(craft_payload, 1 << 20), await self.lane.run(craft_payload, 16)
+
+        large, small = asyncio.run(run())
+        self.assertEqual(large, craft_payload(1 << 20))
+        self.assertEqual(small, craft_payload(16))
+        self.assertEqual(self.lane.statistics["shared_memory_results"], 1)
+        self.assertEqual(self.lane.statistics["submitted"], 2)
+
+    @unittest.skipUnless(SHARED_MEMORY_AVAILABLE and NUMPY_AVAILABLE, "shared_memory와 numpy 필요")
+    def test_ndarray_result(self):
+        """numpy 배열 결과 복원"""
+        matrix = asyncio.run(self.lane.run(fuzz_matrix, 1024))
+        self.assertEqual(matrix.shape, (1024, 64))
+        self.assertEqual(int(matrix[-1, -1]), 1024 * 64 - 1)
+
+    def test_event_loop_stays_responsive(self):
+        """CPU 작업 중에도 이벤트 루프 지연이 작음"""
+        async def run():
+            lags = []
+            task = asyncio.ensure_future(self.lane.run(burn_cpu, 0.5))
+            while not task.done():
+                started = time.perf_counter()
+                await asyncio.sleep(0.01)
+                lags.append(time.perf_counter() - started - 0.01)
+            await task
+            return max(lags[1:] or [0.0])
+
+        self.assertLess(asyncio.run(run()), 0.1)
+
+    def test_requires_declared_stage(self):
+        """@cpu_stage로 선언하지 않은 함수는 거부"""
+        with self.assertRaises(TypeError):
+            asyncio.run(self.lane.run(undeclared))
+
+    def test_attack_stage_runs_inline_in_virtual_time(self):
+        """가상 시간 루프에서는 바로 실행"""
+        class CraftAttack(BaseAttack):
+            def _get_attack_type(self):
+                return AttackType.INJECTION
+
+            async def _run_attack(self):
+                payload = await self.run_cpu(craft_payload, 128)
+                return True, [], {"payload_size": len(payload)}
+
+        dvd = DVDLite(config_path="nonexistent.json")
+        dvd.register_attack("craft", CraftAttack)
+        result = clock.run(dvd.run_attack("craft"), virtual_time=True)
+
+        self.assertEqual(result.details["payload_size"], 128)
+        self.assertEqual(dvd.cpu_lane.statistics["inline"], 1)
+        self.assertEqual(dvd.cpu_lane.statistics["submitted"], 0)
+
+if __name__ == "__main__":
+    unittest.main()
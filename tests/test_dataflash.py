@@ -0,0 +1,109 @@
+"""
+DataFlash 로그 파서 테스트
+"""
+import asyncio
+import io
+import os
+import sys
+import tempfile
+import unittest
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dvd_lite.main import DVDLite
+from dvd_lite.cti import SimpleCTI
+from dvd_lite.dvd_attacks.exfiltration.dataflash import (
+    DataFlashLog, DataFlashWriter, DataFlashError, extract_artifacts, write_synthetic_log, NUMPY_AVAILABLE
+)
+
+@unittest.skipUnless(NUMPY_AVAILABLE, "numpy 필요")
+class TestDataFlashLog(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "00000042.BIN")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _write(self, data: bytes) -> str:
+        with open(self.path, "wb") as f:
+            f.write(data)
+        return self.path
+
+    def test_synthetic_flight(self):
+        """GPS / ATT / PARM 추출과 배율 적용"""
+        stream = io.BytesIO()
+        write_synthetic_log(stream, duration=30.0, rate_hz=10.0, origin=(37.0, -122.0, 50.0),
+                            parameters={"FENCE_ENABLE": 1.0, "RTL_ALT": 1500.0})
+        with DataFlashLog(self._write(stream.getvalue())) as log:
+            self.assertEqual(log.counts()["GPS"], 300)
+            gps = log.table("GPS")
+            self.assertAlmostEqual(float(gps["Lat"][0]), 37.0, places=6)
+            self.assertAlmostEqual(float(gps["Alt"][0]), 70.0)
+            artifacts = extract_artifacts(log)
+
+        self.assertEqual(artifacts["parse"]["skipped_bytes"], 0)
+        self.assertEqual(artifacts["gps"]["fixes"], 299)
+        self.assertEqual(artifacts["attitude"]["samples"], 300)
+        self.assertAlmostEqual(artifacts["attitude"]["max_roll"], 15.0, places=1)
+        self.assertEqual(artifacts["parameters"], {"FENCE_ENABLE": 1.0, "RTL_ALT": 1500.0})
+
+    def test_late_formats_and_last_parameter_value(self):
+        """로그 중간의 FMT도 학습하고, 같은 파라미터는 마지막 값을 사용"""
+        stream = io.BytesIO()
+        writer = DataFlashWriter(stream)
+        writer.add_format("PARM", "QNf", ["TimeUS", "Name", "Value"])
+        writer.write("PARM", 0, b"RTL_ALT", 1500.0)
+        writer.add_format("BARO", "Qfh", ["TimeUS", "Alt", "Temp"])
+        writer.write("BARO", 10, 12.5, 2100)
+        writer.write("PARM", 20, b"RTL_ALT", 3000.0)
+
+        with DataFlashLog(self._write(stream.getvalue())) as log:
+            self.assertEqual(log.parameters(), {"RTL_ALT": 3000.0})
+            self.assertEqual(float(log.messages("BARO")["Alt"][0]), 12.5)
+            self.assertIsNone(log.messages("IMU"))
+
+    def test_resync_after_corruption(self):
+        """손상 구간과 페이로드 안의 헤더 바이트를 건너뛰고 다시 동기화"""
+        stream = io.BytesIO()
+        writer = DataFlashWriter(stream)
+        writer.add_format("MSG", "QZ", ["TimeUS", "Message"])
+        for index in range(50):
+            # 페이로드 안에 헤더와 같은 바이트열 (0xA3 0x95)
+            writer.write("MSG", index, b"\xa3\x95\x80 fake header")
+        data = stream.getvalue()
+        middle = len(data) // 2
+        corrupted = data[:middle] + b"\xa3\x95\x81garbage" + data[middle + 20:]
+
+        with DataFlashLog(self._write(corrupted)) as log:
+            self.assertGreater(log.statistics["resyncs"], 0)
+            self.assertGreater(log.statistics["skipped_bytes"], 0)
+            self.assertGreaterEqual(log.counts()["MSG"], 48)
+
+    def test_not_a_log(self):
+        with self.assertRaises(DataFlashError):
+            DataFlashLog(self._write(b"\x00" * 1024))
+
+    def test_flight_log_extraction_feeds_cti(self):
+        """추출물 IOC가 CTI 수집기에 위협 지표로 들어감"""
+        with open(self.path, "wb") as f:
+            write_synthetic_log(f, duration=10.0, parameters={"FENCE_ENABLE": 1.0})
+
+        from dvd_lite.dvd_attacks import register_all_dvd_attacks
+        register_all_dvd_attacks()
+        dvd = DVDLite(config_path="nonexistent.json")
+        cti = SimpleCTI()
+
+        result = asyncio.run(dvd.run_attack("flight_log_extraction", log_path=self.path))
+        asyncio.run(cti.collect_from_result(result))
+
+        self.assertEqual(result.status.value, "success")
+        # 홈 위치는 첫 3D 고정 샘플
+        self.assertIn("LOG_HOME:37.7749052,-122.4189000", result.iocs)
+        self.assertIn("LOG_PARAM:FENCE_ENABLE=1", result.iocs)
+        self.assertIn("log_home", {indicator.ioc_type for indicator in cti.indicators})
+
+if __name__ == "__main__":
+    unittest.main()
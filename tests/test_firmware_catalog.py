@@ -0,0 +1,137 @@
+"""
+펌웨어 버전 카탈로그 테스트
+"""
+import asyncio
+import os
+import sys
+import tempfile
+import unittest
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dvd_lite.main import DVDLite
+from dvd_lite.dvd_attacks.firmware_attacks.firmware_engine import (
+    FirmwareManifest, synthetic_image, write_firmware, NUMPY_AVAILABLE
+)
+from dvd_lite.dvd_attacks.firmware_attacks.firmware_catalog import FirmwareCatalog, version_number
+
+IMAGE_SIZE = 128 * 1024
+
+def _manifest(index: int, board_id: int, version: str, signed: bool) -> FirmwareManifest:
+    return FirmwareManifest(path=f"/fw/{board_id}/{version}-{index}.apj", format="apj", image_path="",
+                            image_size=IMAGE_SIZE, sha256=f"{index:064x}", board_id=board_id, version=version,
+                            git_identity=None, signed=signed, descriptor=None, metadata={})
+
+class TestFirmwareCatalogQueries(unittest.TestCase):
+
+    def setUp(self):
+        self.catalog = FirmwareCatalog()
+        index = 0
+        for board_id in range(20):
+            for major in (3, 4):
+                for minor in range(10):
+                    for signed in (False, True):
+                        index += 1
+                        self.catalog.add(_manifest(index, board_id, f"{major}.{minor}", signed), 1, 0)
+
+    def tearDown(self):
+        self.catalog.close()
+
+    def test_version_number_ordering(self):
+        self.assertLess(version_number("4.5"), version_number("4.10"))
+        self.assertLess(version_number("3.6.12"), version_number("4.0"))
+        self.assertEqual(version_number("V4.5.0-rc1"), version_number("4.5.0.1"))
+        self.assertEqual(version_number(None), 0)
+
+    def test_oldest_signed_with_tag(self):
+        """태그 조건과 버전 상한을 만족하는 가장 오래된 서명 이미지"""
+        vulnerable = self.catalog.find(board_id=7, signed=True, below="4.9")[5:8]
+        for entry in vulnerable:
+            self.catalog.tag(entry.sha256, "CVE-TEST-1", "시험용 취약점")
+
+        entry = self.catalog.oldest(board_id=7, signed=True, tag="CVE-TEST-1", below="4.9")
+        self.assertEqual(entry.version, vulnerable[0].version)
+        self.assertEqual(entry.tags, ["CVE-TEST-1"])
+        self.assertIsNone(self.catalog.oldest(board_id=8, tag="CVE-TEST-1"))
+
+        oldest = self.catalog.oldest(board_id=7, signed=True)
+        self.assertEqual((oldest.version, oldest.signed), ("3.0", True))
+        newest = self.catalog.find(board_id=7, signed=False, newest=True, limit=1)[0]
+        self.assertEqual(newest.version, "4.9")
+
+    def test_queries_use_covering_indexes(self):
+        """보드 / 해시 질의는 테이블을 읽지 않고 커버링 인덱스만 사용"""
+        plan = " ".join(self.catalog.query_plan(board_id=3, signed=True, below="4.0"))
+        self.assertIn("COVERING INDEX images_board_version", plan)
+        self.assertNotIn("TEMP B-TREE", plan)
+
+        plan = " ".join(self.catalog.query_plan(board_id=3, signed=True, tag="CVE-TEST-1"))
+        self.assertIn("COVERING INDEX", plan)
+        self.assertIn("PRIMARY KEY", plan)
+        self.assertNotIn("SCAN", plan)
+
+@unittest.skipUnless(NUMPY_AVAILABLE, "numpy 필요")
+class TestFirmwareCatalogImport(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.images = os.path.join(self.directory.name, "images")
+        os.makedirs(os.path.join(self.images, "old"))
+        self.database = os.path.join(self.directory.name, "catalog.db")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _write(self, name: str, **kwargs) -> str:
+        return write_firmware(os.path.join(self.images, name), synthetic_image(IMAGE_SIZE, **kwargs))
+
+    def test_incremental_import(self):
+        """바뀌지 않은 파일은 다시 분석하지 않고, 사라진 파일은 지움"""
+        self._write("current.apj", seed=1, version=(4, 5), signed=True)
+        self._write("old/copter-4.1.apj", seed=2, version=(4, 1), signed=True)
+        removed = self._write("old/copter-3.6.bin", seed=3, version=(3, 6))
+        with open(os.path.join(self.images, "notes.txt"), "w") as f:
+            f.write("펌웨어 아님")
+
+        with FirmwareCatalog(self.database) as catalog:
+            first = asyncio.run(catalog.import_directory(self.images))
+        self.assertEqual((first["scanned"], first["imported"], first["unchanged"]), (3, 3, 0))
+
+        os.remove(removed)
+        self._write("old/copter-4.0.px4", seed=4, version=(4, 0), signed=True)
+        with FirmwareCatalog(self.database) as catalog:
+            second = asyncio.run(catalog.import_directory(self.images))
+            self.assertEqual((second["imported"], second["unchanged"], second["removed"]), (1, 2, 1))
+            self.assertEqual(len(catalog), 3)
+            self.assertEqual(catalog.oldest(board_id=9, signed=True).version, "4.0")
+
+    def test_rollback_and_secure_boot_use_catalog(self):
+        current = self._write("current.apj", seed=1, version=(4, 5), signed=True)
+        self._write("old/copter-4.1.apj", seed=2, version=(4, 1), signed=True)
+        vulnerable = self._write("old/copter-4.0.apj", seed=3, version=(4, 0), signed=True)
+        self._write("old/copter-3.6.apj", seed=4, version=(3, 6))
+
+        with FirmwareCatalog(self.database) as catalog:
+            asyncio.run(catalog.import_directory(self.images))
+            sha256 = catalog.find(board_id=9, below="4.1")[-1].sha256
+            self.assertEqual(catalog.lookup(sha256)[0].path, vulnerable)
+            catalog.tag(sha256, "CVE-TEST-2")
+
+        from dvd_lite.dvd_attacks import register_all_dvd_attacks
+        register_all_dvd_attacks()
+        dvd = DVDLite(config_path="nonexistent.json")
+
+        result = asyncio.run(dvd.run_attack("firmware_rollback", current_firmware=current, catalog=self.database,
+                                            firmware_dir=self.images, require_tag="CVE-TEST-2"))
+        self.assertEqual(result.status.value, "success")
+        self.assertIn("FIRMWARE_ROLLBACK:board9:4.5->4.0", result.iocs)
+        self.assertIn("FIRMWARE_VULN_TAG:copter-4.0.apj:CVE-TEST-2", result.iocs)
+
+        result = asyncio.run(dvd.run_attack("secure_boot_bypass", firmware_path=current, catalog=self.database,
+                                            output_dir=self.directory.name))
+        self.assertEqual(result.status.value, "success")
+        self.assertIn("SECURE_BOOT_DOWNGRADE:board9:4.5->4.0", result.iocs)
+
+if __name__ == "__main__":
+    unittest.main()
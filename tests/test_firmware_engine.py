@@ -0,0 +1,130 @@
+"""
+펌웨어 분석 엔진 테스트
+"""
+import asyncio
+import os
+import sys
+import tempfile
+import unittest
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dvd_lite.main import DVDLite
+from dvd_lite.dvd_attacks.firmware_attacks.firmware_engine import (
+    FirmwareEngine, FirmwareError, find_padding, patch_image, strip_signature, synthetic_image, write_firmware,
+    NUMPY_AVAILABLE
+)
+
+IMAGE_SIZE = 512 * 1024
+
+@unittest.skipUnless(NUMPY_AVAILABLE, "numpy 필요")
+class TestFirmwareEngine(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.image = synthetic_image(IMAGE_SIZE, seed=1)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory.name, name)
+
+    def _analyze(self, *paths):
+        async def run():
+            with FirmwareEngine() as engine:
+                manifests = await engine.analyze_many(list(paths))
+                diffs = [await engine.diff(manifests[0], manifest) for manifest in manifests[1:]]
+                return manifests, diffs
+        return asyncio.run(run())
+
+    def test_formats_decode_to_same_image(self):
+        """.apj / .px4 / .bin이 같은 이미지로 풀리고 descriptor를 읽음"""
+        paths = [write_firmware(self._path(f"fw.{fmt}"), self.image, board_id=9) for fmt in ("apj", "px4", "bin")]
+        manifests, diffs = self._analyze(*paths)
+
+        self.assertEqual([manifest.format for manifest in manifests], ["apj", "px4", "bin"])
+        self.assertEqual(len({manifest.sha256 for manifest in manifests}), 1)
+        self.assertEqual(len({tuple(manifest.chunk_digests) for manifest in manifests}), 1)
+        self.assertGreater(len(manifests[0].chunk_digests), 8)
+        self.assertEqual(manifests[2].version, "4.5")
+        self.assertEqual(manifests[2].board_id, 9)
+        self.assertTrue(all(diff.identical and not diff.regions for diff in diffs))
+
+    def test_overwrite_and_insertion_diff(self):
+        """덮어쓰기는 바이트 단위로, 삽입은 CDC로 재동기화해 좁은 구간만 보고"""
+        overwritten = patch_image(self.image, 300000, b"\x00" * 10)
+        inserted = self.image[:200000] + b"\x5a" * 800 + self.image[200000:]
+        paths = [write_firmware(self._path(name), data)
+                 for name, data in (("a.bin", self.image), ("b.bin", overwritten), ("c.bin", inserted))]
+        _, (overwrite_diff, insert_diff) = self._analyze(*paths)
+
+        self.assertEqual(overwrite_diff.regions, [(300000, 10)])
+        self.assertEqual(len(insert_diff.regions), 1)
+        offset, length = insert_diff.regions[0]
+        self.assertLessEqual(offset, 200000)
+        self.assertGreaterEqual(offset + length, 200800)
+        self.assertGreater(insert_diff.similarity, 0.9)
+
+    def test_corrupt_firmware(self):
+        with open(self._path("bad.apj"), "w") as f:
+            f.write('{"magic": "APJFWv1", "image_size": 10, "image": "!!!not base64!!!"}')
+        with self.assertRaises(FirmwareError):
+            self._analyze(self._path("bad.apj"))
+
+    def test_signature_strip_and_padding(self):
+        signed = synthetic_image(IMAGE_SIZE, seed=2, signed=True)
+        stripped, region = strip_signature(signed)
+        self.assertIsNotNone(region)
+        self.assertEqual(strip_signature(stripped), (stripped, None))
+        self.assertEqual(strip_signature(self.image), (self.image, None))
+
+        offset, length = find_padding(self.image)
+        self.assertEqual(offset + length, IMAGE_SIZE)
+        self.assertGreaterEqual(length, IMAGE_SIZE // 8 - 1)
+
+@unittest.skipUnless(NUMPY_AVAILABLE, "numpy 필요")
+class TestFirmwareAttacks(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        from dvd_lite.dvd_attacks import register_all_dvd_attacks
+        register_all_dvd_attacks()
+        self.dvd = DVDLite(config_path="nonexistent.json")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _write(self, name: str, **kwargs) -> str:
+        image = synthetic_image(IMAGE_SIZE, **kwargs)
+        return write_firmware(os.path.join(self.directory.name, name), image)
+
+    def test_upload_manipulation(self):
+        path = self._write("arducopter.apj", seed=3)
+        result = asyncio.run(self.dvd.run_attack("firmware_upload_manipulation", firmware_path=path,
+                                                 output_dir=self.directory.name))
+        self.assertEqual(result.status.value, "success")
+        self.assertTrue(any(ioc.startswith("FIRMWARE_TAMPERED:arducopter_patched.apj:") for ioc in result.iocs))
+        self.assertTrue(any(ioc.startswith("FIRMWARE_PATCH:") for ioc in result.iocs))
+        self.assertTrue(os.path.exists(os.path.join(self.directory.name, "arducopter_patched.apj")))
+
+    def test_rollback_selects_oldest_same_board(self):
+        current = self._write("current.apj", seed=4, version=(4, 5))
+        candidates = [self._write("old.apj", seed=5, version=(4, 1)),
+                      self._write("older.apj", seed=6, version=(3, 6)),
+                      self._write("other_board.apj", seed=7, version=(2, 0), board_id=50)]
+        result = asyncio.run(self.dvd.run_attack("firmware_rollback", current_firmware=current,
+                                                 candidate_firmware=candidates))
+        self.assertEqual(result.status.value, "success")
+        self.assertIn("FIRMWARE_ROLLBACK:board9:4.5->3.6", result.iocs)
+
+    def test_secure_boot_signature_strip(self):
+        path = self._write("signed.bin", seed=8, signed=True)
+        result = asyncio.run(self.dvd.run_attack("secure_boot_bypass", firmware_path=path,
+                                                 output_dir=self.directory.name))
+        self.assertEqual(result.status.value, "success")
+        self.assertTrue(any(ioc.startswith("SECURE_BOOT_SIGNATURE_STRIPPED:signed.bin:0x") for ioc in result.iocs))
+
+if __name__ == "__main__":
+    unittest.main()
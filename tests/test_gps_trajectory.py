@@ -0,0 +1,139 @@
+"""
+GPS 스푸핑 궤적 생성 테스트
+"""
+import asyncio
+import math
+import unittest
+import sys
+import os
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dvd_lite import mavlink
+from dvd_lite.sitl import StandInVehicle
+from dvd_lite.main import DVDLite
+from dvd_lite.dvd_attacks.protocol_tampering.gps_trajectory import (
+    SpoofProfile, TrajectoryGenerator, NUMPY_AVAILABLE
+)
+
+ORIGIN = (37.7749, -122.4194)
+
+def haversine(lat1, lon1, lat2, lon2):
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    return 2 * 6371008.8 * math.asin(math.sqrt(a))
+
+@unittest.skipUnless(NUMPY_AVAILABLE, "numpy 필요")
+class TestGPSTrajectory(unittest.TestCase):
+
+    def setUp(self):
+        self.generator = TrajectoryGenerator(*ORIGIN)
+
+    def test_drift_distance_and_speed(self):
+        """가속 후 등속 표류 - 최종 거리와 속도"""
+        profile = SpoofProfile(mode="drift", duration=120, drift_speed=3.0, drift_bearing=45.0, ramp_time=10.0)
+        track = self.generator.generate(profile)
+
+        final = float(track.t[-1])
+        expected = 3.0 * (final - 5.0)
+        self.assertAlmostEqual(haversine(*ORIGIN, float(track.lat[-1]), float(track.lon[-1])), expected, delta=0.5)
+        self.assertAlmostEqual(float(track.vn[-1]), 3.0 * math.cos(math.radians(45)), places=3)
+        self.assertLess(float(abs(track.vn[0])), 0.1)
+
+    def test_step_and_circle(self):
+        """계단 오프셋은 step_time 전후로 0/offset, 원형 포획은 반지름 유지"""
+        step = self.generator.generate(SpoofProfile(mode="step", duration=10, step_offset=80.0, step_time=4.0))
+        self.assertEqual(float(step.offset[39]), 0.0)
+        self.assertEqual(float(step.offset[40]), 80.0)
+        self.assertEqual(float(abs(step.vn).max()), 0.0)
+
+        circle = self.generator.generate(SpoofProfile(mode="circle", duration=120, circle_radius=25.0, capture_time=10.0))
+        captured = circle.t >= 10.0
+        distances = [haversine(*ORIGIN, float(lat), float(lon))
+                     for lat, lon in zip(circle.lat[captured], circle.lon[captured])]
+        self.assertAlmostEqual(min(distances), 25.0, delta=0.05)
+        self.assertAlmostEqual(max(distances), 25.0, delta=0.05)
+
+    def test_bulk_encoding_matches_single(self):
+        """일괄 인코딩 결과가 메시지별 인코딩과 같고 디코딩 가능"""
+        track = self.generator.generate(SpoofProfile(mode="circle", duration=30), start_time=1.7e9)
+        frames = track.encode("GPS_RAW_INT", seq_start=250)
+
+        self.assertEqual(len(frames), 300)
+        message = next(mavlink.parse_frames(frames[123]))
+        self.assertEqual(message.packet_seq, (250 + 123) & 0xFF)
+        self.assertEqual(message.lat, round(float(track.lat[123]) * 1e7))
+        self.assertEqual(frames[123], mavlink.encode("GPS_RAW_INT", message.packet_seq, **message.fields))
+
+        gps_input = next(mavlink.parse_frames(track.encode("GPS_INPUT")[0]))
+        self.assertEqual(gps_input.fix_type, 3)
+        self.assertEqual(gps_input.time_week, 2288)
+
+    def test_live_attack_streams_frames(self):
+        """live=True면 궤적 프레임을 대상에 전송"""
+        from dvd_lite.dvd_attacks import register_all_dvd_attacks
+        register_all_dvd_attacks()
+        dvd = DVDLite(config_path="nonexistent.json")
+
+        async def run():
+            async with StandInVehicle() as vehicle:
+                host, port = vehicle.address
+                result = await dvd.run_attack("gps_spoofing", live=True, target_ip=host, mavlink_port=port,
+                                              profile={"mode": "circle", "rate_hz": 50.0, "duration": 0.4})
+                await asyncio.sleep(0.05)
+                return result, vehicle.statistics
+
+        result, statistics = asyncio.run(run())
+        self.assertEqual(result.status.value, "success")
+        self.assertEqual(statistics["by_message"]["GPS_INPUT"], 20)
+        self.assertTrue(result.iocs[0].startswith("GPS_SPOOF:circle:GPS_INPUT:"))
+
+    def test_live_deadline_follows_track_duration(self):
+        """live 궤적 길이가 시나리오 예상 시간보다 길어도 제한 시간에 잘리지 않음"""
+        from dvd_lite.dvd_attacks import register_all_dvd_attacks
+        register_all_dvd_attacks()
+        dvd = DVDLite(config_path="nonexistent.json")
+        # 시나리오 예상 시간 기반 제한 시간을 0.2초로 줄임
+        dvd.config["attacks"].update(deadline_factor=0.0, deadline_slack=0.2)
+        profile = {"mode": "drift", "rate_hz": 20.0, "duration": 0.6}
+        self.assertAlmostEqual(dvd.attack_deadline("gps_spoofing", params={"live": True, "profile": profile}), 0.8)
+        self.assertAlmostEqual(dvd.attack_deadline("gps_spoofing", params={"profile": profile}), 0.2)
+
+        async def run():
+            async with StandInVehicle() as vehicle:
+                host, port = vehicle.address
+                return await dvd.run_attack("gps_spoofing", live=True, target_ip=host, mavlink_port=port,
+                                            profile=profile)
+
+        result = asyncio.run(run())
+        self.assertEqual(result.status.value, "success")
+        self.assertEqual(result.details["frames_sent"], 12)
+
+class TestTelemetrySpoof(unittest.TestCase):
+
+    def _run(self):
+        from dvd_lite import clock
+        from dvd_lite.attacks import TelemetrySpoof
+        dvd = DVDLite(config_path="nonexistent.json")
+        dvd.register_attack("telemetry_spoof", TelemetrySpoof)
+        return clock.run(dvd.run_attack("telemetry_spoof"), virtual_time=True)
+
+    @unittest.skipUnless(NUMPY_AVAILABLE, "numpy 필요")
+    def test_trajectory_frames(self):
+        result = self._run()
+        self.assertEqual(result.details["spoofed_frames"], 300)
+        self.assertTrue(result.iocs[0].startswith("FAKE_GPS:"))
+
+    def test_without_numpy(self):
+        """numpy가 없으면 궤적 없이 임의 오프셋 좌표로 대체"""
+        from unittest import mock
+        with mock.patch("dvd_lite.attacks.NUMPY_AVAILABLE", False):
+            result = self._run()
+        self.assertNotIn("trajectory", result.details)
+        lat, lon = map(float, result.iocs[0].split(":")[1].split(","))
+        self.assertLess(abs(lat - ORIGIN[0]), 0.011)
+        self.assertLess(abs(lon - ORIGIN[1]), 0.011)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,201 @@
+"""
+로그 다운로드 엔진 테스트
+"""
+import asyncio
+import io
+import os
+import sys
+import tempfile
+import unittest
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from collections import deque
+from dvd_lite.mavlink import MAVLinkClient, MAVLinkMessage
+from dvd_lite.sitl import StandInVehicle
+from dvd_lite.main import DVDLite
+from dvd_lite.dvd_attacks.exfiltration.log_download import IntervalSet, LogDownloader, LogDownloadError, LogEntry
+from dvd_lite.dvd_attacks.exfiltration.dataflash import write_synthetic_log, NUMPY_AVAILABLE
+
+class TestIntervalSet(unittest.TestCase):
+
+    def test_merge_and_gaps(self):
+        intervals = IntervalSet()
+        self.assertEqual(intervals.add(0, 90), 90)
+        self.assertEqual(intervals.add(180, 270), 90)
+        self.assertEqual(intervals.gaps(0, 300), [(90, 180), (270, 300)])
+        # 겹치는 구간은 새로 채운 바이트만 계산하고 맞닿은 구간은 병합
+        self.assertEqual(intervals.add(60, 200), 90)
+        self.assertEqual(list(intervals), [(0, 270)])
+        self.assertEqual(intervals.covered, 270)
+        self.assertTrue(intervals.contains(100, 270))
+        self.assertFalse(intervals.contains(100, 271))
+        self.assertEqual(intervals.add(0, 270), 0)
+
+class StaleChunkClient:
+    """요청을 순서대로 처리하되, 두 번째 요청 앞에 이전 요청의 늦은 조각을 끼워 넣는 가짜 클라이언트"""
+
+    def __init__(self, log: bytes):
+        self.log = log
+        self.requests = deque()
+        self.responses = deque()
+        self.sent = []
+
+    def send(self, name, **fields):
+        if name != "LOG_REQUEST_DATA":
+            return
+        self.sent.append((fields["ofs"], fields["count"]))
+        self.requests.append((fields["ofs"], fields["count"]))
+
+    def _chunk(self, offset: int) -> MAVLinkMessage:
+        data = self.log[offset:offset + 90]
+        return MAVLinkMessage("LOG_DATA", 120, 0, 1, 1, {"id": 7, "ofs": offset, "count": len(data), "data": data})
+
+    async def recv(self, names, timeout):
+        await asyncio.sleep(0)
+        if not self.responses and self.requests:
+            start, count = self.requests.popleft()
+            if start == 360:
+                self.responses.append(self._chunk(0))
+            self.responses.extend(self._chunk(offset) for offset in range(start, start + count, 90))
+        return self.responses.popleft() if self.responses else None
+
+class TestLogDownloadRetire(unittest.TestCase):
+
+    def test_stale_chunk_keeps_inflight_ranges(self):
+        """어느 요청 구간에도 속하지 않는 늦은 조각은 진행 중인 구간을 끝내지 않음"""
+        log = bytes(range(256)) * 6
+        client = StaleChunkClient(log)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "download.bin")
+            downloader = LogDownloader(client, window=2, request_chunks=4, timeout=0.1)
+            report = asyncio.run(downloader.download(LogEntry(7, len(log), 0), path))
+            with open(path, "rb") as f:
+                data = f.read()
+
+        self.assertEqual(data, log)
+        self.assertEqual(report.re_requests, 0)
+        self.assertEqual(report.duplicate_bytes, 90)
+        self.assertEqual(client.sent, [(offset, min(360, len(log) - offset)) for offset in range(0, len(log), 360)])
+
+@unittest.skipUnless(NUMPY_AVAILABLE, "numpy 필요")
+class TestLogDownloader(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        stream = io.BytesIO()
+        write_synthetic_log(stream, duration=60.0, rate_hz=20.0)
+        cls.log = stream.getvalue()
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _download(self, log, window=8, request_chunks=64, **vehicle_options):
+        path = os.path.join(self.directory.name, "download.bin")
+
+        async def run():
+            async with StandInVehicle(seed=11, **vehicle_options) as vehicle:
+                vehicle.logs = {1: b"old", 7: log}
+                async with await MAVLinkClient.connect(vehicle.address) as client:
+                    downloader = LogDownloader(client, window=window, request_chunks=request_chunks, timeout=0.1)
+                    entries = await downloader.list_logs()
+                    report = await downloader.download(entries[-1], path)
+                    return entries, report, vehicle.statistics["tx_dropped"]
+
+        entries, report, dropped = asyncio.run(run())
+        with open(path, "rb") as f:
+            return entries, report, dropped, f.read()
+
+    def test_download(self):
+        entries, report, _, data = self._download(self.log)
+        self.assertEqual([(entry.id, entry.size) for entry in entries], [(1, 3), (7, len(self.log))])
+        self.assertTrue(report.complete)
+        self.assertEqual(data, self.log)
+        self.assertGreater(report.kbps, 0)
+
+    def test_lossy_download_rerequests_gaps(self):
+        """유실된 조각만 다시 요청해 완전한 파일을 만듦"""
+        _, report, dropped, data = self._download(self.log, tx_drop_rate=0.05)
+        self.assertGreater(dropped, 0)
+        self.assertEqual(data, self.log)
+        self.assertGreater(report.re_requests, 0)
+        self.assertEqual(report.duplicate_bytes, 0)
+
+    def test_window_beats_request_per_chunk(self):
+        """왕복 지연이 있을 때 조각마다 요청하는 방식보다 빠름"""
+        log = self.log[:9000]
+        _, naive, _, _ = self._download(log, window=1, request_chunks=1, response_delay=0.002)
+        _, windowed, _, data = self._download(log, response_delay=0.002)
+        self.assertEqual(data, log)
+        self.assertEqual(naive.requests, 100)
+        self.assertGreater(windowed.kbps, naive.kbps * 5)
+
+    def test_no_logs_and_unreachable(self):
+        async def run():
+            async with StandInVehicle() as vehicle:
+                async with await MAVLinkClient.connect(vehicle.address) as client:
+                    return await LogDownloader(client, timeout=0.1).list_logs()
+
+        self.assertEqual(asyncio.run(run()), [])
+
+        async def unreachable():
+            async with await MAVLinkClient.connect(("127.0.0.1", 9)) as client:
+                await LogDownloader(client, timeout=0.01, max_retries=1).list_logs()
+
+        with self.assertRaises(LogDownloadError):
+            asyncio.run(unreachable())
+
+    def test_live_flight_log_extraction(self):
+        """live=True면 최근 로그를 내려받아 파싱"""
+        from dvd_lite.dvd_attacks import register_all_dvd_attacks
+        register_all_dvd_attacks()
+        dvd = DVDLite(config_path="nonexistent.json")
+
+        async def run():
+            async with StandInVehicle() as vehicle:
+                vehicle.logs = {7: self.log}
+                host, port = vehicle.address
+                return await dvd.run_attack("flight_log_extraction", live=True, target_ip=host, mavlink_port=port,
+                                            timeout=0.1, output_dir=self.directory.name)
+
+        result = asyncio.run(run())
+        self.assertEqual(result.status.value, "success")
+        self.assertTrue(result.details["downloads"]["00000007.BIN"]["complete"])
+        # 기본값은 한 요청으로 로그 전체를 스트림 전송 (진행 중인 전송을 대체하는 기체 대비)
+        # 로컬 UDP 버퍼 유실로 생긴 빈 곳 재요청은 제외
+        download = result.details["downloads"]["00000007.BIN"]
+        self.assertEqual(download["requests"] - download["re_requests"], 1)
+        self.assertEqual(result.details["logs"]["00000007.BIN"]["gps"]["fixes"], 1199)
+        self.assertTrue(any(ioc.startswith("LOG_DOWNLOADED:127.0.0.1:7:") for ioc in result.iocs))
+        self.assertTrue(any(ioc.startswith("LOG_HOME:") for ioc in result.iocs))
+
+    def test_deadline_extended_by_log_size(self):
+        """받을 로그 크기만큼 제한 시간을 늘려 느린 전송도 끝까지 받음"""
+        from dvd_lite.dvd_attacks import register_all_dvd_attacks
+        register_all_dvd_attacks()
+        dvd = DVDLite(config_path="nonexistent.json")
+        # 시나리오 예상 시간 기반 제한 시간을 0.3초로 줄임
+        dvd.config["attacks"].update(deadline_factor=0.0, deadline_slack=0.3)
+        log = self.log[:9000]
+
+        async def run(min_transfer_rate):
+            async with StandInVehicle(response_delay=0.005) as vehicle:
+                vehicle.logs = {7: log}
+                host, port = vehicle.address
+                # 조각마다 요청해 전송이 약 0.5초 걸리도록
+                return await dvd.run_attack("flight_log_extraction", live=True, target_ip=host, mavlink_port=port,
+                                            timeout=0.1, window=1, request_chunks=1,
+                                            min_transfer_rate=min_transfer_rate, output_dir=self.directory.name)
+
+        result = asyncio.run(run(900))
+        self.assertEqual(result.status.value, "success")
+        self.assertTrue(result.details["downloads"]["00000007.BIN"]["complete"])
+        # 전송 시간을 거의 0으로 잡으면 연장되지 않아 중단됨
+        self.assertEqual(asyncio.run(run(1e12)).status.value, "partial")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+"""
+MAVLink 코덱과 플러드 엔진 테스트
+"""
+import asyncio
+import unittest
+import sys
+import os
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dvd_lite import mavlink
+from dvd_lite.sitl import StandInVehicle
+from dvd_lite.main import DVDLite
+from dvd_lite.dvd_attacks.denial_of_service.flood_engine import MAVLinkFloodEngine, TokenBucket
+
+class TestMAVLinkCodec(unittest.TestCase):
+
+    def test_heartbeat_wire_format(self):
+        """HEARTBEAT 인코딩 (pymavlink와 동일한 바이트열)"""
+        frame = mavlink.encode("HEARTBEAT", 7, type=6, autopilot=8, mavlink_version=3)
+        self.assertEqual(frame.hex(), "fd09000007ffbe0000000000000006080000031f99")
+
+    def test_template_matches_encoder(self):
+        """템플릿의 시퀀스/CRC 패치 결과가 전체 인코딩과 같음"""
+        template = mavlink.FrameTemplate("COMMAND_LONG", target_system=1, command=400, param1=1.0)
+        for seq in (0, 1, 200, 255, 256 + 3):
+            expected = mavlink.encode("COMMAND_LONG", seq, target_system=1, command=400, param1=1.0)
+            self.assertEqual(bytes(template.frame(seq)), expected)
+
+    def test_parse_roundtrip_and_crc_check(self):
+        """디코딩 시 잘린 페이로드 복원, CRC 오류 프레임 제외"""
+        good = mavlink.encode("COMMAND_LONG", 3, target_system=1, command=400)
+        bad = bytearray(good)
+        bad[-1] ^= 0xFF
+        statistics = {}
+
+        messages = list(mavlink.parse_frames(bytes(bad) + good, statistics))
+        self.assertEqual(len(messages), 1)
+        self.assertEqual(messages[0].command, 400)
+        self.assertEqual(messages[0].param7, 0.0)
+        self.assertEqual(statistics["crc_errors"], 1)
+
+class TestMAVLinkFlood(unittest.TestCase):
+
+    def test_token_bucket(self):
+        """토큰은 rate로 쌓이고 burst를 넘지 않음"""
+        bucket = TokenBucket(rate=1000, burst=50)
+        bucket.take(0.0, 0)
+        self.assertEqual(bucket.take(0.01, 100), 10)
+        self.assertEqual(bucket.take(1.0, 100), 50)
+
+    def test_engine_against_stand_in(self):
+        """목표 전송률 유지, 대상 수신과 HEARTBEAT 측정"""
+        async def run():
+            async with StandInVehicle(heartbeat_interval=0.1) as vehicle:
+                async with MAVLinkFloodEngine(vehicle.address, heartbeat_interval=0.1) as engine:
+                    report = await engine.run_step(5000, 0.5)
+                return report, vehicle.statistics
+
+        report, statistics = asyncio.run(run())
+        self.assertGreater(report.achieved_pps, 4000)
+        self.assertLess(report.achieved_pps, 5500)
+        self.assertGreaterEqual(report.heartbeats, 2)
+        self.assertIsNotNone(report.heartbeat_latency_p95)
+        self.assertGreater(statistics["by_message"]["HEARTBEAT"], 0)
+
+    def test_live_attack(self):
+        """live=True면 단계별 플러드 결과를 보고"""
+        from dvd_lite.dvd_attacks import register_all_dvd_attacks
+        register_all_dvd_attacks()
+        dvd = DVDLite(config_path="nonexistent.json")
+
+        async def run():
+            async with StandInVehicle() as vehicle:
+                host, port = vehicle.address
+                return await dvd.run_attack("mavlink_flood", live=True, target_ip=host, mavlink_port=port,
+                                            rates=[1000, 3000], step_duration=0.3)
+
+        result = asyncio.run(run())
+        self.assertEqual(result.status.value, "success")
+        self.assertEqual([step["target_rate"] for step in result.details["steps"]], [1000, 3000])
+        self.assertEqual(len(result.iocs), 2)
+
+    def test_sweep_longer_than_estimated_duration(self):
+        """스윕 길이가 시나리오 예상 시간보다 길어도 모든 단계를 측정"""
+        from dvd_lite.dvd_attacks import register_all_dvd_attacks
+        register_all_dvd_attacks()
+        dvd = DVDLite(config_path="nonexistent.json")
+        # 시나리오 예상 시간 기반 제한 시간을 스윕(0.9초)보다 짧은 0.6초로 줄임
+        dvd.config["attacks"].update(deadline_factor=0.0, deadline_slack=0.6)
+        params = {"live": True, "rates": [1000, 2000, 3000], "step_duration": 0.3}
+        self.assertAlmostEqual(dvd.attack_deadline("mavlink_flood", params=params), 1.5)
+
+        async def run():
+            async with StandInVehicle() as vehicle:
+                host, port = vehicle.address
+                return await dvd.run_attack("mavlink_flood", target_ip=host, mavlink_port=port, **params)
+
+        result = asyncio.run(run())
+        self.assertEqual(result.status.value, "success")
+        self.assertEqual([step["target_rate"] for step in result.details["steps"]], [1000, 2000, 3000])
+
+if __name__ == "__main__":
+    unittest.main()
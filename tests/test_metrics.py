@@ -0,0 +1,90 @@
+"""
+메트릭 수집 테스트
+"""
+import asyncio
+import unittest
+import sys
+import os
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dvd_lite.metrics import MetricsRegistry, MetricsServer, RateMeter
+
+class TestMetricsRegistry(unittest.TestCase):
+
+    def test_disabled_registry_records_nothing(self):
+        """비활성 상태에서는 no-op"""
+        registry = MetricsRegistry(enabled=False)
+        registry.counter("dvd_test_total").inc()
+        with registry.span("dvd_test_seconds"):
+            pass
+
+        self.assertEqual(registry.counter("dvd_test_total").labels().value, 0)
+        self.assertNotIn("dvd_test_seconds", registry.render_prometheus())
+
+    def test_histogram_buckets_and_render(self):
+        """고정 버킷 누적 개수와 Prometheus 텍스트 형식"""
+        registry = MetricsRegistry(enabled=True)
+        histogram = registry.histogram("dvd_probe_seconds", "프로브 시간", buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 0.7, 3.0):
+            histogram.labels(scanner="test").observe(value)
+        registry.counter("dvd_attack_results_total", "공격 결과").labels(attack="GPSSpoofing", status="success").inc(2)
+
+        text = registry.render_prometheus()
+
+        self.assertIn('dvd_probe_seconds_bucket{scanner="test",le="0.1"} 1', text)
+        self.assertIn('dvd_probe_seconds_bucket{scanner="test",le="1.0"} 3', text)
+        self.assertIn('dvd_probe_seconds_bucket{scanner="test",le="+Inf"} 4', text)
+        self.assertIn('dvd_probe_seconds_count{scanner="test"} 4', text)
+        self.assertIn('dvd_attack_results_total{attack="GPSSpoofing",status="success"} 2.0', text)
+        self.assertIn("# TYPE dvd_probe_seconds histogram", text)
+
+    def test_span_records_elapsed(self):
+        """구간 측정이 히스토그램에 기록"""
+        registry = MetricsRegistry(enabled=True)
+        with registry.span("dvd_phase_seconds", phase="run"):
+            sum(range(1000))
+
+        child = registry.histogram("dvd_phase_seconds").labels(phase="run")
+        self.assertEqual(child.count, 1)
+        self.assertGreater(child.sum, 0)
+
+    def test_rate_meter_window(self):
+        """처리율은 누적값이 아닌 최근 구간 기준"""
+        current = [0.0]
+        meter = RateMeter(window=10.0, clock=lambda: current[0])
+
+        for _ in range(100):
+            current[0] += 0.1
+            meter.mark()
+        self.assertAlmostEqual(meter.rate(), 10.0, delta=0.2)
+
+        current[0] += 20.0
+        self.assertEqual(meter.rate(), 0.0)
+
+    def test_metrics_endpoint(self):
+        """localhost /metrics 엔드포인트"""
+        registry = MetricsRegistry(enabled=True)
+        registry.gauge("dvd_queue_depth", "큐 길이").set(3)
+
+        async def fetch():
+            server = MetricsServer(registry, port=0)
+            await server.start()
+            try:
+                reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+                writer.write(b"GET /metrics HTTP/1.1\r\nHost: localhost\r\n\r\n")
+                await writer.drain()
+                response = await reader.read()
+                writer.close()
+                return response.decode()
+            finally:
+                await server.stop()
+
+        response = asyncio.run(fetch())
+
+        self.assertTrue(response.startswith("HTTP/1.1 200 OK"))
+        self.assertIn("dvd_queue_depth 3.0", response)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+"""
+미션 전송 엔진 테스트
+"""
+import asyncio
+import unittest
+import sys
+import os
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dvd_lite.mavlink import MAVLinkClient
+from dvd_lite.sitl import StandInVehicle
+from dvd_lite.main import DVDLite
+from dvd_lite.dvd_attacks.injection.mission_engine import (
+    MissionTransfer, MissionTransferError, generate_waypoints, NUMPY_AVAILABLE
+)
+
+CENTER = (37.7749, -122.4194)
+
+@unittest.skipUnless(NUMPY_AVAILABLE, "numpy 필요")
+class TestMissionTransfer(unittest.TestCase):
+
+    def _upload(self, count, window, **vehicle_options):
+        async def run():
+            async with StandInVehicle(seed=3, **vehicle_options) as vehicle:
+                async with await MAVLinkClient.connect(vehicle.address) as client:
+                    columns = generate_waypoints("lawnmower", *CENTER, count=count)
+                    report = await MissionTransfer(client, window=window, timeout=0.1).upload(columns)
+                    return columns, report, vehicle
+        return asyncio.run(run())
+
+    def test_waypoint_patterns(self):
+        """패턴별 웨이포인트 열 생성"""
+        orbit = generate_waypoints("orbit", *CENTER, count=8, radius=100.0)
+        self.assertEqual(list(orbit["seq"]), list(range(8)))
+        self.assertEqual(int(orbit["x"][0]), round((CENTER[0] + 100.0 / 111194.9) * 1e7))
+
+        line = generate_waypoints("line", *CENTER, count=4, target=(37.8, -122.4))
+        self.assertEqual(int(line["x"][-1]), 378000000)
+        self.assertEqual(int(line["y"][-1]), -1224000000)
+
+        with self.assertRaises(ValueError):
+            generate_waypoints("spiral", *CENTER, count=3)
+
+    def test_pipelined_upload(self):
+        """앞서 보내기로 항목 수만큼 기다리지 않음"""
+        columns, pipelined, vehicle = self._upload(300, window=32, response_delay=0.005)
+        _, stop_and_wait, _ = self._upload(60, window=1, response_delay=0.005)
+
+        self.assertEqual([item["x"] for item in vehicle.mission], list(columns["x"]))
+        self.assertEqual(pipelined.retransmissions, 0)
+        # 항목당 시간: 요청-응답 방식은 항목마다 왕복 지연을 기다림
+        self.assertLess(pipelined.elapsed / 300, stop_and_wait.elapsed / 60 / 5)
+
+    def test_lossy_upload_retransmits_only_lost_items(self):
+        """유실된 항목 수만큼만 재전송"""
+        columns, report, vehicle = self._upload(300, window=32, drop_rate=0.05)
+
+        self.assertEqual([item["seq"] for item in vehicle.mission], list(range(300)))
+        self.assertGreater(vehicle.statistics["dropped"], 0)
+        self.assertLessEqual(report.retransmissions, vehicle.statistics["dropped"])
+
+    def test_download_roundtrip(self):
+        """업로드한 미션을 그대로 내려받음"""
+        async def run():
+            async with StandInVehicle() as vehicle:
+                async with await MAVLinkClient.connect(vehicle.address) as client:
+                    transfer = MissionTransfer(client, timeout=0.1)
+                    columns = generate_waypoints("orbit", *CENTER, count=120)
+                    await transfer.upload(columns)
+                    downloaded, report = await transfer.download()
+                    return columns, downloaded, report
+
+        columns, downloaded, report = asyncio.run(run())
+        self.assertEqual(report.items, 120)
+        self.assertEqual(list(downloaded["x"]), list(columns["x"]))
+        self.assertEqual(list(downloaded["y"]), list(columns["y"]))
+
+    def test_unreachable_target(self):
+        """응답이 없으면 재시도 후 MissionTransferError"""
+        async def run():
+            async with await MAVLinkClient.connect(("127.0.0.1", 9)) as client:
+                await MissionTransfer(client, timeout=0.01, max_retries=2).upload(
+                    generate_waypoints("line", *CENTER, count=3))
+
+        with self.assertRaises(MissionTransferError):
+            asyncio.run(run())
+
+    def test_live_flight_plan_injection(self):
+        """live=True면 기존 미션을 백업하고 악성 미션으로 교체"""
+        from dvd_lite.dvd_attacks import register_all_dvd_attacks
+        register_all_dvd_attacks()
+        dvd = DVDLite(config_path="nonexistent.json")
+
+        async def run():
+            async with StandInVehicle() as vehicle:
+                vehicle.mission = [{"seq": 0, "x": 1, "y": 2, "z": 10.0, "command": 16}]
+                host, port = vehicle.address
+                result = await dvd.run_attack("flight_plan_injection", live=True, target_ip=host,
+                                              mavlink_port=port, waypoint_count=250, verify=True)
+                return result, vehicle.mission
+
+        result, mission = asyncio.run(run())
+        self.assertEqual(result.status.value, "success")
+        self.assertEqual(len(mission), 250)
+        self.assertEqual(result.details["original_items"], 1)
+        self.assertTrue(result.details["verified"])
+        self.assertIn("MISSION_BACKUP:1_items", result.iocs)
+
+class TestWaypointInject(unittest.TestCase):
+
+    def _run(self):
+        from dvd_lite import clock
+        from dvd_lite.attacks import WaypointInject
+        dvd = DVDLite(config_path="nonexistent.json")
+        dvd.register_attack("waypoint_inject", WaypointInject)
+        return clock.run(dvd.run_attack("waypoint_inject"), virtual_time=True)
+
+    @unittest.skipUnless(NUMPY_AVAILABLE, "numpy 필요")
+    def test_divert_mission(self):
+        result = self._run()
+        self.assertEqual(result.details["mission_items"], 10)
+        self.assertTrue(result.iocs[0].startswith("WAYPOINT_INJECTED:"))
+
+    def test_without_numpy(self):
+        """numpy가 없으면 미션을 만들지 않고 waypoint_count만 보고"""
+        from unittest import mock
+        with mock.patch("dvd_lite.attacks.NUMPY_AVAILABLE", False), \
+                mock.patch("dvd_lite.attacks.generate_waypoints", side_effect=AssertionError):
+            result = self._run()
+        self.assertEqual(result.details["mission_items"], 10)
+        self.assertTrue(result.iocs[0].startswith("WAYPOINT_INJECTED:"))
+
+if __name__ == "__main__":
+    unittest.main()
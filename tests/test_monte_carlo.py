@@ -0,0 +1,89 @@
+"""
+몬테카를로 성공률 추정기 테스트
+"""
+import unittest
+import sys
+import os
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dvd_lite.dvd_attacks.utils.common import calculate_success_probability, NUMPY_AVAILABLE
+from dvd_lite.dvd_attacks.utils.monte_carlo import wilson_interval
+from dvd_lite.dvd_attacks.core import StochasticModel, AttackResult, AttackStatus, AttackType
+
+@unittest.skipUnless(NUMPY_AVAILABLE, "numpy 필요")
+class TestMonteCarloEngine(unittest.TestCase):
+
+    def _engine(self, **kwargs):
+        from dvd_lite.dvd_attacks.utils.monte_carlo import MonteCarloEngine
+        return MonteCarloEngine(**dict(dict(trials=200_000, batch_size=50_000, seed=7), **kwargs))
+
+    def test_estimate_matches_model(self):
+        """추정치가 해석적 성공 확률을 신뢰구간 안에 포함"""
+        model = StochasticModel(success_probability=0.3, duration_min=1.0, duration_max=3.0,
+                                trials=10, min_successes=1)
+        estimate = self._engine().estimate("mavlink_service_discovery", model)
+
+        expected = 1 - 0.7 ** 10
+        self.assertEqual(estimate.trials, 200_000)
+        self.assertLessEqual(estimate.ci_low, expected)
+        self.assertGreaterEqual(estimate.ci_high, expected)
+        self.assertAlmostEqual(estimate.mean_duration, 2.0, places=2)
+
+    def test_deterministic_across_layouts(self):
+        """같은 시드면 단일/전체, 직렬/프로세스 풀 실행 결과가 동일"""
+        models = {
+            "a": StochasticModel(success_probability=0.7, duration_min=1.0, duration_max=3.0),
+            "b": StochasticModel(success_probability=0.4)
+        }
+        serial = self._engine().estimate_all(models)
+        pooled = self._engine(max_workers=2).estimate_all(models, use_processes=True)
+        single = self._engine().estimate("a", models["a"])
+
+        self.assertEqual(serial, pooled)
+        self.assertEqual(serial["a"], single)
+
+    def test_compare_with_live(self):
+        """실제 AttackResult 통계와 비교"""
+        estimates = self._engine().estimate_all({
+            "gps_spoofing": StochasticModel(success_probability=0.7, duration_min=1.0, duration_max=3.0)
+        })
+        results = [
+            AttackResult(
+                attack_id=f"gps_{i}", attack_name="GPSSpoofing", attack_type=AttackType.RECONNAISSANCE,
+                status=AttackStatus.SUCCESS if i % 10 < 7 else AttackStatus.FAILED,
+                success_rate=0.7, response_time=2.0, timestamp=0.0, target="10.13.0.2",
+                iocs=[], details={}
+            )
+            for i in range(100)
+        ]
+
+        comparison = self._engine().compare_with_live(estimates, results)["gps_spoofing"]
+
+        self.assertEqual(comparison["live_trials"], 100)
+        self.assertEqual(comparison["live_successes"], 70)
+        self.assertTrue(comparison["consistent"])
+
+    def test_vectorized_success_probability(self):
+        """배열 입력 시 원소별 계산 및 [0, 1] 범위 제한"""
+        import numpy as np
+
+        rates = calculate_success_probability(np.array([0.2, 0.5, 0.9]), [1.5, np.array([1.0, 1.0, 2.0])])
+        np.testing.assert_allclose(rates, [0.3, 0.75, 1.0])
+
+class TestWilsonInterval(unittest.TestCase):
+
+    def test_known_interval(self):
+        """윌슨 신뢰구간 기준값"""
+        low, high = wilson_interval(70, 100)
+        self.assertAlmostEqual(low, 0.6041, places=3)
+        self.assertAlmostEqual(high, 0.7810, places=3)
+
+    def test_scalar_success_probability(self):
+        """스칼라 입력은 기존 동작 유지"""
+        self.assertEqual(calculate_success_probability(0.8, [2.0]), 1.0)
+        self.assertAlmostEqual(calculate_success_probability(0.5, [0.5]), 0.25)
+
+if __name__ == "__main__":
+    unittest.main()
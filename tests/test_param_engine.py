@@ -0,0 +1,115 @@
+"""
+파라미터 엔진 테스트
+"""
+import asyncio
+import os
+import sys
+import tempfile
+import unittest
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dvd_lite.mavlink import MAVLinkClient
+from dvd_lite.sitl import StandInVehicle
+from dvd_lite.main import DVDLite
+from dvd_lite.dvd_attacks.injection.param_engine import (
+    ParameterEngine, ParamSnapshot, ParamTransferError, NUMPY_AVAILABLE
+)
+
+@unittest.skipUnless(NUMPY_AVAILABLE, "numpy 필요")
+class TestParamSnapshot(unittest.TestCase):
+
+    def test_lookup_and_diff(self):
+        """이름 조회와 변경/추가/삭제 비교"""
+        before = ParamSnapshot.from_dict({"RTL_ALT": 1500.0, "FENCE_ENABLE": 1.0, "GPS_TYPE": 1.0})
+        after = ParamSnapshot.from_dict({"FENCE_ENABLE": 0.0, "RTL_ALT": 1500.0, "LOG_BITMASK": 1.0})
+
+        self.assertEqual(before.get("RTL_ALT"), 1500.0)
+        self.assertIsNone(before.get("NO_SUCH_PARAM"))
+        self.assertNotIn("LOG_BITMASK", before)
+
+        diff = before.diff(after)
+        self.assertEqual(diff.changed, {"FENCE_ENABLE": (1.0, 0.0)})
+        self.assertEqual(diff.added, {"LOG_BITMASK": 1.0})
+        self.assertEqual(diff.removed, {"GPS_TYPE": 1.0})
+        self.assertFalse(before.diff(before))
+
+    def test_save_load(self):
+        snapshot = ParamSnapshot.from_dict({"BATT_CAPACITY": (5000.0, 6), "WPNAV_SPEED": 500.0})
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "params.npz")
+            snapshot.save(path)
+            loaded = ParamSnapshot.load(path)
+        self.assertEqual(loaded.to_dict(), snapshot.to_dict())
+        self.assertEqual(loaded.param_type("BATT_CAPACITY"), 6)
+
+@unittest.skipUnless(NUMPY_AVAILABLE, "numpy 필요")
+class TestParameterEngine(unittest.TestCase):
+
+    def _run(self, action, **vehicle_options):
+        async def run():
+            async with StandInVehicle(seed=7, **vehicle_options) as vehicle:
+                async with await MAVLinkClient.connect(vehicle.address) as client:
+                    return await action(ParameterEngine(client, timeout=0.1)), vehicle
+        return asyncio.run(run())
+
+    def test_full_dump(self):
+        (snapshot, report), vehicle = self._run(lambda engine: engine.fetch_all())
+        self.assertEqual(report.count, 1000)
+        self.assertEqual(report.missing, 0)
+        self.assertEqual(snapshot.to_dict(), {name: value for name, (value, _) in vehicle.parameters.items()})
+
+    def test_lossy_dump_rerequests_missing_indices(self):
+        """스트림에서 빠진 인덱스만 재요청"""
+        (snapshot, report), vehicle = self._run(lambda engine: engine.fetch_all(), tx_drop_rate=0.05)
+        self.assertEqual(len(snapshot), 1000)
+        self.assertEqual(report.missing, 0)
+        self.assertGreater(report.rerequested, 0)
+        # 전체 재요청이 아니라 유실된 항목 근처 수만큼만
+        self.assertLess(report.rerequested, vehicle.statistics["tx_dropped"] * 2)
+
+    def test_set_many_verifies_echo(self):
+        """PARAM_SET 응답 값으로 검증 - 정수형 파라미터는 기체가 반올림"""
+        async def action(engine):
+            before, _ = await engine.fetch_all()
+            report = await engine.set_many({"FENCE_ENABLE": 0, "RTL_ALT": 2.6, "WPNAV_SPEED": 1234.5}, before)
+            after, _ = await engine.fetch_all()
+            return report, before.diff(after)
+
+        (report, diff), vehicle = self._run(action, tx_drop_rate=0.05, drop_rate=0.05)
+        self.assertEqual(report.applied, {"FENCE_ENABLE": 0.0, "WPNAV_SPEED": 1234.5})
+        self.assertEqual(report.mismatched, {"RTL_ALT": (2.6, 3.0)})
+        self.assertEqual(report.failed, [])
+        self.assertEqual(set(diff.changed), {"FENCE_ENABLE", "RTL_ALT", "WPNAV_SPEED"})
+        self.assertEqual(vehicle.parameters["RTL_ALT"][0], 3.0)
+
+    def test_unreachable_target(self):
+        async def run():
+            async with await MAVLinkClient.connect(("127.0.0.1", 9)) as client:
+                await ParameterEngine(client, timeout=0.01, max_retries=2).fetch_all()
+
+        with self.assertRaises(ParamTransferError):
+            asyncio.run(run())
+
+    def test_live_parameter_manipulation(self):
+        """live=True면 안전 파라미터를 해제하고 전후 차이를 IOC로 남김"""
+        from dvd_lite.dvd_attacks import register_all_dvd_attacks
+        register_all_dvd_attacks()
+        dvd = DVDLite(config_path="nonexistent.json")
+
+        async def run():
+            async with StandInVehicle() as vehicle:
+                host, port = vehicle.address
+                result = await dvd.run_attack("parameter_manipulation", live=True, target_ip=host,
+                                              mavlink_port=port, timeout=0.1)
+                return result, vehicle.parameters
+
+        result, parameters = asyncio.run(run())
+        self.assertEqual(result.status.value, "success")
+        self.assertEqual(parameters["FENCE_ENABLE"][0], 0.0)
+        self.assertIn("PARAM_MODIFIED:FENCE_ENABLE=1->0", result.iocs)
+        self.assertIn("PARAM_DUMP:127.0.0.1:1000_params", result.iocs)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+"""
+프로파일링 훅 테스트
+"""
+import asyncio
+import json
+import pstats
+import tempfile
+import unittest
+import sys
+import os
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dvd_lite.profiling import ProfilingConfig, ProfileSession
+from dvd_lite.main import DVDLite, BaseAttack, AttackType
+
+def _busy(iterations: int = 20000) -> int:
+    return sum(i * i for i in range(iterations))
+
+class _BusyAttack(BaseAttack):
+    def _get_attack_type(self):
+        return AttackType.RECONNAISSANCE
+
+    async def _run_attack(self):
+        _busy()
+        await asyncio.sleep(0)
+        return True, 1.0, {}
+
+class TestProfileSession(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def _run(self, mode, workload=_busy):
+        config = ProfilingConfig(mode=mode, output_dir=self.tmp.name, sample_interval=0.001)
+        with ProfileSession(config, "unit") as session:
+            workload()
+        return session
+
+    def test_cprofile_writes_pstats_and_overhead(self):
+        """cProfile 결과와 오버헤드 보고서 저장"""
+        session = self._run("cprofile")
+        stats = pstats.Stats(session.files[0])
+        self.assertTrue(any(func[2] == "_busy" for func in stats.stats))
+
+        with open(session.files[-1]) as f:
+            report = json.load(f)
+        self.assertEqual(report["mode"], "cprofile")
+        self.assertGreater(report["calibrated_slowdown"], 0)
+        self.assertGreaterEqual(report["wall_seconds"], 0)
+
+    def test_sampling_writes_folded_stacks(self):
+        """샘플링 결과는 'frame;frame count' 형식"""
+        def workload():
+            import time
+            end = time.perf_counter() + 0.05
+            while time.perf_counter() < end:
+                _busy(1000)
+
+        session = self._run("sampling", workload)
+        lines = Path(session.files[0]).read_text().splitlines()
+        self.assertTrue(lines)
+        stack, count = lines[0].rsplit(" ", 1)
+        self.assertIn(";", stack)
+        self.assertGreater(int(count), 0)
+        self.assertGreater(session.report["samples"], 0)
+
+    def test_tracemalloc_snapshot(self):
+        """tracemalloc 스냅샷과 상위 할당 목록 저장"""
+        session = self._run("tracemalloc", lambda: [bytes(1024) for _ in range(100)])
+        self.assertTrue(any(path.endswith(".snapshot") for path in session.files))
+        self.assertIn("peak", session.report["traced_memory"])
+
+    def test_nested_session_is_noop(self):
+        """중첩 세션은 바깥 세션만 기록"""
+        config = ProfilingConfig(mode="cprofile", output_dir=self.tmp.name)
+        with ProfileSession(config, "outer") as outer:
+            with ProfileSession(config, "inner") as inner:
+                _busy(100)
+        self.assertTrue(outer.files)
+        self.assertEqual(inner.files, [])
+
+    def test_from_argv_strips_options(self):
+        """데모 스크립트 인자 파싱"""
+        argv = ["quick_start.py", "single", "--profile", "sampling", "--profile-attacks", "a,b"]
+        config = ProfilingConfig.from_argv(argv)
+        self.assertEqual(argv, ["quick_start.py", "single"])
+        self.assertEqual(config.mode, "sampling")
+        self.assertEqual(config.attacks, ["a", "b"])
+        self.assertFalse(ProfilingConfig.from_argv(["x"]).enabled)
+        with self.assertRaises(ValueError):
+            ProfilingConfig(mode="perf")
+
+    def test_dvdlite_profiles_selected_attacks(self):
+        """DVDLite는 지정한 공격만 프로파일"""
+        dvd = DVDLite(config_path="nonexistent.json")
+        dvd.register_attack("busy", _BusyAttack)
+        dvd.register_attack("other", _BusyAttack)
+        dvd.enable_profiling("cprofile", self.tmp.name, attacks=["busy"])
+
+        async def run():
+            await dvd.run_attack("busy")
+            await dvd.run_attack("other")
+        asyncio.run(run())
+
+        profiles = sorted(path.name for path in Path(self.tmp.name).glob("*.pstats"))
+        self.assertEqual(len(profiles), 1)
+        self.assertTrue(profiles[0].startswith("attack_busy_"))
+
+if __name__ == "__main__":
+    unittest.main()
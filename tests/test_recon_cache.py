@@ -0,0 +1,153 @@
+"""
+정찰 결과 캐시 테스트
+"""
+import unittest
+import sys
+import os
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dvd_lite import clock
+from dvd_lite.recon_cache import ReconCache
+from dvd_lite.main import DVDLite
+from dvd_connector.network_scanner import (
+    NetworkScanResult, NetworkDevice, NetworkService, ServiceType, diff_scan_results
+)
+
+def _scan(services_by_ip):
+    devices = [
+        NetworkDevice(ip=ip, services=[NetworkService(port=port, service_type=ServiceType.MAVLINK) for port in ports])
+        for ip, ports in services_by_ip.items()
+    ]
+    return NetworkScanResult("10.13.0.0/24", 256, len(devices), devices, [], 0.0, 0.0)
+
+class TestReconCache(unittest.TestCase):
+
+    def setUp(self):
+        self.time = 0.0
+        self.cache = ReconCache(clock=lambda: self.time)
+
+    def test_ttl_expiry(self):
+        """TTL이 지나면 캐시 항목 만료"""
+        self.cache.put("discovery", "10.13.0.2", {"ports": [14550]}, "result", ttl=60)
+
+        self.assertEqual(self.cache.get("discovery", "10.13.0.2", {"ports": [14550]}).result, "result")
+        self.assertIsNone(self.cache.get("discovery", "10.13.0.2", {"ports": [14551]}))
+        self.time = 61.0
+        self.assertIsNone(self.cache.get("discovery", "10.13.0.2", {"ports": [14550]}))
+        self.assertEqual(self.cache.statistics["hits"], 1)
+        self.assertEqual(self.cache.statistics["misses"], 2)
+
+    def test_findings_for_target(self):
+        """대상별 유효한 정찰 결과 조회"""
+        self.cache.put("discovery", "10.13.0.2", {}, "mavlink", ttl=60)
+        self.cache.put("wifi", "10.13.0.2", {}, "wifi", ttl=10)
+        self.cache.put("discovery", "10.13.0.3", {}, "other", ttl=60)
+        self.time = 20.0
+
+        self.assertEqual(self.cache.findings("10.13.0.2"), {"discovery": "mavlink"})
+
+    def test_invalidate_from_scan_diff(self):
+        """서비스가 바뀐 호스트만 무효화, 호스트 추가 시 전체 무효화"""
+        self.cache.put("discovery", "10.13.0.2", {}, "a", ttl=60)
+        self.cache.put("discovery", "10.13.0.3", {}, "b", ttl=60)
+
+        before = _scan({"10.13.0.2": [14550], "10.13.0.3": [14550]})
+        changed = _scan({"10.13.0.2": [14550, 5760], "10.13.0.3": [14550]})
+        self.assertEqual(self.cache.invalidate_from_diff(diff_scan_results(before, changed)), 1)
+        self.assertEqual(set(self.cache.findings("10.13.0.3")), {"discovery"})
+
+        added = _scan({"10.13.0.2": [14550, 5760], "10.13.0.3": [14550], "10.13.0.4": []})
+        diff = diff_scan_results(changed, added)
+        self.assertEqual(diff.added_hosts, ["10.13.0.4"])
+        self.assertEqual(self.cache.invalidate_from_diff(diff), 1)
+        self.assertEqual(len(self.cache), 0)
+
+    def test_dvd_lite_reuses_recon_result(self):
+        """cache_ttl 시나리오는 두 번째 실행에서 캐시 결과 사용"""
+        from dvd_lite.dvd_attacks import register_all_dvd_attacks
+        register_all_dvd_attacks()
+
+        dvd = DVDLite(config_path="nonexistent.json")
+        dvd.set_seed(2024)
+
+        async def run():
+            first = await dvd.run_attack("mavlink_service_discovery")
+            second = await dvd.run_attack("mavlink_service_discovery")
+            refreshed = await dvd.run_attack("mavlink_service_discovery", refresh_cache=True)
+            return first, second, refreshed
+
+        first, second, refreshed = clock.run(run(), virtual_time=True)
+        self.assertEqual(first.status.value, "success")
+        self.assertTrue(second.details["cache_hit"])
+        self.assertEqual(second.response_time, 0.0)
+        self.assertEqual(second.iocs, first.iocs)
+        self.assertNotIn("cache_hit", refreshed.details)
+        self.assertEqual(dvd.recon_cache.statistics["hits"], 1)
+
+class FakeScanner:
+    """미리 정한 스캔 결과를 차례로 돌려주는 스캐너"""
+
+    def __init__(self, *scans):
+        self.scans = list(scans)
+
+    async def scan_network(self, network_range, quick_scan=False, deep_scan=False):
+        return self.scans.pop(0)
+
+class TestReconCacheScanRounds(unittest.TestCase):
+
+    def test_scan_rounds_invalidate_and_enumeration_uses_findings(self):
+        """라운드마다 스캔 차분으로 캐시를 무효화하고, 캐시 적중 / 정찰 결과 사용이 결과와 버스에 남음"""
+        from integrated_dvd_testbed import DVDRealtimeConnector, DVDConnectorConfig
+        from dvd_lite.dvd_attacks import register_all_dvd_attacks
+        register_all_dvd_attacks()
+
+        connector = DVDRealtimeConnector(DVDConnectorConfig(seed=2024, network_scan=True, cpu_workers=0))
+        dvd = connector.dvd_lite
+        connector.network_scanner = FakeScanner(
+            _scan({"10.13.0.2": [14550]}),
+            _scan({"10.13.0.2": [14550]}),
+            _scan({"10.13.0.2": [14550, 5760]})
+        )
+        published = []
+
+        async def collect(batch):
+            published.extend(batch)
+
+        async def round_():
+            diff = await connector.refresh_network_scan()
+            discovery = await dvd.run_attack("mavlink_service_discovery")
+            enumeration = await dvd.run_attack("drone_component_enumeration", refresh_cache=True)
+            return diff, discovery, enumeration
+
+        async def run():
+            dvd.result_bus.subscribe("test", collect)
+            rounds = [await round_() for _ in range(3)]
+            await dvd.result_bus.close()
+            return rounds
+
+        (first, second, third) = clock.run(run(), virtual_time=True)
+
+        # 1라운드: 기준 스캔, 정찰 실행 후 구성 요소 열거가 그 결과를 사용
+        self.assertIsNone(first[0])
+        self.assertNotIn("cache_hit", first[1].details)
+        self.assertEqual(first[2].details["recon_sources"], ["mavlink_service_discovery"])
+        services = first[1].details["discovered_services"]
+        self.assertEqual(len(first[2].details["components"]), len(services))
+
+        # 2라운드: 변경 없음 - 캐시 적중 결과도 결과 목록과 버스에 기록
+        self.assertFalse(second[0].has_changes)
+        self.assertTrue(second[1].details["cache_hit"])
+
+        # 3라운드: 대상 서비스 변경 - 캐시 무효화 후 정찰 재실행
+        self.assertEqual(third[0].changed_hosts, ["10.13.0.2"])
+        self.assertNotIn("cache_hit", third[1].details)
+
+        self.assertEqual(len(dvd.results), 6)
+        self.assertEqual(sum(1 for result in dvd.results if result.details.get("cache_hit")), 1)
+        self.assertEqual(len(published), 6)
+        self.assertEqual(dvd.recon_cache.statistics["invalidations"], 2)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+"""
+결과 이벤트 버스 테스트
+"""
+import asyncio
+import unittest
+import sys
+import os
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dvd_lite import clock
+from dvd_lite.bus import ResultBus, OverflowPolicy
+from dvd_lite.cti import SimpleCTI
+from dvd_lite.main import DVDLite, BaseAttack, AttackType
+
+class TestResultBus(unittest.TestCase):
+
+    def _slow_consumer(self, received, delay=1.0):
+        async def handler(batch):
+            await asyncio.sleep(delay)
+            received.append(list(batch))
+        return handler
+
+    def test_drop_policies(self):
+        """큐가 가득 차면 정책에 따라 새/오래된 이벤트를 버림"""
+        newest, oldest = [], []
+
+        async def run():
+            bus = ResultBus()
+            bus.subscribe("newest", self._slow_consumer(newest), maxsize=2, policy=OverflowPolicy.DROP_NEWEST)
+            bus.subscribe("oldest", self._slow_consumer(oldest), maxsize=2, policy=OverflowPolicy.DROP_OLDEST)
+            for event in range(6):
+                await bus.publish(event)
+            await bus.close()
+            return bus.get_statistics()
+
+        stats = clock.run(run(), virtual_time=True)
+
+        # 발행 중에는 소비 작업이 실행되지 않으므로 큐에는 2개만 남음
+        self.assertEqual(newest, [[0], [1]])
+        self.assertEqual(oldest, [[4], [5]])
+        self.assertEqual(stats["newest"]["dropped"], 4)
+        self.assertEqual(stats["oldest"]["delivered"], 2)
+
+    def test_block_policy_applies_backpressure(self):
+        """block 정책은 유실 없이 발행자를 대기시킴"""
+        received = []
+
+        async def run():
+            bus = ResultBus()
+            bus.subscribe("slow", self._slow_consumer(received), maxsize=1)
+            start = clock.now()
+            for event in range(4):
+                await bus.publish(event)
+            elapsed = clock.now() - start
+            await bus.close()
+            return elapsed, bus.get_statistics()["slow"]
+
+        elapsed, stats = clock.run(run(), virtual_time=True)
+        self.assertEqual([event for batch in received for event in batch], [0, 1, 2, 3])
+        self.assertGreaterEqual(elapsed, 2.0)
+        self.assertGreater(stats["blocked_seconds"], 0)
+
+    def test_batching(self):
+        """batch_size/batch_timeout에 따라 이벤트를 묶어서 전달"""
+        batches = []
+
+        async def handler(batch):
+            batches.append(list(batch))
+
+        async def run():
+            bus = ResultBus()
+            bus.subscribe("batched", handler, batch_size=3, batch_timeout=0.5)
+            for event in range(5):
+                await bus.publish(event)
+            await asyncio.sleep(1.0)
+            await bus.publish(5)
+            await bus.close()
+
+        clock.run(run(), virtual_time=True)
+        self.assertEqual(batches, [[0, 1, 2], [3, 4], [5]])
+
+    def test_cti_consumes_from_bus(self):
+        """CTI는 공격 실행과 분리되어 버스에서 결과를 수집"""
+        class Probe(BaseAttack):
+            def _get_attack_type(self):
+                return AttackType.RECONNAISSANCE
+
+            async def _run_attack(self):
+                return True, ["PORT:10.13.0.2:14550"], {}
+
+        class SlowCTI(SimpleCTI):
+            async def collect_from_result(self, attack_result):
+                await asyncio.sleep(10)
+                await super().collect_from_result(attack_result)
+
+        dvd = DVDLite(config_path="nonexistent.json")
+        dvd.register_attack("probe", Probe)
+        cti = SlowCTI()
+        dvd.register_cti_collector(cti)
+
+        async def run():
+            start = clock.now()
+            await dvd.run_attack("probe")
+            attack_elapsed = clock.now() - start
+            await dvd.drain_results()
+            return attack_elapsed
+
+        attack_elapsed = clock.run(run(), virtual_time=True)
+        self.assertLess(attack_elapsed, 10)
+        self.assertEqual(cti.get_summary()["total_indicators"], 1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+"""
+실험 난수 서비스 테스트
+"""
+import asyncio
+import unittest
+import sys
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dvd_lite import clock
+from dvd_lite.main import DVDLite
+from dvd_lite.rng import ExperimentRNG
+
+def _draw(rng: ExperimentRNG):
+    """프로세스 풀 작업 - 스트림에서 난수 추출"""
+    return [rng.random.random() for _ in range(5)]
+
+class TestExperimentRNG(unittest.TestCase):
+
+    def test_streams_keyed_by_path(self):
+        """같은 시드/경로면 동일, 경로가 다르면 독립 스트림"""
+        first = ExperimentRNG(1234).spawn("campaign", 0, "gps_spoofing", 1)
+        second = ExperimentRNG(1234).spawn("campaign", 0).spawn("gps_spoofing", 1)
+        other = ExperimentRNG(1234).spawn("campaign", 0, "gps_spoofing", 2)
+
+        self.assertEqual(_draw(first), _draw(second))
+        self.assertNotEqual(_draw(ExperimentRNG(1234).spawn("campaign", 0, "gps_spoofing", 1)), _draw(other))
+
+    def test_process_pool_matches_serial(self):
+        """프로세스 풀 실행 결과가 직렬 실행과 동일"""
+        streams = [ExperimentRNG(99).spawn("trial", i) for i in range(4)]
+        serial = [_draw(ExperimentRNG(99).spawn("trial", i)) for i in range(4)]
+
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            pooled = list(pool.map(_draw, streams))
+
+        self.assertEqual(serial, pooled)
+
+    def test_metadata_records_seed(self):
+        """메타데이터에 시드 기록"""
+        metadata = ExperimentRNG(42).spawn("campaign", 3).metadata()
+        self.assertEqual(metadata["seed"], 42)
+        self.assertEqual(metadata["path"], ["campaign", "3"])
+
+class TestReproducibleAttacks(unittest.TestCase):
+
+    ATTACKS = ["gps_spoofing", "mavlink_flood", "mavlink_service_discovery", "wifi_network_discovery"]
+
+    def _run(self, parallel: bool):
+        from dvd_lite.dvd_attacks import register_all_dvd_attacks
+        register_all_dvd_attacks()
+
+        dvd = DVDLite()
+        dvd.set_seed(2024)
+        streams = {name: dvd.rng.spawn("campaign", 0, name) for name in self.ATTACKS}
+
+        async def run():
+            if parallel:
+                return await asyncio.gather(*[dvd.run_attack(name, rng=streams[name]) for name in self.ATTACKS])
+            return [await dvd.run_attack(name, rng=streams[name]) for name in self.ATTACKS]
+
+        results = clock.run(run(), virtual_time=True)
+        return [(r.status, round(r.response_time, 9), r.iocs, r.details) for r in results]
+
+    def test_parallel_matches_serial(self):
+        """같은 시드면 병렬 실행과 직렬 실행 결과가 동일"""
+        self.assertEqual(self._run(parallel=True), self._run(parallel=False))
+
+    def test_trial_streams_advance(self):
+        """스트림 미지정 시 공격별 시행 번호로 재현 가능한 스트림 사용"""
+        first = DVDLite()
+        first.set_seed(7)
+        second = DVDLite()
+        second.set_seed(7)
+
+        self.assertEqual(
+            _draw(first.attack_rng("gps_spoofing")), _draw(second.attack_rng("gps_spoofing"))
+        )
+        self.assertEqual(first.attack_rng("gps_spoofing").path, ("attack", "gps_spoofing", 1))
+
+if __name__ == "__main__":
+    unittest.main()
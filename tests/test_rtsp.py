@@ -0,0 +1,171 @@
+"""
+RTSP 클라이언트 / RTP 역패킷화 테스트
+"""
+import asyncio
+import os
+import sys
+import tempfile
+import unittest
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dvd_lite.main import DVDLite
+from dvd_lite.sitl import StandInCamera
+from dvd_lite.rtsp import (
+    AccessUnit, Depacketizer, FrameRing, KeyFrameSampler, RTSPClient, RTSPError,
+    build_rtp, packetize_h264, parse_rtp, parse_sdp, sample_stream
+)
+
+def _packets(frames, start_sequence=0, mtu=1400):
+    """(타임스탬프, NAL 목록) 프레임 → RTP 패킷 목록"""
+    packets = []
+    sequence = start_sequence
+    for timestamp, nal_units in frames:
+        payloads = packetize_h264(nal_units, mtu)
+        for index, payload in enumerate(payloads):
+            packets.append(parse_rtp(build_rtp(96, index == len(payloads) - 1, sequence, timestamp, 7, payload)))
+            sequence = (sequence + 1) & 0xFFFF
+    return packets
+
+class TestDepacketizer(unittest.TestCase):
+
+    def setUp(self):
+        self.sps, self.pps = b"\x67\x42\xc0\x1f", b"\x68\xce\x3c\x80"
+        self.idr = b"\x65" + bytes(range(256)) * 20
+        self.slice = b"\x41" + b"\x01" * 600
+
+    def test_fu_a_and_stap_a_reassembly(self):
+        """큰 NAL은 FU-A, 파라미터 세트는 STAP-A로 보내도 원래 NAL로 복원 (시퀀스 랩어라운드 포함)"""
+        frames = [(0, [self.sps, self.pps, self.idr]), (3000, [self.slice])]
+        packets = _packets(frames, start_sequence=0xFFFE)
+        self.assertGreater(len(packets), 4)
+        depacketizer = Depacketizer()
+        units = [unit for unit in map(depacketizer.push, packets) if unit is not None]
+
+        self.assertEqual([unit.nal_units for unit in units], [[self.sps, self.pps, self.idr], [self.slice]])
+        self.assertEqual([unit.keyframe for unit in units], [True, False])
+        self.assertEqual(depacketizer.statistics["lost_packets"], 0)
+        self.assertTrue(units[0].annexb().startswith(b"\x00\x00\x00\x01\x67"))
+
+    def test_lost_fragment_drops_frame(self):
+        frames = [(0, [self.idr]), (3000, [self.slice]), (6000, [self.idr])]
+        packets = _packets(frames)
+        del packets[2]
+        depacketizer = Depacketizer()
+        units = [unit for unit in map(depacketizer.push, packets) if unit is not None]
+        self.assertEqual(len(units), 2)
+        self.assertEqual(depacketizer.statistics["lost_packets"], 1)
+        self.assertEqual(depacketizer.statistics["dropped_frames"], 1)
+
+    def test_lost_first_packet_drops_frame(self):
+        """프레임 첫 패킷을 잃으면 나머지 패킷이 온전해도 그 프레임은 버림"""
+        second_slice = b"\x41" + b"\x02" * 600
+        frames = [(0, [self.idr]), (3000, [self.slice, second_slice]), (6000, [self.slice])]
+        packets = _packets(frames)
+        first = next(index for index, packet in enumerate(packets) if packet.timestamp == 3000)
+        del packets[first]
+        depacketizer = Depacketizer()
+        units = [unit for unit in map(depacketizer.push, packets) if unit is not None]
+        self.assertEqual([unit.timestamp for unit in units], [0, 6000])
+        self.assertEqual(depacketizer.statistics["lost_packets"], 1)
+        self.assertEqual(depacketizer.statistics["dropped_frames"], 1)
+
+    def test_ring_and_sampler_are_bounded(self):
+        """링은 한도를 넘으면 오래된 프레임부터 버리고, 샘플러는 간격과 해시로 거름"""
+        ring = FrameRing(max_frames=10, max_bytes=10_000)
+        sampler = KeyFrameSampler(interval=1.0, max_samples=3, max_hashes=4)
+        for index in range(200):
+            scene = (index // 30) % 2
+            unit = AccessUnit(index * 9000, [bytes([0x65, scene]) * 1000], index % 5 == 0)
+            ring.append(unit)
+            sampler.offer(unit)
+        self.assertLessEqual(ring.bytes, 10_000)
+        self.assertEqual(len(ring), 5)
+        self.assertEqual(ring.evicted, 195)
+        # 0.1초 간격 프레임 중 5개마다 키 프레임 → 1초마다 하나만 해시
+        self.assertEqual(sampler.statistics["keyframes"], 40)
+        self.assertEqual(sampler.statistics["hashed"], 20)
+        self.assertEqual(sampler.statistics["unique"], 2)
+        self.assertEqual(sampler.statistics["duplicates"], 18)
+
+    def test_parse_sdp(self):
+        sdp = "v=0\r\na=control:*\r\nm=audio 0 RTP/AVP 0\r\na=control:trackID=1\r\n" \
+              "m=video 0 RTP/AVP 96\r\na=rtpmap:96 H264/90000\r\na=control:trackID=0\r\n"
+        tracks = parse_sdp(sdp, "rtsp://10.13.0.3:554/stream/")
+        self.assertEqual([track.media for track in tracks], ["audio", "video"])
+        self.assertEqual(tracks[1].codec, "H264")
+        self.assertEqual(tracks[1].control, "rtsp://10.13.0.3:554/stream/trackID=0")
+
+class TestRTSPSession(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_sample_stream(self):
+        """대체 카메라 스트림을 링 버퍼에 받고 반복 장면은 한 번만 저장"""
+        async def run():
+            async with StandInCamera(fps=100, gop=10, scene_keyframes=4, seed=1) as camera:
+                sampler = KeyFrameSampler(interval=0.2, output_dir=self.directory.name)
+                ring = FrameRing(max_frames=20)
+                report = await sample_stream(camera.url, 1.0, sampler, ring)
+                return report, dict(camera.statistics)
+
+        report, statistics = asyncio.run(run())
+        self.assertEqual(report.codec, "H264")
+        self.assertGreater(report.frames, 50)
+        self.assertEqual(report.lost_packets, 0)
+        self.assertEqual(report.ring_frames, 20)
+        self.assertEqual(report.evicted_frames, report.frames - 20)
+        # 키 프레임 0.1초마다, 장면은 0.4초마다 바뀜 → 샘플은 장면 수만큼
+        self.assertGreater(report.sampler["duplicates"], 0)
+        self.assertEqual(report.sampler["unique"], len(report.samples))
+        self.assertEqual(len(os.listdir(self.directory.name)), len(report.samples))
+        with open(report.samples[0].path, "rb") as f:
+            self.assertTrue(f.read().startswith(b"\x00\x00\x00\x01\x67"))
+        self.assertEqual(statistics["sessions"], 1)
+
+    def test_errors(self):
+        async def run():
+            async with StandInCamera() as camera:
+                host, port = camera.address
+                async with await RTSPClient.connect(f"rtsp://{host}:{port}/missing") as client:
+                    self.assertIn("DESCRIBE", await client.options())
+                    with self.assertRaises(RTSPError) as context:
+                        await client.describe()
+                    self.assertEqual(context.exception.status, 404)
+            with self.assertRaises(RTSPError):
+                await RTSPClient.connect("rtsp://127.0.0.1:9/stream", timeout=1.0)
+
+        asyncio.run(run())
+
+    def test_live_attacks(self):
+        """CameraStreamDiscovery가 찾은 스트림을 VideoStreamHijacking이 탈취"""
+        from dvd_lite.dvd_attacks import register_all_dvd_attacks
+        register_all_dvd_attacks()
+        dvd = DVDLite(config_path="nonexistent.json")
+
+        async def run():
+            async with StandInCamera(path="/live", fps=60, gop=15) as camera:
+                host, port = camera.address
+                discovery = await dvd.run_attack("camera_stream_discovery", live=True, target_ip=host,
+                                                 rtsp_ports=[port, 9])
+                hijack = await dvd.run_attack("video_stream_hijacking", live=True,
+                                              stream_url=discovery.details["streams"][0]["url"],
+                                              duration=0.5, sample_interval=0.1)
+                return discovery, hijack
+
+        discovery, hijack = asyncio.run(run())
+        self.assertEqual(discovery.status.value, "success")
+        url = discovery.details["streams"][0]["url"]
+        self.assertTrue(url.endswith("/live"))
+        self.assertIn(f"RTSP_STREAM:{url}:H264", discovery.iocs)
+        self.assertEqual(hijack.status.value, "success")
+        self.assertTrue(any(ioc.startswith(f"RTSP_HIJACKED:{url}:H264:") for ioc in hijack.iocs))
+        self.assertTrue(any(ioc.startswith("VIDEO_KEYFRAME:") for ioc in hijack.iocs))
+
+if __name__ == "__main__":
+    unittest.main()
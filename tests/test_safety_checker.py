@@ -0,0 +1,384 @@
+"""
+안전성 검사기 테스트
+"""
+import asyncio
+import unittest
+import sys
+import os
+import tempfile
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dvd_connector.safety_checker import SafetyChecker, SafetyCheckResult, SafetyLevel, NetworkType
+
+SIM_CONFIG = {
+    "host": "localhost",
+    "dvd_network": "10.13.0.0/24",
+    "environment": "SIMULATION",
+    "simulation_mode": True,
+    "safety_enabled": True
+}
+
+class TestSafetyCheckerConcurrency(unittest.TestCase):
+
+    def test_scan_ports_concurrent(self):
+        """열린 포트만 반환하고 프로브는 동시에 수행"""
+        async def scan():
+            server = await asyncio.start_server(lambda r, w: w.close(), "127.0.0.1", 0)
+            open_port = server.sockets[0].getsockname()[1]
+
+            checker = SafetyChecker(probe_timeout=0.5)
+            try:
+                return open_port, await checker._scan_ports("127.0.0.1", [open_port, 1])
+            finally:
+                server.close()
+                await server.wait_closed()
+
+        open_port, open_ports = asyncio.run(scan())
+        self.assertEqual(open_ports, [open_port])
+
+    def test_deadline_bounds_check(self):
+        """마감 시간을 넘긴 단계는 취소되고 위반으로 기록"""
+        checker = SafetyChecker(check_deadline=0.3)
+
+        async def slow_phase(*args, **kwargs):
+            await asyncio.sleep(30)
+
+        async def empty_phase(*args, **kwargs):
+            return {"devices": [], "violations": []}
+
+        checker._check_network_safety = slow_phase
+        checker._check_hardware_safety = empty_phase
+        checker._check_process_safety = empty_phase
+
+        start = time.monotonic()
+        result = asyncio.run(checker.comprehensive_safety_check(SIM_CONFIG))
+        elapsed = time.monotonic() - start
+
+        self.assertLess(elapsed, 2.0)
+        self.assertIn("안전성 검사 시간 초과: network", result.safety_violations)
+
+class TestSafetyCheckerCache(unittest.TestCase):
+
+    def setUp(self):
+        self.checker = SafetyChecker()
+        self.calls = []
+
+        def phase(name):
+            async def run(*args, **kwargs):
+                self.calls.append(name)
+                return {"devices": [], "violations": []}
+            return run
+
+        self.checker._check_network_safety = phase("network")
+        self.checker._check_hardware_safety = phase("hardware")
+        self.checker._check_process_safety = phase("process")
+
+    def test_unchanged_fingerprint_reuses_result(self):
+        """환경 지문이 같으면 이전 결과 재사용"""
+        async def run_twice():
+            first = await self.checker.comprehensive_safety_check(SIM_CONFIG)
+            second = await self.checker.comprehensive_safety_check(SIM_CONFIG)
+            return first, second
+
+        self.checker.compute_fingerprint = lambda config: self._fingerprint("p1", config)
+        first, second = asyncio.run(run_twice())
+
+        self.assertIs(first, second)
+        self.assertEqual(sorted(self.calls), ["hardware", "network", "process"])
+
+    def test_only_changed_phases_rerun(self):
+        """프로세스 집합만 바뀌면 프로세스 단계만 다시 실행"""
+        async def run():
+            self.checker.compute_fingerprint = lambda config: self._fingerprint("p1", config)
+            await self.checker.comprehensive_safety_check(SIM_CONFIG)
+            self.calls.clear()
+            self.checker.compute_fingerprint = lambda config: self._fingerprint("p2", config)
+            return await self.checker.comprehensive_safety_check(SIM_CONFIG)
+
+        result = asyncio.run(run())
+
+        self.assertEqual(self.calls, ["process"])
+        self.assertTrue(result.is_safe_to_proceed)
+
+    def _fingerprint(self, processes, config):
+        from dvd_connector.safety_checker import EnvironmentFingerprint
+        return EnvironmentFingerprint(
+            device_nodes="d", usb_devices="u", processes=processes,
+            target_config=str(sorted(config.items()))
+        )
+
+class TestSystemReaders(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _write(self, relative, data):
+        path = self.root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+
+    def test_read_process_cmdlines(self):
+        """/proc 명령줄 파싱 및 커널 스레드 처리"""
+        from dvd_connector.safety_checker import read_process_cmdlines
+
+        self._write("proc/12/cmdline", b"python3\0mavproxy.py\0--master=udp:0.0.0.0:14550\0")
+        self._write("proc/2/cmdline", b"")
+        self._write("proc/2/comm", b"kthreadd\n")
+        self._write("proc/self/cmdline", b"ignored\0")
+
+        processes = read_process_cmdlines(str(self.root / "proc"))
+
+        self.assertEqual(processes, {
+            12: "python3 mavproxy.py --master=udp:0.0.0.0:14550",
+            2: "[kthreadd]"
+        })
+
+    def test_read_usb_devices_and_matcher(self):
+        """USB sysfs 속성 읽기 및 플라이트 컨트롤러 시그니처 매칭"""
+        from dvd_connector.safety_checker import read_usb_devices, FLIGHT_CONTROLLER_MATCHER
+
+        for name, value in [("idVendor", b"2dae\n"), ("idProduct", b"1016\n"),
+                            ("manufacturer", b"Hex/ProfiCNC\n"), ("product", b"CubeOrange\n")]:
+            self._write(f"usb/1-1/{name}", value)
+        self._write("usb/1-1:1.0/bInterfaceClass", b"02\n")
+
+        devices = read_usb_devices(str(self.root / "usb"))
+
+        self.assertEqual(len(devices), 1)
+        self.assertEqual(devices[0]["bus_id"], "1-1")
+        self.assertEqual(devices[0]["product"], "CubeOrange")
+        self.assertIsNotNone(FLIGHT_CONTROLLER_MATCHER.search(devices[0]["product"]))
+
+class TestSafetyWatchdog(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        for name in ("proc", "dev", "usb"):
+            (self.root / name).mkdir()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _spawn(self, pid, cmdline):
+        path = self.root / "proc" / str(pid)
+        path.mkdir()
+        (path / "cmdline").write_bytes(cmdline)
+
+    def _watchdog(self):
+        from dvd_connector.watchdog import SafetyWatchdog
+        return SafetyWatchdog(
+            network_interval=0,
+            dev_path=str(self.root / "dev"),
+            proc_root=str(self.root / "proc"),
+            usb_sysfs_root=str(self.root / "usb")
+        )
+
+    def test_new_dangerous_process_trips(self):
+        """기준선 이후 새로 생긴 위험 프로세스만 감지"""
+        from dvd_connector.watchdog import WatchdogEventType
+
+        self._spawn(10, b"mavproxy.py\0--master=/dev/ttyACM0\0")
+        watchdog = self._watchdog()
+        received = []
+        watchdog.add_listener(received.append)
+
+        async def run():
+            await watchdog.start()
+            try:
+                watchdog.check_processes()
+                self.assertFalse(watchdog.tripped.is_set())
+
+                self._spawn(11, b"python3\0mavproxy.py\0--master=udp:0.0.0.0:14550\0")
+                watchdog.check_processes()
+            finally:
+                await watchdog.stop()
+
+        asyncio.run(run())
+
+        self.assertTrue(watchdog.tripped.is_set())
+        self.assertEqual(len(received), 1)
+        self.assertEqual(received[0].event_type, WatchdogEventType.DANGEROUS_PROCESS)
+        self.assertEqual(received[0].details["pid"], 11)
+
+    def test_serial_device_added(self):
+        """새 시리얼 디바이스 노드 감지"""
+        from dvd_connector.watchdog import WatchdogEventType
+
+        watchdog = self._watchdog()
+
+        async def run():
+            await watchdog.start()
+            try:
+                (self.root / "dev" / "ttyACM0").touch()
+                (self.root / "dev" / "null").touch()
+                for _ in range(50):
+                    if watchdog.tripped.is_set():
+                        break
+                    # inotify 미사용 환경에서는 폴링 경로로 직접 확인
+                    if not watchdog.statistics["inotify_enabled"]:
+                        watchdog._handle_new_nodes(["ttyACM0", "null"])
+                    await asyncio.sleep(0.02)
+            finally:
+                await watchdog.stop()
+
+        asyncio.run(run())
+
+        types = [event.event_type for event in watchdog.events]
+        self.assertEqual(types, [WatchdogEventType.SERIAL_DEVICE_ADDED])
+
+    def test_usb_replug_detected_again(self):
+        """같은 bus_id로 뽑았다 다시 꽂은 플라이트 컨트롤러도 다시 감지"""
+        import shutil
+        from dvd_connector.watchdog import WatchdogEventType
+
+        watchdog = self._watchdog()
+
+        def plug():
+            usb = self.root / "usb" / "1-1"
+            usb.mkdir()
+            for name, value in [("idVendor", "2dae\n"), ("idProduct", "1016\n"),
+                                ("manufacturer", "Hex/ProfiCNC\n"), ("product", "CubeOrange\n")]:
+                (usb / name).write_text(value)
+            (self.root / "dev" / "ttyACM0").touch()
+            watchdog._handle_new_nodes(["ttyACM0"])
+
+        def unplug():
+            shutil.rmtree(self.root / "usb" / "1-1")
+            (self.root / "dev" / "ttyACM0").unlink()
+            watchdog._handle_removed_nodes(["ttyACM0"])
+
+        async def run():
+            await watchdog.start()
+            try:
+                # 이벤트 루프로 돌아가지 않으므로 inotify 콜백과 겹치지 않고 처리 순서가 고정됨
+                plug()
+                unplug()
+                plug()
+            finally:
+                await watchdog.stop()
+
+        asyncio.run(run())
+
+        detected = [event for event in watchdog.events if event.event_type == WatchdogEventType.HARDWARE_DETECTED]
+        self.assertEqual(len(detected), 2)
+        self.assertEqual({event.details["bus_id"] for event in detected}, {"1-1"})
+
+def _verdict(level, violations):
+    return SafetyCheckResult(level, NetworkType.SIMULATION, [], list(violations), [],
+                             level in (SafetyLevel.SAFE, SafetyLevel.CAUTION), 0.0)
+
+class ScriptedChecker:
+    """정해 둔 결과를 차례로 돌려주는 검사기 (마지막 결과는 반복)"""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.calls = 0
+
+    async def comprehensive_safety_check(self, target_config, deadline=None, use_cache=True):
+        self.calls += 1
+        return self.results.pop(0) if len(self.results) > 1 else self.results[0]
+
+class TestSafetyRecheck(unittest.TestCase):
+    """감시 이벤트 후 재검사 - 시작 시 기준선 대비 판단"""
+
+    def _testbed(self, baseline, *results):
+        import signal
+        from types import SimpleNamespace
+        from integrated_dvd_testbed import IntegratedDVDTestbed, DVDRealtimeConnector, DVDConnectorConfig
+
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            self.addCleanup(signal.signal, signum, signal.getsignal(signum))
+        testbed = IntegratedDVDTestbed({})
+        testbed.is_running = True
+        testbed.dvd_connector = DVDRealtimeConnector(DVDConnectorConfig(cpu_workers=0))
+        testbed.safety_watchdog = SimpleNamespace(checker=ScriptedChecker(*results), target_config={},
+                                                  tripped=asyncio.Event())
+        testbed._safety_baseline = baseline
+        testbed.dvd_connector.attack_orchestrator.pause("test")
+        return testbed
+
+    def _recheck(self, testbed, **kwargs):
+        from dvd_lite import clock
+        clock.run(testbed._recheck_safety(**kwargs), virtual_time=True)
+        return testbed.dvd_connector.attack_orchestrator
+
+    def test_resumes_when_no_worse_than_baseline(self):
+        """기준선이 이미 DANGER여도 같은 위반만 있으면 재개"""
+        baseline = _verdict(SafetyLevel.DANGER, ["인터넷 접근 가능 - 실제 네트워크 환경"])
+        testbed = self._testbed(baseline, baseline)
+        orchestrator = self._recheck(testbed)
+        self.assertFalse(orchestrator.is_paused)
+        self.assertEqual(testbed.safety_watchdog.checker.calls, 1)
+
+    def test_waits_until_recovered(self):
+        baseline = _verdict(SafetyLevel.SAFE, [])
+        testbed = self._testbed(baseline, _verdict(SafetyLevel.WARNING, ["실제 무선 장비 감지: elrs"]), baseline)
+        orchestrator = self._recheck(testbed)
+        self.assertFalse(orchestrator.is_paused)
+        self.assertEqual(testbed.safety_watchdog.checker.calls, 2)
+
+    def test_aborts_after_bounded_retries(self):
+        """기준선에 없던 위반이 계속되면 정해진 횟수 후 실험 중단"""
+        baseline = _verdict(SafetyLevel.DANGER, ["인터넷 접근 가능 - 실제 네트워크 환경"])
+        worse = _verdict(SafetyLevel.DANGER, baseline.safety_violations + ["실제 드론 하드웨어 감지: 10.13.0.9"])
+        testbed = self._testbed(baseline, worse)
+        orchestrator = self._recheck(testbed, max_attempts=3)
+        self.assertEqual(testbed.safety_watchdog.checker.calls, 3)
+        self.assertTrue(orchestrator.aborted)
+        self.assertFalse(testbed.is_running)
+
+    def test_real_checker_output_stable_across_rechecks(self):
+        """실제 검사기 결과로 재검사 - 같은 디바이스는 검사 시각이 달라도 새 위반이 아님"""
+        from unittest import mock
+
+        cube = {"bus_id": "1-1", "idVendor": "2dae", "idProduct": "1016",
+                "manufacturer": "Hex/ProfiCNC", "product": "CubeOrange"}
+        radio = {"bus_id": "1-2", "idVendor": "0403", "idProduct": "6015",
+                 "manufacturer": "RadioMaster", "product": "ExpressLRS"}
+        usb_devices = [cube]
+
+        async def scan_ports(host, ports):
+            return [14550, 14551] if host == "10.13.0.4" else []
+
+        checker = SafetyChecker()
+        patches = [
+            mock.patch("dvd_connector.safety_checker.read_usb_devices", lambda: list(usb_devices)),
+            mock.patch.object(checker, "_scan_ports", scan_ports),
+            mock.patch.object(checker, "_check_internet_access", mock.AsyncMock(return_value=False)),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        baseline = asyncio.run(checker.comprehensive_safety_check(SIM_CONFIG, use_cache=False))
+        self.assertFalse(baseline.is_safe_to_proceed)
+        self.assertIn("실제 드론 하드웨어 감지: 10.13.0.4 (MAVLink Primary, MAVLink Secondary)",
+                      baseline.safety_violations)
+        self.assertIn("실제 플라이트 컨트롤러 감지: ID 2dae:1016 Hex/ProfiCNC CubeOrange (USB 1-1)",
+                      baseline.safety_violations)
+
+        testbed = self._testbed(baseline, baseline)
+        testbed.safety_watchdog.checker, testbed.safety_watchdog.target_config = checker, SIM_CONFIG
+        orchestrator = self._recheck(testbed, max_attempts=1)
+        self.assertFalse(orchestrator.is_paused)
+        self.assertFalse(orchestrator.aborted)
+
+        # 기준선 이후 새로 연결된 무선 장비는 새 위반
+        usb_devices.append(radio)
+        testbed = self._testbed(baseline, baseline)
+        testbed.safety_watchdog.checker, testbed.safety_watchdog.target_config = checker, SIM_CONFIG
+        orchestrator = self._recheck(testbed, max_attempts=1)
+        self.assertTrue(orchestrator.aborted)
+        self.assertEqual(testbed.experiment_results['system_logs'][-1]['level'], "error")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+"""
+텔레메트리 열 저장소 테스트
+"""
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import unittest
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dvd_lite.main import DVDLite
+from dvd_lite.sitl import StandInVehicle
+from dvd_lite.telemetry_store import TelemetryStore, TelemetryReader, NUMPY_AVAILABLE
+
+if NUMPY_AVAILABLE:
+    import numpy as np
+    from dvd_lite.telemetry_store import varint_encode, varint_decode
+
+@unittest.skipUnless(NUMPY_AVAILABLE, "numpy 필요")
+class TestTelemetryStore(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = self.directory.name
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_varint_round_trip(self):
+        values = np.array([0, 1, -1, 127, 128, -2**62, 2**62, 2**63 - 1, -2**63, 5, 5], dtype=np.int64)
+        encoded = varint_encode(values)
+        self.assertTrue((varint_decode(encoded, len(values)) == values).all())
+        # 50Hz 시각(µs)은 첫 값 이후 차분 20000만 남아 값마다 3바이트
+        steps = np.arange(1000, dtype=np.int64) * 20000 + 1_700_000_000_000_000
+        self.assertEqual(len(varint_encode(steps)), 8 + 999 * 3)
+
+    def test_segments_and_time_range(self):
+        """청크가 찰 때마다 세그먼트 기록, 구간 밖 세그먼트는 건너뛰고 읽음"""
+        with TelemetryStore(self.path, chunk_rows=100) as store:
+            store.declare("position", {"lat": ("i4", 1e7), "alt": ("i4", 1e2), "mode": "category"})
+            for index in range(250):
+                store.append("position", 1000.0 + index * 0.02,
+                             {"lat": 37.0 + index * 1e-6, "alt": index / 10, "mode": "AUTO" if index < 200 else "RTL"})
+        self.assertEqual(store.statistics["segments"], 3)
+
+        with TelemetryReader(self.path) as reader:
+            self.assertEqual(reader.message_types(), ["position"])
+            self.assertEqual(reader.rows("position"), 250)
+            columns = reader.read("position")
+            self.assertAlmostEqual(float(columns["lat"][123]), 37.000123, places=7)
+            self.assertAlmostEqual(float(columns["alt"][249]), 24.9)
+            self.assertEqual(list(columns["mode"][198:202]), ["AUTO", "AUTO", "RTL", "RTL"])
+
+            window = reader.read("position", ["alt"], start=1002.0, end=1002.5)
+            self.assertEqual(set(window), {"timestamp", "alt"})
+            self.assertEqual(len(window["alt"]), 26)
+            self.assertAlmostEqual(float(window["timestamp"][0]), 1002.0)
+            self.assertEqual(reader.read("missing"), {})
+
+    def test_inferred_schema_and_extend(self):
+        """선언하지 않은 종류는 첫 샘플로 형식 추론, 열 단위 일괄 추가"""
+        with TelemetryStore(self.path, chunk_rows=64) as store:
+            store.append("status", 1.0, {"armed": True, "count": 3, "voltage": 12.5, "mode": "GUIDED"})
+            store.extend("status", [2.0, 3.0], {"armed": [False, True], "count": [4, 5],
+                                                "voltage": [12.4, 12.3], "mode": ["AUTO", "GUIDED"]})
+        with TelemetryReader(self.path) as reader:
+            columns = reader.read("status")
+        self.assertEqual(columns["armed"].tolist(), [True, False, True])
+        self.assertEqual(columns["count"].tolist(), [3, 4, 5])
+        self.assertEqual(columns["voltage"].tolist(), [12.5, 12.4, 12.3])
+        self.assertEqual(columns["mode"].tolist(), ["GUIDED", "AUTO", "GUIDED"])
+
+    def test_sparse_row_after_segment_boundary(self):
+        """세그먼트를 넘긴 뒤 빠진 필드는 이전 세그먼트 값이 아니라 0"""
+        with TelemetryStore(self.path, chunk_rows=2) as store:
+            store.append("status", 1.0, {"a": 1, "b": 10})
+            store.append("status", 2.0, {"a": 2, "b": 20})
+            store.append("status", 3.0, {"a": 3})
+        with TelemetryReader(self.path) as reader:
+            columns = reader.read("status")
+        self.assertEqual(columns["a"].tolist(), [1, 2, 3])
+        self.assertEqual(columns["b"].tolist(), [10, 20, 0])
+
+    def test_hour_capture_size(self):
+        """50Hz 한 시간 수집 텔레메트리가 수 MB 안에 저장됨"""
+        rng = random.Random(3)
+        rows = 50 * 3600
+        columns = {
+            "gps_lat": [37.7749 + rng.uniform(-0.01, 0.01) for _ in range(rows)],
+            "gps_lon": [-122.4194 + rng.uniform(-0.01, 0.01) for _ in range(rows)],
+            "altitude": [rng.uniform(10, 100) for _ in range(rows)],
+            "battery_voltage": [rng.uniform(11.0, 12.6) for _ in range(rows)],
+            "armed": [rng.choice([True, False]) for _ in range(rows)],
+            "mode": [rng.choice(["GUIDED", "AUTO", "STABILIZE"]) for _ in range(rows)],
+        }
+        with TelemetryStore(self.path) as store:
+            store.declare("mavlink_telemetry", {"gps_lat": ("i4", 1e7), "gps_lon": ("i4", 1e7),
+                                                "altitude": ("i4", 1e2), "battery_voltage": ("i2", 1e3),
+                                                "armed": "?", "mode": "category"})
+            store.extend("mavlink_telemetry", 1.7e9 + np.arange(rows) / 50, columns)
+        self.assertLess(store.statistics["bytes_written"], 3 * 1024 * 1024)
+
+        with TelemetryReader(self.path) as reader:
+            self.assertEqual(reader.rows("mavlink_telemetry"), rows)
+            restored = reader.read("mavlink_telemetry", ["gps_lat", "mode"])
+        self.assertTrue(np.allclose(restored["gps_lat"], columns["gps_lat"], atol=1e-7))
+        self.assertEqual(restored["mode"][-1], columns["mode"][-1])
+
+    def test_live_telemetry_exfiltration(self):
+        """live=True면 대상 텔레메트리 스트림을 수집해 저장소에 기록"""
+        from dvd_lite.dvd_attacks import register_all_dvd_attacks
+        register_all_dvd_attacks()
+        dvd = DVDLite(config_path="nonexistent.json")
+
+        async def run():
+            async with StandInVehicle(heartbeat_interval=0.1) as vehicle:
+                host, port = vehicle.address
+                return await dvd.run_attack("telemetry_exfiltration", live=True, target_ip=host,
+                                            mavlink_port=port, duration=0.5, rate=50, capture_dir=self.path)
+
+        result = asyncio.run(run())
+        self.assertEqual(result.status.value, "success")
+        self.assertGreater(result.details["samples"]["position"], 10)
+        self.assertEqual(result.details["samples"]["position"], result.details["samples"]["attitude"])
+        self.assertGreater(result.details["samples"]["heartbeat"], 0)
+        self.assertAlmostEqual(result.details["track"]["max_relative_alt"], 50.0)
+        self.assertTrue(any(ioc.startswith("TELEMETRY_CAPTURED:127.0.0.1:") for ioc in result.iocs))
+        self.assertTrue(any(ioc.startswith("TELEMETRY_POSITION:37.77") for ioc in result.iocs))
+
+if __name__ == "__main__":
+    unittest.main()